@@ -1,4 +1,8 @@
+import os
+
+from boa3.internal.compiler.batchcompiler import BatchCompiler, ContractCompilationResult
 from boa3.internal.compiler.compiler import Compiler
+from boa3.internal.compiler.gasreport import GasReport
 from boa3.internal.exception.InvalidPathException import InvalidPathException
 
 __all__ = ['Boa3']
@@ -48,8 +52,9 @@ class Boa3:
             env: str = None,
             fail_fast: bool = True,
             optimize: bool = True,
-            exclude_warnings: list = None
-    ):
+            exclude_warnings: list = None,
+            gas_report: bool = False
+    ) -> GasReport | None:
         """
         Load a Python file to be compiled and save the result into the files.
         By default, the resultant .nef file is saved in the same folder of the
@@ -62,6 +67,8 @@ class Boa3:
         :param debug: if nefdbgnfo file should be generated.
         :param env: specific environment id to compile.
         :param fail_fast: if should stop compilation on first error found.
+        :param gas_report: if the GAS needed to invoke each public method should be estimated.
+        :return: the estimated GAS of each public method if `gas_report` is True. None otherwise
         """
         if not path.endswith('.py'):
             raise InvalidPathException(path)
@@ -71,6 +78,63 @@ class Boa3:
         elif not output_path.endswith('.nef'):
             raise InvalidPathException(output_path)
 
-        Compiler().compile_and_save(path, output_path, root_folder, show_errors, log_level, debug, env, fail_fast,
-                                    optimize, exclude_warnings
-                                    )
+        compiler = Compiler()
+        compiler.compile_and_save(path, output_path, root_folder, show_errors, log_level, debug, env, fail_fast,
+                                  optimize, exclude_warnings
+                                  )
+        return compiler.generate_gas_report() if gas_report else None
+
+    @staticmethod
+    def compile_many(
+            paths: list[str],
+            jobs: int = None,
+            output_folder: str = None,
+            root_folder: str = None,
+            show_errors: bool = True,
+            log_level: str = None,
+            debug: bool = False,
+            env: str = None,
+            fail_fast: bool = True,
+            optimize: bool = True,
+            exclude_warnings: list = None,
+            gas_report: bool = False
+    ) -> list[ContractCompilationResult]:
+        """
+        Load many Python files to be compiled in parallel and save the results into the files.
+        By default, each resultant .nef file is saved in the same folder of its source file.
+
+        A contract that fails to compile doesn't stop the compilation of the others. The reason of the failure is
+        returned in its result.
+
+        :param paths: the paths of the Python files to compile
+        :param jobs: the number of worker processes. The number of CPUs by default.
+        :param output_folder: Optional folder to save the generated files
+        :param root_folder: the root path of the project
+        :param show_errors: if compiler errors should be logged.
+        :param debug: if nefdbgnfo files should be generated.
+        :param env: specific environment id to compile.
+        :param fail_fast: if should stop each compilation on first error found.
+        :param gas_report: if the GAS needed to invoke each public method should be estimated.
+        :return: the result of each contract, in the same order of the given paths
+        """
+        files_to_compile = []
+        for path in paths:
+            if not path.endswith('.py'):
+                raise InvalidPathException(path)
+
+            output_path = path.replace('.py', '.nef')
+            if output_folder is not None:
+                output_path = os.path.join(output_folder, os.path.basename(output_path))
+            files_to_compile.append((path, output_path))
+
+        return BatchCompiler(jobs).compile_and_save(files_to_compile,
+                                                    root_folder=root_folder,
+                                                    log=show_errors,
+                                                    log_level=log_level,
+                                                    debug=debug,
+                                                    env=env,
+                                                    fail_fast=fail_fast,
+                                                    optimize=optimize,
+                                                    exclude_warnings=exclude_warnings,
+                                                    gas_report=gas_report
+                                                    )
@@ -8,7 +8,7 @@ from boa3.internal.analyser.constructanalyser import ConstructAnalyser
 from boa3.internal.analyser.moduleanalyser import ModuleAnalyser
 from boa3.internal.analyser.supportedstandard.standardanalyser import StandardAnalyser
 from boa3.internal.analyser.typeanalyser import TypeAnalyser
-from boa3.internal.compiler.compiledmetadata import CompiledMetadata
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.exception.CompilerError import CompilerError
 from boa3.internal.exception.CompilerWarning import CompilerWarning
 from boa3.internal.model.symbol import ISymbol
@@ -24,8 +24,10 @@ class Analyser:
     """
 
     def __init__(self, ast_tree: ast.AST, path: str = None, project_root: str = None,
-                 env: str = None, log: bool = False, fail_fast: bool = False, exclude_warnings: list = None):
+                 env: str = None, log: bool = False, fail_fast: bool = False, exclude_warnings: list = None,
+                 context: CompilationContext = None):
         self.symbol_table: dict[str, ISymbol] = {}
+        self.context: CompilationContext = context if context is not None else CompilationContext.current()
 
         self.ast_tree: ast.AST = ast_tree
         self.metadata: NeoMetadata = NeoMetadata()
@@ -67,7 +69,8 @@ class Analyser:
             root: str = None,
             env: str = None,
             compiler_entry: bool = False,
-            exclude_warnings: list = None
+            exclude_warnings: list = None,
+            context: CompilationContext = None
     ) -> Self:
         """
         Analyses the syntax of the Python code
@@ -82,6 +85,7 @@ class Analyser:
         :param root: the path of the project root that the current smart contract is part of.
         :param env: specific environment id to compile.
         :param compiler_entry: Whether this is the entry compiler analyser. False by default.
+        :param context: the compilation that is analysing the file. Uses the current compilation if it's None.
         :return: a boolean value that represents if the analysis was successful
         :rtype: Analyser
         """
@@ -89,12 +93,11 @@ class Analyser:
             ast_tree = ast.parse(source.read())
 
         analyser = Analyser(ast_tree, path, root if isinstance(root, str) else path, env, log, fail_fast,
-                            exclude_warnings)
-        CompiledMetadata.set_current_metadata(analyser.metadata)
+                            exclude_warnings, context)
+        analyser.context.metadata.set_current_metadata(analyser.metadata)
 
         if compiler_entry:
-            from boa3.internal.model.imports.compilerbuiltin import CompilerBuiltin
-            CompilerBuiltin.update_with_analyser(analyser)
+            analyser.context.builtin.update_with_analyser(analyser)
 
         # fill symbol table
         if not analyser.__analyse_modules(imported_files, import_stack):
@@ -127,7 +130,7 @@ class Analyser:
 
     def copy(self) -> Self:
         copied = Analyser(ast_tree=self.ast_tree, path=self.path, project_root=self.root,
-                          env=self._env, log=self._log, fail_fast=self._fail_fast)
+                          env=self._env, log=self._log, fail_fast=self._fail_fast, context=self.context)
 
         copied.metadata = self.metadata
         copied.is_analysed = self.is_analysed
@@ -178,7 +181,7 @@ class Analyser:
         self._imported_files = module_analyser.analysed_files.copy()
 
         if self.metadata != current_metadata:
-            CompiledMetadata.set_current_metadata(self.metadata)
+            self.context.metadata.set_current_metadata(self.metadata)
 
         return not module_analyser.has_errors
 
@@ -17,6 +17,7 @@ from boa3.internal.model.property import Property
 from boa3.internal.model.symbol import ISymbol
 from boa3.internal.model.type.classes.userclass import UserClass
 from boa3.internal.model.type.primitive.primitivetype import PrimitiveType
+from boa3.internal.model.variable import Variable
 
 
 class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
@@ -136,11 +137,13 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
     def visit_Assign(self, node: ast.Assign) -> ast.AST:
         super().generic_visit(node)
         self.set_variables_value(node.targets, node.value)
+        self.set_global_variables_value(node, node.targets, node.value)
         return node
 
     def visit_AnnAssign(self, node: ast.AnnAssign) -> ast.AST:
         super().generic_visit(node)
         self.set_variables_value([node.target], node.value)
+        self.set_global_variables_value(node, [node.target], node.value)
         return node
 
     def visit_AugAssign(self, node: ast.AugAssign) -> ast.AST:
@@ -165,6 +168,25 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
                 elif target.id in self.current_scope:
                     self.current_scope.remove(target.id)
 
+    def set_global_variables_value(self, node: ast.AST, targets: list[ast.AST], value: ast.AST):
+        """
+        Sets the evaluated value of the module variables, so they can be used as literals in the functions and in the
+        modules that import them, instead of being stored in static fields
+        """
+        if self._is_optimizing or self._current_class is not None:
+            return
+
+        new_value = self.literal_eval(value)
+        if not isinstance(self.get_type(new_value), PrimitiveType):
+            return
+
+        for target in targets:
+            if isinstance(target, ast.Name) and isinstance(target.ctx, ast.Store):
+                var = self.symbols.get(target.id)
+                # only the first assignment of the variable in this module sets its value
+                if isinstance(var, Variable) and var.origin is node:
+                    var.set_initial_assign(new_value)
+
     def visit_BinOp(self, bin_op: ast.BinOp) -> ast.AST:
         """
         Visitor of a binary operation node
@@ -435,9 +457,10 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
 
     def visit_Call(self, node: ast.Call) -> ast.AST:
         # check if the call can be evaluated during compile time
-        # TODO: right now only UInt160 and UInt256 constructors are evaluated #2kq12zd
+        # the builtin methods without side effects implement `evaluate_literal` to be replaced by their result
         literal_args = []
-        args_are_literal = True
+        # the keyword arguments are not included in the evaluation
+        args_are_literal = len(node.keywords) == 0
 
         for index, arg in enumerate(node.args.copy()):
             updated_arg = self.visit(arg)  # first try to optimize the arguments
@@ -465,7 +488,8 @@ class AstOptimizer(IAstAnalyser, ast.NodeTransformer):
                 try:
                     result = func.evaluate_literal(*literal_args)
                     if result is not Undefined:
-                        return self.parse_to_node(str(result), node, is_origin_str=isinstance(result, str))
+                        self.has_changes = True
+                        return self.parse_to_node(repr(result), node)
                 except BaseException:
                     self._log_warning(CompilerWarning.InvalidArgument(
                         node.lineno, node.col_offset
@@ -188,6 +188,9 @@ class ModuleAnalyser(IAstAnalyser, ast.NodeVisitor):
                     elif isinstance(source_node, ast.AugAssign):
                         # augmented assignments of global variables shouldn't be evaluated in the module analyser
                         outer_symbol.set_is_reassigned()
+                    elif hasattr(outer_symbol, 'set_has_many_assignments'):
+                        # the functions can't use the first value if the variable is assigned again in the module
+                        outer_symbol.set_has_many_assignments()
                     self.__set_source_origin(source_node, is_module_scope)
             else:
                 if (not isinstance(source_node, ast.Global) and
@@ -1,3 +1,4 @@
+import glob
 import logging
 import os
 import pathlib
@@ -6,6 +7,7 @@ from argparse import _SubParsersAction
 
 from boa3.boa3 import Boa3
 from boa3.internal.cli_commands.icommand import ICommand
+from boa3.internal.compiler.gasreport import GasReport
 from boa3.internal.exception.CompilerWarning import DeprecatedSymbol, InvalidArgument, NameShadowing, RedeclaredSymbol, \
     UnreachableCode, TypeCasting, UsingSpecificException, MethodWarning
 from boa3.internal.exception.NotLoadedException import NotLoadedException
@@ -28,8 +30,10 @@ class CompileCommand(ICommand):
 
     def add_arguments_and_callback(self):
         self.parser.add_argument("input",
+                                 nargs='+',
                                  type=str,
-                                 help=".py smart contract to compile")
+                                 help=".py smart contracts to compile, glob patterns are accepted. "
+                                      "More than one contract is compiled in parallel")
         self.parser.add_argument("-db", "--debug",
                                  action='store_true',
                                  help="generates a .nefdbgnfo file")
@@ -45,7 +49,15 @@ class CompileCommand(ICommand):
                                  default=None,
                                  help="Chooses the name and where the compiled files will be generated, "
                                       "if not specified it will be generated on the same directory with the same name "
-                                      "as the python file.")
+                                      "as the python file. Only accepted when compiling a single contract.")
+        self.parser.add_argument("-j", "--jobs",
+                                 type=int,
+                                 default=None,
+                                 help="Number of processes used to compile more than one contract, "
+                                      "if not specified it will use the number of CPUs.")
+        self.parser.add_argument("--gas-report",
+                                 action='store_true',
+                                 help="Estimates the GAS needed to invoke each public method of the contract")
         self.parser.add_argument("--no-failfast",
                                  action='store_true',
                                  help="Do not stop on first compile error")
@@ -63,7 +75,7 @@ class CompileCommand(ICommand):
 
     @staticmethod
     def execute_command(args: dict):
-        sc_path: str = args['input']
+        sc_paths: list[str] = CompileCommand._expand_inputs(args['input'])
         project_path: str = args['project_path']
         debug: bool = args['debug']
         env: str = args['env']
@@ -71,8 +83,10 @@ class CompileCommand(ICommand):
         fail_fast: bool = not args['no_failfast']
         log_level = args['log_level']
         exclude_warnings = args['exclude_warnings']
+        jobs: int | None = args['jobs']
+        gas_report: bool = args['gas_report']
 
-        if not sc_path.endswith(".py"):
+        if any(not sc_path.endswith(".py") for sc_path in sc_paths):
             logging.error("Input file is not .py")
             sys.exit(1)
 
@@ -84,24 +98,24 @@ class CompileCommand(ICommand):
         if log_level is None:
             log_level = "WARN"
 
-        file_path = pathlib.Path(sc_path).resolve()
-        file_path_parts = file_path.parts
-        current_file_path = pathlib.Path(file_path_parts[0]).resolve()
-        for part in file_path_parts[1:]:
-            try:
-                actual_name = next(f.name for f in current_file_path.iterdir()
-                                   if f.name.lower() == part.lower())
-                if actual_name != part:
-                    logging.error(
-                        f"File path exists but case doesn't match. Found: {actual_name}, Expected: {part}"
-                    )
-                    sys.exit(1)
+        if jobs is not None and jobs < 1:
+            logging.error("Number of jobs must be greater than zero")
+            sys.exit(1)
 
-                current_file_path = current_file_path / actual_name
-            except StopIteration:
-                logging.error(f"Can't find '{part}' in the path '{file_path}'")
+        file_paths = [CompileCommand._validate_file_path(sc_path) for sc_path in sc_paths]
+
+        if len(sc_paths) > 1:
+            if output_path is not None:
+                logging.error("Output path can only be used when compiling a single file")
                 sys.exit(1)
 
+            CompileCommand._compile_many(sc_paths, jobs=jobs, debug=debug, root_folder=project_path, env=env,
+                                         fail_fast=fail_fast, log_level=log_level, exclude_warnings=exclude_warnings,
+                                         gas_report=gas_report)
+            return
+
+        sc_path = sc_paths[0]
+        file_path = file_paths[0]
         filename = file_path.name
         path = file_path.parent
 
@@ -113,17 +127,20 @@ class CompileCommand(ICommand):
             path, filename = os.path.split(os.path.realpath(output_path))
 
         try:
-            Boa3.compile_and_save(sc_path,
-                                  output_path=output_path,
-                                  debug=debug,
-                                  root_folder=project_path,
-                                  env=env,
-                                  fail_fast=fail_fast,
-                                  show_errors=True,
-                                  log_level=log_level,
-                                  exclude_warnings=exclude_warnings
-                                  )
+            report = Boa3.compile_and_save(sc_path,
+                                           output_path=output_path,
+                                           debug=debug,
+                                           root_folder=project_path,
+                                           env=env,
+                                           fail_fast=fail_fast,
+                                           show_errors=True,
+                                           log_level=log_level,
+                                           exclude_warnings=exclude_warnings,
+                                           gas_report=gas_report
+                                           )
             logging.info(f"Wrote {filename.replace('.py', '.nef')} to {path}")
+            if report is not None:
+                CompileCommand._log_gas_report(report)
         except NotLoadedException as e:
             error_message = e.message
             log_error = 'Could not compile'
@@ -135,3 +152,74 @@ class CompileCommand(ICommand):
         except Exception as e:
             logging.exception(e)
             sys.exit(1)
+
+    @staticmethod
+    def _expand_inputs(inputs: list[str]) -> list[str]:
+        """
+        Replaces the glob patterns in the inputs by the files they match. Patterns are expanded here as well, because
+        some shells don't expand them.
+        """
+        sc_paths = []
+        for sc_input in inputs:
+            if not glob.has_magic(sc_input):
+                sc_paths.append(sc_input)
+                continue
+
+            matched_paths = sorted(glob.glob(sc_input, recursive=True))
+            if len(matched_paths) == 0:
+                logging.error(f"No files match '{sc_input}'")
+                sys.exit(1)
+            sc_paths.extend(matched_paths)
+
+        # the same file is compiled only once, even if it's matched more than once
+        return list(dict.fromkeys(sc_paths))
+
+    @staticmethod
+    def _validate_file_path(sc_path: str) -> pathlib.Path:
+        file_path = pathlib.Path(sc_path).resolve()
+        file_path_parts = file_path.parts
+        current_file_path = pathlib.Path(file_path_parts[0]).resolve()
+        for part in file_path_parts[1:]:
+            try:
+                actual_name = next(f.name for f in current_file_path.iterdir()
+                                   if f.name.lower() == part.lower())
+                if actual_name != part:
+                    logging.error(
+                        f"File path exists but case doesn't match. Found: {actual_name}, Expected: {part}"
+                    )
+                    sys.exit(1)
+
+                current_file_path = current_file_path / actual_name
+            except StopIteration:
+                logging.error(f"Can't find '{part}' in the path '{file_path}'")
+                sys.exit(1)
+
+        return file_path
+
+    @staticmethod
+    def _compile_many(sc_paths: list[str], **compile_options):
+        try:
+            results = Boa3.compile_many(sc_paths, show_errors=True, **compile_options)
+        except Exception as e:
+            logging.exception(e)
+            sys.exit(1)
+
+        failed_count = 0
+        for result in results:
+            if result.success:
+                path, filename = os.path.split(os.path.realpath(result.output_path))
+                logging.info(f"Wrote {filename} to {path}")
+                if result.gas_report is not None:
+                    CompileCommand._log_gas_report(result.gas_report)
+            else:
+                failed_count += 1
+                logging.error(f"{result.path}: {result.error}")
+
+        if failed_count > 0:
+            logging.error(f"Could not compile {failed_count} of {len(results)} files")
+            sys.exit(1)
+
+    @staticmethod
+    def _log_gas_report(report: GasReport):
+        for line in str(report).splitlines():
+            logging.info(line)
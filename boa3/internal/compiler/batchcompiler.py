@@ -0,0 +1,104 @@
+__all__ = [
+    'BatchCompiler',
+    'ContractCompilationResult'
+]
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from boa3.internal.compiler.gasreport import GasReport
+from boa3.internal.exception.NotLoadedException import NotLoadedException
+
+
+class ContractCompilationResult:
+    """
+    The result of the compilation of one of the smart contracts of a batch.
+
+    :ivar path: the path of the compiled Python file
+    :ivar output_path: the path of the generated .nef file
+    :ivar error: the reason why the compilation failed. None if the contract was compiled.
+    :ivar gas_report: the estimated GAS of each public method, if it was requested
+    """
+
+    def __init__(self, path: str, output_path: str, error: str = None, gas_report: GasReport = None):
+        self.path: str = path
+        self.output_path: str = output_path
+        self.error: str | None = error
+        self.gas_report: GasReport | None = gas_report
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.success:
+            return f'{self.path} -> {self.output_path}'
+        return f'{self.path}: {self.error}'
+
+
+class BatchCompiler:
+    """
+    This class is responsible for compiling many smart contracts at once.
+
+    The contracts are distributed across a pool of worker processes, and each worker is reused for every contract it
+    receives, so the interpreter is started and the compiler modules are imported once per worker instead of once per
+    contract. Each contract is still compiled in its own compilation context, with its own compiler builtins.
+    """
+
+    def __init__(self, jobs: int = None):
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        elif jobs < 1:
+            raise ValueError(f'number of jobs must be greater than zero: {jobs}')
+
+        self._jobs: int = jobs
+
+    @property
+    def jobs(self) -> int:
+        return self._jobs
+
+    def compile_and_save(self, paths: list[tuple[str, str]], **compile_options) -> list[ContractCompilationResult]:
+        """
+        Compiles the smart contracts and saves the generated files
+
+        :param paths: the path of each Python file to compile and the path to save its generated files
+        :param compile_options: the arguments of `Compiler.compile_and_save` that are shared by every contract. If
+                                `gas_report` is True, the GAS of each contract is estimated too
+        :return: the result of each contract, in the same order of the given paths
+        """
+        if len(paths) == 0:
+            return []
+
+        jobs = min(self._jobs, len(paths))
+        if jobs == 1:
+            # a pool isn't worth starting for a single worker
+            return [_compile_contract(path, output_path, compile_options) for path, output_path in paths]
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_compile_contract, path, output_path, compile_options)
+                       for path, output_path in paths]
+            return [future.result() for future in futures]
+
+
+def _compile_contract(path: str, output_path: str, compile_options: dict) -> ContractCompilationResult:
+    from boa3.internal.compiler.compiler import Compiler
+
+    compile_options = compile_options.copy()
+    generate_gas_report = compile_options.pop('gas_report', False)
+    gas_report = None
+
+    try:
+        compiler = Compiler()
+        compiler.compile_and_save(path, output_path, **compile_options)
+        if generate_gas_report:
+            gas_report = compiler.generate_gas_report()
+        error = None
+    except NotLoadedException as e:
+        error = 'Could not compile'
+        if len(e.message) > 0:
+            error += f': {e.message}'
+    except Exception as e:
+        # the exception may not be serializable to be sent back from the worker, so only its message is kept
+        error = f'{type(e).__name__}: {e}'
+
+    return ContractCompilationResult(path, output_path, error, gas_report)
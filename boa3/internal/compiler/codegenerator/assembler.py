@@ -0,0 +1,94 @@
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+class Assembler:
+    """
+    This class is responsible for assembling the Neo VM instructions into the final bytecode.
+
+    The instructions targets are used as labels: the addresses are assigned in a linear sweep, without using the code
+    map, and the jumps that don't fit in their short form are widened until every jump fits.
+    """
+
+    def __init__(self, codes: list[VMCode]):
+        self._codes: list[VMCode] = codes
+        self._addresses: dict[VMCode, int] = {}
+        self._size: int = 0
+        self._has_widened_codes: bool = False
+
+    @property
+    def has_widened_codes(self) -> bool:
+        """
+        Gets whether any instruction was changed to a larger opcode during the assembling
+        """
+        return self._has_widened_codes
+
+    @property
+    def bytecode_size(self) -> int:
+        return self._size
+
+    def get_address(self, vm_code: VMCode) -> int:
+        """
+        Gets the vm code's first byte address in the assembled bytecode
+
+        :param vm_code: the instruction to get the address
+        :return: the vm code's address if it's in the bytecode. Otherwise, return's zero.
+        """
+        return self._addresses.get(vm_code, 0)
+
+    def assemble(self) -> bytes:
+        """
+        Gets the bytecode of the instructions
+
+        :return: the generated bytecode
+        """
+        self._assign_addresses()
+        self._relax_branches()
+
+        # the final size is already known, so the bytecode is written in a preallocated buffer
+        bytecode = bytearray(self._size)
+        addresses = self._addresses
+        for code in self._codes:
+            encoded = code.encode(self.get_address)
+            address = addresses[code]
+            bytecode[address:address + len(encoded)] = encoded
+        return bytes(bytecode)
+
+    def _assign_addresses(self):
+        addresses = self._addresses
+        get_address = self.get_address
+
+        next_address = 0
+        for code in self._codes:
+            addresses[code] = next_address
+            next_address += code.get_size(get_address)
+        self._size = next_address
+
+    def _relax_branches(self):
+        """
+        Changes the opcodes of the instructions whose data doesn't fit in its opcode maximum size to their larger
+        equivalents.
+
+        Widening an instruction can only increase the distance between the other instructions and their targets, so
+        it starts with every instruction in its shortest form and widens only those that overflow, repeating until
+        nothing changes. Each pass is linear and an instruction is never checked again after being widened.
+        """
+        get_address = self.get_address
+        instr_with_small_codes = [code for code in self._codes if OpcodeHelper.has_larger_opcode(code.opcode)]
+
+        while len(instr_with_small_codes) > 0:
+            remaining_codes = []
+            for code in instr_with_small_codes:
+                if len(code.get_raw_data(get_address)) > code.info.max_data_len:
+                    code.set_opcode(OpcodeInfo.get_info(OpcodeHelper.get_larger_opcode(code.opcode)))
+                else:
+                    remaining_codes.append(code)
+
+            if len(remaining_codes) == len(instr_with_small_codes):
+                break
+
+            # the addresses of the instructions after each changed code have changed
+            self._has_widened_codes = True
+            instr_with_small_codes = remaining_codes
+            self._assign_addresses()
@@ -3,7 +3,8 @@ __all__ = [
 ]
 
 
-from collections.abc import Sequence
+import functools
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from boa3.internal import constants
@@ -15,6 +16,7 @@ from boa3.internal.compiler.codegenerator.codeoptimizer import CodeOptimizer
 from boa3.internal.compiler.codegenerator.engine.stackmemento import NeoStack, StackMemento
 from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
 from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.compiler.compileroutput import CompilerOutput
 from boa3.internal.model.builtin.builtin import Builtin
 from boa3.internal.model.builtin.builtincallable import IBuiltinCallable
@@ -50,6 +52,10 @@ from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo, OpcodeInformation
 from boa3.internal.neo.vm.type.Integer import Integer
 from boa3.internal.neo.vm.type.StackItem import StackItemType
 
+# the maximum number of int constants of a match or of an if-elif chain that are compared one by one, instead of being
+# split in a comparison tree
+_DISPATCH_LINEAR_SEARCH_SIZE = 4
+
 
 class CodeGenerator:
     """
@@ -67,11 +73,16 @@ class CodeGenerator:
         :param optimization_level: The level of optimization that should be used after generating the code
         :return: the Neo VM bytecode
         """
-        VMCodeMapping.reset()
+        with analyser.context.activate():
+            return CodeGenerator._generate_code(analyser, optimization_level)
+
+    @staticmethod
+    def _generate_code(analyser: Analyser, optimization_level: OptimizationLevel) -> CompilerOutput:
+        analyser.context.vm_code_mapping.clear()
         analyser.update_symbol_table_with_imports()
 
         all_imports = CodeGenerator._find_all_imports(analyser)
-        generator = CodeGenerator(analyser.symbol_table, optimization_level)
+        generator = CodeGenerator(analyser.symbol_table, optimization_level, analyser.context)
 
         from boa3.internal.exception.CompilerError import CompilerError
 
@@ -144,6 +155,8 @@ class CodeGenerator:
                 visitor.visit_and_update_analyser(global_ast, analyser)
                 generator.initialized_static_fields = True
 
+            generator.convert_shared_methods()
+
         except CompilerError:
             pass
 
@@ -173,9 +186,13 @@ class CodeGenerator:
 
     def __init__(self,
                  symbol_table: dict[str, ISymbol],
-                 optimization_level: OptimizationLevel = OptimizationLevel.DEFAULT
+                 optimization_level: OptimizationLevel = OptimizationLevel.DEFAULT,
+                 context: CompilationContext = None
                  ):
 
+        self._context: CompilationContext = context if context is not None else CompilationContext.current()
+        self._vm_code_mapping: VMCodeMapping = self._context.vm_code_mapping
+
         self.symbol_table: dict[str, ISymbol] = symbol_table.copy()
         self._optimization_level = (optimization_level
                                     if isinstance(optimization_level, OptimizationLevel)
@@ -200,7 +217,7 @@ class CodeGenerator:
         self._inserted_loop_breaks: dict[int, list[int]] = {}
 
         self._opcodes_to_remove: list[int] = []
-        self._stack_states: StackMemento = StackMemento()  # simulates neo execution stack
+        self._stack_states: StackMemento = StackMemento(self._vm_code_mapping)  # simulates neo execution stack
 
         self.can_init_static_fields: bool = False
         self.initialized_static_fields: bool = False
@@ -208,6 +225,25 @@ class CodeGenerator:
         self._static_vars: list | None = None
         self._global_vars: list | None = None
 
+        # the code generated once as internal methods, mapped by the identifier of each method
+        self._shared_methods: dict[str, tuple[Method, Callable[[], None]]] = {}
+        self._shared_methods_args: dict[Method, list[IType]] = {}
+        self._generated_shared_methods: set[str] = set()
+
+    @property
+    def context(self) -> CompilationContext:
+        """
+        Gets the compilation that is generating the code
+        """
+        return self._context
+
+    @property
+    def vm_code_mapping(self) -> VMCodeMapping:
+        """
+        Gets the instructions generated in the current compilation
+        """
+        return self._vm_code_mapping
+
     @property
     def bytecode(self) -> bytes:
         """
@@ -219,9 +255,9 @@ class CodeGenerator:
         return output.bytecode
 
     def _remove_opcodes_without_target(self):
-        opcodes = VMCodeMapping.instance().get_opcodes(self._opcodes_to_remove)
+        opcodes = self._vm_code_mapping.get_opcodes(self._opcodes_to_remove)
         self.set_code_targets()
-        VMCodeMapping.instance().remove_opcodes_by_code(opcodes)
+        self._vm_code_mapping.remove_opcodes_by_code(opcodes)
         self._opcodes_to_remove.clear()
 
     @property
@@ -232,15 +268,15 @@ class CodeGenerator:
         :return: the generated bytecode
         """
         self._remove_opcodes_without_target()
-        return VMCodeMapping.instance().result()
+        return self._vm_code_mapping.result()
 
     def get_optimized_output(self, optimization_level: OptimizationLevel) -> CompilerOutput:
         self._remove_opcodes_without_target()
 
-        optimizer = CodeOptimizer(symbol_table=self.symbol_table)
+        optimizer = CodeOptimizer(symbol_table=self.symbol_table, vm_code_mapping=self._vm_code_mapping)
         optimizer.optimize(optimization_level)
 
-        return VMCodeMapping.instance().result()
+        return self._vm_code_mapping.result()
 
     @property
     def last_code(self) -> VMCode | None:
@@ -250,8 +286,8 @@ class CodeGenerator:
         :return: the last code. If the bytecode is empty, returns None
         :rtype: VMCode or None
         """
-        if len(VMCodeMapping.instance().codes) > 0:
-            return VMCodeMapping.instance().codes[-1]
+        if len(self._vm_code_mapping.codes) > 0:
+            return self._vm_code_mapping.codes[-1]
         else:
             return None
 
@@ -284,7 +320,7 @@ class CodeGenerator:
 
         :return: the last code's first address
         """
-        instance = VMCodeMapping.instance()
+        instance = self._vm_code_mapping
         if len(instance.codes) > 0:
             return instance.get_start_address(instance.codes[-1])
         else:
@@ -297,7 +333,7 @@ class CodeGenerator:
 
         :return: the current bytecode size
         """
-        return VMCodeMapping.instance().bytecode_size
+        return self._vm_code_mapping.bytecode_size
 
     @property
     def _args(self) -> list[str]:
@@ -444,6 +480,9 @@ class CodeGenerator:
     def store_constant_variable(self, var: Variable) -> bool:
         return optimizerhelper.is_storing_static_variable(self._optimization_level, var)
 
+    def move_loop_invariants(self) -> bool:
+        return self._optimization_level >= OptimizationLevel.HIGH
+
     # endregion
 
     def is_none_inserted(self) -> bool:
@@ -579,7 +618,9 @@ class CodeGenerator:
         num_args: int = len(method.args)
         num_vars: int = len(method.locals)
 
-        method.init_address = VMCodeMapping.instance().bytecode_size
+        method.init_address = self._vm_code_mapping.bytecode_size
+        method.local_slots = None
+        method.local_ranges = None
         if num_args > 0 or num_vars > 0:
             init_data = bytearray([num_vars, num_args])
             self.__insert1(OpcodeInfo.INITSLOT, init_data)
@@ -591,8 +632,8 @@ class CodeGenerator:
         Converts the end of the method
         """
         if (self._current_method.init_bytecode is None
-                and self._current_method.init_address in VMCodeMapping.instance().code_map):
-            self._current_method.init_bytecode = VMCodeMapping.instance().code_map[self._current_method.init_address]
+                and self._vm_code_mapping.has_address(self._current_method.init_address)):
+            self._current_method.init_bytecode = self._vm_code_mapping.get_code(self._current_method.init_address)
 
         if self.last_code.opcode is not Opcode.RET or self._check_codes_with_target():
             if self._current_method.is_init:
@@ -697,7 +738,7 @@ class CodeGenerator:
                 self._stack_append(Type.int)
 
         for_increment = self.last_code_start_address
-        test_address = VMCodeMapping.instance().bytecode_size
+        test_address = self._vm_code_mapping.bytecode_size
         self._update_continue_jumps(start_address, for_increment)
 
         if is_neo_iterator:
@@ -713,6 +754,53 @@ class CodeGenerator:
 
         return test_address
 
+    def convert_begin_range_for(self) -> int:
+        """
+        Converts the beginning of a for statement that iterates over a range, without creating the range's values.
+        The loop limit and the first value must be on the top of the stack, with the first value on the top
+
+        :return: the address of the for first opcode
+        """
+        address = self.convert_begin_while(True)
+        self.duplicate_stack_top_item()     # the current value is the counter
+        return address
+
+    def convert_end_range_for(self, start_address: int, step: int, is_inclusive: bool = False) -> int:
+        """
+        Converts the end of a for statement that iterates over a range
+
+        :param start_address: the address of the for first opcode
+        :param step: the value added to the counter after each iteration
+        :param is_inclusive: whether the loop limit is the last value of the counter or the first value out of the range
+        :return: the address of the loop condition
+        """
+        for_increment = self.bytecode_size
+        if step == 1:
+            self.__insert1(OpcodeInfo.INC)      # counter += 1
+        elif step == -1:
+            self.__insert1(OpcodeInfo.DEC)      # counter -= 1
+        else:
+            self.convert_literal(step)
+            self.convert_operation(BinaryOp.Add)
+        if len(self._stack) < 1 or self._stack[-1] is not Type.int:
+            self._stack_append(Type.int)
+
+        test_address = self._vm_code_mapping.bytecode_size
+        self._update_continue_jumps(start_address, for_increment)
+
+        self.duplicate_stack_item(2)    # dup limit and counter
+        self.duplicate_stack_item(2)
+        if step > 0:
+            # continue loop condition: counter < limit
+            self.convert_operation(BinaryOp.GtE if is_inclusive else BinaryOp.Gt)
+        else:
+            # continue loop condition: counter > limit
+            self.convert_operation(BinaryOp.LtE if is_inclusive else BinaryOp.Lt)
+
+        self.convert_end_loop(start_address, test_address, True)
+
+        return test_address
+
     def convert_end_loop(self, start_address: int, test_address: int, is_for: bool, is_internal: bool = False) -> int:
         """
         Converts the end of a loop statement
@@ -727,9 +815,9 @@ class CodeGenerator:
         self._update_continue_jumps(start_address, test_address)
 
         # inserts end jmp
-        while_begin: VMCode = VMCodeMapping.instance().code_map[start_address]
-        while_body: int = VMCodeMapping.instance().get_end_address(while_begin) + 1
-        end_jmp_to: int = while_body - VMCodeMapping.instance().bytecode_size
+        while_begin: VMCode = self._vm_code_mapping.get_code(start_address)
+        while_body: int = self._vm_code_mapping.get_end_address(while_begin) + 1
+        end_jmp_to: int = while_body - self._vm_code_mapping.bytecode_size
         self._insert_jump(OpcodeInfo.JMPIF, end_jmp_to)
 
         self._current_loop.pop()
@@ -783,7 +871,7 @@ class CodeGenerator:
                     # if len is less than 2, it means it has no breaks or the only break is else branch begin
                     # so it can remove the jump in the beginning of else branch
                     self._opcodes_to_remove.extend(is_loop_insertions)
-                self._update_jump(else_begin, VMCodeMapping.instance().bytecode_size)
+                self._update_jump(else_begin, self._vm_code_mapping.bytecode_size)
 
     def convert_begin_if(self) -> int:
         """
@@ -793,7 +881,7 @@ class CodeGenerator:
         """
         # it will be updated when the if ends
         self._insert_jump(OpcodeInfo.JMPIFNOT)
-        return VMCodeMapping.instance().get_start_address(self.last_code)
+        return self._vm_code_mapping.get_start_address(self.last_code)
 
     def convert_begin_else(self, start_address: int, insert_jump: bool = False, is_internal: bool = False) -> int:
         """
@@ -807,7 +895,7 @@ class CodeGenerator:
         self._insert_jump(OpcodeInfo.JMP, insert_jump=insert_jump)
 
         # updates the begin jmp with the target address
-        self._update_jump(start_address, VMCodeMapping.instance().bytecode_size)
+        self._update_jump(start_address, self._vm_code_mapping.bytecode_size)
         if is_internal:
             self._stack_states.restore_state(start_address + 1)
 
@@ -820,10 +908,107 @@ class CodeGenerator:
         :param start_address: the address of the if first opcode
         """
         # updates the begin jmp with the target address
-        self._update_jump(start_address, VMCodeMapping.instance().bytecode_size)
+        self._update_jump(start_address, self._vm_code_mapping.bytecode_size)
         if is_internal:
             self._stack_states.restore_state(start_address)
 
+    def convert_constant_dispatch(self, values: list[Any]) -> tuple[list[int], list[int]]:
+        """
+        Converts the jumps to the cases of a match or an if-elif chain that compares a value with distinct constants.
+        The value must be on the top of the stack and it stays there when any of the jumps is taken.
+
+        Int values are searched with a balanced comparison tree and the other values are compared one by one.
+
+        :param values: the constants of each case
+        :return: the addresses of the jump to each case and the addresses of the jumps to the default case
+        """
+        case_jumps: list[int] = [0] * len(values)
+        default_jumps: list[int] = []
+
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            sorted_cases = sorted(range(len(values)), key=lambda case: values[case])
+            self._convert_int_dispatch_tree([(values[case], case) for case in sorted_cases],
+                                            case_jumps, default_jumps)
+        else:
+            for case, value in enumerate(values):
+                self.duplicate_stack_top_item()
+                self.convert_literal(value)
+                self.__insert1(OpcodeInfo.EQUAL)
+                self._stack_pop()
+                self._stack_pop()
+                self._stack_append(Type.bool)
+                self._insert_jump(OpcodeInfo.JMPIF)
+                case_jumps[case] = self.last_code_start_address
+
+            self._insert_jump(OpcodeInfo.JMP, insert_jump=True)
+            default_jumps.append(self.last_code_start_address)
+
+        # the value is removed in the beginning of each case
+        self._stack_pop()
+        return case_jumps, default_jumps
+
+    def _convert_int_dispatch_tree(self, cases: list[tuple[int, int]], case_jumps: list[int], default_jumps: list[int]):
+        """
+        Converts a balanced comparison tree of int constants
+
+        :param cases: the constants sorted by value and the index of their cases
+        """
+        if len(cases) <= _DISPATCH_LINEAR_SEARCH_SIZE:
+            for value, case in cases:
+                self.duplicate_stack_top_item()
+                self.convert_literal(value)
+                self._insert_jump(OpcodeInfo.JMPEQ)
+                case_jumps[case] = self.last_code_start_address
+
+            self._insert_jump(OpcodeInfo.JMP, insert_jump=True)
+            default_jumps.append(self.last_code_start_address)
+            return
+
+        middle = len(cases) // 2
+        self.duplicate_stack_top_item()
+        self.convert_literal(cases[middle][0])
+        self._insert_jump(OpcodeInfo.JMPLT)     # if value < middle value, search in the lower half
+        lower_half_jump = self.last_code_start_address
+
+        self._convert_int_dispatch_tree(cases[middle:], case_jumps, default_jumps)
+        self._update_jump(lower_half_jump, self._vm_code_mapping.bytecode_size)
+        self._convert_int_dispatch_tree(cases[:middle], case_jumps, default_jumps)
+
+    def convert_begin_dispatch_case(self, jump_addresses: list[int], subject_type: IType):
+        """
+        Converts the beginning of a case of a constant dispatch
+
+        :param jump_addresses: the addresses of the jumps to the case
+        :param subject_type: the type of the value compared with the constants
+        """
+        for address in jump_addresses:
+            self._update_jump(address, self._vm_code_mapping.bytecode_size)
+
+        self._stack_append(subject_type)
+        self.remove_stack_top_item()
+
+    def convert_end_dispatch_case(self, ends_with_return: bool) -> int | None:
+        """
+        Converts the end of a case of a constant dispatch
+
+        :param ends_with_return: whether the last statement of the case always leaves the method
+        :return: the address of the jump to the end of the dispatch. None if there is no jump
+        """
+        if ends_with_return and self.last_code.opcode is Opcode.RET:
+            return None
+
+        self._insert_jump(OpcodeInfo.JMP, insert_jump=True)
+        return self.last_code_start_address
+
+    def convert_end_dispatch(self, jump_addresses: list[int]):
+        """
+        Converts the end of a constant dispatch
+
+        :param jump_addresses: the addresses of the jumps in the end of each case
+        """
+        for address in jump_addresses:
+            self._update_jump(address, self._vm_code_mapping.bytecode_size)
+
     def convert_begin_try(self) -> int:
         """
         Converts the beginning of the try statement
@@ -866,7 +1051,7 @@ class CodeGenerator:
         """
         self.__insert1(OpcodeInfo.ENDTRY)
         if end_address is not None:
-            vmcode_mapping_instance = VMCodeMapping.instance()
+            vmcode_mapping_instance = self._vm_code_mapping
 
             try_vm_code = vmcode_mapping_instance.get_code(start_address)
             try_jump = vmcode_mapping_instance.get_code(end_address)
@@ -891,7 +1076,7 @@ class CodeGenerator:
         """
         if has_try_body:
             self.__insert1(OpcodeInfo.ENDFINALLY)
-            vmcode_mapping_instance = VMCodeMapping.instance()
+            vmcode_mapping_instance = self._vm_code_mapping
 
             try_vm_code = vmcode_mapping_instance.get_code(start_address)
             try_last_code = vmcode_mapping_instance.get_code(last_address)
@@ -903,20 +1088,20 @@ class CodeGenerator:
                 try_vm_code.set_finally_code(finally_start_code)
             self._update_jump(vmcode_mapping_instance.bytecode_size, self.last_code_start_address)
 
-        self._update_jump(last_address, VMCodeMapping.instance().bytecode_size)
+        self._update_jump(last_address, self._vm_code_mapping.bytecode_size)
 
     def fix_negative_index(self, value_index: int = None, test_is_negative=True):
         self._can_append_target = not self._can_append_target
 
         value_code = self.last_code_start_address
-        size = VMCodeMapping.instance().bytecode_size
+        size = self._vm_code_mapping.bytecode_size
 
         if test_is_negative:
             self.duplicate_stack_top_item()
             self.__insert1(OpcodeInfo.SIGN)
             self.convert_literal(-1)
 
-            jmp_address = VMCodeMapping.instance().bytecode_size
+            jmp_address = self._vm_code_mapping.bytecode_size
             self._insert_jump(OpcodeInfo.JMPNE)     # if index < 0
 
         state = self._stack_states.get_state(value_index) if isinstance(value_index, int) else self._stack
@@ -938,37 +1123,44 @@ class CodeGenerator:
 
         if test_is_negative:
             if not isinstance(value_index, int):
-                value_index = VMCodeMapping.instance().bytecode_size
-            jmp_target = value_index if value_index < size else VMCodeMapping.instance().bytecode_size
+                value_index = self._vm_code_mapping.bytecode_size
+            jmp_target = value_index if value_index < size else self._vm_code_mapping.bytecode_size
             self._update_jump(jmp_address, jmp_target)
 
-            VMCodeMapping.instance().move_to_end(value_index, value_code)
+            self._vm_code_mapping.move_to_end(value_index, value_code)
 
         self._can_append_target = not self._can_append_target
 
-    def fix_index_out_of_range(self, has_another_index_in_stack: bool):
+    def fix_index_out_of_range(self, has_another_index_in_stack: bool,
+                               test_is_negative: bool = True, test_is_too_big: bool = True):
         """
         Will fix a negative index to 0 or an index greater than the sequence length to the length.
 
         For example: [0, 1, 2][-999:999] is the same as [0, 1, 2][0:3]
 
         :param has_another_index_in_stack: whether the stack is [..., Sequence, index, index] or [..., Sequence, index].
+        :param test_is_negative: whether the index may be negative
+        :param test_is_too_big: whether the index may be greater than the sequence length
         """
-        # if index is still negative, then it should be 0
-        self.duplicate_stack_item(2 if has_another_index_in_stack else 1)
-        self.__insert1(OpcodeInfo.SIGN)
-        self.convert_literal(-1)
-        jmp_address = VMCodeMapping.instance().bytecode_size
-        self._insert_jump(OpcodeInfo.JMPNE)  # if index < 0, then index = 0
+        if test_is_negative:
+            # if index is still negative, then it should be 0
+            self.duplicate_stack_item(2 if has_another_index_in_stack else 1)
+            self.__insert1(OpcodeInfo.SIGN)
+            self.convert_literal(-1)
+            jmp_address = self._vm_code_mapping.bytecode_size
+            self._insert_jump(OpcodeInfo.JMPNE)  # if index < 0, then index = 0
 
-        if has_another_index_in_stack:
-            self.swap_reverse_stack_items(2)
-        self.remove_stack_top_item()
-        self.convert_literal(0)
-        if has_another_index_in_stack:
-            self.swap_reverse_stack_items(2)
-        jmp_target = VMCodeMapping.instance().bytecode_size
-        self._update_jump(jmp_address, jmp_target)
+            if has_another_index_in_stack:
+                self.swap_reverse_stack_items(2)
+            self.remove_stack_top_item()
+            self.convert_literal(0)
+            if has_another_index_in_stack:
+                self.swap_reverse_stack_items(2)
+            jmp_target = self._vm_code_mapping.bytecode_size
+            self._update_jump(jmp_address, jmp_target)
+
+        if not test_is_too_big:
+            return
 
         # index can not be greater than len(string)
         self.duplicate_stack_item(3 if has_another_index_in_stack else 2)
@@ -1024,7 +1216,7 @@ class CodeGenerator:
         elif break_address not in self._jumps_to_loop_break[loop_start]:
             self._jumps_to_loop_break[loop_start].append(break_address)
 
-        is_break_instructions = VMCodeMapping.instance().get_addresses(is_break_start, is_break_end)
+        is_break_instructions = self._vm_code_mapping.get_addresses(is_break_start, is_break_end)
 
         if loop_start not in self._inserted_loop_breaks:
             self._inserted_loop_breaks[loop_start] = is_break_instructions
@@ -1036,7 +1228,7 @@ class CodeGenerator:
                     loop_breaks_list.append(address)
 
     def _update_break_jumps(self, loop_start_address) -> int:
-        jump_target = VMCodeMapping.instance().bytecode_size
+        jump_target = self._vm_code_mapping.bytecode_size
 
         if loop_start_address in self._jumps_to_loop_break:
             jump_addresses = self._jumps_to_loop_break.pop(loop_start_address)
@@ -1050,7 +1242,7 @@ class CodeGenerator:
         :param value: the value to be converted
         :return: the converted value's start address in the bytecode
         """
-        start_address = VMCodeMapping.instance().bytecode_size
+        start_address = self._vm_code_mapping.bytecode_size
         if isinstance(value, bool):
             self.convert_bool_literal(value)
         elif isinstance(value, int):
@@ -1139,13 +1331,14 @@ class CodeGenerator:
         :param dictionary: the value to be converted
         """
         value_type = Type.dict.build(dictionary)
-        self.convert_new_map(value_type)
 
-        for key, value in dictionary.items():
-            self.duplicate_stack_top_item()
+        # the items are packed in a single instruction, so they are pushed in reverse order
+        # the evaluation order doesn't change the result, since they are all literal values
+        for key, value in reversed(dictionary.items()):
+            self.convert_literal(value)
             self.convert_literal(key)
-            value_start = self.convert_literal(value)
-            self.convert_set_item(value_start)
+
+        self.convert_new_map(value_type, len(dictionary))
 
     def convert_byte_array(self, array: bytes):
         """
@@ -1199,13 +1392,22 @@ class CodeGenerator:
             self._stack_pop()
             self._stack_append(value_type)
 
-    def convert_new_map(self, map_type: IType):
+    def convert_new_map(self, map_type: IType, length: int = 0):
         """
         Converts the creation of a new map
 
         :param map_type: the Neo Boa type of the map
+        :param length: the number of key-value pairs in the stack that are included in the new map. The key of the
+                       first item must be on the top of the stack, followed by its value
         """
-        self.__insert1(OpcodeInfo.NEWMAP)
+        if length <= 0:
+            self.__insert1(OpcodeInfo.NEWMAP)
+        else:
+            self.convert_literal(length)
+            self.__insert1(OpcodeInfo.PACKMAP)
+            self._stack_pop()  # map size
+            for x in range(length * 2):
+                self._stack_pop()
         self._stack_append(map_type)
 
     def convert_new_empty_array(self, length: int, array_type: IType, *, as_struct: bool = False):
@@ -1252,13 +1454,15 @@ class CodeGenerator:
         if index_type is Type.int and check_for_negative_index:
             self.fix_negative_index(value_start_address)
 
-    def convert_set_item(self, value_start_address: int, index_inserted_internally: bool = False):
+    def convert_set_item(self, value_start_address: int, index_inserted_internally: bool = False,
+                         index_is_positive: bool = False):
         """
         Converts the end of setting af a value in an array
         """
         item_type: IType = self._stack[-3]  # top: index, 2nd-to-top: value, 3nd-to-top: array or map
         if item_type.stack_item is not StackItemType.Map:
-            self._set_array_item(value_start_address, check_for_negative_index=not index_inserted_internally)
+            self._set_array_item(value_start_address,
+                                 check_for_negative_index=not (index_inserted_internally or index_is_positive))
 
         self.__insert1(OpcodeInfo.SETITEM)
         self._stack_pop()  # value
@@ -1342,7 +1546,7 @@ class CodeGenerator:
 
         self.__insert1(OpcodeInfo.INC)              # index += 1
 
-        condition_address = VMCodeMapping.instance().bytecode_size
+        condition_address = self._vm_code_mapping.bytecode_size
         self.duplicate_stack_top_item()         # end while index < slice_end
         self.duplicate_stack_item(4)
         self.convert_operation(BinaryOp.Lt)
@@ -1452,7 +1656,7 @@ class CodeGenerator:
             self.swap_reverse_stack_items(2)
             self.convert_operation(BinaryOp.Concat)             # string = string + array[index]
 
-            condition_address = VMCodeMapping.instance().bytecode_size
+            condition_address = self._vm_code_mapping.bytecode_size
             self.swap_reverse_stack_items(2)
             self.__insert1(OpcodeInfo.DEC)                      # index--
             self.swap_reverse_stack_items(2)
@@ -1468,6 +1672,18 @@ class CodeGenerator:
             self.remove_stack_top_item()
 
     def convert_get_substring_stride(self):
+        str_type = self._stack[-2]
+        method_id = '-substring_stride_{0}'.format(str_type.identifier)
+        if method_id not in self._shared_methods:
+            self._include_shared_method(method_id, Method(return_type=str_type),
+                                        self._generate_substring_stride, num_args=2)
+
+        self._convert_shared_method_call(method_id)
+        self._stack_pop()  # stride
+        self._stack_pop()  # string
+        self._stack_append(str_type)
+
+    def _generate_substring_stride(self):
         # initializing auxiliary variables
         self.duplicate_stack_item(2)
         self.convert_builtin_method_call(Builtin.Len)
@@ -1502,7 +1718,7 @@ class CodeGenerator:
         self.swap_reverse_stack_items(2)
 
         # verifying if it should still be in the while
-        condition_address = VMCodeMapping.instance().bytecode_size
+        condition_address = self._vm_code_mapping.bytecode_size
         self.duplicate_stack_item(2)
         self.duplicate_stack_item(4)
         self.convert_operation(BinaryOp.Lt)             # stop the loop when index >= len(str)
@@ -1517,6 +1733,18 @@ class CodeGenerator:
         self.remove_stack_top_item()
 
     def convert_get_array_stride(self):
+        array_type = self._stack[-2]
+        method_id = '-array_stride'
+        if method_id not in self._shared_methods:
+            self._include_shared_method(method_id, Method(return_type=array_type),
+                                        self._generate_array_stride, num_args=2)
+
+        self._convert_shared_method_call(method_id)
+        self._stack_pop()  # stride
+        self._stack_pop()  # array
+        self._stack_append(array_type)
+
+    def _generate_array_stride(self):
         # initializing auxiliary variable
         self.duplicate_stack_item(2)
         self.convert_builtin_method_call(Builtin.Len)
@@ -1544,7 +1772,7 @@ class CodeGenerator:
         self.__insert1(OpcodeInfo.DEC)
 
         # verifying if it should still be in the while
-        condition_address = VMCodeMapping.instance().bytecode_size
+        condition_address = self._vm_code_mapping.bytecode_size
         self.duplicate_stack_top_item()
         self.__insert1(OpcodeInfo.SIGN)
         self.convert_literal(-1)
@@ -1717,9 +1945,12 @@ class CodeGenerator:
             self.convert_builtin_method_call(Interop.Serialize, addresses)
 
         self.convert_literal(storage_key)
-        self.convert_builtin_method_call(Interop.StorageGetContext)
 
-        builtin_method = Interop.StorageGet if is_get else Interop.StoragePut
+        # the variables are in the contract's own storage, so it can use the syscalls that don't need the context
+        if is_get:
+            builtin_method = Interop.StorageGet.build([Type.bytes])
+        else:
+            builtin_method = Interop.StoragePut.build([Type.bytes, Type.bytes])
         self.convert_builtin_method_call(builtin_method)
 
         if is_get:
@@ -1778,7 +2009,7 @@ class CodeGenerator:
 
         if function.stores_on_slot and 0 < len(function.args) <= len(args_address):
             address = args_address[-len(function.args)]
-            load_instr = VMCodeMapping.instance().code_map[address]
+            load_instr = self._vm_code_mapping.get_code(address)
             if OpcodeHelper.is_load_slot(load_instr.opcode):
                 store: Opcode = OpcodeHelper.get_store_from_load(load_instr.opcode)
                 store_opcode = OpcodeInfo.get_info(store)
@@ -1805,7 +2036,7 @@ class CodeGenerator:
             self._update_codes_without_target_to_next(self.last_code_start_address)
             jump = self.last_code_start_address
             self.__insert1(store_opcode, store_data)
-            self._update_jump(jump, VMCodeMapping.instance().bytecode_size)
+            self._update_jump(jump, self._vm_code_mapping.bytecode_size)
 
     def _convert_builtin_call(self, builtin: IBuiltinCallable, previous_stack_size: int = None, is_internal: bool = False):
         if not isinstance(previous_stack_size, int):
@@ -1814,7 +2045,9 @@ class CodeGenerator:
             previous_stack_size = 0
 
         size_before_generating = self.bytecode_size
-        if is_internal:
+        if isinstance(builtin, IBuiltinMethod) and builtin.is_shared:
+            self._convert_shared_builtin_call(builtin)
+        elif is_internal:
             builtin.generate_internal_opcodes(self)
         else:
             builtin.generate_opcodes(self)
@@ -1835,6 +2068,71 @@ class CodeGenerator:
         if builtin.return_type not in (None, Type.none):
             self._stack_append(builtin.return_type)
 
+    def _convert_shared_builtin_call(self, builtin: IBuiltinMethod):
+        """
+        Converts the call to the internal method of a shared builtin. The method is generated after the user's code.
+
+        :param builtin: the builtin to be called
+        """
+        method_id = builtin.shared_method_id
+        if method_id not in self._shared_methods:
+            method = builtin.build_shared_method()
+            if method.external_name is None:
+                # the optimizer names the method and its inlined variables after the builtin
+                method.external_name = builtin.identifier
+            self._include_shared_method(method_id, method,
+                                        functools.partial(builtin.generate_internal_opcodes, self),
+                                        builtin.args_on_stack)
+
+        self._convert_shared_method_call(method_id)
+
+    def _include_shared_method(self, method_id: str, method: Method, generate: Callable[[], None], num_args: int):
+        """
+        Includes a method that is generated only once, after the user's code
+
+        :param method_id: the identifier of the method
+        :param method: the method that is called
+        :param generate: the function that generates the method body
+        :param num_args: the number of values on the stack used by the method
+        """
+        self._shared_methods[method_id] = method, generate
+        if len(method.args) == 0:
+            # the arguments are kept on the stack
+            self._shared_methods_args[method] = list(self._stack)[-num_args:] if num_args > 0 else []
+
+    def _convert_shared_method_call(self, method_id: str):
+        from boa3.internal.neo.vm.CallCode import CallCode
+
+        method, generate = self._shared_methods[method_id]
+        call_code = CallCode(method)
+        self.__insert_code(call_code)
+        self._update_codes_with_target(call_code)
+
+    def convert_shared_methods(self):
+        """
+        Converts the internal methods that are shared by every call of the same builtin
+        """
+        pending = [method_id for method_id in self._shared_methods
+                   if method_id not in self._generated_shared_methods]
+
+        while len(pending) > 0:
+            for method_id in pending:
+                method, generate = self._shared_methods[method_id]
+                self._generated_shared_methods.add(method_id)
+
+                self.convert_begin_method(method)
+                for arg_type in self._shared_methods_args.get(method, []):
+                    self._stack_append(arg_type)
+                generate()
+                self.convert_end_method()
+
+                # the optimizer must know the method to find which instructions belong to it
+                self.symbol_table['-shared_{0}'.format(method_id)] = method
+
+            # the generated methods may use other shared methods
+            pending = [method_id for method_id in self._shared_methods
+                       if method_id not in self._generated_shared_methods]
+
     def convert_method_call(self, function: Method, num_args: int):
         """
         Converts a method function call
@@ -1863,7 +2161,28 @@ class CodeGenerator:
                                    None)
             self._add_to_metadata_permissions(function.origin_class, function_id)
 
-            if isinstance(function_id, str):
+            method_token_id = None
+            # a method token must say if the called method returns a value, and the call fails if it doesn't match the
+            # called method. If it may return anything, it's called with System.Contract.Call, that accepts both
+            if isinstance(function_id, str) and function.return_type is not Type.any:
+                method_token_id = self._vm_code_mapping.add_contract_method_token(
+                    function.origin_class.contract_hash,
+                    function_id,
+                    len(function.args),
+                    function.return_type is not Type.none,
+                    Interop.CallFlagsType.default_value
+                )
+
+            if isinstance(method_token_id, int):
+                # the hash, the name and the number of arguments of the called method are known, so it's called by a
+                # method token instead of packing the arguments to call System.Contract.Call
+                self.convert_method_token_call(method_token_id)
+                for arg in range(len(function.args)):
+                    self._stack_pop()
+                if function.return_type is not Type.none:
+                    self._stack_append(function.return_type)
+
+            elif isinstance(function_id, str):
                 self.convert_new_array(len(function.args))
                 self.convert_literal(Interop.CallFlagsType.default_value)
                 self.convert_literal(function_id)
@@ -1891,7 +2210,7 @@ class CodeGenerator:
         Converts a method token call
         """
         if method_token_id >= 0:
-            method_token = VMCodeMapping.instance().get_method_token(method_token_id)
+            method_token = self._vm_code_mapping.get_method_token(method_token_id)
             if method_token is not None:
                 opcode_info = OpcodeInfo.CALLT
                 self.__insert1(opcode_info, Integer(method_token_id).to_byte_array(min_length=opcode_info.data_len))
@@ -2019,10 +2338,10 @@ class CodeGenerator:
             if has_message:
                 self.swap_reverse_stack_items(2)
 
-            len_pos = VMCodeMapping.instance().bytecode_size
+            len_pos = self._vm_code_mapping.bytecode_size
             # if the value is an array, a map or a struct, asserts it is not empty
             self.convert_builtin_method_call(Builtin.Len)
-            len_code = VMCodeMapping.instance().code_map[len_pos]
+            len_code = self._vm_code_mapping.get_code(len_pos)
 
             if asserted_type is Type.any:
                 # need to check in runtime
@@ -2038,7 +2357,7 @@ class CodeGenerator:
                 self.insert_type_check(StackItemType.Struct)
                 self._insert_jump(OpcodeInfo.JMPIFNOT, 2)
 
-                VMCodeMapping.instance().move_to_end(len_pos, len_pos)
+                self._vm_code_mapping.move_to_end(len_pos, len_pos)
             if has_message:
                 self.swap_reverse_stack_items(2)
 
@@ -2123,11 +2442,11 @@ class CodeGenerator:
         if OpcodeHelper.has_target(op_info.opcode):
             data = vm_code.raw_data
             relative_address: int = Integer.from_bytes(data, signed=True)
-            actual_address = VMCodeMapping.instance().bytecode_size + relative_address
+            actual_address = self._vm_code_mapping.bytecode_size + relative_address
             if (self._can_append_target
                     and relative_address != 0
-                    and actual_address in VMCodeMapping.instance().code_map):
-                vm_code.set_target(VMCodeMapping.instance().code_map[actual_address])
+                    and self._vm_code_mapping.has_address(actual_address)):
+                vm_code.set_target(self._vm_code_mapping.get_code(actual_address))
             else:
                 self._include_missing_target(vm_code, actual_address)
 
@@ -2140,7 +2459,7 @@ class CodeGenerator:
 
         :param vm_code: the opcode that will be inserted
         """
-        VMCodeMapping.instance().insert_code(vm_code)
+        self._vm_code_mapping.insert_code(vm_code)
 
     def _include_missing_target(self, vmcode: VMCode, target_address: int = 0):
         """
@@ -2151,7 +2470,7 @@ class CodeGenerator:
         :return:
         """
         if OpcodeHelper.has_target(vmcode.opcode):
-            if target_address == VMCodeMapping.instance().bytecode_size:
+            if target_address == self._vm_code_mapping.bytecode_size:
                 target_address = None
             else:
                 self._remove_missing_target(vmcode)
@@ -2180,7 +2499,7 @@ class CodeGenerator:
         """
         Verifies if there are any instructions targeting positions not included yet.
         """
-        instance = VMCodeMapping.instance()
+        instance = self._vm_code_mapping
         current_bytecode_size = instance.bytecode_size
         for target_address, codes in list(self._missing_target.items()):
             if target_address is not None and target_address >= current_bytecode_size:
@@ -2189,7 +2508,7 @@ class CodeGenerator:
         if None in self._missing_target:
             for code in self._missing_target[None]:
                 if OpcodeHelper.is_jump(code.info.opcode) and code.target is None:
-                    target = Integer.from_bytes(code.raw_data) + VMCodeMapping.instance().get_start_address(code)
+                    target = Integer.from_bytes(code.raw_data) + self._vm_code_mapping.get_start_address(code)
                     if target >= current_bytecode_size:
                         return True
         return False
@@ -2200,7 +2519,7 @@ class CodeGenerator:
 
         :param vm_code: targeted instruction
         """
-        instance = VMCodeMapping.instance()
+        instance = self._vm_code_mapping
         vm_code_start_address = instance.get_start_address(vm_code)
         for target_address, codes in list(self._missing_target.items()):
             if target_address is not None and target_address <= vm_code_start_address:
@@ -2212,7 +2531,7 @@ class CodeGenerator:
         if address is None:
             address = self.bytecode_size
 
-        instance = VMCodeMapping.instance()
+        instance = self._vm_code_mapping
         vm_code = instance.get_code(address)
         if vm_code is None:
             return
@@ -2239,14 +2558,14 @@ class CodeGenerator:
             if target is None:
                 for code in vmcodes.copy():
                     relative_address: int = Integer.from_bytes(code.raw_data, signed=True)
-                    code_address: int = VMCodeMapping.instance().get_start_address(code)
+                    code_address: int = self._vm_code_mapping.get_start_address(code)
                     absolute_address = code_address + relative_address
-                    code.set_target(VMCodeMapping.instance().get_code(absolute_address))
+                    code.set_target(self._vm_code_mapping.get_code(absolute_address))
 
                     vmcodes.remove(code)
             else:
                 for code in vmcodes.copy():
-                    code.set_target(VMCodeMapping.instance().get_code(target))
+                    code.set_target(self._vm_code_mapping.get_code(target))
                     vmcodes.remove(code)
 
             if len(vmcodes) == 0:
@@ -2261,7 +2580,7 @@ class CodeGenerator:
         :param insert_jump: whether it should be included a jump to the end before the else branch
         """
         if isinstance(jump_to, VMCode):
-            jump_to = VMCodeMapping.instance().get_start_address(jump_to) - VMCodeMapping.instance().bytecode_size
+            jump_to = self._vm_code_mapping.get_start_address(jump_to) - self._vm_code_mapping.bytecode_size
 
         if self.last_code.opcode is not Opcode.RET or insert_jump:
             data: bytes = self._get_jump_data(op_info, jump_to)
@@ -2276,16 +2595,16 @@ class CodeGenerator:
         :param jump_address: jump code start address
         :param updated_jump_to: new data of the code
         """
-        vmcode: VMCode = VMCodeMapping.instance().get_code(jump_address)
+        vmcode: VMCode = self._vm_code_mapping.get_code(jump_address)
         if vmcode is not None:
-            if updated_jump_to in VMCodeMapping.instance().code_map:
+            if self._vm_code_mapping.has_address(updated_jump_to):
                 self._remove_missing_target(vmcode)
-                target: VMCode = VMCodeMapping.instance().get_code(updated_jump_to)
+                target: VMCode = self._vm_code_mapping.get_code(updated_jump_to)
                 vmcode.set_target(target)
             else:
                 data: bytes = self._get_jump_data(vmcode.info, updated_jump_to - jump_address)
-                VMCodeMapping.instance().update_vm_code(vmcode, vmcode.info, data)
-                if updated_jump_to not in VMCodeMapping.instance().code_map:
+                self._vm_code_mapping.update_vm_code(vmcode, vmcode.info, data)
+                if not self._vm_code_mapping.has_address(updated_jump_to):
                     self._include_missing_target(vmcode, updated_jump_to)
 
     def change_jump(self, jump_address: int, new_jump_opcode: Opcode):
@@ -2296,7 +2615,7 @@ class CodeGenerator:
         if not OpcodeHelper.is_jump(new_jump_opcode):
             return
 
-        vmcode: VMCode = VMCodeMapping.instance().get_code(jump_address)
+        vmcode: VMCode = self._vm_code_mapping.get_code(jump_address)
         if vmcode is not None and OpcodeHelper.is_jump(vmcode.opcode):
             previous_consumed_items_from_stack = vmcode.info.stack_items
             new_consumed_items_from_stack = OpcodeInfo.get_info(new_jump_opcode).stack_items
@@ -2321,8 +2640,7 @@ class CodeGenerator:
         return Integer(jump_to).to_byte_array(min_length=op_info.data_len, signed=True)
 
     def _add_to_metadata_permissions(self, contract_class: ContractInterfaceClass, method_name: str):
-        from boa3.internal.compiler.compiledmetadata import CompiledMetadata
-        CompiledMetadata.instance().add_contract_permission(contract_class.contract_hash, method_name)
+        self._context.metadata.add_contract_permission(contract_class.contract_hash, method_name)
 
     def duplicate_stack_top_item(self):
         self.duplicate_stack_item(1)
@@ -2398,9 +2716,9 @@ class CodeGenerator:
 
     def _remove_inserted_opcodes_since(self, last_address: int, last_stack_size: int | None = None):
         self._stack_states.restore_state(last_address)
-        if VMCodeMapping.instance().bytecode_size > last_address:
+        if self._vm_code_mapping.bytecode_size > last_address:
             # remove opcodes inserted during the evaluation of the symbol
-            VMCodeMapping.instance().remove_opcodes(last_address, VMCodeMapping.instance().bytecode_size)
+            self._vm_code_mapping.remove_opcodes(last_address, self._vm_code_mapping.bytecode_size)
 
         if isinstance(last_stack_size, int) and last_stack_size < self.stack_size:
             # remove any additional values pushed to the stack during the evalution of the symbol
@@ -1,22 +1,27 @@
 import ast
 import os.path
 from inspect import isclass
+from typing import Any
 
 from boa3.internal import constants
 from boa3.internal.analyser.astanalyser import IAstAnalyser
 from boa3.internal.compiler.codegenerator.codegenerator import CodeGenerator
 from boa3.internal.compiler.codegenerator.generatordata import GeneratorData
+from boa3.internal.compiler.codegenerator.loopinvariantvisitor import LoopInvariantVisitor
+from boa3.internal.compiler.codegenerator.valuerangevisitor import ValueRangeVisitor
 from boa3.internal.compiler.codegenerator.variablegenerationdata import VariableGenerationData
-from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
 from boa3.internal.model.builtin.builtin import Builtin
 from boa3.internal.model.builtin.decorator import ContractDecorator
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
 from boa3.internal.model.expression import IExpression
 from boa3.internal.model.imports.package import Package
 from boa3.internal.model.method import Method
+from boa3.internal.model.operation.binary.arithmetic.concat import Concat
 from boa3.internal.model.operation.binary.binaryoperation import BinaryOperation
+from boa3.internal.model.operation.binary.relational.numericequality import NumericEquality
 from boa3.internal.model.operation.binaryop import BinaryOp
 from boa3.internal.model.operation.operation import IOperation
+from boa3.internal.model.operation.unaryop import UnaryOp
 from boa3.internal.model.operation.unary.unaryoperation import UnaryOperation
 from boa3.internal.model.property import Property
 from boa3.internal.model.symbol import ISymbol
@@ -25,6 +30,7 @@ from boa3.internal.model.type.classes.userclass import UserClass
 from boa3.internal.model.type.collection.sequence.sequencetype import SequenceType
 from boa3.internal.model.type.type import IType, Type
 from boa3.internal.model.variable import Variable
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
 
 
 class VisitorCodeGenerator(IAstAnalyser):
@@ -48,6 +54,10 @@ class VisitorCodeGenerator(IAstAnalyser):
         self.global_stmts: list[ast.AST] = []
         self._is_generating_initialize = False
         self._root_module: ast.AST = self._tree
+        self._value_ranges: ValueRangeVisitor | None = None
+        self._loop_invariants: LoopInvariantVisitor | None = None
+        # the variables with the values of the loop invariants that were already evaluated
+        self._evaluated_invariants: set[str] = set()
 
     @property
     def _symbols(self) -> dict[str, ISymbol]:
@@ -59,8 +69,8 @@ class VisitorCodeGenerator(IAstAnalyser):
         return symbol_table
 
     def include_instruction(self, node: ast.AST, address: int):
-        if self.current_method is not None and address in VMCodeMapping.instance().code_map:
-            bytecode = VMCodeMapping.instance().code_map[address]
+        if self.current_method is not None and self.generator.vm_code_mapping.has_address(address):
+            bytecode = self.generator.vm_code_mapping.get_code(address)
             from boa3.internal.model.debuginstruction import DebugInstruction
             self.current_method.include_instruction(DebugInstruction.build(node, bytecode))
 
@@ -98,13 +108,21 @@ class VisitorCodeGenerator(IAstAnalyser):
         return result
 
     def visit(self, node: ast.AST) -> GeneratorData:
+        if self._loop_invariants is not None:
+            invariant_id = self._loop_invariants.get_invariant_variable(node)
+            if invariant_id in self._evaluated_invariants:
+                # the value was evaluated before the loop
+                self.generator.convert_load_symbol(invariant_id)
+                return self.build_data(node, result_type=self.current_method.locals[invariant_id].type,
+                                       already_generated=True)
+
         result = super().visit(node)
         if not isinstance(result, GeneratorData):
             result = self.build_data(node)
         return result
 
     def visit_to_map(self, node: ast.AST, generate: bool = False) -> GeneratorData:
-        address: int = VMCodeMapping.instance().bytecode_size
+        address: int = self.generator.vm_code_mapping.bytecode_size
         if isinstance(node, ast.Expr):
             value = self.visit_Expr(node, generate)
         elif generate:
@@ -339,12 +357,18 @@ class VisitorCodeGenerator(IAstAnalyser):
 
             if method.is_public or method.is_called:
                 if not isinstance(self.current_class, ClassType) or not self.current_class.is_interface:
+                    self._value_ranges = ValueRangeVisitor(method, function, self._symbols)
+                    if self.generator.move_loop_invariants():
+                        self._loop_invariants = LoopInvariantVisitor(method, function, self._symbols)
                     self.generator.convert_begin_method(method)
 
                     for stmt in function.body:
                         self.visit_to_map(stmt)
 
                     self.generator.convert_end_method(function.name)
+                    self._value_ranges = None
+                    self._loop_invariants = None
+                    self._evaluated_invariants.clear()
 
             self.current_method = None
 
@@ -390,11 +414,11 @@ class VisitorCodeGenerator(IAstAnalyser):
                     self.generator.convert_load_symbol(var_id)
                     self.visit_to_generate(index)
 
-                    aux_index = VMCodeMapping.instance().bytecode_size
+                    aux_index = self.generator.vm_code_mapping.bytecode_size
                     value_data = self.visit_to_generate(value)
                     value_address = value_data.index if value_data.index is not None else aux_index
 
-                    self.generator.convert_set_item(value_address)
+                    self.generator.convert_set_item(value_address, index_is_positive=self._is_non_negative(index))
 
             elif len(var_ids) > 0:
                 # it's a chained assignment
@@ -410,14 +434,14 @@ class VisitorCodeGenerator(IAstAnalyser):
                         if pos < len(var_ids) - 1:
                             self.generator.convert_load_symbol(var_id)
                             self.visit_to_generate(index)
-                            fix_index = VMCodeMapping.instance().bytecode_size
+                            fix_index = self.generator.vm_code_mapping.bytecode_size
                             self.generator.duplicate_stack_item(3)
                         else:
                             self.visit_to_generate(index)
-                            fix_index = VMCodeMapping.instance().bytecode_size
+                            fix_index = self.generator.vm_code_mapping.bytecode_size
                             self.generator.convert_load_symbol(var_id)
                             self.generator.swap_reverse_stack_items(3)
-                        self.generator.convert_set_item(fix_index)
+                        self.generator.convert_set_item(fix_index, index_is_positive=self._is_non_negative(index))
 
     def visit_AnnAssign(self, ann_assign: ast.AnnAssign) -> GeneratorData:
         """
@@ -493,7 +517,7 @@ class VisitorCodeGenerator(IAstAnalyser):
         if isinstance(var_data.type, UserClass):
             self.generator.duplicate_stack_top_item()
         elif hasattr(var_data.origin_object_type, 'identifier') and var_data.already_generated:
-            VMCodeMapping.instance().remove_opcodes(start_address)
+            self.generator.vm_code_mapping.remove_opcodes(start_address)
             self.generator.convert_load_symbol(var_data.origin_object_type.identifier)
 
         self.generator.convert_load_symbol(var_id, class_type=var_data.origin_object_type)
@@ -529,7 +553,7 @@ class VisitorCodeGenerator(IAstAnalyser):
             self.visit_to_generate(slice)
 
             index_is_constant_number = isinstance(slice, ast.Constant) and isinstance(slice.value, int)
-            self.generator.convert_get_item(index_is_positive=(index_is_constant_number and slice.value >= 0),
+            self.generator.convert_get_item(index_is_positive=self._is_non_negative(slice),
                                             test_is_negative_index=not (index_is_constant_number and slice.value < 0))
 
             value_type = value_data.type
@@ -567,21 +591,27 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         for index_number, omitted in [(subscript.slice.lower, lower_omitted), (subscript.slice.upper, upper_omitted)]:
             if not omitted:
-                addresses.append(VMCodeMapping.instance().bytecode_size)
+                addresses.append(self.generator.vm_code_mapping.bytecode_size)
                 self.visit_to_generate(index_number)
 
                 index_is_constant_number = isinstance(index_number, ast.Constant) and isinstance(index_number.value,
                                                                                                  int)
+                index_is_positive = self._is_non_negative(index_number)
                 if index_is_constant_number and index_number.value < 0:
                     self.generator.fix_negative_index(test_is_negative=False)
-                elif not index_is_constant_number:
+                elif not index_is_constant_number and not index_is_positive:
                     self.generator.fix_negative_index()
 
                 if step_negative:
                     self.generator.duplicate_stack_item(len(addresses) + 1)  # duplicates the subscript
                     self.generator.fix_index_negative_stride()
-
-                self.generator.fix_index_out_of_range(has_another_index_in_stack=len(addresses) == 2)
+                    self.generator.fix_index_out_of_range(has_another_index_in_stack=len(addresses) == 2)
+                else:
+                    is_within_length = (self._value_ranges is not None
+                                        and self._value_ranges.is_within_length(index_number, subscript.value))
+                    self.generator.fix_index_out_of_range(has_another_index_in_stack=len(addresses) == 2,
+                                                          test_is_negative=not index_is_positive,
+                                                          test_is_too_big=not is_within_length)
 
         # if both are explicit
         if not lower_omitted and not upper_omitted:
@@ -619,11 +649,76 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         :param bin_op: the python ast binary operation node
         """
-        if isinstance(bin_op.op, BinaryOperation):
+        if isinstance(bin_op.op, Concat):
+            self._convert_concat(self._get_concat_operands(bin_op, bin_op.op), bin_op.op)
+        elif isinstance(bin_op.op, BinaryOperation):
             self._convert_binary_operation(bin_op.left, bin_op.right, bin_op.op)
 
         return self.build_data(bin_op)
 
+    def _get_concat_operands(self, node: ast.AST, operation: Concat) -> list[ast.AST]:
+        """
+        Gets the operands of a chain of concatenations, like `a + b + c`, including the parts of the f-strings in it
+        """
+        if isinstance(node, ast.BinOp) and isinstance(node.op, Concat) and node.op.result == operation.result:
+            # the concatenation is associative, so the order of the operations doesn't change the result
+            return (self._get_concat_operands(node.left, operation)
+                    + self._get_concat_operands(node.right, operation))
+
+        if isinstance(node, ast.JoinedStr) and operation.result is Type.str:
+            return list(node.values)
+
+        return [node]
+
+    def _convert_concat(self, operands: list[ast.AST], operation: Concat):
+        """
+        Converts a chain of concatenations, joining the adjacent literals during the compilation
+
+        The result is converted to its type only after the last concatenation, instead of after each one of them
+        """
+        parts: list[ast.AST | str | bytes] = []
+        for operand in operands:
+            value = self._get_concat_literal(operand)
+            if value is None:
+                parts.append(operand)
+            elif len(parts) > 0 and type(parts[-1]) is type(value):
+                parts[-1] += value
+            else:
+                parts.append(value)
+
+        if len(parts) == 0:
+            # it's an empty f-string
+            parts.append('')
+
+        for index, part in enumerate(parts):
+            if isinstance(part, ast.AST):
+                self.visit_to_generate(part)
+            else:
+                self.generator.convert_literal(part)
+
+            if index > 0:
+                self.generator.convert_operation(operation, is_internal=index < len(parts) - 1)
+
+    @staticmethod
+    def _get_concat_literal(node: ast.AST) -> str | bytes | None:
+        """
+        Gets the value of a part of a concatenation that is known during the compilation
+
+        :return: None if the value is only known when the code runs
+        """
+        if isinstance(node, ast.FormattedValue):
+            if node.conversion != -1 or node.format_spec is not None:
+                return None
+            node = node.value
+            if isinstance(node, ast.Constant) and isinstance(node.value, (bool, int, str)):
+                # the same string that the conversion of the value would return
+                return str(node.value)
+            return None
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (str, bytes)):
+            return node.value
+        return None
+
     def visit_UnaryOp(self, un_op: ast.UnaryOp) -> GeneratorData:
         """
         Visitor of a binary operation node
@@ -686,11 +781,12 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         :param while_node: the python ast while statement node
         """
+        self._convert_loop_invariants(while_node)
         start_addr: int = self.generator.convert_begin_while()
         for stmt in while_node.body:
             self.visit_to_map(stmt, generate=True)
 
-        test_address: int = VMCodeMapping.instance().bytecode_size
+        test_address: int = self.generator.vm_code_mapping.bytecode_size
         test_data = self.visit_to_map(while_node.test, generate=True)
         self.generator.convert_end_while(start_addr, test_address)
 
@@ -701,7 +797,24 @@ class VisitorCodeGenerator(IAstAnalyser):
         self.generator.convert_end_loop_else(start_addr, else_begin_address, len(while_node.orelse) > 0)
         return self.build_data(while_node, index=start_addr)
 
+    def _convert_loop_invariants(self, loop: ast.For | ast.While):
+        """
+        Evaluates the expressions that have the same value in every iteration of the loop before it starts
+        """
+        if self._loop_invariants is None:
+            return
+
+        for var_id, expression in self._loop_invariants.get_loop_invariants(loop):
+            self.visit_to_generate(expression)
+            self.generator.convert_store_variable(var_id)
+            self._evaluated_invariants.add(var_id)
+
     def visit_Match(self, match_node: ast.Match) -> GeneratorData:
+        dispatch = self._get_match_dispatch(match_node)
+        if dispatch is not None:
+            self._convert_constant_dispatch(match_node.subject, *dispatch)
+            return self.build_data(match_node)
+
         case_addresses = []
 
         for index, case in enumerate(match_node.cases):
@@ -717,15 +830,9 @@ class VisitorCodeGenerator(IAstAnalyser):
                     pattern_type = self.get_type(case.pattern.value)
                 elif isinstance(case.pattern, ast.MatchMapping):
                     pattern_type = Type.dict
-
-                    self.generator.convert_new_map(pattern_type)
-
-                    for map_index in range(len(case.pattern.keys)):
-                        start_address = VMCodeMapping.instance().bytecode_size
-                        self.generator.duplicate_stack_top_item()
-                        self.visit_to_generate(case.pattern.keys[map_index])
-                        self.visit_to_generate(case.pattern.patterns[map_index].value)
-                        self.generator.convert_set_item(start_address)
+                    self._create_map(case.pattern.keys,
+                                     [pattern.value for pattern in case.pattern.patterns],
+                                     pattern_type)
                 else:
                     pattern = self.visit_to_generate(case.pattern.value)
                     pattern_type = pattern.type
@@ -761,14 +868,152 @@ class VisitorCodeGenerator(IAstAnalyser):
 
         return self.build_data(match_node)
 
+    def _get_match_dispatch(self,
+                            match_node: ast.Match) -> tuple[list[tuple[Any, list[ast.AST]]], list[ast.AST]] | None:
+        """
+        Gets the cases of a match statement that compares a variable only with constants of the variable type
+
+        :return: the constant and the body of each case and the body of the default case. None if any of the patterns
+                 isn't a constant
+        """
+        subject_type = self._get_dispatch_subject_type(match_node.subject)
+        if subject_type is None:
+            return None
+
+        cases = []
+        default_body = []
+        for case in match_node.cases:
+            if case.guard is not None:
+                return None
+
+            if hasattr(case.pattern, 'pattern') and case.pattern.pattern is None:
+                # the wildcard is always the last case
+                default_body = case.body
+            elif isinstance(case.pattern, ast.MatchValue):
+                value = self._get_dispatch_constant(case.pattern.value, subject_type)
+                if value is None:
+                    return None
+                cases.append((value, case.body))
+            else:
+                return None
+
+        if len(cases) == 0:
+            return None
+        return cases, default_body
+
+    def _get_if_dispatch(self,
+                         if_node: ast.If) -> tuple[ast.Name, list[tuple[Any, list[ast.AST]]], list[ast.AST]] | None:
+        """
+        Gets the branches of an if-elif chain that compares the same int variable with constants, like
+        `if x == 1: ... elif x == 2: ... elif x == 3: ...`
+
+        :return: the compared variable, the constant and the body of each branch and the body of the else branch.
+                 None if the chain is too short
+        """
+        subject = None
+        cases = []
+        default_body = []
+
+        node = if_node
+        while node is not None:
+            test = node.test
+            if (not isinstance(test, ast.Compare)
+                    or len(test.ops) != 1
+                    or not isinstance(test.ops[0], NumericEquality)
+                    or not isinstance(test.left, ast.Name)
+                    or (subject is not None and test.left.id != subject.id)):
+                # the rest of the chain is the else branch
+                default_body = [node]
+                break
+
+            value = self._get_int_literal(test.comparators[0])
+            if subject is None:
+                subject = test.left
+                if self._get_dispatch_subject_type(subject) is not Type.int:
+                    return None
+            if value is None:
+                default_body = [node]
+                break
+
+            cases.append((value, node.body))
+            if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+                node = node.orelse[0]
+            else:
+                default_body = node.orelse
+                node = None
+
+        if len(cases) < 3:
+            # it's cheaper to compare short chains one by one
+            return None
+        return subject, cases, default_body
+
+    def _get_dispatch_subject_type(self, subject: ast.AST) -> IType | None:
+        if not isinstance(subject, ast.Name):
+            return None
+
+        _, symbol = self.generator.get_symbol(subject.id)
+        if isinstance(symbol, Variable) and symbol.type in (Type.int, Type.str, Type.bytes):
+            return symbol.type
+        return None
+
+    def _get_dispatch_constant(self, node: ast.AST, subject_type: IType) -> Any:
+        if subject_type is Type.int:
+            return self._get_int_literal(node)
+
+        if isinstance(node, ast.Constant) and subject_type.is_type_of(node.value):
+            return node.value
+        return None
+
+    def _convert_constant_dispatch(self, subject: ast.Name, cases: list[tuple[Any, list[ast.AST]]],
+                                   default_body: list[ast.AST]):
+        """
+        Converts a match or an if-elif chain that compares a variable with constants, jumping directly to the branch
+        of the variable value instead of comparing each branch sequentially
+        """
+        values = []
+        bodies = []
+        for value, body in cases:
+            # if a value is repeated, only the first branch can be executed
+            if value not in values:
+                values.append(value)
+                bodies.append(body)
+
+        subject_type = self.visit_to_generate(subject).type
+        case_jumps, default_jumps = self.generator.convert_constant_dispatch(values)
+
+        end_jumps = []
+        for jump_address, body in zip(case_jumps, bodies):
+            self.generator.convert_begin_dispatch_case([jump_address], subject_type)
+            for stmt in body:
+                self.visit_to_map(stmt, generate=True)
+
+            ends_with_return = len(body) > 0 and isinstance(body[-1], ast.Return)
+            end_jump = self.generator.convert_end_dispatch_case(ends_with_return)
+            if end_jump is not None:
+                end_jumps.append(end_jump)
+
+        self.generator.convert_begin_dispatch_case(default_jumps, subject_type)
+        for stmt in default_body:
+            self.visit_to_map(stmt, generate=True)
+
+        self.generator.convert_end_dispatch(end_jumps)
+
     def visit_For(self, for_node: ast.For) -> GeneratorData:
         """
         Visitor of for statement node
 
         :param for_node: the python ast for node
         """
-        self.visit_to_generate(for_node.iter)
-        start_address = self.generator.convert_begin_for()
+        self._convert_loop_invariants(for_node)
+        range_loop = self._get_range_loop(for_node.iter)
+        if range_loop is not None:
+            # iterates over the range with a counter, instead of creating a list with its values
+            step, is_inclusive = self._convert_range_loop_limits(*range_loop)
+            start_address = self.generator.convert_begin_range_for()
+        else:
+            step, is_inclusive = None, False
+            self.visit_to_generate(for_node.iter)
+            start_address = self.generator.convert_begin_for()
 
         if isinstance(for_node.target, tuple):
             for target in for_node.target:
@@ -785,7 +1030,10 @@ class VisitorCodeGenerator(IAstAnalyser):
         if self.current_method is not None:
             self.current_method.remove_instruction(for_node.lineno, for_node.col_offset)
 
-        condition_address = self.generator.convert_end_for(start_address)
+        if step is not None:
+            condition_address = self.generator.convert_end_range_for(start_address, step, is_inclusive)
+        else:
+            condition_address = self.generator.convert_end_for(start_address)
         self.include_instruction(for_node, condition_address)
         else_begin = self.generator.last_code_start_address
 
@@ -798,12 +1046,89 @@ class VisitorCodeGenerator(IAstAnalyser):
                                              is_for=True)
         return self.build_data(for_node)
 
+    def _get_range_loop(self, iter_node: ast.AST) -> tuple[ast.AST, ast.AST, int, bool] | None:
+        """
+        Gets the arguments of a range iterated by a for loop, if the loop can iterate using only a counter
+
+        :param iter_node: the python ast node of the for loop iterable
+        :return: the stop and start of the range, its step and whether it's reversed. None if the iterable isn't a range
+                 or if its step isn't a literal value
+        """
+        is_reversed = False
+        if self._is_builtin_call(iter_node, Builtin.Reversed) and len(iter_node.args) == 1:
+            is_reversed = True
+            iter_node = iter_node.args[0]
+
+        # the arguments were reordered and the defaults were included when the call was analysed
+        if not self._is_builtin_call(iter_node, Builtin.Range) or len(iter_node.args) != 3:
+            return None
+
+        stop, start, step_node = iter_node.args
+        step = self._get_int_literal(step_node)
+        if step is None or step == 0 or (is_reversed and abs(step) != 1):
+            # the step is checked in runtime and only the reversed ranges with unit steps have known last values
+            return None
+
+        return stop, start, step, is_reversed
+
+    def _convert_range_loop_limits(self, stop: ast.AST, start: ast.AST, step: int,
+                                   is_reversed: bool) -> tuple[int, bool]:
+        """
+        Converts the limit and the first value of a range loop counter, with the first value on the top of the stack
+
+        :return: the step of the counter and whether its limit is inclusive
+        """
+        if not is_reversed:
+            # the counter goes from start to stop, excluding stop
+            self.visit_to_generate(stop)
+            self.visit_to_generate(start)
+            return step, False
+
+        # the counter goes from the last value of the range to start, including it
+        self.visit_to_generate(start)
+        self.visit_to_generate(stop)
+        self.generator.insert_opcode(Opcode.DEC if step > 0 else Opcode.INC)
+        return -step, True
+
+    def _is_non_negative(self, node: ast.AST) -> bool:
+        """
+        Verifies if the value of an int expression is known to be never negative
+        """
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, int) and node.value >= 0
+
+        return self._value_ranges is not None and self._value_ranges.is_non_negative(node)
+
+    def _is_builtin_call(self, node: ast.AST, builtin_method: IBuiltinMethod) -> bool:
+        if (not isinstance(node, ast.Call)
+                or not isinstance(node.func, ast.Name)
+                or len(node.keywords) > 0):
+            return False
+
+        _, symbol = self.generator.get_symbol(node.func.id)
+        return isinstance(symbol, type(builtin_method))
+
+    @staticmethod
+    def _get_int_literal(node: ast.AST) -> int | None:
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, type(UnaryOp.Negative))):
+            value = VisitorCodeGenerator._get_int_literal(node.operand)
+            return -value if value is not None else None
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
+            return node.value
+        return None
+
     def visit_If(self, if_node: ast.If) -> GeneratorData:
         """
         Visitor of if statement node
 
         :param if_node: the python ast if statement node
         """
+        dispatch = self._get_if_dispatch(if_node)
+        if dispatch is not None:
+            self._convert_constant_dispatch(*dispatch)
+            return self.build_data(if_node)
+
         test = self.visit_to_map(if_node.test, generate=True)
 
         if not Type.bool.is_type_of(test.type) and test.type is not None:
@@ -881,7 +1206,7 @@ class VisitorCodeGenerator(IAstAnalyser):
         :returns: The called function return type
         """
         # the parameters are included into the stack in the reversed order
-        last_address = VMCodeMapping.instance().bytecode_size
+        last_address = self.generator.vm_code_mapping.bytecode_size
         last_stack = self.generator.stack_size
 
         func_data = self.visit(call.func)
@@ -943,7 +1268,7 @@ class VisitorCodeGenerator(IAstAnalyser):
         args_generated = []
         for arg in args:
             args_addresses.append(
-                VMCodeMapping.instance().bytecode_size
+                self.generator.vm_code_mapping.bytecode_size
             )
             args_generated.append(self.visit_to_generate(arg))
 
@@ -954,8 +1279,8 @@ class VisitorCodeGenerator(IAstAnalyser):
                 value = self.generator._stack_pop(-num_args - 1)
                 self.generator._stack_append(value)
                 class_type = value if isinstance(value, UserClass) else None
-            end_address = VMCodeMapping.instance().move_to_end(last_address, args_begin_address,
-                                                               self.generator._opcodes_to_remove)
+            end_address = self.generator.vm_code_mapping.move_to_end(last_address, args_begin_address,
+                                                                     self.generator._opcodes_to_remove)
             if not symbol.is_init:
                 args_addresses.append(end_address)
 
@@ -1059,7 +1384,7 @@ class VisitorCodeGenerator(IAstAnalyser):
         :param attribute: the python ast attribute node
         :return: the identifier of the attribute
         """
-        last_address = VMCodeMapping.instance().bytecode_size
+        last_address = self.generator.vm_code_mapping.bytecode_size
         last_stack = self.generator.stack_size
 
         _attr, attr = self.generator.get_symbol(attribute.attr)
@@ -1230,13 +1555,7 @@ class VisitorCodeGenerator(IAstAnalyser):
         :param dict_node: the python ast dict node
         """
         result_type = Type.dict
-        length = min(len(dict_node.keys), len(dict_node.values))
-        self.generator.convert_new_map(result_type)
-        for key_value in range(length):
-            self.generator.duplicate_stack_top_item()
-            self.visit_to_generate(dict_node.keys[key_value])
-            value_data = self.visit_to_generate(dict_node.values[key_value])
-            self.generator.convert_set_item(value_data.index)
+        self._create_map(dict_node.keys, dict_node.values, result_type)
 
         return self.build_data(dict_node, result_type=result_type, already_generated=True)
 
@@ -1248,12 +1567,7 @@ class VisitorCodeGenerator(IAstAnalyser):
         """
         result_type = Type.str
         index = self.generator.bytecode_size
-        for index, value in enumerate(fstring.values):
-            self.visit_to_generate(value)
-            if index != 0:
-                self.generator.convert_operation(BinaryOp.Concat)
-                if index < len(fstring.values) - 1:
-                    self._remove_inserted_opcodes_since(self.generator.last_code_start_address)
+        self._convert_concat(list(fstring.values), BinaryOp.Concat)
 
         return self.build_data(fstring, result_type=result_type, index=index, already_generated=True)
 
@@ -1309,3 +1623,45 @@ class VisitorCodeGenerator(IAstAnalyser):
             for value in reversed(values):
                 self.visit_to_generate(value)
         self.generator.convert_new_array(length, array_type)
+
+    def _create_map(self, keys: list[ast.AST], values: list[ast.AST], map_type: IType):
+        """
+        Creates a new map from a literal dict
+
+        :param keys: list of keys of the new map items
+        :param values: list of values of the new map items
+        """
+        length = min(len(keys), len(values))
+        items = keys[:length] + values[:length]
+
+        if not any(self._may_have_side_effects(item) for item in items):
+            # the items are packed in a single instruction, so they are pushed in reverse order
+            for index in reversed(range(length)):
+                self.visit_to_generate(values[index])
+                self.visit_to_generate(keys[index])
+        else:
+            # keeps the evaluation order of Python, and reverses the items before packing them
+            for index in range(length):
+                self.visit_to_generate(keys[index])
+                self.visit_to_generate(values[index])
+            self.generator.swap_reverse_stack_items(length * 2)
+
+        self.generator.convert_new_map(map_type, length)
+
+    def _may_have_side_effects(self, node: ast.AST) -> bool:
+        """
+        Verifies if the evaluation of an expression may change any value or fail, so it must keep its position in the
+        evaluation order
+        """
+        if not isinstance(node, ast.AST):
+            # the values of singleton patterns are None, True or False instead of nodes
+            return False
+        if isinstance(node, ast.Constant):
+            return False
+        if isinstance(node, ast.Name):
+            return not isinstance(node.ctx, ast.Load)
+        if isinstance(node, (ast.Tuple, ast.List)):
+            return any(self._may_have_side_effects(item) for item in node.elts)
+        if isinstance(node, ast.Dict):
+            return any(self._may_have_side_effects(item) for item in node.keys + node.values)
+        return True
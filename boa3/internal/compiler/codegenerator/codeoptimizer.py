@@ -2,16 +2,29 @@ __all__ = [
     'CodeOptimizer'
 ]
 
+import logging
+
+from boa3.internal import constants
 from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
 from boa3.internal.compiler.codegenerator.engine.neoengine import NeoEngine
-from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
+from boa3.internal.compiler.codegenerator.methodinliner import MethodInliner
+from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel, get_inline_size_threshold
+from boa3.internal.compiler.codegenerator.peephole.peepholeoptimizer import PeepholeOptimizer
+from boa3.internal.compiler.codegenerator.peephole.peepholereport import PeepholeReport
+from boa3.internal.compiler.codegenerator.slotallocator import SlotAllocator
+from boa3.internal.compiler.codegenerator.storagecontexthoister import StorageContextHoister
+from boa3.internal.compiler.codegenerator.storagereadeliminator import StorageReadEliminator
 from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.model.imports.importsymbol import Import
+from boa3.internal.model.imports.package import Package
 from boa3.internal.model.method import Method
 from boa3.internal.model.symbol import ISymbol
+from boa3.internal.model.type.classes.classtype import ClassType
+from boa3.internal.neo.vm.VMCode import VMCode
 
 
 class CodeOptimizer:
-    def __init__(self, symbol_table: dict[str, ISymbol]):
+    def __init__(self, symbol_table: dict[str, ISymbol], vm_code_mapping: VMCodeMapping = None):
         if isinstance(symbol_table, dict):
             # works with a copy to prevent changes on the original symbol table
             symbol_table = symbol_table.copy()
@@ -19,17 +32,153 @@ class CodeOptimizer:
             symbol_table = {}
 
         self.symbol_table = symbol_table
-        self._map_instance = VMCodeMapping.instance()
+        self._map_instance = vm_code_mapping if vm_code_mapping is not None else VMCodeMapping.instance()
+        self.peephole_report: PeepholeReport | None = None
 
     def optimize(self, optimization_level: OptimizationLevel = OptimizationLevel.DEFAULT):
+        self._remove_unreachable_code()
+
+        inline_size_threshold = get_inline_size_threshold(optimization_level)
+        if inline_size_threshold > 0 and self._inline_methods(inline_size_threshold):
+            # the methods that were inlined in all their calls are not called anymore
+            self._remove_unreachable_code()
+
+        if optimization_level >= OptimizationLevel.HIGH:
+            self._hoist_storage_contexts()
+            self._eliminate_storage_reads()
+            self._apply_peephole_rules()
+            self._reallocate_local_slots()
+
+    def _remove_unreachable_code(self):
+        """
+        Removes the instructions that can't be executed from any of the public methods, including the methods that
+        are never called
+        """
+        # the instructions without target would be removed when generating the bytecode, so they are not followed
+        self._map_instance.remove_empty_targets()
+
+        script = ExecutionScript.from_code_map(self._map_instance)
         engine = NeoEngine()
-        engine.load_script(ExecutionScript.from_code_map(self._map_instance))
+        engine.load_script(script)
+
+        if not engine.is_complete:
+            # some edges couldn't be followed, so any instruction might still be reachable
+            return
 
         executed_instructions_addresses = set()
 
-        # executed the methods to check if there are opcodes that are not executed
-        for method in self.symbol_table.values():
-            if isinstance(method, Method) and method.is_public:
-                executed_instructions = engine.execute(method.start_address)
+        # executes the methods to check if there are opcodes that are not executed
+        for entry_code in self._get_entry_points():
+            entry_address = self._map_instance.get_start_address(entry_code)
+            if entry_address in script:
+                executed_instructions_addresses.update(engine.execute(entry_address))
+
+        unreachable_codes = [code for address, code in self._map_instance.code_map.items()
+                             if address not in executed_instructions_addresses]
+        if 0 < len(unreachable_codes) < len(script):
+            removed_codes = set(unreachable_codes)
+            for method in self._get_methods():
+                method.update_end_bytecode(self._map_instance, removed_codes)
+
+            self._map_instance.remove_opcodes_by_code(unreachable_codes)
+
+    def _inline_methods(self, size_threshold: int) -> bool:
+        """
+        Replaces the calls to small private methods with a copy of their instructions
+
+        :return: whether any call was replaced
+        """
+        inliner = MethodInliner(self._map_instance, self._get_methods(), size_threshold)
+        inlined_calls = inliner.inline()
+
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        for method_name, calls_count in inlined_calls.items():
+            logger.info(f"Inlined method '{method_name}' in {calls_count} call(s)")
+
+        return len(inlined_calls) > 0
+
+    def _hoist_storage_contexts(self):
+        """
+        Gets the storage context once in each method that would get it more than once
+        """
+        hoister = StorageContextHoister(self._map_instance, self._get_methods())
+        reused_contexts = hoister.hoist()
+
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        for method_name, calls_count in reused_contexts.items():
+            logger.info(f"Reused the storage context in {calls_count} call(s) of method '{method_name}'")
+
+    def _eliminate_storage_reads(self):
+        """
+        Reuses the values read from the storage when the same key is read again and logs each removed read
+        """
+        eliminator = StorageReadEliminator(self._map_instance, self._get_methods())
+        removed_reads = eliminator.eliminate()
+
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        for method_name, key in removed_reads:
+            logger.info(f"Removed a repeated storage read of key {key} in method '{method_name}'")
+
+    def _apply_peephole_rules(self):
+        """
+        Replaces locally redundant sequences of instructions and logs how much each rule has reduced the bytecode
+        """
+        methods = self._get_methods()
+        optimizer = PeepholeOptimizer(self._map_instance, methods, self._get_entry_points(methods))
+        self.peephole_report = optimizer.optimize()
+
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        for rule_report in self.peephole_report.rules:
+            logger.info(f"Peephole rule {rule_report}")
+
+    def _reallocate_local_slots(self):
+        """
+        Reuses the slots of the local variables that are never needed at the same time
+        """
+        allocator = SlotAllocator(self._map_instance, self._get_methods())
+        removed_slots = allocator.allocate()
+
+        logger = logging.getLogger(constants.BOA_LOGGING_NAME)
+        for method_name, slots_count in removed_slots.items():
+            logger.info(f"Removed {slots_count} local slot(s) from method '{method_name}'")
+
+    def _get_entry_points(self, methods: list[Method] = None) -> list[VMCode]:
+        """
+        Gets the first instruction of each method that can be called from outside the contract
+        """
+        if methods is None:
+            methods = self._get_methods()
+
+        entry_points = []
+        for method in methods:
+            if method.is_public:
+                # methods with default arguments can be called from both of its starting instructions
+                entry_points.extend(code for code in (method.start_bytecode, method.init_bytecode)
+                                    if code is not None)
+
+        return entry_points
+
+    def _get_methods(self) -> list[Method]:
+        """
+        Gets all the methods in the symbol table, including the ones from imported modules and classes
+        """
+        methods = []
+        visited_symbols = set()
+        symbols_to_check = list(self.symbol_table.values())
+
+        while len(symbols_to_check) > 0:
+            symbol = symbols_to_check.pop()
+            if id(symbol) in visited_symbols:
+                continue
+            visited_symbols.add(id(symbol))
+
+            if isinstance(symbol, Method):
+                methods.append(symbol)
+            elif isinstance(symbol, ClassType):
+                symbols_to_check.extend(symbol.methods.values())
+            elif isinstance(symbol, Import):
+                symbols_to_check.extend(symbol.all_symbols.values())
+            elif isinstance(symbol, Package):
+                symbols_to_check.extend(symbol.symbols.values())
 
-                executed_instructions_addresses.update(executed_instructions)
+        return methods
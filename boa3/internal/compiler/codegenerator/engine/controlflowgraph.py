@@ -0,0 +1,146 @@
+__all__ = [
+    'BasicBlock',
+    'ControlFlowGraph'
+]
+
+import bisect
+
+from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+# instructions that never continue to the next instruction
+_TERMINATOR_OPCODES = frozenset([
+    Opcode.JMP,
+    Opcode.JMP_L,
+    Opcode.ENDTRY,
+    Opcode.ENDTRY_L,
+    Opcode.ENDFINALLY,
+    Opcode.RET,
+    Opcode.THROW,
+    Opcode.ABORT,
+    Opcode.ABORTMSG,
+])
+
+
+class BasicBlock:
+    """
+    A sequence of instructions that is always executed from the first to the last one
+
+    :ivar start: the index in the script of the first instruction of the block
+    :ivar end: the index in the script after the last instruction of the block
+    :ivar successors: the indexes of the first instructions of the blocks that can be executed after this one
+    """
+
+    __slots__ = ('start', 'end', 'successors')
+
+    def __init__(self, start: int, end: int, successors: list[int]):
+        self.start: int = start
+        self.end: int = end
+        self.successors: list[int] = successors
+
+
+class ControlFlowGraph:
+    """
+    The control flow graph of a script: every jump, call and exception handler is an edge between its basic blocks.
+    """
+
+    def __init__(self, script: ExecutionScript):
+        self._script: ExecutionScript = script
+        self._blocks: dict[int, BasicBlock] = {}
+        self._block_starts: list[int] = []
+
+        # if any instruction can't be followed, every instruction must be considered reachable
+        self.is_complete: bool = True
+        self._build()
+
+    @property
+    def blocks(self) -> list[BasicBlock]:
+        return list(self._blocks.values())
+
+    def get_block(self, index: int) -> BasicBlock | None:
+        """
+        Gets the block starting at the instruction in the given index. If that instruction is in the middle of a
+        block, gets the rest of that block
+        """
+        if index in self._blocks:
+            return self._blocks[index]
+
+        position = bisect.bisect_right(self._block_starts, index) - 1
+        if position < 0:
+            return None
+
+        containing_block = self._blocks[self._block_starts[position]]
+        if index >= containing_block.end:
+            return None
+        return BasicBlock(index, containing_block.end, containing_block.successors)
+
+    def _build(self):
+        instructions = self._script.instructions
+        size = len(instructions)
+
+        # the instruction targets and the instructions after a branch are the first instructions of the blocks
+        leaders = {0} if size > 0 else set()
+        branches: dict[int, list[int]] = {}
+        for index, code in enumerate(instructions):
+            successors = self._get_successors(index, code)
+            if successors is None:
+                continue
+
+            branches[index] = successors
+            leaders.update(successors)
+            if index + 1 < size:
+                leaders.add(index + 1)
+
+        sorted_leaders = sorted(leader for leader in leaders if leader < size)
+        for position, start in enumerate(sorted_leaders):
+            end = sorted_leaders[position + 1] if position + 1 < len(sorted_leaders) else size
+            last_index = end - 1
+            if last_index in branches:
+                successors = [successor for successor in branches[last_index] if successor < size]
+            else:
+                successors = [end] if end < size else []
+            self._blocks[start] = BasicBlock(start, end, successors)
+        self._block_starts = sorted_leaders
+
+    def _get_successors(self, index: int, code: VMCode) -> list[int] | None:
+        """
+        Gets the indexes of the instructions that can be executed after the given one
+
+        :return: the successors if the instruction ends a block. None if it always continues to the next instruction
+        """
+        opcode = code.opcode
+        script = self._script
+
+        if opcode is Opcode.PUSHA:
+            # the address of a pointer is not a target, so the instructions it can reach are unknown
+            self.is_complete = False
+            return None
+
+        if not OpcodeHelper.has_target(opcode):
+            return [] if opcode in _TERMINATOR_OPCODES else None
+
+        if code.target is None or code.target is code:
+            # instructions without a valid target are removed when the bytecode is generated
+            return None
+
+        if isinstance(code, TryCode):
+            targets = [code.except_start_code, code.finally_start_code]
+        else:
+            targets = [code.target]
+
+        successors = []
+        for target in targets:
+            if target is None:
+                continue
+            target_index = script.get_index(target)
+            if target_index < 0:
+                self.is_complete = False
+            elif target_index not in successors:
+                successors.append(target_index)
+
+        if opcode not in _TERMINATOR_OPCODES:
+            successors.append(index + 1)
+        return successors
@@ -2,6 +2,7 @@ __all__ = [
     'ExecutionScript'
 ]
 
+import bisect
 from typing import Self
 
 from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
@@ -11,8 +12,12 @@ from boa3.internal.neo3.contracts.nef import MethodToken
 
 class ExecutionScript:
     def __init__(self, code_map: dict[int, VMCode], tokens: list[MethodToken]):
-        self._addresses = tuple(code_map.keys())
-        self._instructions = tuple(code_map.values())
+        self._addresses: list[int] = list(code_map.keys())
+        self._instructions: list[VMCode] = list(code_map.values())
+
+        # maps each instruction, by address and by identity, to its position in the script
+        self._address_index: dict[int, int] = {address: index for index, address in enumerate(self._addresses)}
+        self._code_index: dict[VMCode, int] = {code: index for index, code in enumerate(self._instructions)}
 
         self._last_address = self._addresses[-1] if len(self._addresses) else -1
         self._last_instruction_size = self._instructions[-1].size if len(self._instructions) else 0
@@ -24,26 +29,50 @@ class ExecutionScript:
         obj = ExecutionScript(instance.code_map, instance._method_tokens.to_list())
         return obj
 
+    @property
+    def instructions(self) -> list[VMCode]:
+        return self._instructions
+
+    @property
+    def end_address(self) -> int:
+        return self._last_address + self._last_instruction_size
+
     def get_instruction(self, address) -> VMCode:
-        if address not in self._addresses:
+        if address not in self._address_index:
             raise IndexError
-        index = self._addresses.index(address)
-        return self._instructions[index]
+        return self._instructions[self._address_index[address]]
+
+    def get_address(self, index: int) -> int:
+        return self._addresses[index]
+
+    def get_index(self, code: VMCode) -> int:
+        """
+        Gets the position of the instruction in the script
+
+        :return: the index of the instruction if it's in the script. Otherwise, returns -1
+        """
+        return self._code_index.get(code, -1)
+
+    def get_index_from_address(self, address: int) -> int:
+        """
+        Gets the position of the instruction that starts at the given address
+
+        :return: the index of the instruction if there's one starting at the address. Otherwise, returns -1
+        """
+        return self._address_index.get(address, -1)
 
     def next_address(self, address) -> int:
-        if address in self._addresses:
-            address_index = self._addresses.index(address)
-            if address < self._last_address:
-                next_address = self._addresses[address_index + 1]
-            else:
-                next_address = self._last_address + self._last_instruction_size
+        if address in self._address_index:
+            next_index = self._address_index[address] + 1
         else:
-            next_address = next((instr_address
-                                 for instr_address in self._addresses
-                                 if instr_address > address),
-                                self._last_address + self._last_instruction_size)
+            next_index = bisect.bisect_right(self._addresses, address)
 
-        return next_address
+        if next_index < len(self._addresses):
+            return self._addresses[next_index]
+        return self.end_address
 
     def __contains__(self, obj) -> bool:
-        return obj in self._addresses
+        return obj in self._address_index
+
+    def __len__(self) -> int:
+        return len(self._instructions)
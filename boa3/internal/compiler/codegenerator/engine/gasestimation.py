@@ -0,0 +1,81 @@
+__all__ = [
+    'GasEstimation',
+    'GasRangeEstimation'
+]
+
+from boa3.internal import constants
+
+
+class GasRangeEstimation:
+    """
+    The estimated execution price of a range of instructions, like a basic block or an iteration of a loop
+
+    :ivar start_address: the address of the first instruction of the range
+    :ivar end_address: the address after the last instruction of the range
+    :ivar best_price: the price of the cheapest way to execute the range, without the execution fee factor
+    :ivar worst_price: the price of the most expensive way to execute the range, without the execution fee factor
+    """
+
+    __slots__ = ('start_address', 'end_address', 'best_price', 'worst_price')
+
+    def __init__(self, start_address: int, end_address: int, best_price: int, worst_price: int):
+        self.start_address: int = start_address
+        self.end_address: int = end_address
+        self.best_price: int = best_price
+        self.worst_price: int = worst_price
+
+    @property
+    def best_gas(self) -> int:
+        """
+        Gets the estimated GAS, in its smallest unit, of the cheapest way to execute the range
+        """
+        return self.best_price * constants.DEFAULT_EXEC_FEE_FACTOR
+
+    @property
+    def worst_gas(self) -> int:
+        """
+        Gets the estimated GAS, in its smallest unit, of the most expensive way to execute the range
+        """
+        return self.worst_price * constants.DEFAULT_EXEC_FEE_FACTOR
+
+
+class GasEstimation:
+    """
+    The estimated execution price of a method
+
+    The best and worst cases don't repeat any loop: the price of each iteration is estimated separately in `loops`.
+
+    :ivar best_price: the price of the cheapest way to return from the method, without the execution fee factor
+    :ivar worst_price: the price of the most expensive way to leave the method, without the execution fee factor
+    :ivar blocks: the estimated price of each basic block of the method, including the methods it calls
+    :ivar loops: the estimated price of one iteration of each loop of the method
+    :ivar has_dynamic_price: whether the method executes instructions whose prices can't be known before the
+                             execution, like calls to other contracts, recursive calls and storage writes. In that
+                             case, the estimations include only their fixed prices.
+    """
+
+    __slots__ = ('best_price', 'worst_price', 'blocks', 'loops', 'has_dynamic_price')
+
+    def __init__(self, best_price: int, worst_price: int,
+                 blocks: list[GasRangeEstimation] = None,
+                 loops: list[GasRangeEstimation] = None,
+                 has_dynamic_price: bool = False):
+        self.best_price: int = best_price
+        self.worst_price: int = worst_price
+        self.blocks: list[GasRangeEstimation] = blocks if blocks is not None else []
+        self.loops: list[GasRangeEstimation] = loops if loops is not None else []
+        self.has_dynamic_price: bool = has_dynamic_price
+
+    @property
+    def best_gas(self) -> int:
+        """
+        Gets the estimated GAS, in its smallest unit, of the cheapest way to return from the method
+        """
+        return self.best_price * constants.DEFAULT_EXEC_FEE_FACTOR
+
+    @property
+    def worst_gas(self) -> int:
+        """
+        Gets the estimated GAS, in its smallest unit, of the most expensive way to leave the method
+        """
+        return self.worst_price * constants.DEFAULT_EXEC_FEE_FACTOR
@@ -0,0 +1,255 @@
+__all__ = [
+    'GasEstimator'
+]
+
+from collections.abc import Callable, Iterable
+
+from boa3.internal.compiler.codegenerator.engine.controlflowgraph import BasicBlock, ControlFlowGraph
+from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
+from boa3.internal.compiler.codegenerator.engine.gasestimation import GasEstimation, GasRangeEstimation
+from boa3.internal.neo.vm.InteropInfo import InteropInfo
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+_CALL_OPCODES = frozenset([
+    Opcode.CALL,
+    Opcode.CALL_L,
+])
+
+# calls whose callee is only known during the execution
+_DYNAMIC_CALL_OPCODES = frozenset([
+    Opcode.CALLA,
+    Opcode.CALLT,
+])
+
+
+class GasEstimator:
+    """
+    Estimates the execution price of the methods of a script, following the edges of its control flow graph.
+
+    Each method is estimated separately: the blocks of a called method aren't part of the caller's graph, but their
+    estimated prices are included in the price of the block that calls it.
+    """
+
+    def __init__(self, script: ExecutionScript):
+        self._script: ExecutionScript = script
+        self._graph: ControlFlowGraph = ControlFlowGraph(script)
+
+        self._estimations: dict[int, GasEstimation] = {}
+        self._estimating: set[int] = set()
+
+    def estimate(self, entry_point: int) -> GasEstimation:
+        """
+        Estimates the execution price of the method that starts at the given address
+
+        :param entry_point: the address of the first instruction of the method
+        :return: the estimated prices of the method, its basic blocks and its loops
+        """
+        entry_index = self._script.get_index_from_address(entry_point)
+        if entry_index < 0:
+            raise ValueError('Invalid address given as entry point')
+
+        return self._estimate(entry_index)
+
+    def _estimate(self, entry_index: int) -> GasEstimation:
+        if entry_index in self._estimations:
+            return self._estimations[entry_index]
+
+        self._estimating.add(entry_index)
+        try:
+            estimation = self._estimate_method(entry_index)
+        finally:
+            self._estimating.discard(entry_index)
+
+        self._estimations[entry_index] = estimation
+        return estimation
+
+    def _estimate_method(self, entry_index: int) -> GasEstimation:
+        blocks: dict[int, BasicBlock] = {}
+        successors: dict[int, list[int]] = {}
+        best_prices: dict[int, int] = {}
+        worst_prices: dict[int, int] = {}
+        has_dynamic_price = not self._graph.is_complete
+
+        # depth-first search to find the blocks of the method, in post-order, and the edges that close its loops
+        order: list[int] = []
+        back_edges: set[tuple[int, int]] = set()
+        on_stack: set[int] = set()
+        stack: list[tuple[int, Iterable[int]]] = []
+
+        def visit(index: int):
+            nonlocal has_dynamic_price
+            block = self._graph.get_block(index)
+            blocks[index] = block
+            successors[index] = self._get_successors(block)
+            best_prices[index], worst_prices[index], is_dynamic = self._get_block_prices(block)
+            has_dynamic_price |= is_dynamic
+
+            on_stack.add(index)
+            stack.append((index, iter(successors[index])))
+
+        visit(entry_index)
+        while len(stack) > 0:
+            index, remaining_successors = stack[-1]
+            for successor in remaining_successors:
+                if successor not in blocks:
+                    visit(successor)
+                    break
+                if successor in on_stack:
+                    back_edges.add((index, successor))
+            else:
+                stack.pop()
+                on_stack.discard(index)
+                order.append(index)
+
+        forward_edges = {index: [successor for successor in block_successors if (index, successor) not in back_edges]
+                         for index, block_successors in successors.items()}
+
+        exits = {index for index, block_successors in successors.items() if len(block_successors) == 0}
+        returns = {index for index in exits if self._script.instructions[blocks[index].end - 1].opcode is Opcode.RET}
+        dead_ends = {index for index, block_successors in forward_edges.items() if len(block_successors) == 0}
+
+        # the cheapest way is the one that returns successfully, if there's any
+        best_price = self._get_first_path_price(entry_index, order, forward_edges, best_prices, min,
+                                                returns, exits, dead_ends)
+        worst_price = self._get_first_path_price(entry_index, order, forward_edges, worst_prices, max,
+                                                 exits, dead_ends)
+
+        block_estimations = [
+            GasRangeEstimation(self._script.get_address(block.start),
+                               self._get_end_address(block.end),
+                               best_prices[index],
+                               worst_prices[index])
+            for index, block in sorted(blocks.items())
+        ]
+        loop_estimations = self._estimate_loops(order, successors, forward_edges, back_edges,
+                                                best_prices, worst_prices)
+
+        return GasEstimation(best_price, worst_price, block_estimations, loop_estimations, has_dynamic_price)
+
+    def _estimate_loops(self, order: list[int],
+                        successors: dict[int, list[int]],
+                        forward_edges: dict[int, list[int]],
+                        back_edges: set[tuple[int, int]],
+                        best_prices: dict[int, int],
+                        worst_prices: dict[int, int]) -> list[GasRangeEstimation]:
+        """
+        Estimates the price of one iteration of each loop, from its first block until a block that jumps back to it
+        """
+        predecessors: dict[int, list[int]] = {index: [] for index in successors}
+        for index, block_successors in successors.items():
+            for successor in block_successors:
+                predecessors[successor].append(index)
+
+        loop_ends: dict[int, set[int]] = {}
+        for source, header in back_edges:
+            if header not in loop_ends:
+                loop_ends[header] = set()
+            loop_ends[header].add(source)
+
+        loops = []
+        for header, ends in loop_ends.items():
+            # the blocks that can reach the end of an iteration without leaving through the loop's first block
+            body = {header}
+            blocks_to_visit = list(ends)
+            while len(blocks_to_visit) > 0:
+                index = blocks_to_visit.pop()
+                if index not in body:
+                    body.add(index)
+                    blocks_to_visit.extend(predecessors[index])
+
+            body_order = [index for index in order if index in body]
+            best_price = self._get_path_price(header, body_order, forward_edges, best_prices, min, ends)
+            worst_price = self._get_path_price(header, body_order, forward_edges, worst_prices, max, ends)
+
+            start_address = min(self._script.get_address(index) for index in body)
+            end_address = max(self._get_end_address(self._graph.get_block(index).end) for index in body)
+            loops.append(GasRangeEstimation(start_address, end_address,
+                                            best_price if best_price is not None else 0,
+                                            worst_price if worst_price is not None else 0))
+
+        loops.sort(key=lambda loop: (loop.start_address, loop.end_address))
+        return loops
+
+    def _get_first_path_price(self, start: int, order: list[int], edges: dict[int, list[int]],
+                              prices: dict[int, int], choose: Callable[[Iterable[int]], int],
+                              *possible_ends: set[int]) -> int:
+        """
+        Gets the price of the path from the start to the first group of blocks that can be reached from it
+        """
+        for ends in possible_ends:
+            path_price = self._get_path_price(start, order, edges, prices, choose, ends)
+            if path_price is not None:
+                return path_price
+        return prices[start]
+
+    @staticmethod
+    def _get_path_price(start: int, order: list[int], edges: dict[int, list[int]],
+                        prices: dict[int, int], choose: Callable[[Iterable[int]], int],
+                        ends: set[int]) -> int | None:
+        """
+        Gets the price of the path chosen between the start and the ends, following only the given edges
+
+        :param order: the blocks in post-order. Only these blocks are included in the path
+        :param choose: how to choose between the prices of the paths that leave a block
+        :return: the price of the chosen path. None if no end can be reached from the start
+        """
+        path_prices: dict[int, int] = {}
+        for index in order:
+            following_prices = [path_prices[successor] for successor in edges[index] if successor in path_prices]
+            if index in ends:
+                following_prices.append(0)
+            if len(following_prices) > 0:
+                path_prices[index] = prices[index] + choose(following_prices)
+
+        return path_prices.get(start)
+
+    def _get_successors(self, block: BasicBlock) -> list[int]:
+        last_index = block.end - 1
+        if self._script.instructions[last_index].opcode in _CALL_OPCODES:
+            # the called method returns to the next instruction
+            return [block.end] if block.end < len(self._script) else []
+        return block.successors
+
+    def _get_block_prices(self, block: BasicBlock) -> tuple[int, int, bool]:
+        """
+        Gets the prices of the instructions of the block and of the methods it calls
+
+        :return: the best and the worst prices of the block and whether they include dynamic prices
+        """
+        best_price = 0
+        worst_price = 0
+        has_dynamic_price = False
+
+        for index in range(block.start, block.end):
+            code = self._script.instructions[index]
+            opcode = code.opcode
+
+            price = code.info.price
+            if opcode is Opcode.SYSCALL:
+                method_hash = code.raw_data
+                interop_price = InteropInfo.get_price(method_hash)
+                if interop_price is not None:
+                    price += interop_price
+                has_dynamic_price |= InteropInfo.has_dynamic_price(method_hash)
+            best_price += price
+            worst_price += price
+
+            if opcode in _CALL_OPCODES:
+                callee_index = self._script.get_index(code.target) if code.target is not None else -1
+                if callee_index < 0 or callee_index in self._estimating:
+                    # a recursive call can be executed any number of times
+                    has_dynamic_price = True
+                else:
+                    callee = self._estimate(callee_index)
+                    best_price += callee.best_price
+                    worst_price += callee.worst_price
+                    has_dynamic_price |= callee.has_dynamic_price
+            elif opcode in _DYNAMIC_CALL_OPCODES:
+                has_dynamic_price = True
+
+        return best_price, worst_price, has_dynamic_price
+
+    def _get_end_address(self, end_index: int) -> int:
+        if end_index < len(self._script):
+            return self._script.get_address(end_index)
+        return self._script.end_address
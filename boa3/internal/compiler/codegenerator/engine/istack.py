@@ -5,41 +5,107 @@ T = TypeVar("T")
 
 
 class IStack(abc.ABC):
+    """
+    A persistent stack: each item is stored in an immutable node that links to the item below it, so copies share
+    their nodes and copying a stack or pushing and popping its top items costs O(1).
+    """
+
     def __init__(self, stack_type: type[T]):
         self._stack_type = stack_type
-        self._stack: list[T] = []
+        self._top: tuple[T, tuple | None] | None = None  # (item, node below)
+        self._size: int = 0
 
     @abc.abstractmethod
     def _default_constructor_args(self) -> tuple:
         return (self._stack_type,)
 
     def append(self, value: T):
-        return self._stack.append(value)
+        self._top = (value, self._top)
+        self._size += 1
 
     def clear(self):
-        return self._stack.clear()
+        self._top = None
+        self._size = 0
 
     def copy(self) -> Self:
         new_stack = self.__class__(*self._default_constructor_args())
-        new_stack._stack = self._stack.copy()
+        new_stack._top = self._top
+        new_stack._size = self._size
         return new_stack
 
     def pop(self, index: int) -> T:
-        return self._stack.pop(index)
+        depth = self._depth(index)
+        if depth < 0:
+            raise IndexError('pop index out of range')
+
+        above, node = self._split(depth)
+        value, node = node
+        self._top = self._push_all(node, reversed(above))
+        self._size -= 1
+        return value
 
     def __len__(self) -> int:
-        return len(self._stack)
+        return self._size
+
+    def __iter__(self):
+        return iter(self._to_list())
 
     def __getitem__(self, index_or_slice: int | slice):
-        return self._stack[index_or_slice]
+        if isinstance(index_or_slice, slice):
+            return self._to_list()[index_or_slice]
+
+        depth = self._depth(index_or_slice)
+        if depth < 0:
+            raise IndexError('stack index out of range')
+
+        node = self._top
+        for _ in range(depth):
+            node = node[1]
+        return node[0]
 
     def reverse(self, start: int = 0, end: int = None, *, rotate: bool = False):
-        if end is None:
-            end = len(self._stack)
+        start, end, _ = slice(start, end).indices(self._size)
+        if start >= end:
+            return
+
+        above, node = self._split(self._size - start)
+        # `above` is ordered from the top, so the items in the range are its last ones
+        items = above[self._size - end:][::-1]  # from the bottom to the top, as in a list
+        above = above[:self._size - end]
 
         if rotate:
-            reverse = self._stack[start:end]
-            reverse.append(reverse.pop(0))
+            items.append(items.pop(0))
         else:
-            reverse = list(reversed(self._stack[start:end]))
-        self._stack[start:end] = reverse
+            items.reverse()
+
+        node = self._push_all(node, items)
+        self._top = self._push_all(node, reversed(above))
+
+    def _depth(self, index: int) -> int:
+        """
+        Gets how many items are above the one in the given index, or -1 if the index is out of range
+        """
+        depth = -index - 1 if index < 0 else self._size - 1 - index
+        return depth if 0 <= depth < self._size else -1
+
+    def _split(self, depth: int) -> tuple[list[T], tuple | None]:
+        """
+        Gets the `depth` items on the top of the stack, ordered from the top, and the node below them
+        """
+        above = []
+        node = self._top
+        for _ in range(depth):
+            above.append(node[0])
+            node = node[1]
+        return above, node
+
+    @staticmethod
+    def _push_all(node: tuple | None, values) -> tuple | None:
+        for value in values:
+            node = (value, node)
+        return node
+
+    def _to_list(self) -> list[T]:
+        values, _ = self._split(self._size)
+        values.reverse()
+        return values
@@ -1,83 +1,64 @@
 __all__ = [
-    'NeoEngine',
-    'NeoEngineState'
+    'NeoEngine'
 ]
 
-from typing import Any
-
+from boa3.internal.compiler.codegenerator.engine.controlflowgraph import ControlFlowGraph
 from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
-from boa3.internal.compiler.codegenerator.engine.istack import IStack
-from boa3.internal.neo.vm.VMCode import VMCode
-from boa3.internal.neo.vm.opcode.Opcode import Opcode
-from boa3.internal.neo.vm.type.StackItem import StackItemType
-from boa3.internal.neo3.vm import VMState
-
-
-class StackItem:
-    def __init__(self, value: Any, stack_item_type: StackItemType):
-        self.value = value
-        self.type = stack_item_type
-
-
-class NeoStack(IStack):
-    def __init__(self):
-        super().__init__(stack_type=StackItem)
-
-    def _default_constructor_args(self) -> tuple:
-        return tuple()
-
-
-class NeoEngineState:
-    def __init__(self,
-                 entry_point: int,
-                 ):
-
-        self.entry_point: int = entry_point
-        self.current_instruction: int = entry_point
-        self.result_stack: list[IStack] = []
-        self.vm_state: VMState = VMState.NONE
 
 
 class NeoEngine:
+    """
+    Simulates the execution of a script by following the edges of its control flow graph, to find which instructions
+    can be executed.
+    """
+
     def __init__(self):
         self._script: ExecutionScript = None
-        self._state_stack: list[NeoEngineState] = []
-
-    @property
-    def current_state(self) -> NeoEngineState | None:
-        if self._state_stack:
-            return self._state_stack[-1]
-        else:
-            return None
+        self._graph: ControlFlowGraph = None
 
     def load_script(self, script: ExecutionScript):
         self._script = script
+        self._graph = ControlFlowGraph(script)
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        Gets whether every edge of the loaded script could be followed. If it's not, the instructions that are not
+        executed still might be reachable.
+        """
+        return self._graph is not None and self._graph.is_complete
 
     def execute(self, entry_point: int) -> set[int]:
-        executed_instructions_addresses = set()
+        """
+        Gets the addresses of all the instructions that can be executed starting from the given address, following
+        every branch, call and exception handler
 
+        :param entry_point: the address of the first executed instruction
+        :return: the addresses of the reachable instructions
+        """
         if not isinstance(self._script, ExecutionScript):
             raise ValueError('Script was not loaded')
 
-        if entry_point not in self._script:
+        entry_index = self._script.get_index_from_address(entry_point)
+        if entry_index < 0:
             raise ValueError('Invalid address given as entry point')
 
-        cur_address = entry_point
-        self._state_stack.append(NeoEngineState(cur_address))
-        while self._state_stack and cur_address in self._script:
-            self._execute_instruction(self._script.get_instruction(cur_address))
+        executed_instructions_addresses = set()
+        visited_blocks = set()
+        blocks_to_visit = [entry_index]
+
+        while len(blocks_to_visit) > 0:
+            block_start = blocks_to_visit.pop()
+            if block_start in visited_blocks:
+                continue
+            visited_blocks.add(block_start)
 
-            executed_instructions_addresses.add(cur_address)
-            cur_address = self._script.next_address(cur_address)
+            block = self._graph.get_block(block_start)
+            if block is None:
+                continue
 
-        if self._state_stack:
-            self._state_stack.clear()
+            for index in range(block.start, block.end):
+                executed_instructions_addresses.add(self._script.get_address(index))
+            blocks_to_visit.extend(successor for successor in block.successors if successor not in visited_blocks)
 
         return executed_instructions_addresses
-
-    def _execute_instruction(self, current_opcode: VMCode):
-        match current_opcode.opcode:
-            case Opcode.INITSLOT | Opcode.INITSSLOT:
-                return
-            case Opcode.RET:
-                self._state_stack.pop()
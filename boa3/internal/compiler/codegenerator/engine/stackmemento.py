@@ -23,92 +23,70 @@ class StackMemento:
     This class is responsible for managing the simulation of the blockchain stack during the code generation
     """
 
-    def __init__(self):
-        self._stacks: list[tuple[VMCode, NeoStack]] = []
-        self._current_stack: NeoStack = NeoStack()
+    def __init__(self, vm_code_mapping: VMCodeMapping):
+        self._vm_code_mapping: VMCodeMapping = vm_code_mapping
 
-    @property
-    def stack_map(self) -> dict[int, NeoStack]:
-        vm_code_mapping = VMCodeMapping.instance()
-        return {vm_code_mapping.get_start_address(vmcode): stack for vmcode, stack in self._stacks}
+        # the state of the stack after each code that changed it, mapped by the code identity
+        self._stacks: dict[VMCode, NeoStack] = {}
+        self._current_stack: NeoStack = NeoStack()
 
     def get_state(self, code_address: int) -> NeoStack:
-        stacks = self.stack_map
-        index = None
-        for address, stack in sorted(stacks.items()):
-            if address >= code_address:
-                break
-            index = address
-
-        if index is None or index not in stacks:
+        stack = self._get_latest_state(code_address)
+        if stack is None:
             return NeoStack()
         else:
-            return stacks[index]
+            return stack
+
+    def _get_latest_state(self, code_address: int) -> NeoStack | None:
+        """
+        Gets the state of the stack recorded by the last code before the given address
+        """
+        vm_code_mapping = self._vm_code_mapping
+        codes = vm_code_mapping.codes
+        for index in range(vm_code_mapping.get_code_index_before(code_address), -1, -1):
+            stack = self._stacks.get(codes[index])
+            if stack is not None:
+                return stack
+        return None
 
     @property
     def current_stack(self) -> NeoStack:
         return self._current_stack
 
     def restore_state(self, code_address):
-        stacks = self.stack_map
-        latest_stack = None
-        for address, stack in reversed(sorted(stacks.items())):
-            if address < code_address:
-                latest_stack = stack
-                break
-
-            vm_code = VMCodeMapping.instance().get_code(address)
-            if (vm_code, stack) in self._stacks:
-                self._stacks.remove((vm_code, stack))
+        vm_code_mapping = self._vm_code_mapping
+        codes = vm_code_mapping.codes
+        for index in range(vm_code_mapping.get_code_index_before(code_address) + 1, len(codes)):
+            self._stacks.pop(codes[index], None)
 
+        latest_stack = self._get_latest_state(code_address)
         if latest_stack is not None:
             self._current_stack = latest_stack
 
-    def append(self, code: VMCode, value: IType):
-        states = self.stack_map
-        index = VMCodeMapping.instance().get_start_address(code)
-        if index in states:
-            states[index].append(value)
-
-        else:
+    def _get_code_state(self, code: VMCode) -> NeoStack:
+        """
+        Gets the state of the stack after the given code. If the code hasn't changed the stack yet, its state starts
+        as a copy of the current stack
+        """
+        stack = self._stacks.get(code)
+        if stack is None:
             if self._current_stack is not None:
                 stack = self._current_stack.copy()
             else:
                 stack = NeoStack()
-            stack.append(value)
 
-            self._stacks.append((code, stack))
+            self._stacks[code] = stack
             self._current_stack = stack
 
-    def pop(self, code: VMCode, index: int = -1):
-        states = self.stack_map
-        stack_index = VMCodeMapping.instance().get_start_address(code)
-        if stack_index in states:
-            stack = states[stack_index]
-        else:
-            if self._current_stack is not None:
-                stack = self._current_stack.copy()
-            else:
-                stack = NeoStack()
+        return stack
 
-            self._stacks.append((code, stack))
-            self._current_stack = stack
+    def append(self, code: VMCode, value: IType):
+        self._get_code_state(code).append(value)
 
+    def pop(self, code: VMCode, index: int = -1):
+        stack = self._get_code_state(code)
         if len(stack) > 0:
             return stack.pop(index)
 
     def reverse(self, code: VMCode, start: int = 0, end: int = None, *, rotate: bool = False):
-        states = self.stack_map
-        stack_index = VMCodeMapping.instance().get_start_address(code)
-        if stack_index in states:
-            stack = states[stack_index]
-        else:
-            if self._current_stack is not None:
-                stack = self._current_stack.copy()
-            else:
-                stack = NeoStack()
-
-            self._stacks.append((code, stack))
-            self._current_stack = stack
-
-        return stack.reverse(start, end, rotate=rotate)
+        return self._get_code_state(code).reverse(start, end, rotate=rotate)
@@ -0,0 +1,252 @@
+import ast
+
+from boa3.internal.model.builtin.builtin import Builtin
+from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.internal.model.method import Method
+from boa3.internal.model.symbol import ISymbol
+from boa3.internal.model.type.classes.contractinterfaceclass import ContractInterfaceClass
+from boa3.internal.model.type.classes.userclass import UserClass
+from boa3.internal.model.type.itype import IType
+from boa3.internal.model.type.type import Type
+from boa3.internal.model.variable import Variable
+
+# the builtins that don't change their arguments or any other value
+_NON_CHANGING_BUILTINS = (Builtin.Len, Builtin.Range, Builtin.Abs, Builtin.Max, Builtin.Min, Builtin.IsInstance)
+
+
+class LoopInvariantVisitor:
+    """
+    This class finds the expressions inside the loops of a function that have the same value in every iteration, so the
+    code generator can evaluate them once before the loop and store their values in new local variables.
+
+    Only the expressions that can't fail and don't have side effects are moved out of the loops, because they are
+    evaluated even if the loop doesn't run or stops before reaching them. They are the lengths of sequences and the
+    loads of instance variables of user classes, including the ones that use each other, like `len(self.items)`. The
+    local variables used by them must be assigned before the loop in every path and must not be reassigned inside the
+    loop, and if their values are mutable, the loop can't call any method or change any item or attribute.
+    """
+
+    def __init__(self, method: Method, function: ast.FunctionDef, symbols: dict[str, ISymbol]):
+        self._method: Method = method
+        self._symbols: dict[str, ISymbol] = symbols.copy()
+        self._symbols.update(method.symbols)
+
+        # maps each loop to the invariant expressions moved out of it and the variables that store their values
+        self._loop_invariants: dict[ast.AST, list[tuple[str, ast.AST]]] = {}
+        # maps each moved expression to the variable with its value
+        self._invariant_variables: dict[ast.AST, str] = {}
+
+        self._find_loops(function.body, set())
+
+    def get_loop_invariants(self, loop: ast.For | ast.While) -> list[tuple[str, ast.AST]]:
+        """
+        Gets the expressions that must be evaluated before the loop
+
+        :param loop: the python ast node of the loop
+        :return: the identifier of the variable that stores the value and the expression of each invariant
+        """
+        return self._loop_invariants.get(loop, [])
+
+    def get_invariant_variable(self, node: ast.AST) -> str | None:
+        """
+        Gets the variable that has the value of an expression evaluated before its loop
+
+        :param node: the python ast node of the expression
+        :return: the identifier of the variable. None if the expression wasn't moved out of a loop
+        """
+        return self._invariant_variables.get(node)
+
+    def _find_loops(self, statements: list[ast.AST], assigned_vars: set[str]):
+        """
+        Finds the invariants of the loops inside the statements
+
+        :param assigned_vars: the local variables that are assigned in every path before the statements
+        """
+        assigned_vars = assigned_vars.copy()
+        for node in statements:
+            if isinstance(node, (ast.For, ast.While)):
+                self._find_invariants(node, assigned_vars)
+
+            # the invariants of the outer loops are found first, so they are moved out of all the loops they are in
+            body_assigned_vars = assigned_vars
+            if isinstance(node, ast.For):
+                body_assigned_vars = assigned_vars | self._get_target_vars(node.target)
+            elif isinstance(node, ast.With):
+                body_assigned_vars = assigned_vars.union(*(self._get_target_vars(item.optional_vars)
+                                                           for item in node.items
+                                                           if item.optional_vars is not None))
+
+            self._find_loops(getattr(node, 'body', []), body_assigned_vars)
+            for field in ('orelse', 'finalbody'):
+                self._find_loops(getattr(node, field, []), assigned_vars)
+            for inner_node in getattr(node, 'handlers', []) + getattr(node, 'cases', []):
+                self._find_loops(inner_node.body, assigned_vars)
+
+            assigned_vars = self._get_assigned_vars([node], assigned_vars)
+
+    def _find_invariants(self, loop: ast.For | ast.While, assigned_vars: set[str]):
+        loop_nodes = [loop.test] if isinstance(loop, ast.While) else [loop.target]
+        loop_nodes.extend(loop.body)
+
+        # the iterated value of a for loop is evaluated after the invariants, so it can't reassign their variables
+        reassigned_vars = self._get_reassigned_vars(loop_nodes + ([loop.iter] if isinstance(loop, ast.For) else []))
+        # the local variables that may not be assigned before the loop are null when the invariants are evaluated
+        reassigned_vars.update(var_id for var_id in self._method.locals if var_id not in assigned_vars)
+        # the iterated value of a for loop is evaluated after the invariants, so it can't change them either
+        may_change_values = self._may_change_values(loop_nodes + ([loop.iter] if isinstance(loop, ast.For) else []))
+
+        invariants: list[tuple[str, ast.AST]] = []
+        # the repeated expressions use the same variable
+        invariant_ids: dict[str, str] = {}
+
+        for node in loop_nodes:
+            for expression in self._find_expressions(node, reassigned_vars, may_change_values):
+                expression_id = ast.dump(expression)
+                if expression_id not in invariant_ids:
+                    var_id = self._include_variable(expression)
+                    invariant_ids[expression_id] = var_id
+                    invariants.append((var_id, expression))
+
+                self._invariant_variables[expression] = invariant_ids[expression_id]
+
+        if len(invariants) > 0:
+            self._loop_invariants[loop] = invariants
+
+    def _find_expressions(self, node: ast.AST, reassigned_vars: set[str], may_change_values: bool) -> list[ast.AST]:
+        """
+        Finds the largest invariant expressions inside the node that can be moved out of the loop
+        """
+        if node in self._invariant_variables:
+            # it's already moved out of an outer loop
+            return []
+
+        if (not isinstance(node, ast.Name)
+                and self._get_invariant_type(node, reassigned_vars, may_change_values) is not None):
+            return [node]
+
+        expressions = []
+        for child in ast.iter_child_nodes(node):
+            expressions.extend(self._find_expressions(child, reassigned_vars, may_change_values))
+        return expressions
+
+    def _get_invariant_type(self, node: ast.AST, reassigned_vars: set[str], may_change_values: bool) -> IType | None:
+        """
+        Gets the type of the value of an invariant expression
+
+        :return: None if the expression isn't invariant or if it may fail
+        """
+        if isinstance(node, ast.Name):
+            if not isinstance(node.ctx, ast.Load) or node.id in reassigned_vars:
+                return None
+
+            # only the local variables are used, because the global ones may be changed by the called methods
+            var = self._method.args.get(node.id, self._method.locals.get(node.id))
+            return var.type if isinstance(var, Variable) else None
+
+        if isinstance(node, ast.Attribute):
+            if not isinstance(node.ctx, ast.Load) or may_change_values:
+                return None
+
+            value_type = self._get_invariant_type(node.value, reassigned_vars, may_change_values)
+            if (not isinstance(value_type, UserClass)
+                    or isinstance(value_type, ContractInterfaceClass)
+                    or node.attr not in value_type.instance_variables):
+                return None
+
+            return value_type.instance_variables[node.attr].type
+
+        if self._is_builtin_call(node, Builtin.Len) and len(node.args) == 1:
+            value_type = self._get_invariant_type(node.args[0], reassigned_vars, may_change_values)
+            if value_type in (Type.str, Type.bytes):
+                return Type.int
+            if (may_change_values
+                    or not isinstance(value_type, IType)
+                    or not (Type.sequence.is_type_of(value_type) or Type.mapping.is_type_of(value_type))):
+                return None
+            return Type.int
+
+        return None
+
+    def _include_variable(self, expression: ast.AST) -> str:
+        var_type = self._get_invariant_type(expression, set(), False)
+
+        index = len(set(self._invariant_variables.values()))
+        var_id = 'loop.invariant' if index == 0 else 'loop.invariant_{0}'.format(index)
+        self._method.include_variable(var_id, Variable(var_type))
+        return var_id
+
+    @classmethod
+    def _get_assigned_vars(cls, statements: list[ast.AST], assigned_vars: set[str]) -> set[str]:
+        """
+        Gets the variables that are assigned in every path after the statements run
+
+        :param assigned_vars: the variables that are assigned before the statements
+        """
+        assigned_vars = assigned_vars.copy()
+        for node in statements:
+            # a variable deleted in any path may not be assigned
+            assigned_vars.difference_update(inner_node.id for inner_node in ast.walk(node)
+                                            if isinstance(inner_node, ast.Name) and isinstance(inner_node.ctx, ast.Del))
+
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    assigned_vars.update(cls._get_target_vars(target))
+            elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+                if node.value is not None:
+                    assigned_vars.update(cls._get_target_vars(node.target))
+            elif isinstance(node, ast.If):
+                assigned_vars = (cls._get_assigned_vars(node.body, assigned_vars)
+                                 & cls._get_assigned_vars(node.orelse, assigned_vars))
+            elif isinstance(node, ast.With):
+                for item in node.items:
+                    if item.optional_vars is not None:
+                        assigned_vars.update(cls._get_target_vars(item.optional_vars))
+                assigned_vars = cls._get_assigned_vars(node.body, assigned_vars)
+            # the loops may not run and the other blocks may stop before assigning their variables
+
+        return assigned_vars
+
+    @staticmethod
+    def _get_target_vars(target: ast.AST) -> set[str]:
+        return {node.id for node in ast.walk(target) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)}
+
+    @staticmethod
+    def _get_reassigned_vars(nodes: list[ast.AST]) -> set[str]:
+        reassigned_vars = set()
+        for node in nodes:
+            for inner_node in ast.walk(node):
+                if isinstance(inner_node, ast.Name) and not isinstance(inner_node.ctx, ast.Load):
+                    reassigned_vars.add(inner_node.id)
+                elif isinstance(inner_node, ast.ExceptHandler) and inner_node.name is not None:
+                    reassigned_vars.add(inner_node.name)
+                elif isinstance(inner_node, (ast.Global, ast.Nonlocal)):
+                    reassigned_vars.update(inner_node.names)
+        return reassigned_vars
+
+    def _may_change_values(self, nodes: list[ast.AST]) -> bool:
+        """
+        Verifies if the nodes may change any item or attribute of a mutable value
+        """
+        for node in nodes:
+            for inner_node in ast.walk(node):
+                if isinstance(inner_node, ast.Call):
+                    if not self._is_builtin_call(inner_node, *_NON_CHANGING_BUILTINS):
+                        return True
+                elif isinstance(inner_node, (ast.Subscript, ast.Attribute)):
+                    if not isinstance(inner_node.ctx, ast.Load):
+                        return True
+        return False
+
+    def _is_builtin_call(self, node: ast.AST, *builtin_methods: IBuiltinMethod) -> bool:
+        if (not isinstance(node, ast.Call)
+                or not isinstance(node.func, ast.Name)
+                or len(node.keywords) > 0):
+            return False
+
+        symbol_id = node.func.id
+        if symbol_id in self._symbols:
+            symbol = self._symbols[symbol_id]
+        else:
+            symbol = Builtin.get_symbol(symbol_id)
+
+        return any(isinstance(symbol, type(builtin_method)) for builtin_method in builtin_methods)
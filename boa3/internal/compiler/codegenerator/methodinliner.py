@@ -0,0 +1,439 @@
+__all__ = [
+    'MethodInliner'
+]
+
+import ast
+
+from boa3.internal.compiler.codegenerator.optimizerhelper import get_method_name, get_reachable, get_successors
+from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.exception import CompilerError
+from boa3.internal.model.method import Method
+from boa3.internal.neo.vm.CallCode import CallCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+# the families of opcodes that use the slots of a method: the opcode of the slot with index zero, the opcode with the
+# index in its data, whether it stores a value and whether it uses an argument slot
+_SLOT_OPCODES = [
+    (Opcode.LDARG0, Opcode.LDARG, False, True),
+    (Opcode.STARG0, Opcode.STARG, True, True),
+    (Opcode.LDLOC0, Opcode.LDLOC, False, False),
+    (Opcode.STLOC0, Opcode.STLOC, True, False),
+]
+
+# instructions that can't be copied, because they depend on where the method is in the bytecode
+_NOT_INLINABLE_OPCODES = frozenset([
+    Opcode.TRY,
+    Opcode.TRY_L,
+    Opcode.ENDTRY,
+    Opcode.ENDTRY_L,
+    Opcode.ENDFINALLY,
+    Opcode.PUSHA,
+    Opcode.CALLA,
+])
+
+_MAX_SLOTS = 255
+
+
+class MethodInliner:
+    """
+    Replaces the calls to small private methods with a copy of their instructions.
+
+    The arguments and local variables of the inlined method are stored in new local variables of the method that calls
+    it, that are shared by all the calls of the inlined method in that method, and its returns jump to the instruction
+    after the call. The local variables that may be read before being stored are set to null before each copy, like
+    they would be in a new call.
+    """
+
+    def __init__(self, vm_code_mapping: VMCodeMapping, methods: list[Method], size_threshold: int):
+        """
+        :param vm_code_mapping: the instructions that will be optimized
+        :param methods: the methods of the bytecode
+        :param size_threshold: the maximum size in bytes of a method that is called more than once to be inlined, and
+                               the maximum that the bytecode can increase to inline it
+        """
+        self._map_instance: VMCodeMapping = vm_code_mapping
+        self._methods: list[Method] = methods
+        self._size_threshold: int = size_threshold
+
+        self.inlined_calls: dict[str, int] = {}
+        # the index of the first local variable of each caller that stores the slots of each inlined method
+        self._inlined_slots: dict[tuple[Method, Method], int] = {}
+
+    def inline(self) -> dict[str, int]:
+        """
+        Inlines the methods, starting with the ones that don't call other inlinable methods, until no call can be
+        replaced
+
+        :return: how many calls of each method were replaced
+        """
+        if self._size_threshold <= 0:
+            return self.inlined_calls
+
+        if any(code.opcode in (Opcode.PUSHA, Opcode.CALLA) for code in self._map_instance.codes):
+            # the addresses of the pointers are fixed, so no instruction can be moved
+            return self.inlined_calls
+
+        while self._run_round():
+            pass
+        return self.inlined_calls
+
+    def _run_round(self) -> bool:
+        """
+        Inlines the methods whose bodies don't call any other inlinable method
+
+        :return: whether any call was replaced
+        """
+        codes = list(self._map_instance.codes)
+        code_index = {code: index for index, code in enumerate(codes)}
+
+        sources: dict[VMCode, list[VMCode]] = {}
+        call_sites: dict[Method, list[CallCode]] = {}
+        for code in codes:
+            if isinstance(code, CallCode):
+                if isinstance(code.target_callable, Method):
+                    call_sites.setdefault(code.target_callable, []).append(code)
+            elif code.target is not None:
+                sources.setdefault(code.target, []).append(code)
+
+        bodies: dict[Method, list[VMCode]] = {}
+        for method in call_sites:
+            body = self._get_inlinable_body(method, codes, code_index, sources)
+            if body is not None:
+                bodies[method] = body
+
+        bodies = {method: body for method, body in bodies.items()
+                  if self._is_worth_inlining(body, call_sites[method])}
+
+        has_changed = False
+        for callee, body in bodies.items():
+            if any(isinstance(code, CallCode) and code.target_callable in bodies for code in body):
+                # the methods it calls are inlined first
+                continue
+
+            inlined_count = 0
+            for call in call_sites[callee]:
+                caller = self._get_caller(call)
+                if caller is not None and caller is not callee and self._inline_call(call, caller, callee, body):
+                    inlined_count += 1
+
+            if inlined_count > 0:
+                name = get_method_name(callee)
+                self.inlined_calls[name] = self.inlined_calls.get(name, 0) + inlined_count
+                has_changed = True
+
+        return has_changed
+
+    def _get_inlinable_body(self, method: Method, codes: list[VMCode],
+                            code_index: dict[VMCode, int],
+                            sources: dict[VMCode, list[VMCode]]) -> list[VMCode] | None:
+        """
+        Gets the instructions of the method if they can be copied into the methods that call it
+
+        :return: the instructions from the method's first to its last. None if the method can't be inlined
+        """
+        if (method.is_public
+                or method.is_init
+                or len(method.defaults) > 0
+                or method.has_starred_argument
+                or method.init_bytecode not in code_index
+                or method.end_bytecode not in code_index):
+            return None
+
+        start = code_index[method.init_bytecode]
+        end = code_index[method.end_bytecode]
+        if end < start:
+            return None
+
+        body = codes[start:end + 1]
+        body_codes = set(body)
+        for code in body:
+            if code.opcode in _NOT_INLINABLE_OPCODES:
+                return None
+            if isinstance(code, CallCode):
+                if code.target_callable is method:
+                    # recursive methods can't be inlined
+                    return None
+            elif code.target is not None and (code.target not in body_codes or code.target is method.init_bytecode):
+                return None
+
+            if any(source not in body_codes for source in sources.get(code, [])):
+                # only the calls can get into the method
+                return None
+
+        return body
+
+    def _is_worth_inlining(self, body: list[VMCode], calls: list[CallCode]) -> bool:
+        """
+        Checks whether the method can be copied into each of its calls without increasing too much the size of the
+        bytecode. The methods that are called more than once must also be smaller than the size threshold.
+        """
+        # if every call is replaced, the method is removed
+        size_increase = -sum(code.size for code in body)
+
+        for call in calls:
+            caller = self._get_caller(call)
+            if caller is None:
+                size_increase = 0
+                break
+
+        for call in calls:
+            caller = self._get_caller(call)
+            caller_init = caller.init_bytecode if caller is not None else None
+            first_slot = (caller_init.raw_data[0]
+                          if caller_init is not None and caller_init.opcode is Opcode.INITSLOT
+                          else 0)
+
+            inlined_size = self._get_inlined_size(body, first_slot)
+            if len(calls) > 1 and inlined_size > self._size_threshold:
+                return False
+            size_increase += inlined_size - call.size
+
+        return size_increase <= self._size_threshold
+
+    def _get_inlined_size(self, body: list[VMCode], first_slot: int) -> int:
+        """
+        Gets the size in bytes of the instructions that replace a call of the method
+
+        :param first_slot: the index of the first local variable of the caller used by the inlined method
+        """
+        num_args = 0
+        if body[0].opcode is Opcode.INITSLOT:
+            num_args = body[0].raw_data[1]
+            body = body[1:]
+
+        # the arguments are stored in local variables
+        size = sum(_build_slot_code(first_slot + index, is_store=True).size for index in range(num_args))
+        for index in _get_locals_read_before_store(body):
+            size += OpcodeInfo.PUSHNULL.data_len + 1
+            size += _build_slot_code(first_slot + num_args + index, is_store=True).size
+        for index, code in enumerate(body):
+            if code.opcode is Opcode.RET:
+                if index < len(body) - 1:
+                    size += OpcodeInfo.JMP.data_len + 1
+            elif code.target is not None:
+                size += code.size
+            else:
+                size += self._copy_code(code, first_slot, num_args).size
+
+        return size
+
+    def _get_caller(self, call: VMCode) -> Method | None:
+        """
+        Gets the method whose instructions include the given call
+        """
+        address = self._map_instance.get_start_address(call)
+        for method in self._methods:
+            start_code = method.start_bytecode
+            if (start_code is None
+                    or method.end_bytecode is None
+                    or not self._map_instance.has_code(start_code)
+                    or not self._map_instance.has_code(method.end_bytecode)):
+                continue
+
+            if (self._map_instance.get_start_address(start_code)
+                    <= address
+                    <= self._map_instance.get_start_address(method.end_bytecode)):
+                return method
+
+        return None
+
+    def _inline_call(self, call: CallCode, caller: Method, callee: Method, body: list[VMCode]) -> bool:
+        """
+        Replaces a call with a copy of the called method
+
+        :return: whether the call was replaced
+        """
+        next_code = self._map_instance.get_code(self._map_instance.get_end_address(call) + 1)
+        if next_code is None:
+            return False
+
+        if body[0].opcode is Opcode.INITSLOT:
+            num_locals, num_args = body[0].raw_data[0], body[0].raw_data[1]
+            body = body[1:]
+        else:
+            num_locals, num_args = 0, 0
+
+        first_slot = 0
+        slot_count = num_args + num_locals
+        if slot_count > 0:
+            caller_init = caller.init_bytecode
+            if caller_init is None or caller_init.opcode is not Opcode.INITSLOT:
+                return False
+
+            if (caller, callee) in self._inlined_slots:
+                # the copies of the method never run at the same time, so they use the same local variables
+                first_slot = self._inlined_slots[caller, callee]
+            else:
+                first_slot, caller_args = caller_init.raw_data[0], caller_init.raw_data[1]
+                if first_slot + slot_count > _MAX_SLOTS or len(caller.locals) != first_slot:
+                    # the variables wouldn't match their slots in the debug info
+                    return False
+
+                self._map_instance.update_vm_code(caller_init, OpcodeInfo.INITSLOT,
+                                                  bytes([first_slot + slot_count, caller_args]))
+                self._include_variables(caller, callee, first_slot, slot_count)
+                self._inlined_slots[caller, callee] = first_slot
+
+        # the arguments are on the stack, with the first one on the top
+        new_codes = [_build_slot_code(first_slot + index, is_store=True) for index in range(num_args)]
+        for index in _get_locals_read_before_store(body):
+            # the value stored by the last execution of the copied instructions can't be read
+            new_codes.append(VMCode(OpcodeInfo.PUSHNULL))
+            new_codes.append(_build_slot_code(first_slot + num_args + index, is_store=True))
+
+        copies: dict[VMCode, VMCode] = {}
+        last_code = body[-1] if len(body) > 0 else None
+        for code in body:
+            if code.opcode is Opcode.RET:
+                if code is last_code:
+                    # the last return just continues to the instruction after the call
+                    copies[code] = next_code
+                    continue
+                copied_code = VMCode(OpcodeInfo.JMP)
+            elif isinstance(code, CallCode):
+                copied_code = CallCode(code.target_callable)
+            else:
+                copied_code = self._copy_code(code, first_slot, num_args)
+
+            copies[code] = copied_code
+            new_codes.append(copied_code)
+
+        for code, copied_code in copies.items():
+            if copied_code is next_code or isinstance(copied_code, CallCode):
+                continue
+            if code.opcode is Opcode.RET:
+                copied_code.set_target(next_code)
+            elif code.target is not None:
+                copied_code.set_target(copies[code.target])
+
+        if len(new_codes) > 0:
+            self._map_instance.insert_codes_after(call, new_codes)
+            replacement = new_codes[0]
+        else:
+            replacement = next_code
+
+        self._map_instance.remove_opcodes_by_code([call])
+        for method in self._methods:
+            # the call is the first instruction of the methods without arguments and local variables
+            if method.init_bytecode is call:
+                method.init_bytecode = replacement
+            if method.init_defaults_bytecode is call:
+                method.init_defaults_bytecode = replacement
+            method.replace_debug_codes({call: replacement})
+
+        if caller.file_origin is not None and caller.file_origin == callee.file_origin:
+            caller.include_copied_instructions(callee, {code: copied_code for code, copied_code in copies.items()
+                                                        if copied_code is not next_code})
+
+        return True
+
+    @staticmethod
+    def _copy_code(code: VMCode, first_slot: int, num_args: int) -> VMCode:
+        """
+        Copies an instruction, moving the slots of the inlined method to the local variables of the caller
+        """
+        for first_opcode, indexed_opcode, is_store, is_arg in _SLOT_OPCODES:
+            opcode = code.opcode
+            if first_opcode <= opcode < indexed_opcode:
+                index = opcode[0] - first_opcode[0]
+            elif opcode is indexed_opcode:
+                index = code.raw_data[0]
+            else:
+                continue
+
+            if not is_arg:
+                index += num_args
+            return _build_slot_code(first_slot + index, is_store)
+
+        if code.target is not None:
+            # the target is set after all the instructions are copied
+            return VMCode(code.info)
+        return VMCode(code.info, code.raw_data)
+
+    @staticmethod
+    def _include_variables(caller: Method, callee: Method, first_slot: int, slot_count: int):
+        """
+        Includes the arguments and local variables of the inlined method in the caller's debug info
+        """
+        variables = list(callee.args.items()) + list(callee.locals.items())
+        if len(caller.locals) != first_slot or len(variables) != slot_count:
+            # the debug info would show the variables in the wrong slots
+            line = callee.origin.lineno if isinstance(callee.origin, ast.AST) else 0
+            col = callee.origin.col_offset if isinstance(callee.origin, ast.AST) else 0
+            raise CompilerError.InternalError(line, col,
+                                              ValueError("the variables of '{0}' don't match the slots used in '{1}'"
+                                                         .format(get_method_name(callee), get_method_name(caller))))
+
+        callee_name = get_method_name(callee)
+        for var_id, var in variables:
+            name = '{0}.{1}'.format(callee_name, var_id)
+            suffix = 1
+            while name in caller.locals:
+                name = '{0}.{1}_{2}'.format(callee_name, var_id, suffix)
+                suffix += 1
+            caller.locals[name] = var
+
+
+def _get_locals_read_before_store(body: list[VMCode]) -> list[int]:
+    """
+    Gets the local variables of a method that may be read before a value is stored in them
+
+    :param body: the instructions of the method, without its INITSLOT
+    :return: the indexes of the local variables
+    """
+    body_index = {code: index for index, code in enumerate(body)}
+    successors = get_successors(body, body_index)
+
+    loaded_slots: dict[int, list[int]] = {}
+    stored_slots: dict[int, list[int]] = {}
+    for index, code in enumerate(body):
+        slot = _get_local_slot(code)
+        if slot is not None:
+            slot_index, is_store = slot
+            if is_store:
+                stored_slots.setdefault(slot_index, []).append(index)
+            else:
+                loaded_slots.setdefault(slot_index, []).append(index)
+
+    if successors is None:
+        # the instructions that run before each load can't be known
+        return sorted(loaded_slots)
+
+    read_slots = []
+    for slot_index, loads in sorted(loaded_slots.items()):
+        # the instructions after a store can't read a value stored before the method started
+        stores = set(stored_slots.get(slot_index, []))
+        before_store = [[] if index in stores else code_successors for index, code_successors in enumerate(successors)]
+
+        reached = get_reachable(before_store, [0]) if len(body) > 0 else set()
+        if any(load in reached for load in loads):
+            read_slots.append(slot_index)
+
+    return read_slots
+
+
+def _get_local_slot(code: VMCode) -> tuple[int, bool] | None:
+    for first_opcode, indexed_opcode, is_store, is_arg in _SLOT_OPCODES:
+        if is_arg:
+            continue
+
+        opcode = code.opcode
+        if first_opcode <= opcode < indexed_opcode:
+            return opcode[0] - first_opcode[0], is_store
+        if opcode is indexed_opcode:
+            return code.raw_data[0], is_store
+
+    return None
+
+
+def _build_slot_code(index: int, is_store: bool) -> VMCode:
+    opcode = (OpcodeHelper.get_store(index, local=True) if is_store
+              else OpcodeHelper.get_load(index, local=True))
+    op_info = OpcodeInfo.get_info(opcode)
+
+    if op_info.data_len > 0:
+        return VMCode(op_info, bytes([index]))
+    return VMCode(op_info)
@@ -4,6 +4,9 @@ from boa3.internal.neo3.contracts import CallFlags
 from boa3.internal.neo3.contracts.nef import MethodToken
 from boa3.internal.neo3.core import types
 
+# the maximum number of method tokens accepted in a NEF file
+MAX_METHOD_TOKENS = 128
+
 
 class MethodTokenCollection:
     def __init__(self):
@@ -13,6 +16,9 @@ class MethodTokenCollection:
     def append(self, contract_method: IBuiltinMethod, call_flag: CallFlags = CallFlags.ALL) -> int | None:
         method_token_id = self._try_get_index(contract_method, call_flag)
         if method_token_id is None and hasattr(contract_method, 'contract_script_hash'):
+            if len(self._method_tokens) >= MAX_METHOD_TOKENS:
+                return None
+
             method_token = MethodToken(hash=types.UInt160(contract_method.contract_script_hash),
                                        method=contract_method.external_name,
                                        parameters_count=(contract_method.internal_call_args
@@ -29,12 +35,28 @@ class MethodTokenCollection:
                 return None
 
             method_token_id = len(self._method_tokens)
-            if hasattr(contract_method, '_method_token_id'):
-                contract_method.reset()
+            contract_method.reset()
             self._method_tokens.append(method_token)
 
         return method_token_id
 
+    def append_contract_method(self, contract_hash: types.UInt160, method_name: str, parameters_count: int,
+                               has_return_value: bool, call_flag: CallFlags = CallFlags.ALL) -> int | None:
+        method_token_id = self._find_token(contract_hash.to_array(), method_name, parameters_count,
+                                           has_return_value, call_flag)
+        if method_token_id is None:
+            if len(self._method_tokens) >= MAX_METHOD_TOKENS:
+                return None
+
+            method_token_id = len(self._method_tokens)
+            self._method_tokens.append(MethodToken(hash=contract_hash,
+                                                   method=method_name,
+                                                   parameters_count=parameters_count,
+                                                   has_return_value=has_return_value,
+                                                   call_flags=call_flag))
+
+        return method_token_id
+
     def clear(self):
         # reset the opcodes to ensure the correct output when calling consecutive compilations
         for method in self._called_builtins:
@@ -51,11 +73,16 @@ class MethodTokenCollection:
                             if hasattr(contract_method, 'internal_call_args')
                             else len(contract_method.args))
 
+        return self._find_token(contract_method.contract_script_hash, contract_method.external_name, parameters_count,
+                                contract_method.return_type is not Type.none, call_flag)
+
+    def _find_token(self, contract_hash: bytes, method_name: str, parameters_count: int, has_return_value: bool,
+                    call_flag: CallFlags) -> int | None:
         method_token_index = next((index for index, token in enumerate(self._method_tokens)
-                                   if (token.hash.to_array() == contract_method.contract_script_hash
-                                       and token.method == contract_method.external_name
+                                   if (token.hash.to_array() == contract_hash
+                                       and token.method == method_name
                                        and token.parameters_count == parameters_count
-                                       and token.has_return_value == (contract_method.return_type is not Type.none)
+                                       and token.has_return_value == has_return_value
                                        and token.call_flags == call_flag)), None)
         return method_token_index
 
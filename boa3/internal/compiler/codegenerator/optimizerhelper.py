@@ -1,11 +1,45 @@
 __all__ = [
     'OptimizationLevel',
+    'build_slot_code',
+    'get_inline_size_threshold',
+    'get_jump_sources',
+    'get_method_body',
+    'get_method_name',
+    'get_reachable',
+    'get_successors',
+    'is_call',
     'is_storing_static_variable'
 ]
 
+import ast
 import enum
 
+from boa3.internal.model.method import Method
 from boa3.internal.model.variable import Variable
+from boa3.internal.neo.vm.CallCode import CallCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+# instructions that never continue to the next instruction
+_TERMINATOR_OPCODES = frozenset([
+    Opcode.JMP,
+    Opcode.JMP_L,
+    Opcode.RET,
+    Opcode.THROW,
+    Opcode.ABORT,
+    Opcode.ABORTMSG,
+])
+
+# the exception handlers can be executed after any instruction of the try
+_EXCEPTION_OPCODES = frozenset([
+    Opcode.TRY,
+    Opcode.TRY_L,
+    Opcode.ENDTRY,
+    Opcode.ENDTRY_L,
+    Opcode.ENDFINALLY,
+])
 
 
 class OptimizationLevel(enum.IntEnum):
@@ -25,3 +59,130 @@ def is_storing_static_variable(level: OptimizationLevel, var: Variable) -> bool:
 
     # doesn't store variables that we know the value on higher optimization levels
     return var.is_reassigned or not var.has_literal_value
+
+
+def get_inline_size_threshold(level: OptimizationLevel) -> int:
+    """
+    Gets the maximum size in bytes of the body of a private method to be copied into each method that calls it.
+    Zero means that methods aren't inlined.
+    """
+    if level <= OptimizationLevel.DEBUG:
+        # the inlined methods can't be stepped into while debugging
+        return 0
+
+    return 32
+
+
+def is_call(code: VMCode) -> bool:
+    """
+    Checks whether the instruction calls a method, that returns to the next instruction
+    """
+    return isinstance(code, CallCode) or code.opcode in (Opcode.CALL, Opcode.CALL_L)
+
+
+def get_jump_sources(codes: list[VMCode]) -> dict[VMCode, list[VMCode]]:
+    """
+    Maps each instruction to the jumps that target it, without the calls
+    """
+    sources: dict[VMCode, list[VMCode]] = {}
+    for code in codes:
+        if code.target is not None and not is_call(code):
+            sources.setdefault(code.target, []).append(code)
+    return sources
+
+
+def get_method_name(method: Method) -> str:
+    """
+    Gets the name of the method that is shown in the optimizer reports and in the debug info of the inlined variables
+    """
+    if isinstance(method.origin, ast.FunctionDef):
+        return method.origin.name
+    return method.external_name if method.external_name is not None else 'method'
+
+
+def get_method_body(method: Method, codes: list[VMCode], code_index: dict[VMCode, int]) -> list[VMCode] | None:
+    """
+    Gets the instructions of a method whose local variables can be changed by the optimizer
+
+    :param method: the method of the instructions
+    :param codes: all the instructions of the bytecode
+    :param code_index: the index of each instruction in the codes
+    :return: the instructions from the method's INITSLOT to its last. None if the method doesn't initialize its slots,
+             if its local variables don't match the ones in the debug info or if it handles exceptions
+    """
+    init_code = method.init_bytecode
+    if (init_code is None
+            or init_code.opcode is not Opcode.INITSLOT
+            # each local variable must have its own slot to be mapped in the debug info
+            or init_code.raw_data[0] != len(method.locals)
+            or init_code not in code_index
+            or method.end_bytecode not in code_index):
+        return None
+
+    start = code_index[init_code]
+    end = code_index[method.end_bytecode]
+    if end < start:
+        return None
+
+    body = codes[start:end + 1]
+    if any(code.opcode is Opcode.INITSLOT or code.opcode in _EXCEPTION_OPCODES for code in body[1:]):
+        return None
+    return body
+
+
+def get_successors(body: list[VMCode], body_index: dict[VMCode, int]) -> list[list[int]] | None:
+    """
+    Gets the indexes of the instructions that can be executed after each instruction of a method
+
+    :param body: the instructions of the method
+    :param body_index: the index of each instruction in the body
+    :return: None if any jump goes to an instruction outside the method
+    """
+    size = len(body)
+    successors = []
+    for index, code in enumerate(body):
+        code_successors = []
+        if OpcodeHelper.has_target(code.opcode) and not is_call(code):
+            if code.target not in body_index:
+                return None
+            code_successors.append(body_index[code.target])
+
+        if code.opcode not in _TERMINATOR_OPCODES and index + 1 < size:
+            code_successors.append(index + 1)
+        successors.append(code_successors)
+
+    return successors
+
+
+def get_reachable(successors: list[list[int]], start: list[int], avoid: int = None) -> set[int]:
+    """
+    Gets the indexes of the instructions that can be executed from the given ones
+
+    :param successors: the successors of each instruction of the method
+    :param start: the indexes of the first instructions
+    :param avoid: the index of an instruction whose successors aren't followed
+    """
+    reached = set()
+    to_visit = list(start)
+    while len(to_visit) > 0:
+        index = to_visit.pop()
+        if index in reached:
+            continue
+        reached.add(index)
+        if index != avoid:
+            to_visit.extend(successors[index])
+
+    return reached
+
+
+def build_slot_code(index: int, is_store: bool) -> VMCode:
+    """
+    Creates the instruction that loads or stores the local variable with the given index
+    """
+    opcode = (OpcodeHelper.get_store(index, local=True) if is_store
+              else OpcodeHelper.get_load(index, local=True))
+    op_info = OpcodeInfo.get_info(opcode)
+
+    if op_info.data_len > 0:
+        return VMCode(op_info, bytes([index]))
+    return VMCode(op_info)
@@ -0,0 +1,31 @@
+__all__ = [
+    'DoubleSwapRule'
+]
+
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+
+class DoubleSwapRule(IPeepholeRule):
+    """
+    Removes two consecutive `SWAP`, since the second one undoes the first
+    """
+
+    @property
+    def identifier(self) -> str:
+        return 'double-swap'
+
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        first_swap = optimizer.get_code(index)
+        second_swap = optimizer.get_code(index + 1)
+        if (first_swap is None or second_swap is None
+                or first_swap.opcode is not Opcode.SWAP or second_swap.opcode is not Opcode.SWAP):
+            return None
+
+        if (optimizer.is_targeted(second_swap)
+                or not optimizer.can_remove(first_swap)
+                or not optimizer.can_remove(second_swap)):
+            return None
+
+        return PeepholeChange(2, removed_codes=[first_swap, second_swap])
@@ -0,0 +1,33 @@
+__all__ = [
+    'IPeepholeRule'
+]
+
+import abc
+
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+
+
+class IPeepholeRule(abc.ABC):
+    """
+    A rule that replaces a short sequence of instructions with an equivalent cheaper one
+    """
+
+    @property
+    @abc.abstractmethod
+    def identifier(self) -> str:
+        """
+        Gets the name of the rule used in the optimization report
+        """
+        pass
+
+    @abc.abstractmethod
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        """
+        Checks whether the rule can be applied to the instructions starting at the given index
+
+        :param optimizer: the optimizer that is applying the rule
+        :type optimizer: boa3.internal.compiler.codegenerator.peephole.peepholeoptimizer.PeepholeOptimizer
+        :param index: the position of the first instruction in the optimizer's code list
+        :return: the changes to the instructions if the rule matches. None otherwise
+        """
+        pass
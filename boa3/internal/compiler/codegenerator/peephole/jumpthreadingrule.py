@@ -0,0 +1,37 @@
+__all__ = [
+    'JumpThreadingRule'
+]
+
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+
+class JumpThreadingRule(IPeepholeRule):
+    """
+    Changes the target of a jump to an unconditional jump to the final target of that jump
+    """
+
+    @property
+    def identifier(self) -> str:
+        return 'jump-threading'
+
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        jump_code = optimizer.get_code(index)
+        if jump_code is None or not OpcodeHelper.is_jump(jump_code.opcode):
+            return None
+
+        target = jump_code.target
+        visited = {jump_code}
+        while target is not None and target.opcode in (Opcode.JMP, Opcode.JMP_L):
+            if target in visited:
+                # infinite loop of jumps
+                return None
+            visited.add(target)
+            target = target.target
+
+        if target is None or target is jump_code.target or optimizer.get_index(target) < 0:
+            return None
+
+        return PeepholeChange(1, retargeted_codes=[(jump_code, target)])
@@ -0,0 +1,42 @@
+__all__ = [
+    'JumpToNextRule'
+]
+
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+class JumpToNextRule(IPeepholeRule):
+    """
+    Removes a jump to the instruction right after it. If the jump is conditional, it's replaced with a `DROP` to
+    remove its condition from the stack.
+    """
+
+    _conditional_jumps = (
+        Opcode.JMPIF,
+        Opcode.JMPIF_L,
+        Opcode.JMPIFNOT,
+        Opcode.JMPIFNOT_L,
+    )
+
+    @property
+    def identifier(self) -> str:
+        return 'jump-to-next'
+
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        jump_code = optimizer.get_code(index)
+        next_code = optimizer.get_code(index + 1)
+        if jump_code is None or next_code is None or jump_code.target is not next_code:
+            return None
+
+        if jump_code.opcode in (Opcode.JMP, Opcode.JMP_L):
+            if not optimizer.can_remove(jump_code):
+                return None
+            return PeepholeChange(1, removed_codes=[jump_code])
+
+        if jump_code.opcode in self._conditional_jumps:
+            return PeepholeChange(1, replaced_codes=[(jump_code, OpcodeInfo.DROP, bytes())])
+
+        return None
@@ -0,0 +1,29 @@
+__all__ = [
+    'JumpToReturnRule'
+]
+
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+class JumpToReturnRule(IPeepholeRule):
+    """
+    Replaces an unconditional jump to a `RET` with the `RET` itself
+    """
+
+    @property
+    def identifier(self) -> str:
+        return 'jump-to-return'
+
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        jump_code = optimizer.get_code(index)
+        if jump_code is None or jump_code.opcode not in (Opcode.JMP, Opcode.JMP_L):
+            return None
+
+        target = jump_code.target
+        if target is None or target.opcode is not Opcode.RET:
+            return None
+
+        return PeepholeChange(1, replaced_codes=[(jump_code, OpcodeInfo.RET, bytes())])
@@ -0,0 +1,41 @@
+__all__ = [
+    'NotJumpRule'
+]
+
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+
+class NotJumpRule(IPeepholeRule):
+    """
+    Replaces `NOT; JMPIF` with `JMPIFNOT` and `NOT; JMPIFNOT` with `JMPIF`
+    """
+
+    _inverted_jumps = {
+        Opcode.JMPIF: OpcodeInfo.JMPIFNOT,
+        Opcode.JMPIF_L: OpcodeInfo.JMPIFNOT_L,
+        Opcode.JMPIFNOT: OpcodeInfo.JMPIF,
+        Opcode.JMPIFNOT_L: OpcodeInfo.JMPIF_L,
+    }
+
+    @property
+    def identifier(self) -> str:
+        return 'not-jump'
+
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        not_code = optimizer.get_code(index)
+        jump_code = optimizer.get_code(index + 1)
+        if not_code is None or jump_code is None or not_code.opcode is not Opcode.NOT:
+            return None
+
+        if jump_code.opcode not in self._inverted_jumps or jump_code.target is None:
+            return None
+
+        if optimizer.is_targeted(jump_code) or not optimizer.can_remove(not_code):
+            return None
+
+        return PeepholeChange(2,
+                              removed_codes=[not_code],
+                              replaced_codes=[(jump_code, self._inverted_jumps[jump_code.opcode], bytes())])
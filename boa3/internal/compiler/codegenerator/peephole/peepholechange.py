@@ -0,0 +1,32 @@
+__all__ = [
+    'PeepholeChange'
+]
+
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.OpcodeInformation import OpcodeInformation
+
+
+class PeepholeChange:
+    """
+    The changes a peephole rule does in the sequence of instructions it matched
+
+    :ivar matched_size: the number of instructions matched by the rule, that can't be changed by other rules
+    :ivar removed_codes: the instructions that must be removed
+    :ivar replaced_codes: the instructions that must have its opcode replaced, with their new opcode and data
+    :ivar retargeted_codes: the instructions that must have its target changed, with their new target
+    """
+
+    __slots__ = ('matched_size', 'removed_codes', 'replaced_codes', 'retargeted_codes')
+
+    def __init__(self, matched_size: int,
+                 removed_codes: list[VMCode] = None,
+                 replaced_codes: list[tuple[VMCode, OpcodeInformation, bytes]] = None,
+                 retargeted_codes: list[tuple[VMCode, VMCode]] = None):
+        self.matched_size: int = matched_size
+        self.removed_codes: list[VMCode] = removed_codes if removed_codes is not None else []
+        self.replaced_codes: list[tuple[VMCode, OpcodeInformation, bytes]] = (replaced_codes
+                                                                              if replaced_codes is not None
+                                                                              else [])
+        self.retargeted_codes: list[tuple[VMCode, VMCode]] = (retargeted_codes
+                                                              if retargeted_codes is not None
+                                                              else [])
@@ -0,0 +1,242 @@
+__all__ = [
+    'PeepholeOptimizer'
+]
+
+import bisect
+
+from boa3.internal.compiler.codegenerator.peephole.doubleswaprule import DoubleSwapRule
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.jumpthreadingrule import JumpThreadingRule
+from boa3.internal.compiler.codegenerator.peephole.jumptonextrule import JumpToNextRule
+from boa3.internal.compiler.codegenerator.peephole.jumptoreturnrule import JumpToReturnRule
+from boa3.internal.compiler.codegenerator.peephole.notjumprule import NotJumpRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.compiler.codegenerator.peephole.peepholereport import PeepholeReport
+from boa3.internal.compiler.codegenerator.peephole.pushdroprule import PushDropRule
+from boa3.internal.compiler.codegenerator.peephole.storeloadrule import StoreLoadRule
+from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.model.method import Method
+from boa3.internal.neo.vm.CallCode import CallCode
+from boa3.internal.neo.vm.TryCode import TryCode
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+
+class PeepholeOptimizer:
+    """
+    Replaces short sequences of instructions with cheaper equivalent ones, until none of its rules can be applied.
+    """
+
+    def __init__(self, vm_code_mapping: VMCodeMapping, methods: list[Method] = None, entry_points: list[VMCode] = None):
+        """
+        :param vm_code_mapping: the instructions that will be optimized
+        :param methods: the methods whose debug information must follow the changed instructions
+        :param entry_points: the instructions that can be executed from outside the contract
+        """
+        self._map_instance: VMCodeMapping = vm_code_mapping
+        self._methods: list[Method] = methods if methods is not None else []
+        self._entry_points: list[VMCode] = entry_points if entry_points is not None else []
+        self._rules: list[IPeepholeRule] = self._get_rules()
+
+        self.report: PeepholeReport = PeepholeReport()
+
+        self._codes: list[VMCode] = []
+        self._code_index: dict[VMCode, int] = {}
+        self._targeted_codes: set[VMCode] = set()
+        self._fixed_codes: set[VMCode] = set()
+        self._slot_frame_starts: list[int] = []
+
+    @staticmethod
+    def _get_rules() -> list[IPeepholeRule]:
+        return [
+            PushDropRule(),
+            DoubleSwapRule(),
+            StoreLoadRule(),
+            NotJumpRule(),
+            JumpToNextRule(),
+            JumpThreadingRule(),
+            JumpToReturnRule(),
+        ]
+
+    @property
+    def codes(self) -> list[VMCode]:
+        """
+        Gets the instructions of the current pass, ordered by their address
+        """
+        return self._codes
+
+    def get_code(self, index: int) -> VMCode | None:
+        """
+        Gets the instruction at the given position
+
+        :return: the instruction if the index is in the list. None otherwise
+        """
+        if 0 <= index < len(self._codes):
+            return self._codes[index]
+        return None
+
+    def get_index(self, code: VMCode) -> int:
+        """
+        Gets the position of the instruction in the current pass
+
+        :return: the index of the instruction if it's in the list. Otherwise, returns -1
+        """
+        return self._code_index.get(code, -1)
+
+    def is_targeted(self, code: VMCode) -> bool:
+        """
+        Checks whether the instruction can be executed after an instruction that is not the one before it
+        """
+        return code in self._targeted_codes
+
+    def can_remove(self, code: VMCode) -> bool:
+        """
+        Checks whether the instruction can be removed. The instructions that start methods and exception handlers
+        can't be removed, because their sources aren't moved to the next instruction.
+        """
+        return code not in self._fixed_codes
+
+    def get_slot_frame(self, index: int) -> tuple[int, int] | None:
+        """
+        Gets the range of instructions that use the same local variables as the instruction at the given position
+
+        :return: the index of the INITSLOT that initializes the local variables and the index after the last
+                 instruction that uses them. None if the instruction is not after an INITSLOT
+        """
+        position = bisect.bisect_right(self._slot_frame_starts, index) - 1
+        if position < 0:
+            return None
+
+        start = self._slot_frame_starts[position]
+        end = (self._slot_frame_starts[position + 1] if position + 1 < len(self._slot_frame_starts)
+               else len(self._codes))
+        return start, end
+
+    def optimize(self) -> PeepholeReport:
+        """
+        Applies the rules until none of them changes the instructions
+
+        :return: how much each rule has reduced the bytecode
+        """
+        if any(code.opcode is Opcode.PUSHA for code in self._map_instance.codes):
+            # the addresses of the pointers are fixed, so no instruction can be moved
+            return self.report
+
+        while self._run_pass():
+            pass
+        return self.report
+
+    def _run_pass(self) -> bool:
+        """
+        Applies each rule where it matches in the instructions. The instructions matched by a rule aren't checked by
+        the other rules in the same pass.
+
+        :return: whether any instruction was changed
+        """
+        self._load_codes()
+
+        changes: list[tuple[IPeepholeRule, PeepholeChange]] = []
+        index = 0
+        while index < len(self._codes):
+            for rule in self._rules:
+                change = rule.match(self, index)
+                if change is not None:
+                    changes.append((rule, change))
+                    index += max(change.matched_size, 1)
+                    break
+            else:
+                index += 1
+
+        if len(changes) == 0:
+            return False
+
+        self._apply_changes(changes)
+        return True
+
+    def _load_codes(self):
+        self._codes = list(self._map_instance.codes)
+        self._code_index = {code: index for index, code in enumerate(self._codes)}
+
+        self._fixed_codes = set(self._entry_points)
+        self._targeted_codes = set()
+        self._slot_frame_starts = []
+
+        for index, code in enumerate(self._codes):
+            if code.opcode is Opcode.INITSLOT:
+                self._slot_frame_starts.append(index)
+
+            if not OpcodeHelper.has_target(code.opcode):
+                continue
+
+            if isinstance(code, TryCode):
+                targets = [code.except_start_code, code.finally_start_code]
+                self._fixed_codes.update(target for target in targets if target is not None)
+            elif isinstance(code, CallCode):
+                targets = [code.target]
+                self._fixed_codes.add(code.target)
+            else:
+                targets = [code.target]
+
+            self._targeted_codes.update(target for target in targets if target is not None)
+
+        self._targeted_codes.update(self._fixed_codes)
+
+    def _apply_changes(self, changes: list[tuple[IPeepholeRule, PeepholeChange]]):
+        removed_codes = []
+
+        for rule, change in changes:
+            saved_bytes = sum(code.size for code in change.removed_codes)
+            saved_price = sum(code.info.price for code in change.removed_codes)
+
+            for code, new_target in change.retargeted_codes:
+                saved_price += self._get_skipped_price(code.target, new_target)
+                code.set_target(new_target)
+
+            for code, opcode_info, data in change.replaced_codes:
+                saved_price += code.info.price - opcode_info.price
+                code_size = code.size
+                self._map_instance.update_vm_code(code, opcode_info, data)
+                saved_bytes += code_size - code.size
+
+            removed_codes.extend(change.removed_codes)
+            self.report.include(rule.identifier, saved_bytes, saved_price)
+
+        if len(removed_codes) > 0:
+            replacements = self._get_replacements(removed_codes)
+            for method in self._methods:
+                method.update_end_bytecode(self._map_instance, replacements.keys())
+
+            self._map_instance.remove_opcodes_by_code(removed_codes)
+
+            for method in self._methods:
+                method.replace_debug_codes(replacements)
+
+    def _get_skipped_price(self, old_target: VMCode, new_target: VMCode) -> int:
+        """
+        Gets the execution price of the jumps that are skipped when an instruction targets another one
+        """
+        price = 0
+        visited = set()
+        code = old_target
+        while code is not None and code is not new_target and code not in visited:
+            visited.add(code)
+            price += code.info.price
+            code = code.target
+        return price
+
+    def _get_replacements(self, removed_codes: list[VMCode]) -> dict[VMCode, VMCode | None]:
+        """
+        Maps each removed instruction to the first instruction after it that is not removed
+
+        :return: a dictionary with the removed codes as keys. The value is None if there isn't a kept code after it
+        """
+        removed = set(removed_codes)
+        replacements = {}
+        next_kept_code = None
+        for code in reversed(self._codes):
+            if code in removed:
+                replacements[code] = next_kept_code
+            else:
+                next_kept_code = code
+        return replacements
@@ -0,0 +1,77 @@
+__all__ = [
+    'PeepholeReport',
+    'PeepholeRuleReport'
+]
+
+from boa3.internal import constants
+
+
+class PeepholeRuleReport:
+    """
+    How much a peephole rule has reduced the bytecode
+
+    :ivar identifier: the name of the rule
+    :ivar applied: how many times the rule was applied
+    :ivar saved_bytes: how many bytes were removed from the bytecode
+    :ivar saved_price: the sum of the execution prices of the removed instructions, without the execution fee factor
+    """
+
+    __slots__ = ('identifier', 'applied', 'saved_bytes', 'saved_price')
+
+    def __init__(self, identifier: str):
+        self.identifier: str = identifier
+        self.applied: int = 0
+        self.saved_bytes: int = 0
+        self.saved_price: int = 0
+
+    @property
+    def saved_gas(self) -> int:
+        """
+        Gets the estimated GAS, in its smallest unit, saved when each of the changed instructions is executed once
+        """
+        return self.saved_price * constants.DEFAULT_EXEC_FEE_FACTOR
+
+    def __str__(self) -> str:
+        gas = self.saved_gas / 10 ** constants.GAS_DECIMALS
+        return (f"'{self.identifier}' applied {self.applied} time(s): "
+                f"{self.saved_bytes} byte(s) and {gas:.8f} GAS saved")
+
+
+class PeepholeReport:
+    """
+    How much each peephole rule has reduced the bytecode
+    """
+
+    def __init__(self):
+        self._rules: dict[str, PeepholeRuleReport] = {}
+
+    @property
+    def rules(self) -> list[PeepholeRuleReport]:
+        return list(self._rules.values())
+
+    @property
+    def saved_bytes(self) -> int:
+        return sum(rule.saved_bytes for rule in self._rules.values())
+
+    @property
+    def saved_gas(self) -> int:
+        return sum(rule.saved_gas for rule in self._rules.values())
+
+    def get_rule(self, identifier: str) -> PeepholeRuleReport | None:
+        return self._rules.get(identifier)
+
+    def include(self, identifier: str, saved_bytes: int, saved_price: int):
+        """
+        Includes a change made by a rule in the report
+
+        :param identifier: the name of the rule
+        :param saved_bytes: how many bytes the change removed
+        :param saved_price: the execution price the change removed
+        """
+        if identifier not in self._rules:
+            self._rules[identifier] = PeepholeRuleReport(identifier)
+
+        rule = self._rules[identifier]
+        rule.applied += 1
+        rule.saved_bytes += saved_bytes
+        rule.saved_price += saved_price
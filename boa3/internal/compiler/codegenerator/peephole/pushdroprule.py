@@ -0,0 +1,44 @@
+__all__ = [
+    'PushDropRule'
+]
+
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+
+class PushDropRule(IPeepholeRule):
+    """
+    Removes an instruction that only pushes a value onto the stack when the value is dropped right after it
+
+    `PUSH x; DROP`, `DUP; DROP` and `LDLOC n; DROP` are removed
+    """
+
+    @property
+    def identifier(self) -> str:
+        return 'push-drop'
+
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        push_code = optimizer.get_code(index)
+        drop_code = optimizer.get_code(index + 1)
+        if push_code is None or drop_code is None or drop_code.opcode is not Opcode.DROP:
+            return None
+
+        if not self._is_push_only(push_code.opcode):
+            return None
+
+        if (optimizer.is_targeted(drop_code)
+                or not optimizer.can_remove(push_code)
+                or not optimizer.can_remove(drop_code)):
+            return None
+
+        return PeepholeChange(2, removed_codes=[push_code, drop_code])
+
+    def _is_push_only(self, opcode: Opcode) -> bool:
+        return (Opcode.PUSHINT8 <= opcode <= Opcode.PUSHINT256
+                or Opcode.PUSHT <= opcode <= Opcode.PUSHF
+                or Opcode.PUSHNULL <= opcode <= Opcode.PUSH16
+                or opcode in (Opcode.DUP, Opcode.OVER)
+                or Opcode.LDSFLD0 <= opcode <= Opcode.LDSFLD
+                or Opcode.LDLOC0 <= opcode <= Opcode.LDLOC
+                or Opcode.LDARG0 <= opcode <= Opcode.LDARG)
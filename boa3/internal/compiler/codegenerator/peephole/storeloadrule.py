@@ -0,0 +1,97 @@
+__all__ = [
+    'StoreLoadRule'
+]
+
+from boa3.internal.compiler.codegenerator.optimizerhelper import get_reachable, get_successors
+from boa3.internal.compiler.codegenerator.peephole.ipeepholerule import IPeepholeRule
+from boa3.internal.compiler.codegenerator.peephole.peepholechange import PeepholeChange
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+# the exception handlers can be executed after any instruction of the try
+_EXCEPTION_OPCODES = frozenset([
+    Opcode.TRY,
+    Opcode.TRY_L,
+    Opcode.ENDTRY,
+    Opcode.ENDTRY_L,
+    Opcode.ENDFINALLY,
+])
+
+
+class StoreLoadRule(IPeepholeRule):
+    """
+    Removes `STLOC n; LDLOC n` when the stored value isn't read anywhere else, so the value is kept on the stack instead
+    of being stored
+    """
+
+    @property
+    def identifier(self) -> str:
+        return 'store-load'
+
+    def match(self, optimizer, index: int) -> PeepholeChange | None:
+        store_code = optimizer.get_code(index)
+        load_code = optimizer.get_code(index + 1)
+        if store_code is None or load_code is None:
+            return None
+
+        local_index = _get_local_index(store_code, Opcode.STLOC0, Opcode.STLOC)
+        if local_index is None or local_index != _get_local_index(load_code, Opcode.LDLOC0, Opcode.LDLOC):
+            return None
+
+        if (optimizer.is_targeted(load_code)
+                or not optimizer.can_remove(store_code)
+                or not optimizer.can_remove(load_code)):
+            return None
+
+        slot_frame = optimizer.get_slot_frame(index)
+        if slot_frame is None:
+            return None
+
+        frame_start, frame_end = slot_frame
+        if _is_read_again(optimizer.codes[frame_start:frame_end], index + 1 - frame_start, local_index):
+            return None
+
+        return PeepholeChange(2, removed_codes=[store_code, load_code])
+
+
+def _is_read_again(frame: list[VMCode], load_index: int, local_index: int) -> bool:
+    """
+    Checks whether the value of the local variable can be read by another instruction after the given load, before
+    another value is stored in it
+
+    :param frame: the instructions that use the same local variables
+    :param load_index: the index of the load in the frame
+    """
+    loads = [index for index, code in enumerate(frame)
+             if index != load_index and _get_local_index(code, Opcode.LDLOC0, Opcode.LDLOC) == local_index]
+    if len(loads) == 0:
+        return False
+
+    successors = None
+    if not any(code.opcode in _EXCEPTION_OPCODES for code in frame):
+        successors = get_successors(frame, {code: index for index, code in enumerate(frame)})
+    if successors is None:
+        # the instructions that run after the load can't be known, so the value may be read by any of them
+        return True
+
+    # the instructions after another store can't read the removed value
+    before_store = [[] if _get_local_index(frame[index], Opcode.STLOC0, Opcode.STLOC) == local_index
+                    else code_successors
+                    for index, code_successors in enumerate(successors)]
+    reached = get_reachable(before_store, before_store[load_index])
+    return any(load in reached for load in loads)
+
+
+def _get_local_index(code: VMCode, first_opcode: Opcode, indexed_opcode: Opcode) -> int | None:
+    """
+    Gets the index of the local variable used by the instruction if its opcode is in the given family of opcodes
+
+    :param first_opcode: the opcode that uses the local variable with index zero
+    :param indexed_opcode: the opcode that has the index of the local variable in its data
+    """
+    opcode = code.opcode
+    if first_opcode <= opcode < indexed_opcode:
+        return opcode[0] - first_opcode[0]
+    if opcode is indexed_opcode:
+        return code.raw_data[0]
+    return None
@@ -0,0 +1,241 @@
+__all__ = [
+    'SlotAllocator'
+]
+
+from boa3.internal.compiler.codegenerator.optimizerhelper import get_jump_sources, get_method_body, \
+    get_method_name, get_successors
+from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.model.method import Method
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3.internal.neo.vm.opcode.OpcodeInformation import OpcodeInformation
+
+
+class SlotAllocator:
+    """
+    Reuses the slots of the local variables of each method whose values are never needed at the same time, to reduce
+    the number of slots initialized by INITSLOT.
+
+    A local variable is live after an instruction if its value may be read before it's stored again. Two variables can
+    share a slot if neither of them is stored while the other one is live.
+    """
+
+    def __init__(self, vm_code_mapping: VMCodeMapping, methods: list[Method]):
+        """
+        :param vm_code_mapping: the instructions that will be optimized
+        :param methods: the methods whose local variables can be reallocated
+        """
+        self._map_instance: VMCodeMapping = vm_code_mapping
+        self._methods: list[Method] = methods
+
+        self.removed_slots: dict[str, int] = {}
+
+    def allocate(self) -> dict[str, int]:
+        """
+        Reallocates the local variables of each method
+
+        :return: how many slots were removed from each method
+        """
+        codes = list(self._map_instance.codes)
+        code_index = {code: index for index, code in enumerate(codes)}
+
+        sources = get_jump_sources(codes)
+
+        for method in self._methods:
+            body = get_method_body(method, codes, code_index)
+            if body is None or body[0].raw_data[0] == 0:
+                continue
+
+            removed_slots = self._allocate_method_slots(method, body, sources)
+            if removed_slots > 0:
+                self.removed_slots[get_method_name(method)] = removed_slots
+
+        return self.removed_slots
+
+    def _allocate_method_slots(self, method: Method, body: list[VMCode], sources: dict[VMCode, list[VMCode]]) -> int:
+        """
+        Reallocates the local variables of the method
+
+        :return: how many slots were removed
+        """
+        init_code = body[0]
+        num_locals, num_args = init_code.raw_data[0], init_code.raw_data[1]
+        body_index = {code: index for index, code in enumerate(body)}
+
+        successors = get_successors(body, body_index)
+        if successors is None:
+            return 0
+
+        if any(source not in body_index for code in body for source in sources.get(code, [])):
+            # some instruction is executed after a jump from another method
+            return 0
+
+        live_after = self._get_live_slots(body, successors)
+        interferences: dict[int, int] = {slot: 0 for slot in range(num_locals)}
+        used_slots = 0
+        for index, code in enumerate(body):
+            slot = _get_local_slot(code)
+            if slot is None:
+                continue
+
+            slot_index, is_store = slot
+            used_slots |= 1 << slot_index
+            if is_store:
+                # the stored variable can't share the slot of any variable that is still needed
+                live_slots = live_after[index] & ~(1 << slot_index)
+                interferences[slot_index] |= live_slots
+                for other_slot in _get_slots(live_slots):
+                    interferences[other_slot] |= 1 << slot_index
+
+        new_slots: dict[int, int] = {}
+        for slot_index in _get_slots(used_slots):
+            used_new_slots = {new_slots[other_slot] for other_slot in _get_slots(interferences[slot_index])
+                              if other_slot in new_slots}
+            new_slot = 0
+            while new_slot in used_new_slots:
+                new_slot += 1
+            new_slots[slot_index] = new_slot
+
+        new_num_locals = max(new_slots.values(), default=-1) + 1
+        if new_num_locals >= num_locals:
+            return 0
+
+        # a slot is shared by more than one variable, so the debug info must tell which one is in the slot
+        local_ranges = self._get_local_ranges(method, body, live_after)
+
+        for code in body:
+            slot = _get_local_slot(code)
+            if slot is not None:
+                slot_index, is_store = slot
+                op_info, data = _get_slot_code_info(new_slots[slot_index], is_store)
+                self._map_instance.update_vm_code(code, op_info, data)
+
+        if new_num_locals > 0 or num_args > 0:
+            self._map_instance.update_vm_code(init_code, OpcodeInfo.INITSLOT, bytes([new_num_locals, num_args]))
+        else:
+            # INITSLOT can't initialize zero slots
+            self._remove_init_slot(init_code, body[1] if len(body) > 1 else None)
+
+        # the variables that are not used anymore don't have a slot in the debug info
+        method.local_slots = {var_id: new_slots[index]
+                              for index, var_id in enumerate(method.locals)
+                              if index in new_slots}
+        method.local_ranges = local_ranges
+        return num_locals - new_num_locals
+
+    @staticmethod
+    def _get_local_ranges(method: Method, body: list[VMCode],
+                          live_after: list[int]) -> dict[str, list[tuple[VMCode, VMCode]]]:
+        """
+        Gets the ranges of instructions in which each local variable has its value in its slot, from an instruction
+        that stores it to the last instruction that may read it
+
+        :return: a dictionary that maps the name of each variable to the first and last instructions of its ranges
+        """
+        local_ranges = {}
+        for slot_index, var_id in enumerate(method.locals):
+            ranges = []
+            range_start = None
+            for index, code in enumerate(body):
+                has_value = (live_after[index] >> slot_index) & 1 or _get_local_slot(code) == (slot_index, False)
+                if has_value and range_start is None:
+                    range_start = index
+                elif not has_value and range_start is not None:
+                    ranges.append((body[range_start], body[index - 1]))
+                    range_start = None
+
+            if range_start is not None:
+                ranges.append((body[range_start], body[-1]))
+            if len(ranges) > 0:
+                local_ranges[var_id] = ranges
+
+        return local_ranges
+
+    def _remove_init_slot(self, init_code: VMCode, next_code: VMCode | None):
+        """
+        Removes the INITSLOT of a method that doesn't use any slot, so the method starts in the next instruction
+        """
+        for method in self._methods:
+            if method.init_bytecode is init_code:
+                method.init_bytecode = next_code
+            if method.init_defaults_bytecode is init_code:
+                method.init_defaults_bytecode = next_code
+            method.replace_debug_codes({init_code: next_code})
+
+        self._map_instance.remove_opcodes_by_code([init_code])
+
+    @staticmethod
+    def _get_live_slots(body: list[VMCode], successors: list[list[int]]) -> list[int]:
+        """
+        Gets the local variables that are live after each instruction of the method, as bit sets of their slots
+        """
+        live_before = [0] * len(body)
+        live_after = [0] * len(body)
+
+        has_changed = True
+        while has_changed:
+            has_changed = False
+            for index in range(len(body) - 1, -1, -1):
+                live = 0
+                for successor in successors[index]:
+                    live |= live_before[successor]
+                live_after[index] = live
+
+                slot = _get_local_slot(body[index])
+                if slot is not None:
+                    slot_index, is_store = slot
+                    if is_store:
+                        live &= ~(1 << slot_index)
+                    else:
+                        live |= 1 << slot_index
+
+                if live != live_before[index]:
+                    live_before[index] = live
+                    has_changed = True
+
+        return live_after
+
+
+def _get_local_slot(code: VMCode) -> tuple[int, bool] | None:
+    """
+    Gets the local variable slot used by the instruction
+
+    :return: the index of the slot and whether the instruction stores a value in it. None if it doesn't use a local
+             variable
+    """
+    opcode = code.opcode
+    if Opcode.LDLOC0 <= opcode < Opcode.LDLOC:
+        return opcode[0] - Opcode.LDLOC0[0], False
+    if opcode is Opcode.LDLOC:
+        return code.raw_data[0], False
+    if Opcode.STLOC0 <= opcode < Opcode.STLOC:
+        return opcode[0] - Opcode.STLOC0[0], True
+    if opcode is Opcode.STLOC:
+        return code.raw_data[0], True
+    return None
+
+
+def _get_slot_code_info(index: int, is_store: bool) -> tuple[OpcodeInformation, bytes]:
+    opcode = (OpcodeHelper.get_store(index, local=True) if is_store
+              else OpcodeHelper.get_load(index, local=True))
+    op_info = OpcodeInfo.get_info(opcode)
+
+    if op_info.data_len > 0:
+        return op_info, bytes([index])
+    return op_info, b''
+
+
+def _get_slots(slots: int) -> list[int]:
+    """
+    Gets the indexes in a bit set of slots
+    """
+    indexes = []
+    index = 0
+    while slots:
+        if slots & 1:
+            indexes.append(index)
+        slots >>= 1
+        index += 1
+    return indexes
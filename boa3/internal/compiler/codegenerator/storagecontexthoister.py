@@ -0,0 +1,133 @@
+__all__ = [
+    'StorageContextHoister'
+]
+
+from boa3.internal.compiler.codegenerator.optimizerhelper import build_slot_code, get_jump_sources, get_method_body, \
+    get_method_name, get_reachable, get_successors
+from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.model.builtin.interop.interop import Interop
+from boa3.internal.model.method import Method
+from boa3.internal.model.variable import Variable
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+
+_MAX_SLOTS = 255
+
+
+class StorageContextHoister:
+    """
+    Gets the storage context only once in each execution of a method, storing it in a new local variable that is used
+    by all the other storage calls of the method, including the ones that use the default context.
+
+    The result of the call to `get_context` that runs before every other one is stored where it's called. The methods
+    that don't have such call, or that get the context only once, are not changed, so the executions that don't use
+    the storage don't get its context.
+    """
+
+    def __init__(self, vm_code_mapping: VMCodeMapping, methods: list[Method]):
+        """
+        :param vm_code_mapping: the instructions that will be optimized
+        :param methods: the methods whose storage contexts can be reused
+        """
+        self._map_instance: VMCodeMapping = vm_code_mapping
+        self._methods: list[Method] = methods
+        self._get_context_hash: bytes = Interop.StorageGetContext.interop_method_hash
+
+        self.reused_contexts: dict[str, int] = {}
+
+    def hoist(self) -> dict[str, int]:
+        """
+        Reuses the storage context in each method
+
+        :return: how many calls to `get_context` were removed from each method
+        """
+        codes = list(self._map_instance.codes)
+        code_index = {code: index for index, code in enumerate(codes)}
+        sources = get_jump_sources(codes)
+
+        for method in self._methods:
+            body = get_method_body(method, codes, code_index)
+            if body is None or body[0].raw_data[0] >= _MAX_SLOTS:
+                continue
+
+            removed_calls = self._hoist_method_context(method, body, sources)
+            if removed_calls > 0:
+                self.reused_contexts[get_method_name(method)] = removed_calls
+
+        return self.reused_contexts
+
+    def _hoist_method_context(self, method: Method, body: list[VMCode], sources: dict[VMCode, list[VMCode]]) -> int:
+        """
+        Stores the storage context of the method in a new local variable
+
+        :return: how many calls to `get_context` were removed
+        """
+        calls = [index for index, code in enumerate(body) if self._is_get_context(code)]
+        if len(calls) == 0:
+            return 0
+
+        body_index = {code: index for index, code in enumerate(body)}
+        successors = get_successors(body, body_index)
+        if successors is None:
+            return 0
+
+        if any(source not in body_index for code in body for source in sources.get(code, [])):
+            # some instruction is executed after a jump from another method
+            return 0
+
+        # the context can only be stored by a call that runs before every other one, otherwise the executions that
+        # don't use the storage would have to get it too
+        first_call = self._get_dominating_call(calls, successors)
+        if first_call is None:
+            return 0
+
+        init_code = body[0]
+        num_locals, num_args = init_code.raw_data[0], init_code.raw_data[1]
+        context_slot = num_locals
+
+        self._map_instance.insert_codes_after(body[first_call], [VMCode(OpcodeInfo.DUP),
+                                                                 build_slot_code(context_slot, is_store=True)])
+        replaced_calls = [call for call in calls if call != first_call]
+
+        for call in replaced_calls:
+            load_code = build_slot_code(context_slot, is_store=False)
+            self._map_instance.update_vm_code(body[call], load_code.info, load_code.raw_data)
+
+        self._map_instance.update_vm_code(init_code, OpcodeInfo.INITSLOT, bytes([num_locals + 1, num_args]))
+        self._include_context_variable(method)
+
+        return len(calls) - 1
+
+    @staticmethod
+    def _get_dominating_call(calls: list[int], successors: list[list[int]]) -> int | None:
+        """
+        Gets the call to `get_context` that always runs before all the other ones
+
+        :return: None if there isn't such call
+        """
+        if len(calls) < 2:
+            return None
+
+        for call in calls:
+            # if the other calls can't be reached without running this one, it always gets the context first
+            reached_without_call = get_reachable(successors, [0], avoid=call)
+            if not any(other_call in reached_without_call for other_call in calls if other_call != call):
+                return call
+
+        return None
+
+    def _is_get_context(self, code: VMCode) -> bool:
+        return code.opcode is Opcode.SYSCALL and code.raw_data == self._get_context_hash
+
+    @staticmethod
+    def _include_context_variable(method: Method):
+        """
+        Includes the variable with the storage context in the method's debug info
+        """
+        name = 'storage.context'
+        suffix = 1
+        while name in method.locals:
+            name = 'storage.context_{0}'.format(suffix)
+            suffix += 1
+        method.locals[name] = Variable(Interop.StorageGetContext.return_type)
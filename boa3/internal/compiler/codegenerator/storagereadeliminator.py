@@ -0,0 +1,244 @@
+__all__ = [
+    'StorageReadEliminator'
+]
+
+from boa3.internal import constants
+from boa3.internal.compiler.codegenerator.optimizerhelper import build_slot_code, get_jump_sources, get_method_body, \
+    get_method_name, get_reachable, get_successors, is_call
+from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+from boa3.internal.model.builtin.interop.interop import Interop
+from boa3.internal.model.method import Method
+from boa3.internal.model.type.collection.sequence.mutable.mutablesequencetype import MutableSequenceType
+from boa3.internal.model.type.itype import IType
+from boa3.internal.model.type.primitive.ibytestringtype import IByteStringType
+from boa3.internal.model.type.primitive.inttype import IntType
+from boa3.internal.model.type.type import Type
+from boa3.internal.model.variable import Variable
+from boa3.internal.neo import cryptography
+from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3.internal.neo.vm.type.Integer import Integer
+from boa3.internal.neo.vm.type.String import String
+
+_STORAGE_READ_SYSCALL = 'System.Storage.Local.Get'
+
+# the syscalls that can change the storage of the contract, directly or by running code of other contracts
+_STORAGE_CHANGE_SYSCALLS = [
+    'System.Storage.Put',
+    'System.Storage.Delete',
+    'System.Storage.Local.Put',
+    'System.Storage.Local.Delete',
+    'System.Contract.Call',
+    'System.Runtime.LoadScript',
+]
+
+_MAX_SLOTS = 255
+
+
+class StorageReadEliminator:
+    """
+    Reuses the value read from the storage when a method reads the same key again, if the storage can't have changed
+    between the reads.
+
+    Only the reads that use the contract's own storage are reused, and their keys must be literals or arguments of
+    immutable types that are never reassigned in the method. The first read must run before the others in every
+    execution, and no storage change, call to another method or call to another contract may run between them. The
+    calls to StdLib and CryptoLib don't change the storage, so they're allowed.
+    """
+
+    def __init__(self, vm_code_mapping: VMCodeMapping, methods: list[Method]):
+        """
+        :param vm_code_mapping: the instructions that will be optimized
+        :param methods: the methods whose storage reads can be reused
+        """
+        self._map_instance: VMCodeMapping = vm_code_mapping
+        self._methods: list[Method] = methods
+
+        self._read_hash: bytes = _get_syscall_hash(_STORAGE_READ_SYSCALL)
+        self._change_hashes: set[bytes] = {_get_syscall_hash(syscall) for syscall in _STORAGE_CHANGE_SYSCALLS}
+        self._pure_contracts: set[bytes] = {Interop.StdLibScriptHash.getter.script_hash,
+                                            Interop.CryptoLibScriptHash.getter.script_hash}
+
+        self.removed_reads: list[tuple[str, str]] = []
+
+    def eliminate(self) -> list[tuple[str, str]]:
+        """
+        Removes the repeated storage reads of each method
+
+        :return: the name of the method and the description of the key of each removed read
+        """
+        codes = list(self._map_instance.codes)
+        code_index = {code: index for index, code in enumerate(codes)}
+        sources = get_jump_sources(codes)
+
+        for method in self._methods:
+            body = get_method_body(method, codes, code_index)
+            if body is None or body[0].raw_data[0] >= _MAX_SLOTS:
+                continue
+
+            method_name = get_method_name(method)
+            for key_description in self._eliminate_method_reads(method, body, sources):
+                self.removed_reads.append((method_name, key_description))
+
+        return self.removed_reads
+
+    def _eliminate_method_reads(self, method: Method, body: list[VMCode],
+                                sources: dict[VMCode, list[VMCode]]) -> list[str]:
+        """
+        Stores the first value read of each repeated key in a new local variable
+
+        :return: the description of the key of each removed read
+        """
+        reads: dict[tuple, list[int]] = {}
+        for index, code in enumerate(body):
+            if self._is_storage_read(code) and code not in sources:
+                key = _get_key_id(method, body, index)
+                if key is not None:
+                    reads.setdefault(key, []).append(index)
+
+        repeated_reads = [key_reads for key_reads in reads.values() if len(key_reads) > 1]
+        if len(repeated_reads) == 0:
+            return []
+
+        body_index = {code: index for index, code in enumerate(body)}
+        successors = get_successors(body, body_index)
+        if successors is None:
+            return []
+
+        if any(source not in body_index for code in body for source in sources.get(code, [])):
+            # some instruction is executed after a jump from another method
+            return []
+
+        changes = [successor for index, code in enumerate(body) if self._may_change_storage(code)
+                   for successor in successors[index]]
+
+        init_code = body[0]
+        num_locals, num_args = init_code.raw_data[0], init_code.raw_data[1]
+        new_locals = 0
+        removed_keys = []
+        removed_codes = []
+
+        for key_reads in repeated_reads:
+            if num_locals + new_locals >= _MAX_SLOTS:
+                break
+
+            first_read = key_reads[0]
+            # the instructions that can run without the first read or after the storage may have changed
+            not_available = get_reachable(successors, [0] + changes, avoid=first_read)
+            reused_reads = [read for read in key_reads[1:] if read not in not_available]
+            if len(reused_reads) == 0:
+                continue
+
+            value_slot = num_locals + new_locals
+            new_locals += 1
+            self._map_instance.insert_codes_after(body[first_read], [VMCode(OpcodeInfo.DUP),
+                                                                     build_slot_code(value_slot, is_store=True)])
+
+            key_description = _get_key_description(method, body[first_read - 1])
+            for read in reused_reads:
+                # the key is replaced by the value that was read, so the read is removed
+                key_code = body[read - 1]
+                load_code = build_slot_code(value_slot, is_store=False)
+                self._map_instance.update_vm_code(key_code, load_code.info, load_code.raw_data)
+                removed_codes.append(body[read])
+
+                for other_method in self._methods:
+                    other_method.replace_debug_codes({body[read]: key_code})
+                removed_keys.append(key_description)
+
+        if new_locals > 0:
+            self._map_instance.remove_opcodes_by_code(removed_codes)
+            self._map_instance.update_vm_code(init_code, OpcodeInfo.INITSLOT,
+                                              bytes([num_locals + new_locals, num_args]))
+            self._include_read_variables(method, new_locals)
+
+        return removed_keys
+
+    def _is_storage_read(self, code: VMCode) -> bool:
+        return code.opcode is Opcode.SYSCALL and code.raw_data == self._read_hash
+
+    def _may_change_storage(self, code: VMCode) -> bool:
+        if code.opcode is Opcode.SYSCALL:
+            return code.raw_data in self._change_hashes
+
+        if code.opcode is Opcode.CALLT:
+            method_token = self._map_instance.get_method_token(Integer.from_bytes(code.raw_data))
+            return method_token is None or method_token.hash.to_array() not in self._pure_contracts
+
+        # the called methods and the called contracts may change the storage
+        return is_call(code) or code.opcode is Opcode.CALLA
+
+    @staticmethod
+    def _include_read_variables(method: Method, count: int):
+        """
+        Includes the variables with the values read from the storage in the method's debug info
+        """
+        value_type = Type.optional.build(Type.bytes)
+        for _ in range(count):
+            name = 'storage.read'
+            suffix = 1
+            while name in method.locals:
+                name = 'storage.read_{0}'.format(suffix)
+                suffix += 1
+            method.locals[name] = Variable(value_type)
+
+
+def _get_key_id(method: Method, body: list[VMCode], read_index: int) -> tuple | None:
+    """
+    Gets what identifies the key of a storage read
+
+    :return: None if the key can have different values in the same execution of the method
+    """
+    if read_index < 1:
+        return None
+
+    key_code = body[read_index - 1]
+    opcode = key_code.opcode
+    if _is_literal_push(opcode):
+        return 'literal', opcode, key_code.raw_data
+
+    arg_index = _get_arg_index(key_code, Opcode.LDARG0, Opcode.LDARG)
+    if arg_index is not None and arg_index < len(method.args):
+        # bytearray or Any arguments can be changed in place, without being reassigned
+        arg_type = list(method.args.values())[arg_index].type
+        if not _is_immutable_type(arg_type):
+            return None
+        if not any(_get_arg_index(code, Opcode.STARG0, Opcode.STARG) == arg_index for code in body):
+            return 'argument', arg_index
+
+    return None
+
+
+def _is_immutable_type(arg_type: IType) -> bool:
+    return (isinstance(arg_type, (IntType, IByteStringType))
+            and not isinstance(arg_type, MutableSequenceType))
+
+
+def _is_literal_push(opcode: Opcode) -> bool:
+    return (Opcode.PUSHINT8 <= opcode <= Opcode.PUSHINT256
+            or Opcode.PUSHDATA1 <= opcode <= Opcode.PUSHDATA4
+            or Opcode.PUSHM1 <= opcode <= Opcode.PUSH16)
+
+
+def _get_arg_index(code: VMCode, first_opcode: Opcode, indexed_opcode: Opcode) -> int | None:
+    if first_opcode <= code.opcode < indexed_opcode:
+        return code.opcode[0] - first_opcode[0]
+    if code.opcode is indexed_opcode:
+        return code.raw_data[0]
+    return None
+
+
+def _get_key_description(method: Method, key_code: VMCode) -> str:
+    arg_index = _get_arg_index(key_code, Opcode.LDARG0, Opcode.LDARG)
+    if arg_index is not None and arg_index < len(method.args):
+        return list(method.args)[arg_index]
+
+    if Opcode.PUSHDATA1 <= key_code.opcode <= Opcode.PUSHDATA4:
+        # the data starts with its size
+        return str(key_code.raw_data[key_code.info.data_len:])
+    return key_code.opcode.name
+
+
+def _get_syscall_hash(syscall: str) -> bytes:
+    return cryptography.sha256(String(syscall).to_bytes())[:constants.SIZE_OF_INT32]
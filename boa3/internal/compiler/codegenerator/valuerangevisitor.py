@@ -0,0 +1,251 @@
+import ast
+
+from boa3.internal.model.builtin.builtin import Builtin
+from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.internal.model.method import Method
+from boa3.internal.model.operation.binary.arithmetic.addition import Addition
+from boa3.internal.model.operation.binary.arithmetic.floordivision import FloorDivision
+from boa3.internal.model.operation.binary.arithmetic.modulo import Modulo
+from boa3.internal.model.operation.binary.arithmetic.multiplication import Multiplication
+from boa3.internal.model.operation.binary.arithmetic.power import Power
+from boa3.internal.model.operation.binary.arithmetic.subtraction import Subtraction
+from boa3.internal.model.symbol import ISymbol
+from boa3.internal.model.type.type import Type
+
+# the operations whose result is never negative if both operands are not negative
+_NON_NEGATIVE_OPERATIONS = (Addition, Multiplication, FloorDivision, Modulo, Power)
+
+
+class ValueRangeVisitor:
+    """
+    This class finds the int expressions of a function that are never negative or never greater than the length of a
+    sequence, so the code generator doesn't need to fix the negative or out of range indexes that use them.
+
+    A local variable is never negative if none of the values assigned to it can be negative, like the counters of for
+    loops over ranges with non-negative limits. The upper bounds are only kept for the counters of ranges whose stop is
+    the length of an immutable argument, like `for i in range(len(string))`.
+    """
+
+    def __init__(self, method: Method, function: ast.FunctionDef, symbols: dict[str, ISymbol]):
+        self._method: Method = method
+        self._symbols: dict[str, ISymbol] = symbols.copy()
+        self._symbols.update(method.symbols)
+
+        # maps each variable to the values assigned to it. None if the value is unknown
+        self._assignments: dict[str, list[ast.AST | None]] = {}
+        self._non_negative_vars: set[str] = set()
+        # maps the counters of ranges with positive steps to the stop of the range
+        self._upper_bounds: dict[str, ast.AST] = {}
+
+        self._find_assignments(function)
+        self._find_non_negative_vars()
+        self._find_upper_bounds()
+
+    def is_non_negative(self, node: ast.AST) -> bool:
+        """
+        Verifies if the value of the expression is never negative
+
+        :param node: the python ast node of the int expression
+        """
+        return self._is_non_negative(node, self._non_negative_vars)
+
+    def is_within_length(self, node: ast.AST, sequence: ast.AST) -> bool:
+        """
+        Verifies if the value of the expression is never greater than the length of the sequence
+
+        :param node: the python ast node of the int expression
+        :param sequence: the python ast node of the sequence
+        """
+        if not isinstance(sequence, ast.Name) or sequence.id in self._assignments:
+            return False
+
+        # only the arguments that are never reassigned have the same length in the entire function
+        arg = self._method.args.get(sequence.id)
+        if arg is None or arg.type not in (Type.str, Type.bytes):
+            return False
+
+        offset = self._get_length_offset(node, sequence.id, set())
+        return offset is not None and offset <= 0
+
+    def _find_assignments(self, function: ast.FunctionDef):
+        for node in ast.walk(function):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    self._include_assignment(target, node.value)
+            elif isinstance(node, (ast.AnnAssign, ast.NamedExpr)):
+                if node.value is not None:
+                    self._include_assignment(node.target, node.value)
+            elif isinstance(node, (ast.AugAssign, ast.For)):
+                # the value of the target depends on the operation or on the iterated value
+                self._include_assignment(node.target, node)
+            elif isinstance(node, ast.withitem):
+                if node.optional_vars is not None:
+                    self._include_assignment(node.optional_vars, None)
+            elif isinstance(node, ast.comprehension):
+                self._include_assignment(node.target, None)
+            elif isinstance(node, ast.ExceptHandler):
+                if node.name is not None:
+                    self._assignments.setdefault(node.name, []).append(None)
+            elif isinstance(node, (ast.Global, ast.Nonlocal)):
+                for name in node.names:
+                    self._assignments.setdefault(name, []).append(None)
+
+    def _include_assignment(self, target: ast.AST, value: ast.AST | None):
+        if isinstance(target, ast.Name):
+            self._assignments.setdefault(target.id, []).append(value)
+            return
+
+        for node in ast.walk(target):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                self._assignments.setdefault(node.id, []).append(None)
+
+    def _find_non_negative_vars(self):
+        # starts with every int local variable and removes the ones with a value that may be negative until the
+        # remaining ones depend only on each other
+        non_negative_vars = {var_id for var_id, var in self._method.locals.items()
+                             if var.type is Type.int and var_id in self._assignments}
+
+        has_changed = True
+        while has_changed:
+            has_changed = False
+            for var_id in list(non_negative_vars):
+                if not all(self._is_non_negative(value, non_negative_vars) for value in self._assignments[var_id]):
+                    non_negative_vars.remove(var_id)
+                    has_changed = True
+
+        self._non_negative_vars = non_negative_vars
+
+    def _find_upper_bounds(self):
+        for var_id in self._non_negative_vars:
+            assignments = self._assignments[var_id]
+            if len(assignments) != 1 or not isinstance(assignments[0], ast.For):
+                continue
+
+            range_args = self._get_range_args(assignments[0].iter)
+            if range_args is not None:
+                stop, start, step = range_args
+                step_value = self._get_int_literal(step)
+                if step_value is not None and step_value > 0:
+                    self._upper_bounds[var_id] = stop
+
+    def _is_non_negative(self, node: ast.AST | None, non_negative_vars: set[str]) -> bool:
+        if isinstance(node, ast.Name):
+            return node.id in non_negative_vars
+
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, int) and node.value >= 0
+
+        if isinstance(node, ast.BinOp):
+            return (isinstance(node.op, _NON_NEGATIVE_OPERATIONS)
+                    and self._is_non_negative(node.left, non_negative_vars)
+                    and self._is_non_negative(node.right, non_negative_vars))
+
+        if isinstance(node, ast.AugAssign):
+            return (isinstance(node.op, _NON_NEGATIVE_OPERATIONS)
+                    and self._is_non_negative(node.target, non_negative_vars)
+                    and self._is_non_negative(node.value, non_negative_vars))
+
+        if isinstance(node, ast.IfExp):
+            return (self._is_non_negative(node.body, non_negative_vars)
+                    and self._is_non_negative(node.orelse, non_negative_vars))
+
+        if isinstance(node, ast.For):
+            range_args = self._get_range_args(node.iter)
+            if range_args is None:
+                return False
+
+            # the values of a range are between its start and its stop
+            stop, start, step = range_args
+            step_value = self._get_int_literal(step)
+            if step_value is not None and step_value < 0:
+                # the values are greater than the stop, like in range(len(x) - 1, -1, -1)
+                return self._get_int_literal(stop) == -1 or self._is_non_negative(stop, non_negative_vars)
+            if step_value is not None and step_value > 0:
+                return self._is_non_negative(start, non_negative_vars)
+            return (self._is_non_negative(start, non_negative_vars)
+                    and self._is_non_negative(stop, non_negative_vars))
+
+        if isinstance(node, ast.Call):
+            if self._is_builtin_call(node, Builtin.Len, Builtin.Abs):
+                return True
+            if self._is_builtin_call(node, Builtin.Max):
+                return any(self._is_non_negative(arg, non_negative_vars) for arg in node.args)
+            if self._is_builtin_call(node, Builtin.Min):
+                return all(self._is_non_negative(arg, non_negative_vars) for arg in node.args)
+
+        return False
+
+    def _get_length_offset(self, node: ast.AST, sequence_id: str, visited: set[str]) -> int | None:
+        """
+        Gets the maximum difference between the value of the expression and the length of the sequence
+
+        :return: the offset if the expression is never greater than len(sequence) + offset. None if it's unknown
+        """
+        if isinstance(node, ast.Call):
+            if (self._is_builtin_call(node, Builtin.Len)
+                    and len(node.args) == 1
+                    and isinstance(node.args[0], ast.Name)
+                    and node.args[0].id == sequence_id):
+                return 0
+            return None
+
+        if isinstance(node, ast.Name):
+            if node.id not in self._upper_bounds or node.id in visited:
+                return None
+
+            # the counter is always less than the stop of the range
+            offset = self._get_length_offset(self._upper_bounds[node.id], sequence_id, visited | {node.id})
+            return offset - 1 if offset is not None else None
+
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (Addition, Subtraction)):
+            right_value = self._get_int_literal(node.right)
+            if right_value is not None:
+                offset = self._get_length_offset(node.left, sequence_id, visited)
+                if offset is None:
+                    return None
+                return offset + right_value if isinstance(node.op, Addition) else offset - right_value
+
+            left_value = self._get_int_literal(node.left)
+            if left_value is not None and isinstance(node.op, Addition):
+                offset = self._get_length_offset(node.right, sequence_id, visited)
+                return offset + left_value if offset is not None else None
+
+        return None
+
+    def _get_range_args(self, iter_node: ast.AST) -> tuple[ast.AST, ast.AST, ast.AST] | None:
+        """
+        Gets the stop, the start and the step of a range, or of a reversed range
+
+        :return: None if the node isn't a call to range
+        """
+        if self._is_builtin_call(iter_node, Builtin.Reversed) and len(iter_node.args) == 1:
+            # the reversed range has the same values
+            iter_node = iter_node.args[0]
+
+        # the arguments were reordered and the defaults were included when the call was analysed
+        if not self._is_builtin_call(iter_node, Builtin.Range) or len(iter_node.args) != 3:
+            return None
+
+        stop, start, step = iter_node.args
+        return stop, start, step
+
+    def _is_builtin_call(self, node: ast.AST, *builtin_methods: IBuiltinMethod) -> bool:
+        if (not isinstance(node, ast.Call)
+                or not isinstance(node.func, ast.Name)
+                or len(node.keywords) > 0):
+            return False
+
+        symbol_id = node.func.id
+        if symbol_id in self._symbols:
+            symbol = self._symbols[symbol_id]
+        else:
+            symbol = Builtin.get_symbol(symbol_id)
+
+        return any(isinstance(symbol, type(builtin_method)) for builtin_method in builtin_methods)
+
+    @staticmethod
+    def _get_int_literal(node: ast.AST) -> int | None:
+        # the negative literals were already evaluated by the optimizer
+        if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
+            return node.value
+        return None
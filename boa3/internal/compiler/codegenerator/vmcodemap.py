@@ -1,4 +1,7 @@
+import bisect
+
 from boa3.internal.neo.vm.VMCode import VMCode
+from boa3.internal.neo.vm.opcode import OpcodeHelper
 
 
 class VMCodeMap:
@@ -9,16 +12,23 @@ class VMCodeMap:
         # optimization so it's not needed to iterate over everything in search of targets
         self._vm_code_with_target: list[VMCode] = []
 
+        # maps each code, by identity, to its position in the list. Positions from `_index_dirty_from` onwards may be
+        # outdated and are recalculated only when they are needed
+        self._vm_code_index: dict[VMCode, int] = {}
+        self._index_dirty_from: int = 0
+
     def __len__(self) -> int:
         return self._vm_code_list.__len__()
 
     def clear(self):
         self._vm_code_addresses.clear()
         self._vm_code_list.clear()
+        self._vm_code_with_target.clear()
+        self._vm_code_index.clear()
+        self._index_dirty_from = 0
 
     def get_code_map(self) -> dict[int, VMCode]:
-        size = len(self)
-        return {self._vm_code_addresses[index]: self._vm_code_list[index] for index in range(size)}
+        return dict(zip(self._vm_code_addresses, self._vm_code_list))
 
     def get_code_list(self) -> list[VMCode]:
         return self._vm_code_list
@@ -33,59 +43,101 @@ class VMCodeMap:
         return self._vm_code_addresses[-1] + self._vm_code_list[-1].size
 
     def insert_code(self, vm_code: VMCode, has_target: bool = False):
-        if vm_code not in self._vm_code_list:
+        if self._get_index(vm_code) < 0:
+            index = len(self._vm_code_list)
             self._vm_code_addresses.append(self.get_bytecode_size())
             self._vm_code_list.append(vm_code)
+            self._vm_code_index[vm_code] = index
+            if self._index_dirty_from == index:
+                self._index_dirty_from = index + 1
 
             if has_target:
                 self._vm_code_with_target.append(vm_code)
 
+    def insert_codes_after(self, vm_code: VMCode, codes: list[VMCode]):
+        """
+        Inserts the codes right after the given code, in the given order
+        """
+        index = self._get_index(vm_code)
+        if index < 0 or len(codes) == 0:
+            return
+
+        index += 1
+        self._vm_code_list[index:index] = codes
+        self._vm_code_addresses[index:index] = [0] * len(codes)
+        self._vm_code_with_target.extend(code for code in codes if OpcodeHelper.has_target(code.opcode))
+
+        self._invalidate_index(index)
+        self._update_addresses_from_index(index)
+
+    def update_has_target(self, vm_code: VMCode, has_target: bool):
+        """
+        Includes or removes the code from the list of codes with target when its opcode is changed
+        """
+        if has_target:
+            if vm_code not in self._vm_code_with_target:
+                self._vm_code_with_target.append(vm_code)
+        elif vm_code in self._vm_code_with_target:
+            self._vm_code_with_target.remove(vm_code)
+
+    def has_code(self, vm_code: VMCode) -> bool:
+        return self._get_index(vm_code) >= 0
+
+    def has_address(self, address: int) -> bool:
+        return self._get_address_index(address) >= 0
+
     def get_code(self, address: int) -> VMCode | None:
-        try:
-            index = self._vm_code_addresses.index(address)
-        except ValueError:
-            # the address is not int the list
-            if address >= self.get_bytecode_size():
-                # the address is not in the bytecode
-                return None
-
-            # if the address is not the start of a instruction, gets the last instruction before given address
-            code_address = 0
-            for addr in self._vm_code_addresses:
-                if addr > address:
-                    break
-                code_address = addr
-
-            index = self._vm_code_addresses.index(code_address)
+        if len(self) < 1 or address >= self.get_bytecode_size():
+            # the address is not in the bytecode
+            return None
+
+        # if the address is not the start of a instruction, gets the last instruction before given address
+        index = bisect.bisect_right(self._vm_code_addresses, address) - 1
+        if index < 0:
+            index = 0
 
         return self._vm_code_list[index]
 
+    def get_index(self, vm_code: VMCode) -> int:
+        """
+        Gets the position of the code in the code list
+
+        :return: the index of the code if it's in the map. Otherwise, returns -1
+        """
+        return self._get_index(vm_code)
+
+    def get_index_before(self, address: int) -> int:
+        """
+        Gets the position of the last code that starts before the given address
+
+        :return: the index of the code. If there's no code before the address, returns -1
+        """
+        return bisect.bisect_left(self._vm_code_addresses, address) - 1
+
     def get_start_address(self, vm_code: VMCode) -> int:
-        try:
-            index = self._vm_code_list.index(vm_code)
-            return self._vm_code_addresses[index]
-        except ValueError:
+        index = self._get_index(vm_code)
+        if index < 0:
             return 0
+        return self._vm_code_addresses[index]
 
     def get_end_address(self, vm_code: VMCode) -> int:
-        try:
-            index = self._vm_code_list.index(vm_code) + 1
-            if index == len(self._vm_code_list):
-                return self.get_bytecode_size()
-            else:
-                return self._vm_code_addresses[index] - 1
-        except ValueError:
+        index = self._get_index(vm_code)
+        if index < 0:
             return 0
 
+        index += 1
+        if index == len(self._vm_code_list):
+            return self.get_bytecode_size()
+        else:
+            return self._vm_code_addresses[index] - 1
+
     def get_addresses(self, start_address: int, end_address: int) -> list[int]:
         if start_address > end_address:
             start_address, end_address = end_address, start_address
 
-        addresses = []
-        for address in range(start_address, end_address + 1):
-            if address in self._vm_code_addresses:
-                addresses.append(address)
-        return addresses
+        first_index = bisect.bisect_left(self._vm_code_addresses, start_address)
+        last_index = bisect.bisect_right(self._vm_code_addresses, end_address)
+        return self._vm_code_addresses[first_index:last_index]
 
     def get_addresses_from_codes(self, codes: list[VMCode]) -> list[int]:
         if len(codes) < 1:
@@ -93,11 +145,9 @@ class VMCodeMap:
 
         addresses = []
         for vm_code in codes:
-            try:
-                index = self._vm_code_list.index(vm_code)
+            index = self._get_index(vm_code)
+            if index >= 0:
                 addresses.append(self._vm_code_addresses[index])
-            except ValueError:
-                continue
 
         return addresses
 
@@ -105,40 +155,70 @@ class VMCodeMap:
         codes = []
 
         for address in sorted(addresses):
-            try:
-                index = self._vm_code_addresses.index(address)
+            index = self._get_address_index(address)
+            if index >= 0:
                 codes.append(self._vm_code_list[index])
-            except ValueError:
-                # address not in list
-                continue
 
         return codes
 
+    def _get_index(self, vm_code: VMCode) -> int:
+        """
+        Gets the position of the code in the code list
+
+        :return: the index of the code if it's in the map. Otherwise, returns -1
+        """
+        index = self._vm_code_index.get(vm_code, -1)
+        if index >= self._index_dirty_from:
+            self._update_index()
+            index = self._vm_code_index.get(vm_code, -1)
+        return index
+
+    def _get_address_index(self, address: int) -> int:
+        """
+        Gets the position of the code that starts in the given address
+
+        :return: the index of the code if there's a code starting in the address. Otherwise, returns -1
+        """
+        index = bisect.bisect_left(self._vm_code_addresses, address)
+        if index < len(self._vm_code_addresses) and self._vm_code_addresses[index] == address:
+            return index
+        return -1
+
+    def _invalidate_index(self, from_index: int):
+        if from_index < self._index_dirty_from:
+            self._index_dirty_from = from_index
+
+    def _update_index(self):
+        code_list = self._vm_code_list
+        code_index = self._vm_code_index
+        for index in range(self._index_dirty_from, len(code_list)):
+            code_index[code_list[index]] = index
+        self._index_dirty_from = len(code_list)
+
     def update_addresses(self, start_address: int = 0):
-        next_address = -1
         final_size = len(self._vm_code_list)
 
         if len(self._vm_code_addresses) > final_size:
-            self._vm_code_addresses = self._vm_code_addresses[:final_size]
+            del self._vm_code_addresses[final_size:]
 
-        for index in range(final_size):
-            address = self._vm_code_addresses[index]
+        first_index = bisect.bisect_left(self._vm_code_addresses, start_address)
+        self._update_addresses_from_index(first_index)
 
-            if address >= start_address:
-                if next_address < 0:
-                    if index > 0:
-                        new_address = self._vm_code_addresses[index - 1]
-                        next_address = new_address + self._vm_code_list[index - 1].size
-                    else:
-                        next_address = 0
+    def _update_addresses_from_index(self, first_index: int):
+        # sizes of the codes with target depend on the addresses of the other codes, so the index must be up to date
+        self._update_index()
 
-                if next_address != address:
-                    if index < len(self._vm_code_addresses):
-                        self._vm_code_addresses[index] = next_address
-                    else:
-                        self._vm_code_addresses.append(next_address)
+        code_list = self._vm_code_list
+        addresses = self._vm_code_addresses
+        if first_index > 0:
+            next_address = addresses[first_index - 1] + code_list[first_index - 1].size
+        else:
+            next_address = 0
 
-                next_address += self._vm_code_list[index].size
+        for index in range(first_index, len(code_list)):
+            if addresses[index] != next_address:
+                addresses[index] = next_address
+            next_address += code_list[index].size
 
     def move_to_end(self, first_code_address: int, last_code_address: int,
                     opcodes_to_remove: list[int] = None) -> int | None:
@@ -150,19 +230,16 @@ class VMCodeMap:
             # there's nothing to change if it's moving the all the codes
             return
 
-        first_index = -1
-        last_index = 0
-        for index, address in enumerate(self._vm_code_addresses):
-            if first_code_address <= address and first_index < 0:
-                first_index = index
-            elif address > last_code_address:
-                last_index = index
-                break
+        size = len(self._vm_code_addresses)
+        first_index = bisect.bisect_left(self._vm_code_addresses, first_code_address)
 
-        if first_index >= 0:
+        if first_index < size:
             # if the first index was not set, there's nothing to move
+            last_index = max(bisect.bisect_right(self._vm_code_addresses, last_code_address), first_index + 1)
+            if last_index >= size:
+                last_index = 0
             if last_index < first_index:
-                last_index = len(self._vm_code_addresses)
+                last_index = size
 
             new_start_opcode = self._vm_code_list[last_index:]
             new_end_opcode = self._vm_code_list[first_index:last_index]
@@ -170,29 +247,43 @@ class VMCodeMap:
             # If there are opcodes to remove that have addresses inside this move_to_end, then update opcodes address too
             if opcodes_to_remove is not None:
                 for index, address in enumerate(opcodes_to_remove):
-                    if self._vm_code_addresses.index(address) in range(last_index, last_index + len(
-                            new_start_opcode)):
+                    if self._get_address_index(address) >= last_index:
                         opcodes_to_remove[index] = address - len(new_end_opcode)
 
             self._vm_code_list[first_index:] = (new_start_opcode + new_end_opcode)
-            self.update_addresses(first_code_address)
+            self._invalidate_index(first_index)
+            self._update_addresses_from_index(first_index)
 
         index = self.get_bytecode_size()
         return index
 
     def remove_opcodes_by_addresses(self, addresses: list[int]):
-        was_changed = False
-        # reversed so we only need to update addresses once after all are removed
-        for code_address in sorted(addresses, reverse=True):
-            try:
-                index = self._vm_code_addresses.index(code_address)
-                code = self._vm_code_list.pop(index)
-
-                was_changed = True
-                self._vm_code_with_target.remove(code)
-            except ValueError:
-                # don't stop the loop if an address is not found
-                continue
-
-        if was_changed:
-            self.update_addresses(min(addresses))
+        indexes_to_remove = set()
+        for code_address in addresses:
+            index = self._get_address_index(code_address)
+            if index >= 0:
+                indexes_to_remove.add(index)
+
+        if len(indexes_to_remove) == 0:
+            return
+
+        # removes everything in a single pass, so the addresses and index are updated only once
+        first_index = min(indexes_to_remove)
+        removed_codes = set()
+        kept_codes = []
+        kept_addresses = []
+        for index in range(first_index, len(self._vm_code_list)):
+            code = self._vm_code_list[index]
+            if index in indexes_to_remove:
+                removed_codes.add(code)
+                self._vm_code_index.pop(code, None)
+            else:
+                kept_codes.append(code)
+                kept_addresses.append(self._vm_code_addresses[index])
+
+        self._vm_code_list[first_index:] = kept_codes
+        self._vm_code_addresses[first_index:] = kept_addresses
+        self._vm_code_with_target = [code for code in self._vm_code_with_target if code not in removed_codes]
+
+        self._invalidate_index(first_index)
+        self._update_addresses_from_index(first_index)
@@ -8,22 +8,20 @@ from boa3.internal.neo.vm.VMCode import VMCode
 from boa3.internal.neo.vm.opcode import OpcodeHelper
 from boa3.internal.neo.vm.opcode.OpcodeInformation import OpcodeInformation
 from boa3.internal.neo3.contracts.contracttypes import CallFlags
+from boa3.internal.neo3.core.types import UInt160
 
 
 class VMCodeMapping:
     """
     This class is responsible for managing the Neo VM instruction during the bytecode generation.
     """
-    _instance: Self = None
-
     @classmethod
-    def instance(cls):
+    def instance(cls) -> Self:
         """
-        :return: the singleton instance
+        :return: the instance of the current compilation
         """
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        from boa3.internal.compiler.compilationcontext import CompilationContext
+        return CompilationContext.current().vm_code_mapping
 
     def __init__(self):
         self._code_map: VMCodeMap = VMCodeMap()
@@ -31,12 +29,17 @@ class VMCodeMapping:
 
     @classmethod
     def reset(cls):
+        """
+        Resets the map of the current compilation to the first state
+        """
+        cls.instance().clear()
+
+    def clear(self):
         """
         Resets the map to the first state
         """
-        if cls._instance is not None:
-            cls._instance._code_map.clear()
-            cls._instance._method_tokens.clear()
+        self._code_map.clear()
+        self._method_tokens.clear()
 
     def add_method_token(self, method: IBuiltinMethod, call_flag: CallFlags) -> int | None:
         """
@@ -47,6 +50,15 @@ class VMCodeMapping:
             return self._method_tokens.append(method, call_flag)
         return None
 
+    def add_contract_method_token(self, contract_hash: UInt160, method_name: str, parameters_count: int,
+                                  has_return_value: bool, call_flag: CallFlags) -> int | None:
+        """
+        Creates a new method token to call a method of another contract and return its id.
+        Returns None if no more method tokens can be included
+        """
+        return self._method_tokens.append_contract_method(contract_hash, method_name, parameters_count,
+                                                          has_return_value, call_flag)
+
     def get_method_token(self, method_token_id: int):
         """
         Returns the method token with given id if it exists.
@@ -97,15 +109,14 @@ class VMCodeMapping:
 
         :return: the generated bytecode
         """
-        self._remove_empty_targets()
-        self._update_larger_codes()
+        self.remove_empty_targets()
 
-        bytecode = bytearray()
-        for code in self.codes:
-            bytecode += code.opcode
-            if code.data is not None:
-                bytecode += code.data
-        return bytes(bytecode)
+        from boa3.internal.compiler.codegenerator.assembler import Assembler
+        assembler = Assembler(self.codes)
+        bytecode = assembler.assemble()
+        if assembler.has_widened_codes:
+            self._update_addresses()
+        return bytecode
 
     def result(self) -> CompilerOutput:
         """
@@ -121,6 +132,23 @@ class VMCodeMapping:
     def insert_code(self, vm_code: VMCode):
         return self._code_map.insert_code(vm_code, has_target=OpcodeHelper.has_target(vm_code.opcode))
 
+    def insert_codes_after(self, vm_code: VMCode, codes: list[VMCode]):
+        """
+        Inserts a sequence of instructions after an instruction that is already in the map
+
+        :param vm_code: the instruction that will precede the inserted ones
+        :param codes: the instructions to be inserted, in their execution order
+        """
+        self._code_map.insert_codes_after(vm_code, codes)
+
+    def has_address(self, address: int) -> bool:
+        """
+        Checks whether there is a VM Opcode starting at the given position
+
+        :param address: the position of the opcode
+        """
+        return self._code_map.has_address(address)
+
     def get_code(self, address: int) -> VMCode | None:
         """
         Gets the VM Opcode at the given position
@@ -131,6 +159,32 @@ class VMCodeMapping:
         """
         return self._code_map.get_code(address)
 
+    def has_code(self, vm_code: VMCode) -> bool:
+        """
+        Checks whether the given instruction is in the bytecode
+
+        :param vm_code: the instruction to check
+        """
+        return self._code_map.has_code(vm_code)
+
+    def get_code_index(self, vm_code: VMCode) -> int:
+        """
+        Gets the position in `codes` of the given vm code
+
+        :param vm_code: the instruction to get the position
+        :return: the index of the vm code if it's in the map. Otherwise, returns -1
+        """
+        return self._code_map.get_index(vm_code)
+
+    def get_code_index_before(self, address: int) -> int:
+        """
+        Gets the position in `codes` of the last vm code that starts before the given address
+
+        :param address: the position of the opcode
+        :return: the index of the vm code. If there's no code before the given address, returns -1
+        """
+        return self._code_map.get_index_before(address)
+
     def get_addresses(self, start_address: int, end_address: int) -> list[int]:
         return self._code_map.get_addresses(start_address, end_address)
 
@@ -164,8 +218,13 @@ class VMCodeMapping:
         :param data: updated opcode data
         """
         code_size = vm_code.size
-        vm_code._info = opcode
-        vm_code._data = data
+        had_target = OpcodeHelper.has_target(vm_code.opcode)
+        vm_code.update(opcode, data)
+
+        has_target = OpcodeHelper.has_target(vm_code.opcode)
+        if has_target != had_target:
+            self._code_map.update_has_target(vm_code, has_target)
+
         if vm_code.size != code_size:
             self._update_addresses(self.get_start_address(vm_code))
 
@@ -183,58 +242,33 @@ class VMCodeMapping:
             if code.target is None:
                 relative = Integer.from_bytes(code.raw_data)
                 absolute = self._code_map.get_start_address(code) + relative
-                if absolute in self.code_map:
-                    code.set_target(self.code_map[absolute])
-
-    def _update_larger_codes(self):
-        """
-        Checks if each instruction data fits in its opcode maximum size and updates the opcode from those that don't
-        """
-        # gets a list with all instructions which its opcode has a larger equivalent, ordered by its address
-        instr_with_small_codes = [code for code in self._code_map.get_code_list() if OpcodeHelper.has_larger_opcode(code.opcode)]
-        instr_with_small_codes.sort(key=lambda code: self.get_start_address(code), reverse=True)
-
-        from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
-        # total_len is initialized with zero because the loop must run at least once
-        total_len = 0
-        current_size = self.bytecode_size
-
-        # if any instruction is updated, the following instruction addresses and the total size will change as well
-        # with the change, previous instruction data may have overflowed the opcode maximum value
-        # to make sure, it must check the opcodes that haven't changed again
-        while total_len != current_size:
-            total_len = current_size
-
-            # verifies each instruction data length
-            for code in instr_with_small_codes.copy():  # it's a copy because the list may change during the iteration
-                if len(code.raw_data) > code.info.max_data_len:
-                    # gets the shortest opcode equivalent that fits the instruction data
-                    info = OpcodeInfo.get_info(OpcodeHelper.get_larger_opcode(code.opcode))
-                    while len(code.raw_data) > info.max_data_len and OpcodeHelper.has_larger_opcode(info.opcode):
-                        info = OpcodeInfo.get_info(OpcodeHelper.get_larger_opcode(code.opcode))
-
-                    self.update_vm_code(code, info)
-                    if info.opcode == OpcodeHelper.get_larger_opcode(info.opcode):
-                        # if it's the largest equivalent, it won't be updated anymore
-                        instr_with_small_codes.remove(code)
-            current_size = self.bytecode_size
-
-    def _validate_targets(self, code_or_address: int | VMCode):
-        if isinstance(code_or_address, int):
-            address = code_or_address
-            code = self.get_code(address)
-        else:
-            code = code_or_address
-            address = self.get_start_address(code)
+                if self.has_address(absolute):
+                    code.set_target(self.get_code(absolute))
 
+    def _validate_targets(self, addresses: list[int]):
+        """
+        Changes the target of the instructions that target any of the given addresses to the instruction after it
+
+        :param addresses: the addresses of the instructions that will be removed
+        """
         targeted_addresses = self.targeted_address()
 
-        if address in targeted_addresses:
-            next_address = self.get_end_address(code) + 1
-            if next_address < self.bytecode_size:
-                next_code = self._code_map.get_code(next_address)
-                for source in targeted_addresses[address]:
-                    self._code_map.get_code(source).set_target(next_code)
+        for address in addresses:
+            if address in targeted_addresses:
+                code = self.get_code(address)
+                next_address = self.get_end_address(code) + 1
+                if next_address < self.bytecode_size:
+                    next_code = self._code_map.get_code(next_address)
+                    sources = targeted_addresses.pop(address)
+                    for source in sources:
+                        self._code_map.get_code(source).set_target(next_code)
+
+                    # if the next instruction is removed as well, its sources are moved again
+                    sources = [source for source in sources if source != next_address]
+                    if next_address in targeted_addresses:
+                        targeted_addresses[next_address].extend(sources)
+                    elif len(sources) > 0:
+                        targeted_addresses[next_address] = sources
 
     def move_to_end(self, first_code_address: int, last_code_address: int, opcodes_to_remove: list[int] = None) -> int:
         """
@@ -254,26 +288,23 @@ class VMCodeMapping:
         if not isinstance(last_code_address, int):
             last_code_address = self.bytecode_size
         addresses_to_remove = self._code_map.get_addresses(first_code_address, last_code_address)
-        for address in addresses_to_remove:
-            self._validate_targets(address)
+        self._validate_targets(addresses_to_remove)
         return self._code_map.remove_opcodes_by_addresses(addresses_to_remove)
 
     def remove_opcodes_by_code(self, codes: list[VMCode]):
         addresses_to_remove = self._code_map.get_addresses_from_codes(codes)
-        for address in addresses_to_remove:
-            self._validate_targets(address)
+        self._validate_targets(addresses_to_remove)
         return self._code_map.remove_opcodes_by_addresses(addresses_to_remove)
 
-    def _remove_empty_targets(self):
+    def remove_empty_targets(self):
         """
         Checks if each instruction that requires a target has one set and remove those that don't
         """
         addresses_to_remove = []
         for code in self._code_map.get_code_with_target_list():
             if code.target is None or code.target is code:
-                address = self.get_start_address(code)
-                self._validate_targets(address)
-                addresses_to_remove.append(address)
+                addresses_to_remove.append(self.get_start_address(code))
 
         if len(addresses_to_remove) > 0:
+            self._validate_targets(addresses_to_remove)
             self._code_map.remove_opcodes_by_addresses(addresses_to_remove)
@@ -0,0 +1,59 @@
+__all__ = [
+    'CompilationContext'
+]
+
+import contextlib
+import contextvars
+from collections.abc import Iterator
+from typing import Self
+
+
+class CompilationContext:
+    """
+    This class stores the state of a single compilation: the generated Neo VM instructions, the metadata of the
+    compiled contract and the compiler builtin packages.
+
+    Each compilation has its own context, so more than one contract can be compiled at the same time in the same
+    process, each one in its own thread.
+
+    :ivar vm_code_mapping: the instructions generated in this compilation
+    :ivar metadata: the metadata of the compiled smart contract
+    :ivar builtin: the builtin packages that can be imported by the compiled smart contract
+    """
+
+    # the context of the compilation that is running in the current thread
+    _current: contextvars.ContextVar[Self] = contextvars.ContextVar('current_compilation_context')
+
+    def __init__(self):
+        from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+        from boa3.internal.compiler.compiledmetadata import CompiledMetadata
+        from boa3.internal.model.imports.compilerbuiltin import CompilerBuiltin
+
+        self.vm_code_mapping: VMCodeMapping = VMCodeMapping()
+        self.metadata: CompiledMetadata = CompiledMetadata()
+        self.builtin: CompilerBuiltin = CompilerBuiltin()
+
+    @classmethod
+    def current(cls) -> Self:
+        """
+        Gets the context of the compilation that is running. If there isn't any, uses a default context for the
+        current thread.
+
+        :return: the active compilation context
+        """
+        context = cls._current.get(None)
+        if context is None:
+            context = cls()
+            cls._current.set(context)
+        return context
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[Self]:
+        """
+        Sets this context as the current context until the end of the `with` block
+        """
+        token = self._current.set(self)
+        try:
+            yield self
+        finally:
+            self._current.reset(token)
@@ -6,13 +6,13 @@ from boa3.sc.compiletime import NeoMetadata
 
 
 class CompiledMetadata:
-    _instance = None
-
     @classmethod
     def instance(cls) -> Self:
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """
+        :return: the instance of the current compilation
+        """
+        from boa3.internal.compiler.compilationcontext import CompilationContext
+        return CompilationContext.current().metadata
 
     def __init__(self):
         self._metadata = NeoMetadata()
@@ -21,9 +21,8 @@ class CompiledMetadata:
     def reset(cls):
         cls.instance()._metadata = NeoMetadata()
 
-    @classmethod
-    def set_current_metadata(cls, metadata: NeoMetadata):
-        cls.instance()._metadata = metadata
+    def set_current_metadata(self, metadata: NeoMetadata):
+        self._metadata = metadata
 
     def add_contract_permission(self, contract: UInt160 | bytes | str, method: str = None):
         if isinstance(contract, bytes):
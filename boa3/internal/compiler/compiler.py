@@ -8,8 +8,10 @@ from boa3.internal import constants
 from boa3.internal.analyser.analyser import Analyser
 from boa3.internal.compiler.codegenerator.codegenerator import CodeGenerator
 from boa3.internal.compiler.codegenerator.optimizerhelper import OptimizationLevel
+from boa3.internal.compiler.compilationcontext import CompilationContext
 from boa3.internal.compiler.compileroutput import CompilerOutput
 from boa3.internal.compiler.filegenerator.filegenerator import FileGenerator
+from boa3.internal.compiler.gasreport import GasReport
 from boa3.internal.exception.NotLoadedException import NotLoadedException
 
 
@@ -24,6 +26,7 @@ class Compiler:
         self.result: CompilerOutput = CompilerOutput(bytearray())
         self._analyser: Analyser = None
         self._entry_smart_contract: str = ''
+        self._context: CompilationContext = None
 
     def compile(self, path: str, root_folder: str = None, env: str = None,
                 log: bool = True, log_level: str = None,
@@ -43,9 +46,9 @@ class Compiler:
         """
         optimization_level = OptimizationLevel.DEFAULT if optimize else OptimizationLevel.NONE
 
-        result = self._internal_compile(path, root_folder, env, log, log_level, fail_fast, optimization_level).bytecode
+        self.result = self._internal_compile(path, root_folder, env, log, log_level, fail_fast, optimization_level)
         self._restore_log_level()
-        return result
+        return self.result.bytecode
 
     def _internal_compile(self, path: str, root_folder: str = None, env: str = None,
                           log: bool = True, log_level: str = None,
@@ -67,13 +70,11 @@ class Compiler:
 
         self._entry_smart_contract = os.path.splitext(filename)[0]
 
-        from boa3.internal.compiler.compiledmetadata import CompiledMetadata
-        from boa3.internal.model.imports.compilerbuiltin import CompilerBuiltin
-        CompilerBuiltin.reset()
-        CompiledMetadata.reset()
-
-        self._analyse(fullpath, root_folder, env, log, fail_fast, exclude_warnings)
-        return self._compile(optimization_level)
+        # each compilation has its own state, so it doesn't interfere with other compilations
+        self._context = CompilationContext()
+        with self._context.activate():
+            self._analyse(fullpath, root_folder, env, log, fail_fast, exclude_warnings)
+            return self._compile(optimization_level)
 
     def compile_and_save(self, path: str, output_path: str, root_folder: str = None,
                          log: bool = True, log_level: str = None,
@@ -102,6 +103,22 @@ class Compiler:
         self._save(output_path, debug)
         self._restore_log_level()
 
+    def generate_gas_report(self) -> GasReport:
+        """
+        Estimates the GAS needed to invoke each public method of the last compiled smart contract
+
+        :return: the estimation of each public method
+        :raise NotLoadedException: raised if no file were compiled
+        """
+        is_bytecode_empty = len(self.result.bytecode) == 0
+        if (self._analyser is None
+                or not self._analyser.is_analysed
+                or is_bytecode_empty):
+            raise NotLoadedException(empty_script=is_bytecode_empty)
+
+        generator = FileGenerator(self.result, self._analyser, self._entry_smart_contract)
+        return generator.generate_gas_report()
+
     def _change_log_level(self, log_level: str = None):
         if not log_level:
             log_level = logging.ERROR
@@ -128,7 +145,7 @@ class Compiler:
         :param fail_fast: if should stop compilation on first error found.
         """
         self._analyser = Analyser.analyse(path, log=log, fail_fast=fail_fast, exclude_warnings=exclude_warnings,
-                                          root=root_folder, env=env, compiler_entry=True)
+                                          root=root_folder, env=env, compiler_entry=True, context=self._context)
 
     def _compile(self, optimization_level: OptimizationLevel) -> CompilerOutput:
         """
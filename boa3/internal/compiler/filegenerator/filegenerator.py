@@ -5,8 +5,12 @@ from typing import Any
 
 from boa3.internal import constants
 from boa3.internal.analyser.analyser import Analyser
+from boa3.internal.compiler.codegenerator.engine.executionscript import ExecutionScript
+from boa3.internal.compiler.codegenerator.engine.gasestimation import GasEstimation
+from boa3.internal.compiler.codegenerator.engine.gasestimator import GasEstimator
 from boa3.internal.compiler.compileroutput import CompilerOutput
 from boa3.internal.compiler.filegenerator.importdata import ImportData
+from boa3.internal.compiler.gasreport import GasReport
 from boa3.internal.model.event import Event
 from boa3.internal.model.imports.importsymbol import BuiltinImport, Import
 from boa3.internal.model.imports.package import Package
@@ -27,6 +31,7 @@ class FileGenerator:
 
     def __init__(self, compiler_result: CompilerOutput, analyser: Analyser, entry_file: str):
         import os
+        self._context = analyser.context
         self._metadata = analyser.metadata
         self._symbols: dict[str, ISymbol] = analyser.symbol_table.copy()
 
@@ -44,6 +49,7 @@ class FileGenerator:
 
         self._inner_methods = None
         self._inner_events = None
+        self._gas_estimator: GasEstimator = None
 
     @property
     def _public_methods(self) -> dict[str, Method]:
@@ -302,7 +308,8 @@ class FileGenerator:
 
         :return: the resulting manifest as a byte array
         """
-        data: dict[str, Any] = self._get_manifest_info()
+        with self._context.activate():
+            data: dict[str, Any] = self._get_manifest_info()
         json_data: str = json.dumps(data, indent=4)
         return bytes(json_data, constants.ENCODING)
 
@@ -371,14 +378,12 @@ class FileGenerator:
         ]
 
     def _construct_abi_method(self, method_id: str, method: Method) -> dict[str, Any]:
-        from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-
         abi_method_name = method.external_name if isinstance(method.external_name, str) else method_id
         logging.getLogger(constants.BOA_LOGGING_NAME).info(f"'{abi_method_name}' method included in the manifest")
 
         method_abi = {
             "name": abi_method_name,
-            "offset": (VMCodeMapping.instance().get_start_address(method.start_bytecode)
+            "offset": (self._context.vm_code_mapping.get_start_address(method.start_bytecode)
                        if method.start_bytecode is not None else 0),
             "parameters": [
                 self._construct_abi_type_hint(arg.type, arg_id) for arg_id, arg in method.args.items()
@@ -512,7 +517,8 @@ class FileGenerator:
 
         :return: the resulting map as a byte array
         """
-        data: dict[str, Any] = self._get_debug_info()
+        with self._context.activate():
+            data: dict[str, Any] = self._get_debug_info()
         json_data: str = json.dumps(data, indent=4)
         return bytes(json_data, constants.ENCODING)
 
@@ -544,19 +550,22 @@ class FileGenerator:
             dbg_method = self._get_method_debug_info(module_id, method_id, method)
             dbg_id = dbg_method['id']
             if method.is_compiled and dbg_id not in method_ids:
+                gas_info = self._get_method_gas_info(method)
+                if gas_info is not None:
+                    dbg_method['gas'] = gas_info
                 method_ids.append(dbg_id)
                 debug_methods.append(dbg_method)
 
         return debug_methods
 
     def _get_method_debug_info(self, module_id: str, method_id: str, method: Method) -> dict[str, Any]:
-        from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-        from boa3.internal.neo.vm.type.AbiType import AbiType
-        from boa3.internal.model.type.itype import IType
-
         sequence_points = []
         for instruction in method.debug_map():
-            vm_code_map = VMCodeMapping.instance()
+            vm_code_map = self._context.vm_code_mapping
+            if not vm_code_map.has_code(instruction.code):
+                # the instruction was removed from the bytecode
+                continue
+
             start_address = vm_code_map.get_start_address(instruction.code)
             end_address = vm_code_map.get_end_address(instruction.code)
             if start_address >= method.start_address and end_address <= method.end_address:
@@ -567,7 +576,7 @@ class FileGenerator:
                                                      instruction.end_line, instruction.end_col)
                 )
 
-        return {
+        debug_info = {
             "id": str(id(method)),
             "name": '{0},{1}'.format(module_id, method_id),
             "range": '{0}-{1}'.format(method.start_address, method.end_address),
@@ -575,13 +584,75 @@ class FileGenerator:
                 '{0},{1}'.format(name, var.type.abi_type) for name, var in method.args.items()
             ],
             "return": method.return_type.abi_type,
-            "variables": [
-                '{0},{1}'.format(name, var.type.abi_type if isinstance(var.type, IType) else AbiType.Any)
-                for name, var in method.locals.items()
-            ],
+            "variables": self._get_debug_variables(method),
             "sequence-points": sequence_points
         }
 
+        if method.local_ranges is not None:
+            debug_info["variable-ranges"] = self._get_debug_variable_ranges(method)
+
+        return debug_info
+
+    def _get_debug_variables(self, method: Method) -> list[str]:
+        """
+        Gets the local variables' debug information. If the slots were reallocated, each variable includes the index of
+        its slot, because a slot can be used by more than one variable. The addresses where each one is in its slot are
+        in the variables' ranges
+        """
+        from boa3.internal.neo.vm.type.AbiType import AbiType
+        from boa3.internal.model.type.itype import IType
+
+        variables = []
+        for name, var in method.locals.items():
+            var_type = var.type.abi_type if isinstance(var.type, IType) else AbiType.Any
+            if method.local_slots is None:
+                variables.append('{0},{1}'.format(name, var_type))
+            elif name in method.local_slots:
+                variables.append('{0},{1},{2}'.format(name, var_type, method.local_slots[name]))
+
+        return variables
+
+    def _get_debug_variable_ranges(self, method: Method) -> list[str]:
+        """
+        Gets the ranges of addresses in which each local variable has its value in its slot, as "name,start-end". It's
+        included when the slots were reallocated, because the variables that share a slot have different ranges
+        """
+        vm_code_map = self._context.vm_code_mapping
+        variable_ranges = []
+        for name, ranges in method.local_ranges.items():
+            for start_code, end_code in ranges:
+                if vm_code_map.has_code(start_code) and vm_code_map.has_code(end_code):
+                    variable_ranges.append('{0},{1}-{2}'.format(name,
+                                                                vm_code_map.get_start_address(start_code),
+                                                                vm_code_map.get_start_address(end_code)))
+
+        return variable_ranges
+
+    def _get_method_gas_info(self, method: Method) -> dict[str, Any] | None:
+        estimation = self._estimate_gas(method)
+        if estimation is None:
+            return None
+
+        return {
+            "best": estimation.best_gas,
+            "worst": estimation.worst_gas,
+            "dynamic": estimation.has_dynamic_price,
+            "blocks": [
+                {
+                    "range": '{0}-{1}'.format(block.start_address, block.end_address),
+                    "best": block.best_gas,
+                    "worst": block.worst_gas
+                } for block in estimation.blocks
+            ],
+            "loops": [
+                {
+                    "range": '{0}-{1}'.format(loop.start_address, loop.end_address),
+                    "best": loop.best_gas,
+                    "worst": loop.worst_gas
+                } for loop in estimation.loops
+            ]
+        }
+
     def _get_method_origin_index(self, method: Method) -> int:
         if method.file_origin in self._files:
             return self._files.index(method.file_origin)
@@ -656,6 +727,43 @@ class FileGenerator:
 
     # endregion
 
+    # region GAS
+
+    def generate_gas_report(self) -> GasReport:
+        """
+        Estimates the GAS needed to invoke each public method. The methods whose first instruction isn't in the
+        bytecode are not included
+
+        :return: the report with the estimation of each method
+        """
+        report = GasReport(self._get_name())
+        with self._context.activate():
+            for method_id, method in self._public_methods.items():
+                estimation = self._estimate_gas(method)
+                if estimation is not None:
+                    abi_method_name = method.external_name if isinstance(method.external_name, str) else method_id
+                    report.include(abi_method_name, estimation)
+        return report
+
+    def _estimate_gas(self, method: Method) -> GasEstimation | None:
+        """
+        Estimates the GAS needed to invoke the method
+
+        :return: the estimation of the method. None if its first instruction isn't in the bytecode
+        """
+        vm_code_mapping = self._context.vm_code_mapping
+        if method.start_bytecode is None or not vm_code_mapping.has_code(method.start_bytecode):
+            return None
+
+        if self._gas_estimator is None:
+            script = ExecutionScript.from_code_map(vm_code_mapping)
+            self._gas_estimator = GasEstimator(script)
+
+        start_address = vm_code_mapping.get_start_address(method.start_bytecode)
+        return self._gas_estimator.estimate(start_address)
+
+    # endregion
+
     def _get_static_var_unique_name(self, variable_id) -> str:
         imported_symbols: dict[str, Import] = {symbol.origin: symbol for symbol in self._all_imports}
 
@@ -0,0 +1,54 @@
+__all__ = [
+    'GasReport'
+]
+
+from boa3.internal import constants
+from boa3.internal.compiler.codegenerator.engine.gasestimation import GasEstimation
+
+
+def _format_gas(gas: int) -> str:
+    return f'{gas / 10 ** constants.GAS_DECIMALS:.8f} GAS'
+
+
+class GasReport:
+    """
+    The estimated GAS needed to invoke each public method of a smart contract
+
+    :ivar contract_name: the name of the smart contract
+    """
+
+    def __init__(self, contract_name: str):
+        self.contract_name: str = contract_name
+        self._methods: dict[str, GasEstimation] = {}
+
+    @property
+    def methods(self) -> dict[str, GasEstimation]:
+        return self._methods.copy()
+
+    def get_method(self, name: str) -> GasEstimation | None:
+        return self._methods.get(name)
+
+    def include(self, name: str, estimation: GasEstimation):
+        """
+        Includes the estimation of a public method in the report
+
+        :param name: the name of the method in the manifest
+        :param estimation: the estimated prices of the method
+        """
+        self._methods[name] = estimation
+
+    def __str__(self) -> str:
+        lines = [f"GAS report of '{self.contract_name}':"]
+        for name, estimation in self._methods.items():
+            method_line = (f"  {name}: best {_format_gas(estimation.best_gas)}, "
+                           f"worst {_format_gas(estimation.worst_gas)}")
+            if estimation.has_dynamic_price:
+                method_line += ' plus dynamic fees'
+            lines.append(method_line)
+
+            for loop in estimation.loops:
+                lines.append(f"    loop {loop.start_address}-{loop.end_address}: "
+                             f"best {_format_gas(loop.best_gas)}, "
+                             f"worst {_format_gas(loop.worst_gas)} per iteration")
+
+        return '\n'.join(lines)
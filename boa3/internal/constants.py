@@ -39,6 +39,8 @@ SIZE_OF_ECPOINT = 33
 DEFAULT_UINT32 = 0
 GAS_DECIMALS = 8
 NEO_DECIMALS = 0
+# default value of the network's multiplier of the opcodes' execution prices
+DEFAULT_EXEC_FEE_FACTOR = 30
 
 INIT_METHOD_ID = '__init__'
 INITIALIZE_METHOD_ID = '_initialize'
@@ -53,3 +55,6 @@ ORACLE_SCRIPT = from_hex_str('0xfe924b7cfe89ddd271abaf7210a80a7e11178758')
 POLICY_SCRIPT = from_hex_str('0xcc5e4edd9f5f8dba8bb65734541df7a1c081c67b')
 ROLE_MANAGEMENT = from_hex_str('0x49cf4e5378ffcd4dec034fd98a174c5491e395e2')
 STD_LIB_SCRIPT = from_hex_str('0xacce6fd80d44e1796aa0c2c625e9e4e0ce39efc0')
+
+# maximum size of the inputs of StdLib methods, like the memory of memorySearch
+STD_LIB_MAX_INPUT_LENGTH = 1024
@@ -65,6 +65,7 @@ class Builtin:
     Super = SuperMethod()
 
     # python class method
+    BytesStringFind = FindBytesStringMethod()
     BytesStringIndex = IndexBytesStringMethod()
     BytesStringIsDigit = IsDigitMethod()
     BytesStringJoin = JoinMethod()
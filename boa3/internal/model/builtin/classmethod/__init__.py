@@ -6,6 +6,7 @@ __all__ = ['AppendMethod',
            'CountSequencePrimitiveMethod',
            'CountStrMethod',
            'ExtendMethod',
+           'FindBytesStringMethod',
            'IndexBytesStringMethod',
            'IndexSequenceMethod',
            'InsertMethod',
@@ -35,6 +36,7 @@ from boa3.internal.model.builtin.classmethod.countsequencegenericmethod import C
 from boa3.internal.model.builtin.classmethod.countsequenceprimitivemethod import CountSequencePrimitiveMethod
 from boa3.internal.model.builtin.classmethod.countstrmethod import CountStrMethod
 from boa3.internal.model.builtin.classmethod.extendmethod import ExtendMethod
+from boa3.internal.model.builtin.classmethod.findbytesstringmethod import FindBytesStringMethod
 from boa3.internal.model.builtin.classmethod.indexbytesstringmethod import IndexBytesStringMethod
 from boa3.internal.model.builtin.classmethod.indexsequencemethod import IndexSequenceMethod
 from boa3.internal.model.builtin.classmethod.insertmethod import InsertMethod
@@ -23,9 +23,14 @@ class CountStrMethod(CountMethod):
 
         super().__init__(args, [start_default, end_default])
 
+    @property
+    def is_shared(self) -> bool:
+        return True
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.builtin import Builtin
         from boa3.internal.model.operation.binaryop import BinaryOp
+        from boa3.internal.model.type.type import Type
         from boa3.internal.neo.vm.opcode.Opcode import Opcode
 
         # if end is None
@@ -115,51 +120,51 @@ class CountStrMethod(CountMethod):
 
         code_generator.convert_end_if(verify_start_neg)
 
-        # index = count = 0
+        # count = 0
         code_generator.convert_literal(0)
 
-        # substr_size = len(substr)
-        code_generator.duplicate_stack_item(4)
-        code_generator.convert_builtin_method_call(Builtin.Len, is_internal=True)
-        code_generator.swap_reverse_stack_items(2)
-
+        # while start >= 0:
         while_start = code_generator.convert_begin_while()
 
-        # while substr_size + index <= end
+        #   start = self.find(substr, start, end)
+        code_generator.duplicate_stack_item(4)
         code_generator.duplicate_stack_item(6)
-        code_generator.duplicate_stack_item(5)
         code_generator.duplicate_stack_item(4)
-        code_generator.convert_get_substring(is_internal=True)
-
-        #   if self[index: index + substr_size] == substr:
         code_generator.duplicate_stack_item(6)
-        code_generator.convert_operation(BinaryOp.NumEq, is_internal=True)
+        code_generator.convert_builtin_method_call(Builtin.BytesStringFind, is_internal=True)
+        code_generator.swap_reverse_stack_items(4)
+        code_generator.remove_stack_top_item()
+        code_generator.swap_reverse_stack_items(2)
+
+        #   if start >= 0:
+        code_generator.duplicate_stack_item(3)
+        code_generator.convert_literal(0)
         is_substr = code_generator.convert_begin_if()
+        code_generator.change_jump(is_substr, Opcode.JMPLT)
 
         #       count += 1
         code_generator.insert_opcode(Opcode.INC)
-        code_generator.convert_end_if(is_substr, is_internal=True)
 
-        code_generator.swap_reverse_stack_items(4)
-        #   index += 1
-        code_generator.insert_opcode(Opcode.INC)
-        code_generator.swap_reverse_stack_items(4)
+        #       start += max(len(substr), 1)
+        code_generator.swap_reverse_stack_items(3, rotate=True)
+        code_generator.duplicate_stack_item(4)
+        code_generator.convert_builtin_method_call(Builtin.Len, is_internal=True)
+        code_generator.convert_literal(1)
+        code_generator.insert_opcode(Opcode.MAX, pop_from_stack=True, add_to_stack=[Type.int])
+        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
+        code_generator.swap_reverse_stack_items(3)
+        code_generator.swap_reverse_stack_items(2)
+
+        code_generator.convert_end_if(is_substr, is_internal=True)
 
         # while condition
         while_condition = code_generator.bytecode_size
-        code_generator.duplicate_stack_item(2)
-        code_generator.duplicate_stack_item(5)
-        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
-        code_generator.duplicate_stack_item(4)
-        code_generator.convert_operation(BinaryOp.LtE, is_internal=True)
+        code_generator.duplicate_stack_item(3)
+        code_generator.convert_literal(0)
+        code_generator.convert_operation(BinaryOp.GtE, is_internal=True)
 
         code_generator.convert_end_while(while_start, while_condition, is_internal=True)
 
         # clean stack
-        code_generator.swap_reverse_stack_items(4)
-        code_generator.remove_stack_top_item()
-        code_generator.remove_stack_top_item()
-        code_generator.remove_stack_top_item()
-        code_generator.swap_reverse_stack_items(3)
-        code_generator.remove_stack_top_item()
-        code_generator.remove_stack_top_item()
+        for _ in range(4):
+            code_generator.remove_stack_item(2)
@@ -0,0 +1,221 @@
+from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.internal.model.method import Method
+from boa3.internal.model.operation.binaryop import BinaryOp
+from boa3.internal.model.variable import Variable
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+
+# how many positions are compared before calling StdLib's memorySearch, that costs more than comparing the first
+# byte of a few hundreds of positions
+COMPARED_POSITIONS = 32
+
+
+class FindBytesStringMethod(IBuiltinMethod):
+
+    def __init__(self):
+        from boa3.internal.model.type.type import Type
+
+        identifier = '-find'
+        byte_string_type = Type.union.build([Type.bytes, Type.str])
+
+        args: dict[str, Variable] = {
+            'self': Variable(byte_string_type),
+            'value': Variable(byte_string_type),
+            'start': Variable(Type.int),
+            'end': Variable(Type.int),
+        }
+        super().__init__(identifier, args, return_type=Type.int)
+
+    @property
+    def is_shared(self) -> bool:
+        return True
+
+    @property
+    def shared_method_id(self) -> str:
+        # the opcodes are the same for str and bytes
+        return self._identifier
+
+    def build_shared_method(self) -> Method:
+        from boa3.internal.model.type.type import Type
+
+        # the top of the stack is the first argument
+        method = Method(args={
+            'start': Variable(Type.int),
+            'end': Variable(Type.int),
+            'string': Variable(self.args['self'].type),
+            'value': Variable(self.args['value'].type),
+        }, return_type=self.return_type)
+
+        for var_id in ('size', 'first', 'window_end', 'found'):
+            method.include_variable(var_id, Variable(Type.int))
+
+        return method
+
+    def generate_internal_opcodes(self, code_generator):
+        from boa3.internal import constants
+        from boa3.internal.model.builtin.builtin import Builtin
+        from boa3.internal.model.builtin.interop.interop import Interop
+        from boa3.internal.model.type.type import Type
+
+        # returns the index of the first occurrence of value in string[start:end] or -1 if it's not found
+        # start and end must be already fixed to valid indexes of the string
+
+        # size = len(value)
+        code_generator.convert_load_symbol('value')
+        code_generator.convert_builtin_method_call(Builtin.Len, is_internal=True)
+        code_generator.duplicate_stack_top_item()
+        code_generator.convert_store_variable('size')
+        # found = -1
+        code_generator.convert_literal(-1)
+        code_generator.convert_store_variable('found')
+
+        # if size == 0:
+        if_is_empty = code_generator.convert_begin_if()
+        code_generator.change_jump(if_is_empty, Opcode.JMPIF)
+        #   if start <= end:
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_load_symbol('end')
+        if_has_start = code_generator.convert_begin_if()
+        code_generator.change_jump(if_has_start, Opcode.JMPGT)
+        #       found = start
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_store_variable('found')
+        code_generator.convert_end_if(if_has_start, is_internal=True)
+
+        # else:
+        else_is_empty = code_generator.convert_begin_else(if_is_empty, is_internal=True)
+        #   the first positions are compared one by one, because it costs less than calling StdLib if the value is
+        #   close to the start. If the value doesn't fit in the memory searched by StdLib, every position is compared
+        #   limit = end - size + 1
+        code_generator.convert_load_symbol('end')
+        code_generator.convert_load_symbol('size')
+        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
+        code_generator.insert_opcode(Opcode.INC)
+        #   if size <= STD_LIB_MAX_INPUT_LENGTH:
+        code_generator.convert_load_symbol('size')
+        code_generator.convert_literal(constants.STD_LIB_MAX_INPUT_LENGTH)
+        if_fits_std_lib = code_generator.convert_begin_if()
+        code_generator.change_jump(if_fits_std_lib, Opcode.JMPGT)
+        #       limit = min(limit, start + COMPARED_POSITIONS)
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_literal(COMPARED_POSITIONS)
+        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
+        code_generator.insert_opcode(Opcode.MIN, pop_from_stack=True, add_to_stack=[Type.int])
+        code_generator.convert_end_if(if_fits_std_lib, is_internal=True)
+        code_generator.convert_store_variable('window_end')
+        #   first = value[0]
+        code_generator.convert_load_symbol('value')
+        code_generator.convert_literal(0)
+        code_generator.insert_opcode(Opcode.PICKITEM, pop_from_stack=True, add_to_stack=[Type.int])
+        code_generator.convert_store_variable('first')
+
+        #   while start < limit:
+        begin_compare_while = code_generator.convert_begin_while()
+        #       if string[start] == first and (size == 1 or string[start:start + size] == value):
+        #       (getting a byte is much cheaper than getting a substring)
+        code_generator.convert_load_symbol('string')
+        code_generator.convert_load_symbol('start')
+        code_generator.insert_opcode(Opcode.PICKITEM, pop_from_stack=True, add_to_stack=[Type.int])
+        code_generator.convert_load_symbol('first')
+        if_first_is_equal = code_generator.convert_begin_if()
+        code_generator.change_jump(if_first_is_equal, Opcode.JMPNE)
+        code_generator.convert_load_symbol('size')
+        code_generator.convert_literal(1)
+        code_generator.convert_operation(BinaryOp.NumEq, is_internal=True)
+        code_generator.duplicate_stack_top_item()
+        if_is_one_byte = code_generator.convert_begin_if()
+        code_generator.change_jump(if_is_one_byte, Opcode.JMPIF)
+        code_generator.remove_stack_top_item()
+        code_generator.convert_load_symbol('string')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_load_symbol('size')
+        code_generator.convert_get_substring(is_internal=True)
+        code_generator.convert_load_symbol('value')
+        code_generator.convert_operation(BinaryOp.Eq, is_internal=True)
+        code_generator.convert_end_if(if_is_one_byte, is_internal=True)
+        if_is_equal = code_generator.convert_begin_if()
+        #           found = start
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_store_variable('found')
+        #           break
+        code_generator.convert_loop_break()
+        code_generator.convert_end_if(if_is_equal, is_internal=True)
+        code_generator.convert_end_if(if_first_is_equal, is_internal=True)
+        #       start += 1
+        code_generator.convert_load_symbol('start')
+        code_generator.insert_opcode(Opcode.INC)
+        code_generator.convert_store_variable('start')
+
+        compare_while_test = code_generator.bytecode_size
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_load_symbol('window_end')
+        code_generator.convert_operation(BinaryOp.Lt, is_internal=True)
+        code_generator.convert_end_while(begin_compare_while, compare_while_test, is_internal=True)
+
+        #   if found < 0:
+        code_generator.convert_load_symbol('found')
+        code_generator.convert_literal(0)
+        if_not_found = code_generator.convert_begin_if()
+        code_generator.change_jump(if_not_found, Opcode.JMPGE)
+        #       the rest is searched in windows of the maximum size accepted by StdLib, that overlap by size - 1 bytes
+        #       while (window_end := min(start + STD_LIB_MAX_INPUT_LENGTH, end)) - start >= size:
+        begin_window_while = code_generator.convert_begin_while()
+        #           found = memorySearch(string[start:window_end], value)
+        code_generator.convert_literal(False)  # backward
+        code_generator.convert_literal(0)  # start
+        code_generator.convert_load_symbol('value')
+        code_generator.convert_load_symbol('string')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_load_symbol('window_end')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
+        # StdLib accepts the buffer returned by SUBSTR, so it doesn't need to be converted
+        code_generator.convert_get_substring(is_internal=True, fix_result_type=False)
+        code_generator.convert_builtin_method_call(Interop.MemorySearch, is_internal=True)
+        code_generator.duplicate_stack_top_item()
+        code_generator.convert_store_variable('found')
+        #           if found >= 0:
+        code_generator.convert_literal(0)
+        if_was_found = code_generator.convert_begin_if()
+        code_generator.change_jump(if_was_found, Opcode.JMPLT)
+        #               found += start
+        code_generator.convert_load_symbol('found')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
+        code_generator.convert_store_variable('found')
+        #               break
+        code_generator.convert_loop_break()
+        code_generator.convert_end_if(if_was_found, is_internal=True)
+        #           start = window_end - size + 1
+        code_generator.convert_load_symbol('window_end')
+        code_generator.convert_load_symbol('size')
+        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
+        code_generator.insert_opcode(Opcode.INC)
+        code_generator.convert_store_variable('start')
+
+        window_while_test = code_generator.bytecode_size
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_literal(constants.STD_LIB_MAX_INPUT_LENGTH)
+        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
+        code_generator.convert_load_symbol('end')
+        code_generator.insert_opcode(Opcode.MIN, pop_from_stack=True, add_to_stack=[Type.int])
+        code_generator.duplicate_stack_top_item()
+        code_generator.convert_store_variable('window_end')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
+        code_generator.convert_load_symbol('size')
+        code_generator.convert_operation(BinaryOp.GtE, is_internal=True)
+        code_generator.convert_end_while(begin_window_while, window_while_test, is_internal=True)
+
+        code_generator.convert_end_if(if_not_found, is_internal=True)
+        code_generator.convert_end_if(else_is_empty, is_internal=True)
+
+        # return found
+        code_generator.convert_load_symbol('found')
+
+    @property
+    def _args_on_stack(self) -> int:
+        return len(self.args)
+
+    @property
+    def _body(self) -> str | None:
+        return None
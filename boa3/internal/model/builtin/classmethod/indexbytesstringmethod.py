@@ -52,7 +52,6 @@ class IndexBytesStringMethod(IndexMethod):
 
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.builtin import Builtin
-        from boa3.internal.model.operation.binaryop import BinaryOp
 
         # fix possible negative or too big indexes for start and end parameters
         code_generator.swap_reverse_stack_items(2)
@@ -76,50 +75,15 @@ class IndexBytesStringMethod(IndexMethod):
         code_generator.fix_index_out_of_range(True)
         code_generator.swap_reverse_stack_items(2)
 
-        # change order of items on stack
-        code_generator.duplicate_stack_item(4)
-        code_generator.convert_builtin_method_call(Builtin.Len, is_internal=True)
-        code_generator.swap_reverse_stack_items(3, rotate=True)
-        code_generator.swap_reverse_stack_items(3, rotate=True)
-
-        # current_index = start
-        # while (size < end - current_index):
-        while_start = code_generator.convert_begin_while()
-        code_generator.duplicate_stack_item(4)
-        code_generator.duplicate_stack_item(2)
-        code_generator.duplicate_stack_item(5)
-        code_generator.convert_get_substring(is_internal=True)
-        code_generator.duplicate_stack_item(6)
-        code_generator.convert_operation(BinaryOp.NumEq, is_internal=True)
-        #   if str[index:current_index + size] == substr:
-        if_was_found = code_generator.convert_begin_if()
-        code_generator.change_jump(if_was_found, Opcode.JMPIFNOT)
-        #       break
-        code_generator.convert_loop_break()
-        code_generator.convert_end_if(if_was_found)
-        #   current_index += 1
-        code_generator.insert_opcode(Opcode.INC)
-
-        condition_address = code_generator.bytecode_size
-        code_generator.duplicate_stack_item(2)
-        code_generator.duplicate_stack_item(2)
-        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
-        code_generator.duplicate_stack_item(4)
-        code_generator.convert_operation(BinaryOp.GtE, is_internal=True)
-        code_generator.convert_end_while(while_start, condition_address, is_internal=True)
+        # index = self.find(x, start, end)
+        code_generator.convert_builtin_method_call(Builtin.BytesStringFind, is_internal=True)
 
-        # if current_index + size >= end:
-        code_generator.duplicate_stack_item(2)
-        code_generator.duplicate_stack_item(2)
-        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
-        code_generator.duplicate_stack_item(4)
+        # if index < 0:
+        code_generator.duplicate_stack_top_item()
+        code_generator.convert_literal(0)
         check_was_found = code_generator.convert_begin_if()
         code_generator.change_jump(check_was_found, Opcode.JMPGE)
         #   raise Exception('substring not found')
         code_generator.convert_literal(self.error_message)
         code_generator.convert_raise_exception()
         code_generator.convert_end_if(check_was_found)
-        # else:
-        #   return current_index
-        for _ in range(1, len(code_generator._stack)):
-            code_generator.remove_stack_item(2)
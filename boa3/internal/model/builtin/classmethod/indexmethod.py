@@ -43,6 +43,10 @@ class IndexMethod(IBuiltinMethod):
     def _arg_value(self) -> Variable:
         return self.args['value']
 
+    @property
+    def is_shared(self) -> bool:
+        return True
+
     @property
     def _args_on_stack(self) -> int:
         return len(self.args)
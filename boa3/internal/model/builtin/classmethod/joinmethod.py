@@ -47,6 +47,10 @@ class JoinMethod(IBuiltinMethod):
     def push_self_first(self) -> bool:
         return self.has_self_argument
 
+    @property
+    def is_shared(self) -> bool:
+        return True
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.builtin import Builtin
         from boa3.internal.model.operation.binaryop import BinaryOp
@@ -2,6 +2,7 @@ import ast
 from typing import Any
 
 from boa3.internal.model.builtin.method.builtinmethod import IBuiltinMethod
+from boa3.internal.model.method import Method
 from boa3.internal.model.type.primitive.ibytestringtype import IByteStringType
 from boa3.internal.model.variable import Variable
 from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -31,135 +32,119 @@ class ReplaceMethod(IBuiltinMethod):
     def _arg_self(self) -> Variable:
         return self.args['self']
 
+    @property
+    def is_shared(self) -> bool:
+        return True
+
+    def build_shared_method(self) -> Method:
+        from boa3.internal.model.type.type import Type
+
+        # the top of the stack is the first argument
+        method = Method(args={
+            'old': Variable(self._arg_self.type),
+            'new': Variable(self._arg_self.type),
+            'count': Variable(Type.int),
+            'string': Variable(self._arg_self.type),
+        }, return_type=self.return_type)
+
+        for var_id in ('result', 'start', 'found', 'position', 'size', 'end'):
+            var_type = self._arg_self.type if var_id == 'result' else Type.int
+            method.include_variable(var_id, Variable(var_type))
+
+        return method
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.builtin import Builtin
         from boa3.internal.model.operation.binaryop import BinaryOp
         from boa3.internal.model.type.type import Type
 
-        # old_length = len(old)
-        code_generator.duplicate_stack_top_item()
+        # size = len(old)
+        code_generator.convert_load_symbol('old')
         code_generator.convert_builtin_method_call(Builtin.Len, is_internal=True)
-
-        # self_length = len(string)
-        code_generator.duplicate_stack_item(5)
+        code_generator.convert_store_variable('size')
+        # end = len(string)
+        code_generator.convert_load_symbol('string')
         code_generator.convert_builtin_method_call(Builtin.Len, is_internal=True)
-
-        # self_length = self_length - old_length + 1
-        code_generator.duplicate_stack_item(2)
-        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
-        code_generator.insert_opcode(Opcode.INC)
-
-        # if count < 0:
-        code_generator.move_stack_item_to_top(5)
-        code_generator.duplicate_stack_top_item()
+        code_generator.convert_store_variable('end')
+        # result = ''
+        code_generator.convert_literal(Type.str.default_value)
+        code_generator.convert_store_variable('result')
+        # start = position = 0
         code_generator.convert_literal(0)
-        if_less_than_zero = code_generator.convert_begin_if()
-        code_generator.change_jump(if_less_than_zero, Opcode.JMPGE)
-
-        #     count = self_length
-        code_generator.remove_stack_top_item()
         code_generator.duplicate_stack_top_item()
+        code_generator.convert_store_variable('start')
+        code_generator.convert_store_variable('position')
 
-        code_generator.convert_end_if(if_less_than_zero)
-
-        # index = 0
-        code_generator.convert_literal(0)
-
-        # new_string = ""
-        code_generator.convert_literal(Type.str.default_value)
-
-        # while index < self_length:
+        # while count != 0 and (found := string.find(old, position, end)) >= 0:
         while_start = code_generator.convert_begin_while()
 
-        #   if self[index:index + old_length] == old and count > 0:
-        #   (self[index:index + old_length] == old)
-        code_generator.duplicate_stack_item(8)
-        code_generator.duplicate_stack_item(3)
-        code_generator.duplicate_stack_item(7)
-        code_generator.convert_get_substring(is_internal=True)
-        code_generator.duplicate_stack_item(7)
-
-
-        if_substring_matches_old = code_generator.convert_begin_if()
-        code_generator.change_jump(if_substring_matches_old, Opcode.JMPNE)
-
-        #   (count > 0)
-        code_generator.duplicate_stack_item(3)
-        code_generator.convert_literal(0)
-
-        if_count_greater_than_zero = code_generator.convert_begin_if()
-        code_generator.change_jump(if_count_greater_than_zero, Opcode.JMPLE)
-
-        #       new_string += new
-        code_generator.duplicate_stack_item(7)
+        #   result += string[start:found] + new
+        #   (the result is converted only when it's returned)
+        code_generator.convert_load_symbol('result')
+        code_generator.convert_load_symbol('string')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_load_symbol('found')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
+        code_generator.convert_get_substring(is_internal=True, fix_result_type=False)
         code_generator.convert_operation(BinaryOp.Concat, is_internal=True)
+        code_generator.convert_load_symbol('new')
+        code_generator.convert_operation(BinaryOp.Concat, is_internal=True)
+        code_generator.convert_store_variable('result')
 
-        #       index += old_length
-        code_generator.swap_reverse_stack_items(2)
-        code_generator.duplicate_stack_item(5)
+        #   start = found + size
+        code_generator.convert_load_symbol('found')
+        code_generator.convert_load_symbol('size')
         code_generator.convert_operation(BinaryOp.Add, is_internal=True)
-        code_generator.swap_reverse_stack_items(2)
+        code_generator.convert_store_variable('start')
 
-        #       count -= 1
-        code_generator.swap_reverse_stack_items(3)
-        code_generator.insert_opcode(Opcode.DEC)
-        code_generator.swap_reverse_stack_items(3)
-
-        #   else:
-        else_substring_matches_old = code_generator.convert_begin_else(if_substring_matches_old)
-        code_generator.convert_end_if(if_count_greater_than_zero)
-
-        #       new_string += self[index]
-        code_generator.duplicate_stack_item(8)
-        code_generator.duplicate_stack_item(3)
+        #   position = found + max(size, 1)
+        #   (if old is empty, new is inserted between each character)
+        code_generator.convert_load_symbol('found')
+        code_generator.convert_load_symbol('size')
         code_generator.convert_literal(1)
-        code_generator.convert_get_substring(is_internal=True)
-        code_generator.convert_operation(BinaryOp.Concat, is_internal=True)
-
-        #       index += 1
-        code_generator.swap_reverse_stack_items(2)
-        code_generator.insert_opcode(Opcode.INC)
-        code_generator.swap_reverse_stack_items(2)
+        code_generator.insert_opcode(Opcode.MAX, pop_from_stack=True, add_to_stack=[Type.int])
+        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
+        code_generator.convert_store_variable('position')
 
-        code_generator.convert_end_if(else_substring_matches_old)
+        #   count -= 1
+        code_generator.convert_load_symbol('count')
+        code_generator.insert_opcode(Opcode.DEC)
+        code_generator.convert_store_variable('count')
 
-        # end while
         while_condition_start = code_generator.bytecode_size
-        # index < self_length
-        code_generator.duplicate_stack_item(2)
-        code_generator.duplicate_stack_item(5)
-        code_generator.convert_operation(BinaryOp.Lt, is_internal=True)
-
-        code_generator.convert_end_while(while_start, while_condition_start, is_internal=True)
-
-        code_generator.remove_stack_item(2)
-        code_generator.remove_stack_item(2)
-        code_generator.remove_stack_item(2)
+        # count != 0
+        code_generator.convert_load_symbol('count')
+        code_generator.convert_literal(0)
+        code_generator.convert_operation(BinaryOp.NumNotEq, is_internal=True)
+        code_generator.duplicate_stack_top_item()
+        if_has_count = code_generator.convert_begin_if()
+
+        # (found := string.find(old, position, end)) >= 0
+        code_generator.convert_load_symbol('old')
+        code_generator.convert_load_symbol('string')
+        code_generator.convert_load_symbol('end')
+        code_generator.convert_load_symbol('position')
+        code_generator.convert_builtin_method_call(Builtin.BytesStringFind, is_internal=True)
+        code_generator.duplicate_stack_top_item()
+        code_generator.convert_store_variable('found')
+        code_generator.convert_literal(0)
+        code_generator.convert_operation(BinaryOp.GtE, is_internal=True)
 
-        code_generator.remove_stack_item(3)
-        code_generator.remove_stack_item(3)
+        code_generator.convert_operation(BinaryOp.And, is_internal=True)
+        code_generator.convert_end_if(if_has_count, is_internal=True)
 
-        # if old_length > 1:
-        code_generator.duplicate_stack_item(2)
-        code_generator.convert_literal(1)
-        if_old_length_greater_than_one = code_generator.convert_begin_if()
-        code_generator.change_jump(if_old_length_greater_than_one, Opcode.JMPLE)
+        code_generator.convert_end_while(while_start, while_condition_start, is_internal=True)
 
-        #     new_string += self[-(old_length - 1):]
-        code_generator.swap_reverse_stack_items(3)
-        code_generator.swap_reverse_stack_items(2)
-        code_generator.insert_opcode(Opcode.DEC)
-        code_generator.insert_opcode(Opcode.RIGHT, pop_from_stack=True, add_to_stack=[Type.str])
+        # return result + string[start:]
+        code_generator.convert_load_symbol('result')
+        code_generator.convert_load_symbol('string')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_load_symbol('end')
+        code_generator.convert_load_symbol('start')
+        code_generator.convert_operation(BinaryOp.Sub, is_internal=True)
+        code_generator.convert_get_substring(is_internal=True, fix_result_type=False)
         code_generator.convert_operation(BinaryOp.Concat, is_internal=True)
-
-        else_old_length_greater_than_one = code_generator.convert_begin_else(if_old_length_greater_than_one, is_internal=True)
-
-        code_generator.remove_stack_item(2)
-        code_generator.remove_stack_item(2)
-
-        code_generator.convert_end_if(else_old_length_greater_than_one)
-
-        # return new_string
         code_generator.convert_cast(Type.str, is_internal=True)
 
     def push_self_first(self) -> bool:
@@ -2,6 +2,7 @@ import ast
 from typing import Any
 
 from boa3.internal.model.builtin.method import IBuiltinMethod
+from boa3.internal.model.method import Method
 from boa3.internal.model.operation.binaryop import BinaryOp
 from boa3.internal.model.type.itype import IType
 from boa3.internal.model.variable import Variable
@@ -58,76 +59,97 @@ class SortMethod(IBuiltinMethod):
     def _arg_self(self) -> Variable:
         return self.args['self']
 
+    @property
+    def is_shared(self) -> bool:
+        return True
+
+    @property
+    def shared_method_id(self) -> str:
+        # the opcodes are the same for any type of list
+        return self._identifier
+
+    def build_shared_method(self) -> Method:
+        from boa3.internal.model.type.type import Type
+
+        # the top of the stack is the first argument
+        method = Method(args={
+            'reverse': Variable(Type.bool),
+            'values': Variable(self._arg_self.type)
+        })
+
+        # the variables used in the inner loop are the first ones, so they use the smaller opcodes
+        for var_id in ('source', 'index', 'left', 'cursor', 'right', 'target', 'middle', 'size', 'width'):
+            var_type = self._arg_self.type if var_id in ('source', 'target') else Type.int
+            method.include_variable(var_id, Variable(var_type))
+
+        return method
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.builtin import Builtin
+        from boa3.internal.model.type.type import Type
         from boa3.internal.neo.vm.opcode.Opcode import Opcode
 
-        # code_generator.remove_stack_top_item()  # ignore key arg
-        # reverse, self // reverse -> top
+        # bottom-up merge sort, that merges the runs of `source` into `target`, doubling the width of the runs on
+        # each pass. Equal items keep their order, like in Python's sort
 
-        # start_index = 0
-        # i = 1
-        # end_address = len(self)
-        code_generator.duplicate_stack_item(2)
+        # size = len(values)
+        code_generator.convert_load_symbol('values')
         code_generator.convert_builtin_method_call(Builtin.Len, is_internal=True)
+        code_generator.convert_store_variable('size')
+        # source = values
+        code_generator.convert_load_symbol('values')
+        code_generator.convert_store_variable('source')
+        # target = values.copy()
+        code_generator.convert_load_symbol('values')
+        code_generator.convert_copy()
+        code_generator.convert_store_variable('target')
+        # width = 1
         code_generator.convert_literal(1)
+        code_generator.convert_store_variable('width')
 
-        # while i <= end_address
-        begin_i_while_address = code_generator.convert_begin_while()
-
-        code_generator.duplicate_stack_item(4)  # push array to the stack top
-        #   j = i
-        code_generator.duplicate_stack_item(2)
-
-        j_while_start_address = code_generator.convert_begin_while()
-        #   while j > start_index and arr[j] < arr[j - 1]:
-        #       arr[j], arr[j - 1] = arr[j - 1], arr[j]
+        # while width < size
+        begin_width_while = code_generator.convert_begin_while()
+        #   left = 0
+        code_generator.convert_literal(0)
+        code_generator.convert_store_variable('left')
+
+        #   while left < size
+        begin_left_while = code_generator.convert_begin_while()
+        #       middle = min(left + width, size)
+        self._load_sum(code_generator, 'left', 'width')
+        code_generator.convert_load_symbol('size')
+        code_generator.insert_opcode(Opcode.MIN, pop_from_stack=True, add_to_stack=[Type.int])
         code_generator.duplicate_stack_top_item()
-        code_generator.insert_opcode(Opcode.DEC)    # (j - 1), j, arr
-
-        arr_j_minus_one_address = code_generator.bytecode_size
-        code_generator.duplicate_stack_item(3)
-        code_generator.duplicate_stack_item(2)
-        code_generator.convert_get_item(index_inserted_internally=True)  # aux = arr[j - 1]
-
-        # arr[j - 1] / j - 1 / j
-        code_generator.swap_reverse_stack_items(3, rotate=True)  # j / arr[j - 1] / j - 1
-        arr_j_address = code_generator.bytecode_size
-        code_generator.duplicate_stack_item(4)
-        code_generator.duplicate_stack_item(2)
-        code_generator.convert_get_item(index_inserted_internally=True)  # arr[j]
-
-        # arr[j] / j / arr[j - 1] / j - 1 / arr
-        code_generator.duplicate_stack_item(4)
-        code_generator.duplicate_stack_item(6)
-        code_generator.swap_reverse_stack_items(3)
-        code_generator.convert_set_item(arr_j_address, index_inserted_internally=True)  # arr[j - 1] = arr[j]
-
-        # j / arr[j - 1] / j - 1 / arr
-        code_generator.duplicate_stack_item(4)
-        code_generator.swap_reverse_stack_items(3)
-        code_generator.convert_set_item(arr_j_minus_one_address, index_inserted_internally=True)  # arr[j] = arr[j - 1]
-
-        j_while_test_address = code_generator.bytecode_size
-        # j > start_index
+        code_generator.convert_store_variable('middle')
+        #       cursor = middle
         code_generator.duplicate_stack_top_item()
-        code_generator.convert_literal(0)
-        code_generator.convert_operation(BinaryOp.Gt, is_internal=True)
-
+        code_generator.convert_store_variable('cursor')
+        #       right = min(middle + width, size)
+        code_generator.convert_load_symbol('width')
+        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
+        code_generator.convert_load_symbol('size')
+        code_generator.insert_opcode(Opcode.MIN, pop_from_stack=True, add_to_stack=[Type.int])
+        code_generator.convert_store_variable('right')
+        #       index = left
+        code_generator.convert_load_symbol('left')
+        code_generator.convert_store_variable('index')
+
+        #       while index < right
+        begin_index_while = code_generator.convert_begin_while()
+        #           take_right = cursor < right and (left >= middle or source[cursor] < source[left])
+        self._load_compare(code_generator, 'cursor', 'right', BinaryOp.Lt)
         code_generator.duplicate_stack_top_item()
-        if_j_positive = code_generator.convert_begin_if()
+        if_cursor_in_run = code_generator.convert_begin_if()
 
-        # arr[j] (> if reverse else <) arr[j - 1]
-        code_generator.duplicate_stack_item(3)
-        code_generator.duplicate_stack_item(3)
-        code_generator.convert_get_item(index_inserted_internally=True)
-        code_generator.duplicate_stack_item(4)
-        code_generator.duplicate_stack_item(4)
-        code_generator.insert_opcode(Opcode.DEC)
-        code_generator.convert_get_item(index_inserted_internally=True)
+        self._load_compare(code_generator, 'left', 'middle', BinaryOp.GtE)
+        code_generator.duplicate_stack_top_item()
+        if_left_in_run = code_generator.convert_begin_if()
+        code_generator.change_jump(if_left_in_run, Opcode.JMPIF)
 
+        self._load_item(code_generator, 'cursor')
+        self._load_item(code_generator, 'left')
         # "gt" if reverse else "lt"
-        code_generator.duplicate_stack_item(8)
+        code_generator.convert_load_symbol('reverse')
         if_is_reverse = code_generator.convert_begin_if()
         code_generator.convert_operation(BinaryOp.Gt, is_internal=True)
 
@@ -135,30 +157,99 @@ class SortMethod(IBuiltinMethod):
         code_generator.convert_operation(BinaryOp.Lt, is_internal=True)
 
         code_generator.convert_end_if(else_is_reverse, is_internal=True)
+        code_generator.convert_operation(BinaryOp.Or, is_internal=True)
+        code_generator.convert_end_if(if_left_in_run, is_internal=True)
 
         code_generator.convert_operation(BinaryOp.And, is_internal=True)
+        code_generator.convert_end_if(if_cursor_in_run, is_internal=True)
+
+        #           target[index] = source[cursor] if take_right else source[left]
+        if_take_right = code_generator.convert_begin_if()
+        self._merge_item(code_generator, 'cursor')
+        else_take_right = code_generator.convert_begin_else(if_take_right, is_internal=True)
+        self._merge_item(code_generator, 'left')
+        code_generator.convert_end_if(else_take_right, is_internal=True)
+
+        #           index += 1
+        self._increment(code_generator, 'index')
+
+        index_while_test = code_generator.bytecode_size
+        self._load_compare(code_generator, 'index', 'right', BinaryOp.Lt)
+        code_generator.convert_end_while(begin_index_while, index_while_test, is_internal=True)
+
+        #       left = right
+        code_generator.convert_load_symbol('right')
+        code_generator.convert_store_variable('left')
+
+        left_while_test = code_generator.bytecode_size
+        self._load_compare(code_generator, 'left', 'size', BinaryOp.Lt)
+        code_generator.convert_end_while(begin_left_while, left_while_test, is_internal=True)
+
+        #   source, target = target, source
+        code_generator.convert_load_symbol('source')
+        code_generator.convert_load_symbol('target')
+        code_generator.convert_store_variable('source')
+        code_generator.convert_store_variable('target')
+        #   width += width
+        self._load_sum(code_generator, 'width', 'width')
+        code_generator.convert_store_variable('width')
+
+        width_while_test = code_generator.bytecode_size
+        self._load_compare(code_generator, 'width', 'size', BinaryOp.Lt)
+        code_generator.convert_end_while(begin_width_while, width_while_test, is_internal=True)
+
+        # if the sorted items ended in the copy, they are copied back to the list
+        code_generator.convert_load_symbol('source')
+        code_generator.convert_load_symbol('values')
+        code_generator.convert_operation(BinaryOp.IsNot, is_internal=True)
+        if_sorted_copy = code_generator.convert_begin_if()
 
-        code_generator.convert_end_if(if_j_positive, is_internal=True)
-
-        code_generator.convert_end_while(j_while_start_address, j_while_test_address, is_internal=True)
+        code_generator.convert_literal(0)
+        code_generator.convert_store_variable('index')
+        begin_copy_while = code_generator.convert_begin_while()
+        # values[index] = source[index]
+        code_generator.convert_load_symbol('values')
+        code_generator.convert_load_symbol('index')
+        self._load_item(code_generator, 'index')
+        code_generator.convert_set_item(code_generator.bytecode_size, index_inserted_internally=True)
+        self._increment(code_generator, 'index')
+
+        copy_while_test = code_generator.bytecode_size
+        self._load_compare(code_generator, 'index', 'size', BinaryOp.Lt)
+        code_generator.convert_end_while(begin_copy_while, copy_while_test, is_internal=True)
+
+        code_generator.convert_end_if(if_sorted_copy, is_internal=True)
+
+    def _load_sum(self, code_generator, left_id: str, right_id: str):
+        code_generator.convert_load_symbol(left_id)
+        code_generator.convert_load_symbol(right_id)
+        code_generator.convert_operation(BinaryOp.Add, is_internal=True)
+
+    def _load_compare(self, code_generator, left_id: str, right_id: str, operation: BinaryOp):
+        code_generator.convert_load_symbol(left_id)
+        code_generator.convert_load_symbol(right_id)
+        code_generator.convert_operation(operation, is_internal=True)
+
+    def _load_item(self, code_generator, index_id: str):
+        # source[index]
+        code_generator.convert_load_symbol('source')
+        code_generator.convert_load_symbol(index_id)
+        code_generator.convert_get_item(index_inserted_internally=True)
 
-        code_generator.remove_stack_top_item()  # remove j from the stack
-        code_generator.remove_stack_top_item()  # remove array from the stack
+    def _increment(self, code_generator, var_id: str):
+        from boa3.internal.neo.vm.opcode.Opcode import Opcode
 
-        #   i += 1
+        code_generator.convert_load_symbol(var_id)
         code_generator.insert_opcode(Opcode.INC)
-
-        condition_i_while_address = code_generator.bytecode_size
-        code_generator.duplicate_stack_top_item()
-        code_generator.duplicate_stack_item(3)
-        code_generator.convert_operation(BinaryOp.Lt, is_internal=True)
-        code_generator.convert_end_while(begin_i_while_address, condition_i_while_address, is_internal=True)
-
-        # clean stack
-        code_generator.remove_stack_top_item()
-        code_generator.remove_stack_top_item()
-        code_generator.remove_stack_top_item()
-        code_generator.remove_stack_top_item()
+        code_generator.convert_store_variable(var_id)
+
+    def _merge_item(self, code_generator, cursor_id: str):
+        # target[index] = source[cursor]; cursor += 1
+        code_generator.convert_load_symbol('target')
+        code_generator.convert_load_symbol('index')
+        self._load_item(code_generator, cursor_id)
+        code_generator.convert_set_item(code_generator.bytecode_size, index_inserted_internally=True)
+        self._increment(code_generator, cursor_id)
 
     def push_self_first(self) -> bool:
         return self.has_self_argument
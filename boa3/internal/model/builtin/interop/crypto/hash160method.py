@@ -1,3 +1,5 @@
+from typing import Any
+
 from boa3.internal.model.builtin.interop.nativecontract import CryptoLibMethod
 from boa3.internal.model.variable import Variable
 
@@ -13,10 +15,26 @@ class Hash160Method(CryptoLibMethod):
 
     @property
     def pack_arguments(self) -> bool:
-        if self._pack_arguments is None:
-            from boa3.internal.model.builtin.interop.interop import Interop
-            self._pack_arguments = Interop.Sha256.pack_arguments  # this is the first method called
-        return self._pack_arguments
+        from boa3.internal.model.builtin.interop.interop import Interop
+        return Interop.Sha256.pack_arguments  # this is the first method called
+
+    def evaluate_literal(self, *args: Any) -> Any:
+        from boa3.internal.neo import cryptography
+        from boa3.internal.neo.vm.type.Integer import Integer
+        from boa3.internal.neo.vm.type.String import String
+
+        if len(args) == 1:
+            key = args[0]
+            # the key is hashed with the same bytes of its stack item
+            if isinstance(key, str):
+                key = String(key).to_bytes()
+            elif isinstance(key, int) and not isinstance(key, bool):
+                key = Integer(key).to_byte_array(signed=True)
+
+            if isinstance(key, bytes):
+                return cryptography.hash160(key)
+
+        return super().evaluate_literal(*args)
 
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.interop.interop import Interop
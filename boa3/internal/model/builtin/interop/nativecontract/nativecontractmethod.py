@@ -1,6 +1,5 @@
 import ast
 
-from boa3.internal.compiler.compiledmetadata import CompiledMetadata
 from boa3.internal.model.builtin.interop.contractgethashmethod import ContractGetHashMethod
 from boa3.internal.model.builtin.interop.interopmethod import InteropMethod
 from boa3.internal.model.type.itype import IType
@@ -24,37 +23,25 @@ class NativeContractMethod(InteropMethod):
 
         from boa3.internal.neo3.contracts import CallFlags
         self._call_flags_default = CallFlags.ALL
-        self._added_to_permissions = False
-        self._pack_arguments = None   # defined during compilation
-        self._method_token_id = None  # defined during compilation
         self.external_name = self._sys_call
 
     @property
     def contract_script_hash(self) -> bytes:
         return self.script_hash_method.script_hash
 
-    def reset(self):
-        # reset the object state to ensure the correct output when calling consecutive compilations
-        super().reset()
-        self._added_to_permissions = False
-        self._pack_arguments = None
-        self._method_token_id = None
-
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.interop.interop import Interop
         from boa3.internal.model.type.type import Type
 
-        self._add_to_contract_permissions()
+        context = code_generator.context
+        context.metadata.add_contract_permission(self.contract_script_hash, self._sys_call)
 
         call_flag = self._call_flags_default
-        self_method_token_id = self._get_method_token_id(call_flag)
+        self_method_token_id = self._get_method_token_id(context, call_flag)
 
         if isinstance(self_method_token_id, int) and self_method_token_id >= 0:
             code_generator.convert_method_token_call(self_method_token_id)
         else:
-            if self._pack_arguments is None:
-                self._pack_arguments = False
-
             code_generator.convert_new_array(len(self.args))
             code_generator.convert_literal(call_flag)
             code_generator.convert_literal(self.method_name)
@@ -64,28 +51,22 @@ class NativeContractMethod(InteropMethod):
             if self.return_type is Type.none:
                 code_generator.remove_stack_top_item()
 
-    def _get_method_token_id(self, call_flag=None) -> int | None:
-        if self._method_token_id is None:
-            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-
-            if call_flag is None:
-                call_flag = self._call_flags_default
-            self._method_token_id = VMCodeMapping.instance().add_method_token(self, call_flag)
-        return self._method_token_id
+    def _get_method_token_id(self, context, call_flag=None) -> int | None:
+        """
+        Gets the id of the method token of this method in the given compilation, including it if it's not included yet
 
-    def _add_to_contract_permissions(self):
-        if not self._added_to_permissions:
-            CompiledMetadata.instance().add_contract_permission(self.contract_script_hash, self._sys_call)
-            self._added_to_permissions = True
+        :type context: boa3.internal.compiler.compilationcontext.CompilationContext
+        """
+        if call_flag is None:
+            call_flag = self._call_flags_default
+        return context.vm_code_mapping.add_method_token(self, call_flag)
 
     @property
     def pack_arguments(self) -> bool:
-        if self._pack_arguments is None:
-            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-            self_method_token_id = self._get_method_token_id(self._call_flags_default)
+        from boa3.internal.compiler.compilationcontext import CompilationContext
+        self_method_token_id = self._get_method_token_id(CompilationContext.current(), self._call_flags_default)
 
-            self._pack_arguments = not isinstance(self_method_token_id, int) or self_method_token_id < 0
-        return self._pack_arguments
+        return not isinstance(self_method_token_id, int) or self_method_token_id < 0
 
     @property
     def method_name(self) -> str:
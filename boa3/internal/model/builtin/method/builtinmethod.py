@@ -51,6 +51,38 @@ class IBuiltinMethod(IBuiltinCallable, Method, ABC):
         """
         return None
 
+    @property
+    def is_shared(self) -> bool:
+        """
+        Returns whether the opcodes of this method are generated only once, as an internal method that is called
+        wherever the builtin is used. Like the user's methods, it is inlined by the optimizer when it's called only
+        once or when it is small enough
+
+        :return: whether the builtin is compiled as a shared method
+        """
+        return False
+
+    @property
+    def shared_method_id(self) -> str:
+        """
+        Gets the identifier of the internal method of a shared builtin. The builtins with the same identifier call the
+        same method.
+
+        :return: the identifier of the shared method
+        """
+        # the opcodes may change with the types of the arguments, so each specialization has its own method
+        return '{0}({1})'.format(self.identifier,
+                                 ','.join(arg.type.identifier for arg in self.args.values()))
+
+    def build_shared_method(self) -> Method:
+        """
+        If `is_shared` is True, gets the internal method that is called instead of generating the builtin opcodes.
+        The arguments of the builtin are the arguments of the method, with the top of the stack being the first.
+
+        :return: the method whose body is generated by `generate_internal_opcodes`
+        """
+        return Method(return_type=self.return_type)
+
     @property
     def args_on_stack(self) -> int:
         """
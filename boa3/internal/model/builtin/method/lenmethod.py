@@ -38,6 +38,17 @@ class LenMethod(IBuiltinMethod):
             return False
         return isinstance(params[0].type, SequenceType)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        if len(args) == 1:
+            value = args[0]
+            if isinstance(value, (bytes, list, tuple, dict)):
+                return len(value)
+            if isinstance(value, str) and value.isascii():
+                # SIZE counts the bytes of the string, so it's folded only if they are as many as its chars, as in ascii
+                return len(value)
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         code_generator.insert_opcode(Opcode.SIZE)
 
@@ -15,8 +15,10 @@ class ReversedMethod(IBuiltinMethod):
             args_type = Type.sequence
 
         args: dict[str, Variable] = {'sequence': Variable(args_type)}
+        return_type = (Type.reversed if args_type is Type.sequence
+                       else Type.reversed.build_collection(args_type.value_type))
 
-        super().__init__(identifier, args, return_type=Type.reversed)
+        super().__init__(identifier, args, return_type=return_type)
 
     @property
     def _args_on_stack(self) -> int:
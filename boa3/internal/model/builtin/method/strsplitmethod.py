@@ -57,6 +57,10 @@ class StrSplitMethod(IBuiltinMethod):
             indexes.append(str_index)
         return indexes
 
+    @property
+    def is_shared(self) -> bool:
+        return True
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.builtin.builtin import Builtin
         from boa3.internal.model.operation.binaryop import BinaryOp
@@ -124,5 +128,10 @@ class StrSplitWithoutMaxsplitMethod(StrSplitMethod):
 
         super().__init__(args, defaults=[separator_default])
 
+    @property
+    def is_shared(self) -> bool:
+        # it's only a call to StdLib
+        return False
+
     def generate_internal_opcodes(self, code_generator):
         code_generator.convert_builtin_method_call(StringSplitWithoutRemoveEmptyEntriesMethod())
@@ -28,6 +28,15 @@ class ToBoolMethod(IBuiltinMethod, ABC):
             return False
         return isinstance(params[0], IExpression) and isinstance(params[0].type, BytesType)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        from boa3.internal import constants
+
+        # the conversion fails in the runtime if the value is bigger than an int
+        if len(args) == 1 and isinstance(args[0], bytes) and len(args[0]) <= constants.SIZE_OF_INT256:
+            return any(args[0])
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.type.type import Type
         code_generator.convert_cast(Type.bool, is_internal=True)
@@ -85,6 +85,44 @@ class IntToBytesMethod(ToBytesMethod):
 
         return [big_endian_index, signed_index, length_index, value_index]
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        from boa3.internal.neo.vm.type.Integer import Integer
+
+        if not 1 <= len(args) <= len(self.args):
+            return super().evaluate_literal(*args)
+
+        value, length, big_endian, signed = args + (None, False, True)[len(args) - 1:]
+        if (not isinstance(value, int) or isinstance(value, bool)
+                or (length is not None and (not isinstance(length, int) or isinstance(length, bool) or length < 0))
+                or not isinstance(big_endian, bool)
+                or not isinstance(signed, bool)):
+            return super().evaluate_literal(*args)
+
+        # same steps of the generated opcodes, returns Undefined if it would raise an exception in the runtime
+        value_bytes = Integer(value).to_byte_array(signed=True)
+        if length is None:
+            length = max(len(value_bytes), 1)
+
+        if value == 0:
+            return self.padding_positive * length
+
+        padding = self.padding_positive
+        if not signed:
+            if value < 0:
+                return super().evaluate_literal(*args)
+            if value_bytes[-1:] == self.padding_positive:
+                value_bytes = value_bytes[:-1]
+        elif value < 0:
+            padding = self.padding_negative
+
+        if length < len(value_bytes):
+            return super().evaluate_literal(*args)
+
+        padding_bytes = padding * (length - len(value_bytes))
+        if big_endian:
+            return padding_bytes + value_bytes[::-1]
+        return value_bytes + padding_bytes
+
     @property
     def exception_message(self) -> str:
         return 'can not convert int to bytes'
@@ -343,6 +381,14 @@ class StrToBytesMethod(ToBytesMethod):
 
         super().__init__(args)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        from boa3.internal.neo.vm.type.String import String
+
+        if len(args) == 1 and isinstance(args[0], str):
+            return String(args[0]).to_bytes()
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         # string and bytes' stack item are the same
         pass
@@ -43,6 +43,29 @@ class ToIntMethod(IBuiltinMethod):
         return ("Neo3-boa uses little-endian and signed representation by default. "
                 "See the method documentation for more details.")
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        from boa3.internal import constants
+
+        if not 1 <= len(args) <= len(self.args):
+            return super().evaluate_literal(*args)
+
+        value, big_endian, signed = args + (False, True)[len(args) - 1:]
+        if (not isinstance(value, bytes)
+                or not isinstance(big_endian, bool)
+                or not isinstance(signed, bool)):
+            return super().evaluate_literal(*args)
+
+        # same steps of the generated opcodes
+        if big_endian:
+            value = value[::-1]
+        if not signed:
+            value = value + b'\x00'
+
+        # the conversion fails in the runtime if the value is bigger than an int
+        if len(value) > constants.SIZE_OF_INT256:
+            return super().evaluate_literal(*args)
+        return int.from_bytes(value, constants.BYTEORDER, signed=True)
+
     def generate_opcodes(self, code_generator):
         def get_constant(data: GeneratorData) -> tuple[bool, Any]:
             is_constant = False
@@ -41,6 +41,25 @@ class ScriptHashMethod(IBuiltinMethod):
     def is_supported(self) -> bool:
         return self.args['value'].type is not Type.any
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        from boa3.internal import constants
+        from boa3.internal.neo import to_script_hash
+        from boa3.internal.neo.vm.type.String import String
+
+        if len(args) == 1:
+            data = args[0]
+            if isinstance(data, str):
+                data = String(data).to_bytes()
+
+            # StdLib's base58Decode fails with big inputs and doesn't ignore trailing whitespaces, so the result
+            # could be different from the one in the runtime
+            if (isinstance(data, bytes)
+                    and len(data) <= constants.STD_LIB_MAX_INPUT_LENGTH
+                    and data == data.rstrip()):
+                return to_script_hash(data)
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal import constants
         from boa3.internal.model.builtin.builtin import Builtin
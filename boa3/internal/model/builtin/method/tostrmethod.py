@@ -28,6 +28,18 @@ class ToStrMethod(IBuiltinMethod, ABC):
             return False
         return isinstance(params[0], IExpression) and isinstance(params[0].type, BytesType)
 
+    def evaluate_literal(self, *args: Any) -> Any:
+        from boa3.internal.neo.vm.type.String import String
+
+        if len(args) == 1 and isinstance(args[0], bytes):
+            try:
+                return String.from_bytes(args[0])
+            except UnicodeDecodeError:
+                # the bytes value can't be represented as a str literal
+                pass
+
+        return super().evaluate_literal(*args)
+
     def generate_internal_opcodes(self, code_generator):
         from boa3.internal.model.type.type import Type
         code_generator.convert_cast(Type.str, is_internal=True)
@@ -165,6 +165,28 @@ class Callable(IExpression, ABC):
             from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
             return VMCodeMapping.instance().get_end_address(self.end_bytecode)
 
+    def update_end_bytecode(self, vm_code_mapping, removed_codes: set[VMCode]):
+        """
+        Changes the last instruction of this method to the last one that is kept if it's going to be removed
+
+        :param vm_code_mapping: the instructions of the bytecode before the removal
+        :type vm_code_mapping: boa3.internal.compiler.codegenerator.vmcodemapping.VMCodeMapping
+        :param removed_codes: the instructions that are going to be removed
+        """
+        if self.end_bytecode not in removed_codes or self.init_bytecode in removed_codes:
+            return
+
+        start_index = vm_code_mapping.get_code_index(self.init_bytecode)
+        end_index = vm_code_mapping.get_code_index(self.end_bytecode)
+        if start_index < 0 or end_index < 0:
+            return
+
+        codes = vm_code_mapping.codes
+        for index in range(end_index - 1, start_index - 1, -1):
+            if codes[index] not in removed_codes:
+                self.end_bytecode = codes[index]
+                break
+
     @property
     def is_called(self) -> bool:
         return len(self._self_calls) > 0
@@ -174,6 +196,12 @@ class Callable(IExpression, ABC):
 
     @property
     def is_compiled(self) -> bool:
+        if self.init_bytecode is not None:
+            # the instructions of methods that are never executed are removed when optimizing the bytecode
+            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+            if not VMCodeMapping.instance().has_code(self.init_bytecode):
+                return False
+
         return self.start_address is not None and self.end_address is not None
 
     def add_call_origin(self, origin: ast.AST) -> bool:
@@ -25,13 +25,13 @@ def get_internal_symbol(symbol_id: str) -> ISymbol | None:
 
 
 class CompilerBuiltin:
-    _instance = None
-
     @classmethod
     def instance(cls) -> Self:
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """
+        :return: the instance of the current compilation
+        """
+        from boa3.internal.compiler.compilationcontext import CompilationContext
+        return CompilationContext.current().builtin
 
     def __init__(self):
         self.packages: list[Package] = []
@@ -51,13 +51,11 @@ class CompilerBuiltin:
 
     @classmethod
     def reset(cls):
-        if cls._instance is not None:
-            for event in cls._instance._events:
-                event.reset_calls()
+        for event in cls.instance()._events:
+            event.reset_calls()
 
-    @classmethod
-    def update_with_analyser(cls, analyser):
-        for pkg in cls.instance().packages:
+    def update_with_analyser(self, analyser):
+        for pkg in self.packages:
             if hasattr(pkg, 'update_with_analyser'):
                 pkg.update_with_analyser(analyser)
 
@@ -113,7 +111,7 @@ class CompilerBuiltin:
     def get_package(self, package_full_path: str) -> Package | None:
         package_ids = package_full_path.split(constants.ATTRIBUTE_NAME_SEPARATOR)
 
-        cur_package: Package = next((root_package for root_package in self._instance.packages
+        cur_package: Package = next((root_package for root_package in self.packages
                                      if root_package.identifier == package_ids[0]),
                                     None)
         if cur_package is None:
@@ -129,7 +127,7 @@ class CompilerBuiltin:
 
     def get_internal_symbol(self, symbol_id: str) -> ISymbol | None:
         packages_stack: list[tuple[list, int]] = []
-        current_list = self._instance.packages
+        current_list = self.packages
         current_index = 0
 
         while len(current_list) > current_index or len(packages_stack) > 0:
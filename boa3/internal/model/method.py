@@ -1,4 +1,5 @@
 import ast
+from typing import Self
 
 from boa3.internal.model.callable import Callable
 from boa3.internal.model.debuginstruction import DebugInstruction
@@ -14,6 +15,10 @@ class Method(Callable):
 
     :ivar args: a dictionary that maps each arg with its name. Empty by default.
     :ivar locals: a dictionary that maps each local variable with its name. Empty by default.
+    :ivar local_slots: a dictionary that maps the name of each local variable to its slot, if the slots were
+     reallocated. None by default.
+    :ivar local_ranges: a dictionary that maps the name of each local variable to the first and last instructions of
+     each range in which its value is kept in its slot, if the slots were reallocated. None by default.
     :ivar imported_symbols: a dictionary that maps each imported symbol with its name. Empty by default.
     :ivar is_public: a boolean value that specifies if the method is public. False by default.
     :ivar return_type: the return type of the method. None by default.
@@ -51,6 +56,8 @@ class Method(Callable):
         self.defined_by_entry = True
         self.is_init = is_init
         self.locals: dict[str, Variable] = {}
+        self.local_slots: dict[str, int] | None = None
+        self.local_ranges: dict[str, list[tuple]] | None = None
 
         if is_init and self.has_cls_or_self:
             self.return_type = list(self.args.values())[0].type
@@ -147,6 +154,42 @@ class Method(Callable):
         if instruction is not None:
             self._debug_map.remove(instruction)
 
+    def replace_debug_codes(self, replacements: dict):
+        """
+        Moves the debug info of the instructions that were replaced to their replacement. If the replacement already
+        has debug info or if it's None, the debug info of the replaced instruction is removed.
+
+        :param replacements: a dictionary that maps each replaced instruction to its replacement
+        :type replacements: dict[VMCode, VMCode or None]
+        """
+        mapped_codes = {info.code for info in self._debug_map}
+        for info in self._debug_map.copy():
+            if info.code in replacements:
+                new_code = replacements[info.code]
+                if new_code is None or new_code in mapped_codes:
+                    self._debug_map.remove(info)
+                else:
+                    info.code = new_code
+                    mapped_codes.add(new_code)
+
+    def include_copied_instructions(self, method: Self, copies: dict):
+        """
+        Includes the debug info of the instructions of another method that were copied into this method. The
+        instructions that already have debug info in this method keep it.
+
+        :param method: the method whose instructions were copied
+        :param copies: a dictionary that maps each copied instruction to its copy
+        :type copies: dict[VMCode, VMCode]
+        """
+        mapped_codes = {info.code for info in self._debug_map}
+        for info in method._debug_map:
+            copied_code = copies.get(info.code)
+            if copied_code is not None and copied_code not in mapped_codes:
+                self._debug_map.append(DebugInstruction(copied_code,
+                                                        info.start_line, info.start_col,
+                                                        info.end_line, info.end_col))
+                mapped_codes.add(copied_code)
+
     def args_to_be_generated(self) -> list[int]:
         """
         Gets the indexes of the arguments that must be generated.
@@ -194,8 +194,7 @@ class ClassType(IType, ABC):
         if first_if_code == code_generator.bytecode_size:
             code_generator.convert_end_if(begin_if, is_internal=True)
 
-            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-            map_instance = VMCodeMapping.instance()
+            map_instance = code_generator.vm_code_mapping
             map_instance.move_to_end(start_address, begin_generic_type - 1)
             map_instance.remove_opcodes(start_address + generic_type_check_size)
             return
@@ -29,11 +29,13 @@ class Variable(IExpression):
         self.is_reassigned = False
         self._origin_variable: Variable | None = None
         self._first_assign_value: Any = Undefined
+        self._has_many_assignments = False
 
     def copy(self) -> Self:
         var = Variable(self._var_type, self._origin_node)
         var.is_reassigned = self.is_reassigned
         var._first_assign_value = self._first_assign_value
+        var._has_many_assignments = self._has_many_assignments
         var._origin_variable = self._origin_variable if self._origin_variable is not None else self
         return var
 
@@ -75,5 +77,16 @@ class Variable(IExpression):
             self._origin_variable.set_is_reassigned()
 
     def set_initial_assign(self, first_value: Any):
-        if not self.has_literal_value:
+        if not self.has_literal_value and not self._has_many_assignments:
             self._first_assign_value = first_value
+
+    def set_has_many_assignments(self):
+        """
+        Sets that the variable is assigned more than once in the module scope, so its value isn't known by the functions
+        """
+        from boa3.internal.analyser.model.optimizer import Undefined
+
+        self._has_many_assignments = True
+        self._first_assign_value = Undefined
+        if hasattr(self._origin_variable, 'set_has_many_assignments'):
+            self._origin_variable.set_has_many_assignments()
@@ -26,3 +26,16 @@ def sha256(byte_array: bytes) -> bytes:
     :rtype: bytes
     """
     return hashlib.sha256(byte_array).digest()
+
+
+def hash256(byte_array: bytes) -> bytes:
+    """
+    Get a hash of the provided message using the sha256 algorithm twice.
+
+    :param byte_array: data to hash.
+    :type byte_array: bytes
+
+    :return: hashed data
+    :rtype: bytes
+    """
+    return sha256(sha256(byte_array))
@@ -10,6 +10,8 @@ class CallCode(VMCode):
     :ivar data: the data in bytes of the code. Empty byte array by default.
     """
 
+    __slots__ = ('_target_callable',)
+
     def __init__(self, target_callable: Callable):
         """
         :param target_callable: the calling method
@@ -19,6 +21,15 @@ class CallCode(VMCode):
         from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
         super().__init__(OpcodeInfo.CALL)
 
+    @property
+    def target_callable(self) -> Callable:
+        """
+        Gets the method that is called by this code
+
+        :rtype: Method
+        """
+        return self._target_callable
+
     @property
     def target(self) -> VMCode:
         return self._target_callable.init_bytecode
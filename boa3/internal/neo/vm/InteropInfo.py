@@ -0,0 +1,113 @@
+from boa3.internal import constants
+from boa3.internal.neo import cryptography
+from boa3.internal.neo.vm.type.String import String
+
+
+class InteropInfo:
+    """
+    Stores the execution prices of the Neo interop services, before applying the network's execution fee factor
+    """
+
+    # region Prices
+
+    _prices: dict[str, int] = {
+        'System.Contract.Call': 1 << 15,
+        'System.Contract.CreateMultisigAccount': 0,
+        'System.Contract.CreateStandardAccount': 1 << 15,
+        'System.Contract.GetCallFlags': 1 << 10,
+
+        'System.Crypto.CheckMultisig': 0,
+        'System.Crypto.CheckSig': 1 << 15,
+
+        'System.Iterator.Create': 1 << 4,
+        'System.Iterator.Next': 1 << 15,
+        'System.Iterator.Value': 1 << 4,
+
+        'System.Runtime.BurnGas': 1 << 4,
+        'System.Runtime.CheckWitness': 1 << 10,
+        'System.Runtime.CurrentSigners': 1 << 4,
+        'System.Runtime.GasLeft': 1 << 4,
+        'System.Runtime.GetAddressVersion': 1 << 3,
+        'System.Runtime.GetCallingScriptHash': 1 << 4,
+        'System.Runtime.GetEntryScriptHash': 1 << 4,
+        'System.Runtime.GetExecutingScriptHash': 1 << 4,
+        'System.Runtime.GetInvocationCounter': 1 << 4,
+        'System.Runtime.GetNetwork': 1 << 3,
+        'System.Runtime.GetNotifications': 1 << 12,
+        'System.Runtime.GetRandom': 1 << 13,
+        'System.Runtime.GetScriptContainer': 1 << 3,
+        'System.Runtime.GetTime': 1 << 3,
+        'System.Runtime.GetTrigger': 1 << 3,
+        'System.Runtime.LoadScript': 1 << 15,
+        'System.Runtime.Log': 1 << 15,
+        'System.Runtime.Notify': 1 << 15,
+        'System.Runtime.Platform': 1 << 3,
+
+        'System.Storage.AsReadOnly': 1 << 4,
+        'System.Storage.Delete': 1 << 15,
+        'System.Storage.Find': 1 << 15,
+        'System.Storage.Get': 1 << 15,
+        'System.Storage.GetContext': 1 << 4,
+        'System.Storage.GetReadOnlyContext': 1 << 4,
+        'System.Storage.Put': 1 << 15,
+        'System.Storage.Local.Delete': 1 << 15,
+        'System.Storage.Local.Find': 1 << 15,
+        'System.Storage.Local.Get': 1 << 15,
+        'System.Storage.Local.Put': 1 << 15,
+    }
+
+    # the services that charge more than their fixed price, depending on their arguments or on the called contract
+    _dynamic_prices: frozenset[str] = frozenset([
+        'System.Contract.Call',
+        'System.Contract.CreateMultisigAccount',
+        'System.Crypto.CheckMultisig',
+        'System.Runtime.BurnGas',
+        'System.Storage.Put',
+        'System.Storage.Local.Put',
+    ])
+
+    # endregion
+
+    _hashes: dict[bytes, str] = None
+
+    @classmethod
+    def get_method_hash(cls, name: str) -> bytes:
+        """
+        Gets the identifier of an interop service used as the SYSCALL operand
+
+        :param name: the name of the interop service
+        """
+        return cryptography.sha256(String(name).to_bytes())[:constants.SIZE_OF_INT32]
+
+    @classmethod
+    def get_name(cls, method_hash: bytes) -> str | None:
+        """
+        Gets the name of an interop service from its SYSCALL operand
+
+        :return: the name of the service if it's known. None otherwise
+        """
+        if cls._hashes is None:
+            cls._hashes = {cls.get_method_hash(name): name for name in cls._prices}
+        return cls._hashes.get(bytes(method_hash))
+
+    @classmethod
+    def get_price(cls, method_hash: bytes) -> int | None:
+        """
+        Gets the fixed execution price of an interop service
+
+        :param method_hash: the SYSCALL operand of the service
+        :return: the price if the service is known. None otherwise
+        """
+        name = cls.get_name(method_hash)
+        return cls._prices[name] if name is not None else None
+
+    @classmethod
+    def has_dynamic_price(cls, method_hash: bytes) -> bool:
+        """
+        Checks whether an interop service can charge more than its fixed price. Unknown services are considered to
+        have dynamic prices.
+
+        :param method_hash: the SYSCALL operand of the service
+        """
+        name = cls.get_name(method_hash)
+        return name is None or name in cls._dynamic_prices
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from boa3.internal.neo.vm.VMCode import VMCode
 from boa3.internal.neo.vm.type.Integer import Integer
 
@@ -10,6 +12,8 @@ class TryCode(VMCode):
     :ivar data: the data in bytes of the code. Empty byte array by default.
     """
 
+    __slots__ = ('_except_start_code', '_finally_start_code')
+
     def __init__(self, except_start_code: VMCode | None = None, finally_start_code: VMCode | None = None):
         """
         :param except_start_code: the first code of the except body
@@ -24,23 +28,33 @@ class TryCode(VMCode):
     def target(self) -> VMCode:
         return self._except_start_code if self._finally_start_code is None else self._finally_start_code
 
+    @property
+    def except_start_code(self) -> VMCode | None:
+        return self._except_start_code
+
+    @property
+    def finally_start_code(self) -> VMCode | None:
+        return self._finally_start_code
+
     def set_except_code(self, except_code: VMCode):
         if self._except_start_code is None and except_code is not None:
             self._except_start_code = except_code
+            self._clear_cache()
 
     def set_finally_code(self, finally_code: VMCode):
         if self._finally_start_code is None and finally_code is not None:
             self._finally_start_code = finally_code
+            self._clear_cache()
 
-    @property
-    def data(self) -> bytes:
+    def get_data(self, get_address: Callable[[VMCode], int]) -> bytes:
         """
-        Gets the Neo VM data of the code
+        Gets the Neo VM data of the code, using the given addresses to resolve its targets
 
+        :param get_address: a function that returns the start address of a code in the bytecode
         :return: the formatted data in bytes of the code.
         """
-        catch_data: bytes = self._get_raw_data(self._except_start_code)
-        finally_data: bytes = self._get_raw_data(self._finally_start_code)
+        catch_data: bytes = self._get_raw_data(self._except_start_code, get_address)
+        finally_data: bytes = self._get_raw_data(self._finally_start_code, get_address)
 
         min_data_len = self._info.data_len // 2
         max_data_len = self._info.max_data_len // 2
@@ -59,7 +73,7 @@ class TryCode(VMCode):
             mutable_data = mutable_data[:max_data_len]
         return bytes(mutable_data)
 
-    def _get_raw_data(self, opcode: VMCode) -> bytes:
+    def _get_raw_data(self, opcode: VMCode, get_address: Callable[[VMCode], int]) -> bytes:
         """
         Gets the Neo VM raw data of the code
 
@@ -69,18 +83,15 @@ class TryCode(VMCode):
         if opcode is None:
             return bytes(min_len)
         else:
-            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-            code_mapping = VMCodeMapping.instance()
-            self_start = code_mapping.get_start_address(self)
-            target_start = code_mapping.get_start_address(opcode)
+            self_start = get_address(self)
+            target_start = get_address(opcode)
 
             return (Integer(target_start - self_start)
                     .to_byte_array(signed=True, min_length=min_len))
 
-    @property
-    def raw_data(self) -> bytes:
-        catch_data: bytes = self._get_raw_data(self._except_start_code)
-        finally_data: bytes = self._get_raw_data(self._finally_start_code)
+    def get_raw_data(self, get_address: Callable[[VMCode], int]) -> bytes:
+        catch_data: bytes = self._get_raw_data(self._except_start_code, get_address)
+        finally_data: bytes = self._get_raw_data(self._finally_start_code, get_address)
 
         size = max(len(catch_data), len(finally_data))
 
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Self
 
 from boa3.internal.neo.vm.opcode import OpcodeHelper
@@ -14,6 +15,8 @@ class VMCode:
     :ivar data: the data in bytes of the code. Empty byte array by default.
     """
 
+    __slots__ = ('_info', '_target', '_data', '_size', '_encoded')
+
     def __init__(self, op_info: OpcodeInformation, data: bytes = None):
         """
         :param op_info: information of the opcode of the code
@@ -25,6 +28,10 @@ class VMCode:
         self._target: VMCode | None = None
         self._data: bytes = data
 
+        # the size and the bytes of the code are cached until its opcode, data or target change
+        self._size: int | None = None
+        self._encoded: bytes | None = None
+
     @property
     def info(self) -> OpcodeInformation:
         """
@@ -41,7 +48,16 @@ class VMCode:
 
         :return: the formatted data in bytes of the code.
         """
-        data: bytearray = bytearray(self.raw_data)
+        return self.get_data(_get_mapped_address)
+
+    def get_data(self, get_address: Callable[[Self], int]) -> bytes:
+        """
+        Gets the Neo VM data of the code, using the given addresses to resolve its targets
+
+        :param get_address: a function that returns the start address of a code in the bytecode
+        :return: the formatted data in bytes of the code.
+        """
+        data: bytearray = bytearray(self.get_raw_data(get_address))
         info = self.info
 
         if len(data) < info.data_len:
@@ -55,15 +71,22 @@ class VMCode:
         """
         Gets the Neo VM raw data of the code
 
+        :return: the unformatted data in bytes of the code.
+        """
+        return self.get_raw_data(_get_mapped_address)
+
+    def get_raw_data(self, get_address: Callable[[Self], int]) -> bytes:
+        """
+        Gets the Neo VM raw data of the code, using the given addresses to resolve its targets
+
+        :param get_address: a function that returns the start address of a code in the bytecode
         :return: the unformatted data in bytes of the code.
         """
         if self.target is None:
             return self._data
         else:
-            from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
-            code_mapping = VMCodeMapping.instance()
-            self_start = code_mapping.get_start_address(self)
-            target_start = code_mapping.get_start_address(self.target)
+            self_start = get_address(self)
+            target_start = get_address(self.target)
 
             if self_start == target_start:
                 return self._data
@@ -73,7 +96,32 @@ class VMCode:
 
     @property
     def size(self) -> int:
-        return len(self._info.opcode) + len(self.data)
+        return self.get_size(_get_mapped_address)
+
+    def get_size(self, get_address: Callable[[Self], int]) -> int:
+        """
+        Gets the size in bytes of the code, using the given addresses to resolve its targets
+
+        :param get_address: a function that returns the start address of a code in the bytecode
+        """
+        if self._size is None:
+            self._size = len(self._info.opcode) + len(self.get_data(get_address))
+        return self._size
+
+    def encode(self, get_address: Callable[[Self], int]) -> bytes:
+        """
+        Gets the bytes of the code in the bytecode, using the given addresses to resolve its targets
+
+        :param get_address: a function that returns the start address of a code in the bytecode
+        """
+        if self._encoded is not None:
+            return self._encoded
+
+        encoded = bytes(self._info.opcode + self.get_data(get_address))
+        if not OpcodeHelper.has_target(self.opcode):
+            # the data of the codes with target depend on the addresses, so only the others can be cached
+            self._encoded = encoded
+        return encoded
 
     @property
     def opcode(self) -> Opcode:
@@ -103,11 +151,33 @@ class VMCode:
         """
         if OpcodeHelper.has_target(self.opcode):
             self._target = target_code
+            self._clear_cache()
 
     def set_opcode(self, opcode):
         if (isinstance(opcode, OpcodeInformation) and
                 OpcodeHelper.has_target(opcode.opcode) == OpcodeHelper.has_target(self.opcode)):
             self._info = opcode
+            self._clear_cache()
+
+    def update(self, op_info: OpcodeInformation, data: bytes = bytes()):
+        """
+        Replaces the opcode and the data of the code
+
+        :param op_info: the updated opcode information
+        :param data: the updated data in bytes of the code
+        """
+        self._info = op_info
+        self._data = data
+        self._clear_cache()
+
+    def _clear_cache(self):
+        self._size = None
+        self._encoded = None
 
     def __str__(self) -> str:
         return self.opcode.name + ' ' + self.data.hex()
+
+
+def _get_mapped_address(vm_code: VMCode) -> int:
+    from boa3.internal.compiler.codegenerator.vmcodemapping import VMCodeMapping
+    return VMCodeMapping.instance().get_start_address(vm_code)
@@ -19,160 +19,160 @@ class OpcodeInfo:
 
     # region Constants
 
-    PUSHINT8 = OpcodeInformation(Opcode.PUSHINT8, 1)
-    PUSHINT16 = OpcodeInformation(Opcode.PUSHINT16, 2)
-    PUSHINT32 = OpcodeInformation(Opcode.PUSHINT32, 4)
-    PUSHINT64 = OpcodeInformation(Opcode.PUSHINT64, 8)
-    PUSHINT128 = OpcodeInformation(Opcode.PUSHINT128, 16)
-    PUSHINT256 = OpcodeInformation(Opcode.PUSHINT256, 32)
+    PUSHINT8 = OpcodeInformation(Opcode.PUSHINT8, 1, price=1)
+    PUSHINT16 = OpcodeInformation(Opcode.PUSHINT16, 2, price=1)
+    PUSHINT32 = OpcodeInformation(Opcode.PUSHINT32, 4, price=1)
+    PUSHINT64 = OpcodeInformation(Opcode.PUSHINT64, 8, price=1)
+    PUSHINT128 = OpcodeInformation(Opcode.PUSHINT128, 16, price=1 << 2)
+    PUSHINT256 = OpcodeInformation(Opcode.PUSHINT256, 32, price=1 << 2)
 
     # Pushes the boolean value True onto the stack.
-    PUSHT = OpcodeInformation(Opcode.PUSHT)
+    PUSHT = OpcodeInformation(Opcode.PUSHT, price=1)
     # Pushes the boolean value False onto the stack.
-    PUSHF = OpcodeInformation(Opcode.PUSHF)
+    PUSHF = OpcodeInformation(Opcode.PUSHF, price=1)
     # Convert the next four bytes to an address, and push the address onto the stack.
-    PUSHA = OpcodeInformation(Opcode.PUSHA, 4)
+    PUSHA = OpcodeInformation(Opcode.PUSHA, 4, price=1 << 2)
     # The item null is pushed onto the stack.
-    PUSHNULL = OpcodeInformation(Opcode.PUSHNULL)
+    PUSHNULL = OpcodeInformation(Opcode.PUSHNULL, price=1)
     # The next byte contains the number of bytes to be pushed onto the stack.
-    PUSHDATA1 = OpcodeInformation(Opcode.PUSHDATA1, 1, constants.ONE_BYTE_MAX_VALUE)
+    PUSHDATA1 = OpcodeInformation(Opcode.PUSHDATA1, 1, constants.ONE_BYTE_MAX_VALUE, price=1 << 3)
     # The next two bytes contain the number of bytes to be pushed onto the stack.
-    PUSHDATA2 = OpcodeInformation(Opcode.PUSHDATA2, 2, constants.TWO_BYTES_MAX_VALUE)
+    PUSHDATA2 = OpcodeInformation(Opcode.PUSHDATA2, 2, constants.TWO_BYTES_MAX_VALUE, price=1 << 9)
     # The next four bytes contain the number of bytes to be pushed onto the stack.
-    PUSHDATA4 = OpcodeInformation(Opcode.PUSHDATA4, 4, constants.FOUR_BYTES_MAX_VALUE)
+    PUSHDATA4 = OpcodeInformation(Opcode.PUSHDATA4, 4, constants.FOUR_BYTES_MAX_VALUE, price=1 << 12)
 
     # The number -1 is pushed onto the stack.
-    PUSHM1 = OpcodeInformation(Opcode.PUSHM1)
+    PUSHM1 = OpcodeInformation(Opcode.PUSHM1, price=1)
     # The number 0 is pushed onto the stack.
-    PUSH0 = OpcodeInformation(Opcode.PUSH0)
+    PUSH0 = OpcodeInformation(Opcode.PUSH0, price=1)
     # The number 1 is pushed onto the stack.
-    PUSH1 = OpcodeInformation(Opcode.PUSH1)
+    PUSH1 = OpcodeInformation(Opcode.PUSH1, price=1)
     # The number 2 is pushed onto the stack.
-    PUSH2 = OpcodeInformation(Opcode.PUSH2)
+    PUSH2 = OpcodeInformation(Opcode.PUSH2, price=1)
     # The number 3 is pushed onto the stack.
-    PUSH3 = OpcodeInformation(Opcode.PUSH3)
+    PUSH3 = OpcodeInformation(Opcode.PUSH3, price=1)
     # The number 4 is pushed onto the stack.
-    PUSH4 = OpcodeInformation(Opcode.PUSH4)
+    PUSH4 = OpcodeInformation(Opcode.PUSH4, price=1)
     # The number 5 is pushed onto the stack.
-    PUSH5 = OpcodeInformation(Opcode.PUSH5)
+    PUSH5 = OpcodeInformation(Opcode.PUSH5, price=1)
     # The number 6 is pushed onto the stack.
-    PUSH6 = OpcodeInformation(Opcode.PUSH6)
+    PUSH6 = OpcodeInformation(Opcode.PUSH6, price=1)
     # The number 7 is pushed onto the stack.
-    PUSH7 = OpcodeInformation(Opcode.PUSH7)
+    PUSH7 = OpcodeInformation(Opcode.PUSH7, price=1)
     # The number 8 is pushed onto the stack.
-    PUSH8 = OpcodeInformation(Opcode.PUSH8)
+    PUSH8 = OpcodeInformation(Opcode.PUSH8, price=1)
     # The number 9 is pushed onto the stack.
-    PUSH9 = OpcodeInformation(Opcode.PUSH9)
+    PUSH9 = OpcodeInformation(Opcode.PUSH9, price=1)
     # The number 10 is pushed onto the stack.
-    PUSH10 = OpcodeInformation(Opcode.PUSH10)
+    PUSH10 = OpcodeInformation(Opcode.PUSH10, price=1)
     # The number 11 is pushed onto the stack.
-    PUSH11 = OpcodeInformation(Opcode.PUSH11)
+    PUSH11 = OpcodeInformation(Opcode.PUSH11, price=1)
     # The number 12 is pushed onto the stack.
-    PUSH12 = OpcodeInformation(Opcode.PUSH12)
+    PUSH12 = OpcodeInformation(Opcode.PUSH12, price=1)
     # The number 13 is pushed onto the stack.
-    PUSH13 = OpcodeInformation(Opcode.PUSH13)
+    PUSH13 = OpcodeInformation(Opcode.PUSH13, price=1)
     # The number 14 is pushed onto the stack.
-    PUSH14 = OpcodeInformation(Opcode.PUSH14)
+    PUSH14 = OpcodeInformation(Opcode.PUSH14, price=1)
     # The number 15 is pushed onto the stack.
-    PUSH15 = OpcodeInformation(Opcode.PUSH15)
+    PUSH15 = OpcodeInformation(Opcode.PUSH15, price=1)
     # The number 16 is pushed onto the stack.
-    PUSH16 = OpcodeInformation(Opcode.PUSH16)
+    PUSH16 = OpcodeInformation(Opcode.PUSH16, price=1)
 
     # endregion
 
     # region Flow control
 
     # The NOP operation does nothing. It is intended to fill in space if opcodes are patched.
-    NOP = OpcodeInformation(Opcode.NOP)
+    NOP = OpcodeInformation(Opcode.NOP, price=1)
     # Unconditionally transfers control to a target instruction. The target instruction is represented as a 1-byte
     # signed offset from the beginning of the current instruction.
-    JMP = OpcodeInformation(Opcode.JMP, 1)
+    JMP = OpcodeInformation(Opcode.JMP, 1, price=1 << 1)
     # Unconditionally transfers control to a target instruction. The target instruction is represented as a 4-bytes
     # signed offset from the beginning of the current instruction.
-    JMP_L = OpcodeInformation(Opcode.JMP_L, 4)
+    JMP_L = OpcodeInformation(Opcode.JMP_L, 4, price=1 << 1)
     # Transfers control to a target instruction if the value is True, not null, or non-zero. The target instruction
     # is represented as a 1-byte signed offset from the beginning of the current instruction.
-    JMPIF = OpcodeInformation(Opcode.JMPIF, 1, stack_items=1)
+    JMPIF = OpcodeInformation(Opcode.JMPIF, 1, stack_items=1, price=1 << 1)
     # Transfers control to a target instruction if the value is True, not null, or non-zero. The target instruction
     # is represented as a 4-bytes signed offset from the beginning of the current instruction.
-    JMPIF_L = OpcodeInformation(Opcode.JMPIF_L, 4, stack_items=1)
+    JMPIF_L = OpcodeInformation(Opcode.JMPIF_L, 4, stack_items=1, price=1 << 1)
     # Transfers control to a target instruction if the value is False, a null reference,
     # or zero. The target instruction is represented as a 1-byte signed offset from the beginning of the current
     # instruction.
-    JMPIFNOT = OpcodeInformation(Opcode.JMPIFNOT, 1, stack_items=1)
+    JMPIFNOT = OpcodeInformation(Opcode.JMPIFNOT, 1, stack_items=1, price=1 << 1)
     # Transfers control to a target instruction if the value is False, a null reference,
     # or zero. The target instruction is represented as a 4-bytes signed offset from the beginning of the current
     # instruction.
-    JMPIFNOT_L = OpcodeInformation(Opcode.JMPIFNOT_L, 4, stack_items=1)
+    JMPIFNOT_L = OpcodeInformation(Opcode.JMPIFNOT_L, 4, stack_items=1, price=1 << 1)
     # Transfers control to a target instruction if two values are equal. The target instruction is represented as a
     # 1-byte signed offset from the beginning of the current instruction.
-    JMPEQ = OpcodeInformation(Opcode.JMPEQ, 1, stack_items=2)
+    JMPEQ = OpcodeInformation(Opcode.JMPEQ, 1, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if two values are equal. The target instruction is represented as a
     # 4-bytes signed offset from the beginning of the current instruction.
-    JMPEQ_L = OpcodeInformation(Opcode.JMPEQ_L, 4, stack_items=2)
+    JMPEQ_L = OpcodeInformation(Opcode.JMPEQ_L, 4, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction when two values are not equal. The target instruction is represented
     # as a 1-byte signed offset from the beginning of the current instruction.
-    JMPNE = OpcodeInformation(Opcode.JMPNE, 1, stack_items=2)
+    JMPNE = OpcodeInformation(Opcode.JMPNE, 1, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction when two values are not equal. The target instruction is represented
     # as a 4-bytes signed offset from the beginning of the current instruction.
-    JMPNE_L = OpcodeInformation(Opcode.JMPNE_L, 4, stack_items=2)
+    JMPNE_L = OpcodeInformation(Opcode.JMPNE_L, 4, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is greater than the second value. The target
     # instruction is represented as a 1-byte signed offset from the beginning of the current instruction.
-    JMPGT = OpcodeInformation(Opcode.JMPGT, 1, stack_items=2)
+    JMPGT = OpcodeInformation(Opcode.JMPGT, 1, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is greater than the second value. The target
     # instruction is represented as a 4-bytes signed offset from the beginning of the current instruction.
-    JMPGT_L = OpcodeInformation(Opcode.JMPGT_L, 4, stack_items=2)
+    JMPGT_L = OpcodeInformation(Opcode.JMPGT_L, 4, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is greater than or equal to the second value. The
     # target instruction is represented as a 1-byte signed offset from the beginning of the current instruction.
-    JMPGE = OpcodeInformation(Opcode.JMPGE, 1, stack_items=2)
+    JMPGE = OpcodeInformation(Opcode.JMPGE, 1, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is greater than or equal to the second value. The
     # target instruction is represented as a 4-bytes signed offset from the beginning of the current instruction.
-    JMPGE_L = OpcodeInformation(Opcode.JMPGE_L, 4, stack_items=2)
+    JMPGE_L = OpcodeInformation(Opcode.JMPGE_L, 4, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is less than the second value. The target
     # instruction is represented as a 1-byte signed offset from the beginning of the current instruction.
-    JMPLT = OpcodeInformation(Opcode.JMPLT, 1, stack_items=2)
+    JMPLT = OpcodeInformation(Opcode.JMPLT, 1, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is less than the second value. The target
     # instruction is represented as a 4-bytes signed offset from the beginning of the current instruction.
-    JMPLT_L = OpcodeInformation(Opcode.JMPLT_L, 4, stack_items=2)
+    JMPLT_L = OpcodeInformation(Opcode.JMPLT_L, 4, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is less than or equal to the second value. The
     # target instruction is represented as a 1-byte signed offset from the beginning of the current instruction.
-    JMPLE = OpcodeInformation(Opcode.JMPLE, 1, stack_items=2)
+    JMPLE = OpcodeInformation(Opcode.JMPLE, 1, stack_items=2, price=1 << 1)
     # Transfers control to a target instruction if the first value is less than or equal to the second value. The
     # target instruction is represented as a 4-bytes signed offset from the beginning of the current instruction.
-    JMPLE_L = OpcodeInformation(Opcode.JMPLE_L, 4, stack_items=2)
+    JMPLE_L = OpcodeInformation(Opcode.JMPLE_L, 4, stack_items=2, price=1 << 1)
     # Calls the function at the target address which is represented as a 1-byte signed offset from the beginning of
     # the current instruction.
-    CALL = OpcodeInformation(Opcode.CALL, 1)
+    CALL = OpcodeInformation(Opcode.CALL, 1, price=1 << 9)
     # Calls the function at the target address which is represented as a 4-bytes signed offset from the beginning of
     # the current instruction.
-    CALL_L = OpcodeInformation(Opcode.CALL_L, 4)
+    CALL_L = OpcodeInformation(Opcode.CALL_L, 4, price=1 << 9)
     # Pop the address of a function from the stack, and call the function.
-    CALLA = OpcodeInformation(Opcode.CALLA)
+    CALLA = OpcodeInformation(Opcode.CALLA, price=1 << 9)
     # Calls the function which is described by the token.
-    CALLT = OpcodeInformation(Opcode.CALLT, 2)
+    CALLT = OpcodeInformation(Opcode.CALLT, 2, price=1 << 15)
     # It turns the vm state to FAULT immediately, and cannot be caught.
     ABORT = OpcodeInformation(Opcode.ABORT)
     # Pop the top value of the stack, if it false, then exit vm execution and set vm state to FAULT.
-    ASSERT = OpcodeInformation(Opcode.ASSERT)
+    ASSERT = OpcodeInformation(Opcode.ASSERT, price=1)
     # Pop the top value of the stack, and throw it.
-    THROW = OpcodeInformation(Opcode.THROW)
+    THROW = OpcodeInformation(Opcode.THROW, price=1 << 9)
     # TRY CatchOffset(sbyte) FinallyOffset(sbyte). If there's no catch body, set CatchOffset 0. If there's no finally
     # body, set FinallyOffset 0.
-    TRY = OpcodeInformation(Opcode.TRY, 2)
+    TRY = OpcodeInformation(Opcode.TRY, 2, price=1 << 2)
     # TRY_L CatchOffset(int) FinallyOffset(int). If there's no catch body, set CatchOffset 0. If there's no finally
     # body, set FinallyOffset 0.
-    TRY_L = OpcodeInformation(Opcode.TRY_L, 8)
+    TRY_L = OpcodeInformation(Opcode.TRY_L, 8, price=1 << 2)
     # Ensures that the appropriate surrounding finally blocks are executed. And then unconditionally transfers
     # control to the specific target instruction, represented as a 1-byte signed offset from the beginning of the
     # current instruction.
-    ENDTRY = OpcodeInformation(Opcode.ENDTRY, 1)
+    ENDTRY = OpcodeInformation(Opcode.ENDTRY, 1, price=1 << 2)
     # Ensures that the appropriate surrounding finally blocks are executed. And then unconditionally transfers
     # control to the specific target instruction, represented as a 4-byte signed offset from the beginning of the
     # current instruction.
-    ENDTRY_L = OpcodeInformation(Opcode.ENDTRY_L, 4)
+    ENDTRY_L = OpcodeInformation(Opcode.ENDTRY_L, 4, price=1 << 2)
     # End finally, If no exception happen or be catched, vm will jump to the target instruction of ENDTRY/ENDTRY_L.
     # Otherwise vm will rethrow the exception to upper layer.
-    ENDFINALLY = OpcodeInformation(Opcode.ENDFINALLY)
+    ENDFINALLY = OpcodeInformation(Opcode.ENDFINALLY, price=1 << 2)
     # Returns from the current method.
     RET = OpcodeInformation(Opcode.RET)
     # Calls to an interop service.
@@ -183,178 +183,178 @@ class OpcodeInfo:
     # region Stack
 
     # Puts the number of stack items onto the stack.
-    DEPTH = OpcodeInformation(Opcode.DEPTH)
+    DEPTH = OpcodeInformation(Opcode.DEPTH, price=1 << 1)
     # Removes the top stack item.
-    DROP = OpcodeInformation(Opcode.DROP)
+    DROP = OpcodeInformation(Opcode.DROP, price=1 << 1)
     # Removes the second-to-top stack item.
-    NIP = OpcodeInformation(Opcode.NIP)
+    NIP = OpcodeInformation(Opcode.NIP, price=1 << 1)
     # The item n back in the main stack is removed.
-    XDROP = OpcodeInformation(Opcode.XDROP, stack_items=1)
+    XDROP = OpcodeInformation(Opcode.XDROP, stack_items=1, price=1 << 4)
     # Clear the stack
-    CLEAR = OpcodeInformation(Opcode.CLEAR)
+    CLEAR = OpcodeInformation(Opcode.CLEAR, price=1 << 4)
     # Duplicates the top stack item.
-    DUP = OpcodeInformation(Opcode.DUP)
+    DUP = OpcodeInformation(Opcode.DUP, price=1 << 1)
     # Copies the second-to-top stack item to the top.
-    OVER = OpcodeInformation(Opcode.OVER)
+    OVER = OpcodeInformation(Opcode.OVER, price=1 << 1)
     # The item n back in the stack is copied to the top.
-    PICK = OpcodeInformation(Opcode.PICK, stack_items=1)
+    PICK = OpcodeInformation(Opcode.PICK, stack_items=1, price=1 << 1)
     # The item at the top of the stack is copied and inserted before the second-to-top item.
-    TUCK = OpcodeInformation(Opcode.TUCK)
+    TUCK = OpcodeInformation(Opcode.TUCK, price=1 << 1)
     # The top two items on the stack are swapped.
-    SWAP = OpcodeInformation(Opcode.SWAP)
+    SWAP = OpcodeInformation(Opcode.SWAP, price=1 << 1)
     # The top three items on the stack are rotated to the left.
-    ROT = OpcodeInformation(Opcode.ROT)
+    ROT = OpcodeInformation(Opcode.ROT, price=1 << 1)
     # The item n back in the stack is moved to the top.
-    ROLL = OpcodeInformation(Opcode.ROLL, stack_items=1)
+    ROLL = OpcodeInformation(Opcode.ROLL, stack_items=1, price=1 << 4)
     # Reverse the order of the top 3 items on the stack.
-    REVERSE3 = OpcodeInformation(Opcode.REVERSE3)
+    REVERSE3 = OpcodeInformation(Opcode.REVERSE3, price=1 << 1)
     # Reverse the order of the top 4 items on the stack.
-    REVERSE4 = OpcodeInformation(Opcode.REVERSE4)
+    REVERSE4 = OpcodeInformation(Opcode.REVERSE4, price=1 << 1)
     # Pop the number N on the stack, and reverse the order of the top N items on the stack.
-    REVERSEN = OpcodeInformation(Opcode.REVERSEN, stack_items=1)
+    REVERSEN = OpcodeInformation(Opcode.REVERSEN, stack_items=1, price=1 << 4)
 
     # endregion
 
     # region Slot
 
     # Initialize the static field list for the current execution context.
-    INITSSLOT = OpcodeInformation(Opcode.INITSSLOT, 1)
+    INITSSLOT = OpcodeInformation(Opcode.INITSSLOT, 1, price=1 << 4)
     # Initialize the argument slot and the local variable list for the current execution context.
-    INITSLOT = OpcodeInformation(Opcode.INITSLOT, 2)
+    INITSLOT = OpcodeInformation(Opcode.INITSLOT, 2, price=1 << 6)
     # Loads the static field at index 0 onto the evaluation stack.
-    LDSFLD0 = OpcodeInformation(Opcode.LDSFLD0)
+    LDSFLD0 = OpcodeInformation(Opcode.LDSFLD0, price=1 << 1)
     # Loads the static field at index 1 onto the evaluation stack.
-    LDSFLD1 = OpcodeInformation(Opcode.LDSFLD1)
+    LDSFLD1 = OpcodeInformation(Opcode.LDSFLD1, price=1 << 1)
     # Loads the static field at index 2 onto the evaluation stack.
-    LDSFLD2 = OpcodeInformation(Opcode.LDSFLD2)
+    LDSFLD2 = OpcodeInformation(Opcode.LDSFLD2, price=1 << 1)
     # Loads the static field at index 3 onto the evaluation stack.
-    LDSFLD3 = OpcodeInformation(Opcode.LDSFLD3)
+    LDSFLD3 = OpcodeInformation(Opcode.LDSFLD3, price=1 << 1)
     # Loads the static field at index 4 onto the evaluation stack.
-    LDSFLD4 = OpcodeInformation(Opcode.LDSFLD4)
+    LDSFLD4 = OpcodeInformation(Opcode.LDSFLD4, price=1 << 1)
     # Loads the static field at index 5 onto the evaluation stack.
-    LDSFLD5 = OpcodeInformation(Opcode.LDSFLD5)
+    LDSFLD5 = OpcodeInformation(Opcode.LDSFLD5, price=1 << 1)
     # Loads the static field at index 6 onto the evaluation stack.
-    LDSFLD6 = OpcodeInformation(Opcode.LDSFLD6)
+    LDSFLD6 = OpcodeInformation(Opcode.LDSFLD6, price=1 << 1)
     # Loads the static field at a specified index onto the evaluation stack. The index is represented as a 1-byte
     # unsigned integer.
-    LDSFLD = OpcodeInformation(Opcode.LDSFLD, 1)
+    LDSFLD = OpcodeInformation(Opcode.LDSFLD, 1, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at index 0.
-    STSFLD0 = OpcodeInformation(Opcode.STSFLD0)
+    STSFLD0 = OpcodeInformation(Opcode.STSFLD0, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at index 1.
-    STSFLD1 = OpcodeInformation(Opcode.STSFLD1)
+    STSFLD1 = OpcodeInformation(Opcode.STSFLD1, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at index 2.
-    STSFLD2 = OpcodeInformation(Opcode.STSFLD2)
+    STSFLD2 = OpcodeInformation(Opcode.STSFLD2, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at index 3.
-    STSFLD3 = OpcodeInformation(Opcode.STSFLD3)
+    STSFLD3 = OpcodeInformation(Opcode.STSFLD3, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at index 4.
-    STSFLD4 = OpcodeInformation(Opcode.STSFLD4)
+    STSFLD4 = OpcodeInformation(Opcode.STSFLD4, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at index 5.
-    STSFLD5 = OpcodeInformation(Opcode.STSFLD5)
+    STSFLD5 = OpcodeInformation(Opcode.STSFLD5, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at index 6.
-    STSFLD6 = OpcodeInformation(Opcode.STSFLD6)
+    STSFLD6 = OpcodeInformation(Opcode.STSFLD6, price=1 << 1)
     # Stores the value on top of the evaluation stack in the static field list at a specified index. The index is
     # represented as a 1-byte unsigned integer.
-    STSFLD = OpcodeInformation(Opcode.STSFLD, 1)
+    STSFLD = OpcodeInformation(Opcode.STSFLD, 1, price=1 << 1)
     # Loads the local variable at index 0 onto the evaluation stack.
-    LDLOC0 = OpcodeInformation(Opcode.LDLOC0)
+    LDLOC0 = OpcodeInformation(Opcode.LDLOC0, price=1 << 1)
     # Loads the local variable at index 1 onto the evaluation stack.
-    LDLOC1 = OpcodeInformation(Opcode.LDLOC1)
+    LDLOC1 = OpcodeInformation(Opcode.LDLOC1, price=1 << 1)
     # Loads the local variable at index 2 onto the evaluation stack.
-    LDLOC2 = OpcodeInformation(Opcode.LDLOC2)
+    LDLOC2 = OpcodeInformation(Opcode.LDLOC2, price=1 << 1)
     # Loads the local variable at index 3 onto the evaluation stack.
-    LDLOC3 = OpcodeInformation(Opcode.LDLOC3)
+    LDLOC3 = OpcodeInformation(Opcode.LDLOC3, price=1 << 1)
     # Loads the local variable at index 4 onto the evaluation stack.
-    LDLOC4 = OpcodeInformation(Opcode.LDLOC4)
+    LDLOC4 = OpcodeInformation(Opcode.LDLOC4, price=1 << 1)
     # Loads the local variable at index 5 onto the evaluation stack.
-    LDLOC5 = OpcodeInformation(Opcode.LDLOC5)
+    LDLOC5 = OpcodeInformation(Opcode.LDLOC5, price=1 << 1)
     # Loads the local variable at index 6 onto the evaluation stack.
-    LDLOC6 = OpcodeInformation(Opcode.LDLOC6)
+    LDLOC6 = OpcodeInformation(Opcode.LDLOC6, price=1 << 1)
     # Loads the local variable at a specified index onto the evaluation stack. The index is represented as a 1-byte
     # unsigned integer.
-    LDLOC = OpcodeInformation(Opcode.LDLOC, 1)
+    LDLOC = OpcodeInformation(Opcode.LDLOC, 1, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at index 0.
-    STLOC0 = OpcodeInformation(Opcode.STLOC0)
+    STLOC0 = OpcodeInformation(Opcode.STLOC0, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at index 1.
-    STLOC1 = OpcodeInformation(Opcode.STLOC1)
+    STLOC1 = OpcodeInformation(Opcode.STLOC1, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at index 2.
-    STLOC2 = OpcodeInformation(Opcode.STLOC2)
+    STLOC2 = OpcodeInformation(Opcode.STLOC2, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at index 3.
-    STLOC3 = OpcodeInformation(Opcode.STLOC3)
+    STLOC3 = OpcodeInformation(Opcode.STLOC3, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at index 4.
-    STLOC4 = OpcodeInformation(Opcode.STLOC4)
+    STLOC4 = OpcodeInformation(Opcode.STLOC4, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at index 5.
-    STLOC5 = OpcodeInformation(Opcode.STLOC5)
+    STLOC5 = OpcodeInformation(Opcode.STLOC5, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at index 6.
-    STLOC6 = OpcodeInformation(Opcode.STLOC6)
+    STLOC6 = OpcodeInformation(Opcode.STLOC6, price=1 << 1)
     # Stores the value on top of the evaluation stack in the local variable list at a specified index. The index is
     # represented as a 1-byte unsigned integer.
-    STLOC = OpcodeInformation(Opcode.STLOC, 1)
+    STLOC = OpcodeInformation(Opcode.STLOC, 1, price=1 << 1)
     # Loads the argument at index 0 onto the evaluation stack.
-    LDARG0 = OpcodeInformation(Opcode.LDARG0)
+    LDARG0 = OpcodeInformation(Opcode.LDARG0, price=1 << 1)
     # Loads the argument at index 1 onto the evaluation stack.
-    LDARG1 = OpcodeInformation(Opcode.LDARG1)
+    LDARG1 = OpcodeInformation(Opcode.LDARG1, price=1 << 1)
     # Loads the argument at index 2 onto the evaluation stack.
-    LDARG2 = OpcodeInformation(Opcode.LDARG2)
+    LDARG2 = OpcodeInformation(Opcode.LDARG2, price=1 << 1)
     # Loads the argument at index 3 onto the evaluation stack.
-    LDARG3 = OpcodeInformation(Opcode.LDARG3)
+    LDARG3 = OpcodeInformation(Opcode.LDARG3, price=1 << 1)
     # Loads the argument at index 4 onto the evaluation stack.
-    LDARG4 = OpcodeInformation(Opcode.LDARG4)
+    LDARG4 = OpcodeInformation(Opcode.LDARG4, price=1 << 1)
     # Loads the argument at index 5 onto the evaluation stack.
-    LDARG5 = OpcodeInformation(Opcode.LDARG5)
+    LDARG5 = OpcodeInformation(Opcode.LDARG5, price=1 << 1)
     # Loads the argument at index 6 onto the evaluation stack.
-    LDARG6 = OpcodeInformation(Opcode.LDARG6)
+    LDARG6 = OpcodeInformation(Opcode.LDARG6, price=1 << 1)
     # Loads the argument at a specified index onto the evaluation stack. The index is represented as a 1-byte
     # unsigned integer.
-    LDARG = OpcodeInformation(Opcode.LDARG, 1)
+    LDARG = OpcodeInformation(Opcode.LDARG, 1, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at index 0.
-    STARG0 = OpcodeInformation(Opcode.STARG0)
+    STARG0 = OpcodeInformation(Opcode.STARG0, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at index 1.
-    STARG1 = OpcodeInformation(Opcode.STARG1)
+    STARG1 = OpcodeInformation(Opcode.STARG1, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at index 2.
-    STARG2 = OpcodeInformation(Opcode.STARG2)
+    STARG2 = OpcodeInformation(Opcode.STARG2, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at index 3.
-    STARG3 = OpcodeInformation(Opcode.STARG3)
+    STARG3 = OpcodeInformation(Opcode.STARG3, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at index 4.
-    STARG4 = OpcodeInformation(Opcode.STARG4)
+    STARG4 = OpcodeInformation(Opcode.STARG4, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at index 5.
-    STARG5 = OpcodeInformation(Opcode.STARG5)
+    STARG5 = OpcodeInformation(Opcode.STARG5, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at index 6.
-    STARG6 = OpcodeInformation(Opcode.STARG6)
+    STARG6 = OpcodeInformation(Opcode.STARG6, price=1 << 1)
     # Stores the value on top of the evaluation stack in the argument slot at a specified index. The index is
     # represented as a 1-byte unsigned integer.
-    STARG = OpcodeInformation(Opcode.STARG, 1)
+    STARG = OpcodeInformation(Opcode.STARG, 1, price=1 << 1)
 
     # endregion
 
     # region Splice
 
-    NEWBUFFER = OpcodeInformation(Opcode.NEWBUFFER)
-    MEMCPY = OpcodeInformation(Opcode.MEMCPY)
+    NEWBUFFER = OpcodeInformation(Opcode.NEWBUFFER, price=1 << 8)
+    MEMCPY = OpcodeInformation(Opcode.MEMCPY, price=1 << 11)
     # Concatenates two strings.
-    CAT = OpcodeInformation(Opcode.CAT)
+    CAT = OpcodeInformation(Opcode.CAT, price=1 << 11)
     # Returns a section of a string.
-    SUBSTR = OpcodeInformation(Opcode.SUBSTR)
+    SUBSTR = OpcodeInformation(Opcode.SUBSTR, price=1 << 11)
     # Keeps only characters left of the specified point in a string.
-    LEFT = OpcodeInformation(Opcode.LEFT, stack_items=2)
+    LEFT = OpcodeInformation(Opcode.LEFT, stack_items=2, price=1 << 11)
     # Keeps only characters right of the specified point in a string.
-    RIGHT = OpcodeInformation(Opcode.RIGHT, stack_items=2)
+    RIGHT = OpcodeInformation(Opcode.RIGHT, stack_items=2, price=1 << 11)
 
     # endregion
 
     # region Bitwise logic
 
     # Flips all of the bits in the input.
-    INVERT = OpcodeInformation(Opcode.INVERT)
+    INVERT = OpcodeInformation(Opcode.INVERT, price=1 << 2)
     # Boolean and between each bit in the inputs.
-    AND = OpcodeInformation(Opcode.AND)
+    AND = OpcodeInformation(Opcode.AND, price=1 << 3)
     # Boolean or between each bit in the inputs.
-    OR = OpcodeInformation(Opcode.OR)
+    OR = OpcodeInformation(Opcode.OR, price=1 << 3)
     # Boolean exclusive or between each bit in the inputs.
-    XOR = OpcodeInformation(Opcode.XOR)
+    XOR = OpcodeInformation(Opcode.XOR, price=1 << 3)
     # Returns 1 if the inputs are exactly equal, 0 otherwise.
-    EQUAL = OpcodeInformation(Opcode.EQUAL)
+    EQUAL = OpcodeInformation(Opcode.EQUAL, price=1 << 5)
     # Returns 1 if the inputs are not equal, 0 otherwise.
-    NOTEQUAL = OpcodeInformation(Opcode.NOTEQUAL)
+    NOTEQUAL = OpcodeInformation(Opcode.NOTEQUAL, price=1 << 5)
 
     # endregion
 
@@ -362,64 +362,64 @@ class OpcodeInfo:
 
     # Puts the sign of top stack item on top of the main stack. If value is negative, put -1; if positive,
     # put 1; if value is zero, put 0.
-    SIGN = OpcodeInformation(Opcode.SIGN)
+    SIGN = OpcodeInformation(Opcode.SIGN, price=1 << 2)
     # The input is made positive.
-    ABS = OpcodeInformation(Opcode.ABS)
+    ABS = OpcodeInformation(Opcode.ABS, price=1 << 2)
     # The sign of the input is flipped.
-    NEGATE = OpcodeInformation(Opcode.NEGATE)
+    NEGATE = OpcodeInformation(Opcode.NEGATE, price=1 << 2)
     # 1 is added to the input.
-    INC = OpcodeInformation(Opcode.INC)
+    INC = OpcodeInformation(Opcode.INC, price=1 << 2)
     # 1 is subtracted from the input.
-    DEC = OpcodeInformation(Opcode.DEC)
+    DEC = OpcodeInformation(Opcode.DEC, price=1 << 2)
     # a is added to b.
-    ADD = OpcodeInformation(Opcode.ADD)
+    ADD = OpcodeInformation(Opcode.ADD, price=1 << 3)
     # b is subtracted from a.
-    SUB = OpcodeInformation(Opcode.SUB)
+    SUB = OpcodeInformation(Opcode.SUB, price=1 << 3)
     # a is multiplied by b.
-    MUL = OpcodeInformation(Opcode.MUL)
+    MUL = OpcodeInformation(Opcode.MUL, price=1 << 3)
     # a is divided by b.
-    DIV = OpcodeInformation(Opcode.DIV)
+    DIV = OpcodeInformation(Opcode.DIV, price=1 << 3)
     # Returns the remainder after dividing a by b.
-    MOD = OpcodeInformation(Opcode.MOD)
+    MOD = OpcodeInformation(Opcode.MOD, price=1 << 3)
     # The result of raising value to the exponent power.
-    POW = OpcodeInformation(Opcode.POW)
+    POW = OpcodeInformation(Opcode.POW, price=1 << 6)
     # Returns the square root of a specified number.
-    SQRT = OpcodeInformation(Opcode.SQRT)
+    SQRT = OpcodeInformation(Opcode.SQRT, price=1 << 6)
     # Performs modulus division on a number multiplied by another number.
-    MODMUL = OpcodeInformation(Opcode.MODMUL)
+    MODMUL = OpcodeInformation(Opcode.MODMUL, price=1 << 5)
     # Performs modulus division on a number raised to the power of another number.
     # If the exponent is -1, it will have the calculation of the modular inverse.
-    MODPOW = OpcodeInformation(Opcode.MODPOW)
+    MODPOW = OpcodeInformation(Opcode.MODPOW, price=1 << 11)
     # Shifts a left b bits, preserving sign.
-    SHL = OpcodeInformation(Opcode.SHL)
+    SHL = OpcodeInformation(Opcode.SHL, price=1 << 3)
     # Shifts a right b bits, preserving sign.
-    SHR = OpcodeInformation(Opcode.SHR)
+    SHR = OpcodeInformation(Opcode.SHR, price=1 << 3)
     # If the input is 0 or 1, it is flipped. Otherwise the output will be 0.
-    NOT = OpcodeInformation(Opcode.NOT)
+    NOT = OpcodeInformation(Opcode.NOT, price=1 << 2)
     # If both a and b are not 0, the output is 1. Otherwise 0.
-    BOOLAND = OpcodeInformation(Opcode.BOOLAND)
+    BOOLAND = OpcodeInformation(Opcode.BOOLAND, price=1 << 3)
     # If a or b is not 0, the output is 1. Otherwise 0.
-    BOOLOR = OpcodeInformation(Opcode.BOOLOR)
+    BOOLOR = OpcodeInformation(Opcode.BOOLOR, price=1 << 3)
     # Returns 0 if the input is 0. 1 otherwise.
-    NZ = OpcodeInformation(Opcode.NZ)
+    NZ = OpcodeInformation(Opcode.NZ, price=1 << 2)
     # Returns 1 if the numbers are equal, 0 otherwise.
-    NUMEQUAL = OpcodeInformation(Opcode.NUMEQUAL)
+    NUMEQUAL = OpcodeInformation(Opcode.NUMEQUAL, price=1 << 3)
     # Returns 1 if the numbers are not equal, 0 otherwise.
-    NUMNOTEQUAL = OpcodeInformation(Opcode.NUMNOTEQUAL)
+    NUMNOTEQUAL = OpcodeInformation(Opcode.NUMNOTEQUAL, price=1 << 3)
     # Returns 1 if a is less than b, 0 otherwise.
-    LT = OpcodeInformation(Opcode.LT)
+    LT = OpcodeInformation(Opcode.LT, price=1 << 3)
     # Returns 1 if a is less than or equal to b, 0 otherwise.
-    LE = OpcodeInformation(Opcode.LE)
+    LE = OpcodeInformation(Opcode.LE, price=1 << 3)
     # Returns 1 if a is greater than b, 0 otherwise.
-    GT = OpcodeInformation(Opcode.GT)
+    GT = OpcodeInformation(Opcode.GT, price=1 << 3)
     # Returns 1 if a is greater than or equal to b, 0 otherwise.
-    GE = OpcodeInformation(Opcode.GE)
+    GE = OpcodeInformation(Opcode.GE, price=1 << 3)
     # Returns the smaller of a and b.
-    MIN = OpcodeInformation(Opcode.MIN, stack_items=2)
+    MIN = OpcodeInformation(Opcode.MIN, stack_items=2, price=1 << 3)
     # Returns the larger of a and b.
-    MAX = OpcodeInformation(Opcode.MAX)
+    MAX = OpcodeInformation(Opcode.MAX, price=1 << 3)
     # Returns 1 if x is within the specified range (left-inclusive), 0 otherwise.
-    WITHIN = OpcodeInformation(Opcode.WITHIN)
+    WITHIN = OpcodeInformation(Opcode.WITHIN, price=1 << 3)
 
     # endregion
 
@@ -427,65 +427,65 @@ class OpcodeInfo:
 
     # A value n is taken from top of main stack. The next n*2 items on main stack are removed, put inside n-sized map
     # and this map is put on top of the main stack.
-    PACKMAP = OpcodeInformation(Opcode.PACKMAP)
+    PACKMAP = OpcodeInformation(Opcode.PACKMAP, price=1 << 11)
     # A value n is taken from top of main stack. The next n items on main stack are removed, put inside n-sized
     # struct and this struct is put on top of the main stack.
-    PACKSTRUCT = OpcodeInformation(Opcode.PACKSTRUCT)
+    PACKSTRUCT = OpcodeInformation(Opcode.PACKSTRUCT, price=1 << 11)
     # A value n is taken from top of main stack. The next n items on main stack are removed, put inside n-sized array
     # and this array is put on top of the main stack.
-    PACK = OpcodeInformation(Opcode.PACK)
+    PACK = OpcodeInformation(Opcode.PACK, price=1 << 11)
     # A collection is removed from top of the main stack. Its elements are put on top of the main stack (in reverse
     # order) and the collection size is also put on main stack.
-    UNPACK = OpcodeInformation(Opcode.UNPACK)
+    UNPACK = OpcodeInformation(Opcode.UNPACK, price=1 << 11)
     # An empty array (with size 0) is put on top of the main stack.
-    NEWARRAY0 = OpcodeInformation(Opcode.NEWARRAY0)
+    NEWARRAY0 = OpcodeInformation(Opcode.NEWARRAY0, price=1 << 4)
     # A value n is taken from top of main stack. A null-filled array with size n is put on top of the main stack.
-    NEWARRAY = OpcodeInformation(Opcode.NEWARRAY)
+    NEWARRAY = OpcodeInformation(Opcode.NEWARRAY, price=1 << 9)
     # A value n is taken from top of main stack. An array of type T with size n is put on top of the main stack.
-    NEWARRAY_T = OpcodeInformation(Opcode.NEWARRAY_T, 1)
+    NEWARRAY_T = OpcodeInformation(Opcode.NEWARRAY_T, 1, price=1 << 9)
     # An empty struct (with size 0) is put on top of the main stack.
-    NEWSTRUCT0 = OpcodeInformation(Opcode.NEWSTRUCT0)
+    NEWSTRUCT0 = OpcodeInformation(Opcode.NEWSTRUCT0, price=1 << 4)
     # A value n is taken from top of main stack. A zero-filled struct with size n is put on top of the main stack.
-    NEWSTRUCT = OpcodeInformation(Opcode.NEWSTRUCT)
+    NEWSTRUCT = OpcodeInformation(Opcode.NEWSTRUCT, price=1 << 9)
     # A Map is created and put on top of the main stack.
-    NEWMAP = OpcodeInformation(Opcode.NEWMAP)
+    NEWMAP = OpcodeInformation(Opcode.NEWMAP, price=1 << 3)
     # An array is removed from top of the main stack. Its size is put on top of the main stack.
-    SIZE = OpcodeInformation(Opcode.SIZE)
+    SIZE = OpcodeInformation(Opcode.SIZE, price=1 << 2)
     # An input index n (or key) and an array (or map) are removed from the top of the main stack. Puts True on top of
     # main stack if array[n] (or map[n]) exist, and False otherwise.
-    HASKEY = OpcodeInformation(Opcode.HASKEY, stack_items=2)
+    HASKEY = OpcodeInformation(Opcode.HASKEY, stack_items=2, price=1 << 6)
     # A map is taken from top of the main stack. The keys of this map are put on top of the main stack.
-    KEYS = OpcodeInformation(Opcode.KEYS)
+    KEYS = OpcodeInformation(Opcode.KEYS, price=1 << 4)
     # A map is taken from top of the main stack. The values of this map are put on top of the main stack.
-    VALUES = OpcodeInformation(Opcode.VALUES)
+    VALUES = OpcodeInformation(Opcode.VALUES, price=1 << 13)
     # An input index n (or key) and an array (or map) are taken from main stack. Element array[n] (or map[n]) is put
     # on top of the main stack.
-    PICKITEM = OpcodeInformation(Opcode.PICKITEM)
+    PICKITEM = OpcodeInformation(Opcode.PICKITEM, price=1 << 6)
     # The item on top of main stack is removed and appended to the second item on top of the main stack.
-    APPEND = OpcodeInformation(Opcode.APPEND)
+    APPEND = OpcodeInformation(Opcode.APPEND, price=1 << 13)
     # A value v, index n (or key) and an array (or map) are taken from main stack. Attribution array[n]=v
     # (or map[n]=v) is performed.
-    SETITEM = OpcodeInformation(Opcode.SETITEM)
+    SETITEM = OpcodeInformation(Opcode.SETITEM, price=1 << 13)
     # An array is removed from the top of the main stack and its elements are reversed.
-    REVERSEITEMS = OpcodeInformation(Opcode.REVERSEITEMS)
+    REVERSEITEMS = OpcodeInformation(Opcode.REVERSEITEMS, price=1 << 13)
     # An input index n (or key) and an array (or map) are removed from the top of the main stack. Element array[n]
     # (or map[n]) is removed.
-    REMOVE = OpcodeInformation(Opcode.REMOVE)
+    REMOVE = OpcodeInformation(Opcode.REMOVE, price=1 << 4)
     # Remove all the items from the compound-type.
-    CLEARITEMS = OpcodeInformation(Opcode.CLEARITEMS, stack_items=1)
+    CLEARITEMS = OpcodeInformation(Opcode.CLEARITEMS, stack_items=1, price=1 << 4)
     # Remove the last element from an array, and push it onto the stack.
-    POPITEM = OpcodeInformation(Opcode.POPITEM, stack_items=1)
+    POPITEM = OpcodeInformation(Opcode.POPITEM, stack_items=1, price=1 << 4)
 
     # endregion
 
     # region Types
 
     # Returns true if the input is null. Returns false otherwise.
-    ISNULL = OpcodeInformation(Opcode.ISNULL)
+    ISNULL = OpcodeInformation(Opcode.ISNULL, price=1 << 1)
     # Returns true if the top item is of the specified type.
-    ISTYPE = OpcodeInformation(Opcode.ISTYPE, 1)
+    ISTYPE = OpcodeInformation(Opcode.ISTYPE, 1, price=1 << 1)
     # Converts the top item to the specified type.
-    CONVERT = OpcodeInformation(Opcode.CONVERT, 1)
+    CONVERT = OpcodeInformation(Opcode.CONVERT, 1, price=1 << 13)
 
     # endregion
 
@@ -495,6 +495,6 @@ class OpcodeInfo:
     ABORTMSG = OpcodeInformation(Opcode.ABORTMSG)
 
     # Pop the top value of the stack, if it false, then exit vm execution and set vm state to FAULT. Includes a reason.
-    ASSERTMSG = OpcodeInformation(Opcode.ASSERTMSG)
+    ASSERTMSG = OpcodeInformation(Opcode.ASSERTMSG, price=1)
 
     # endregion
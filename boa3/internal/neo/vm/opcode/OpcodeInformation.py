@@ -10,9 +10,11 @@ class OpcodeInformation:
     :ivar opcode: the opcode of the code
     :ivar data_len: the size in bytes of the expected operand. Zero by default.
     :ivar max_data_len: the max size in bytes of the operand. Same value as data_len if size is constant.
+    :ivar price: the execution price of the opcode, before applying the network's execution fee factor
     """
 
-    def __init__(self, opcode: Opcode, min_data_len: int = 0, extra_data_max_len: int = 0, stack_items: int = 0):
+    def __init__(self, opcode: Opcode, min_data_len: int = 0, extra_data_max_len: int = 0, stack_items: int = 0,
+                 price: int = 0):
         self.opcode: Opcode = opcode
 
         if min_data_len < 0:
@@ -27,6 +29,10 @@ class OpcodeInformation:
             stack_items = 0
         self.stack_items: int = stack_items
 
+        if price < 0:
+            price = 0
+        self.price: int = price
+
     def get_large(self) -> Self | None:
         large_op = self.opcode.get_large
         if large_op is None:
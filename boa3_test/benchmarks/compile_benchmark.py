@@ -0,0 +1,97 @@
+"""
+Measures the compilation time of a synthetic smart contract with a large number of instructions.
+
+Usage: python boa3_test/benchmarks/compile_benchmark.py [--instructions N] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# each generated helper function has around this many instructions
+_INSTRUCTIONS_PER_HELPER = 35
+
+
+def generate_contract_source(helpers_count: int) -> str:
+    """
+    Generates a contract source with many private helpers, with branches and loops to have jump instructions, and a
+    public method that calls all of them.
+
+    :param helpers_count: the number of helper functions in the generated contract
+    """
+    lines = [
+        'from boa3.sc.compiletime import public',
+        '',
+    ]
+    for index in range(helpers_count):
+        lines.extend([
+            '',
+            f'def helper_{index}(a: int, b: int) -> int:',
+            '    c = a',
+            '    if a > b:',
+            '        c = a - b',
+            '    else:',
+            '        c = b - a',
+            '    while c > 10:',
+            '        c = c // 2',
+            f'    return c + {index}',
+            '',
+        ])
+
+    lines.extend([
+        '',
+        '@public',
+        'def main(x: int) -> int:',
+        '    total = 0',
+    ])
+    lines.extend(f'    total += helper_{index}(x, {index})' for index in range(helpers_count))
+    lines.append('    return total')
+    lines.append('')
+
+    return '\n'.join(lines)
+
+
+def run_benchmark(instructions: int, repeat: int) -> list[float]:
+    from boa3.internal.compiler.compiler import Compiler
+
+    helpers_count = max(1, instructions // _INSTRUCTIONS_PER_HELPER)
+    source = generate_contract_source(helpers_count)
+
+    timings = []
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'SyntheticContract.py')
+        with open(path, 'w') as file:
+            file.write(source)
+
+        for _ in range(repeat):
+            compiler = Compiler()
+            start = time.perf_counter()
+            bytecode = compiler.compile(path)
+            timings.append(time.perf_counter() - start)
+
+            # the instructions are kept in the context of the compilation, not in the context of this thread
+            instructions_count = len(compiler._context.vm_code_mapping.codes)
+            print(f'compiled {instructions_count} instructions '
+                  f'({len(bytecode)} bytes) in {timings[-1]:.2f}s')
+
+    return timings
+
+
+if __name__ == '__main__':
+    # the benchmark files are not in the neo3-boa package, so the project root is added to the sys path
+    project_root = os.path.abspath(f'{os.path.dirname(__file__)}/../..')
+    sys.path.append(project_root)
+
+    parser = argparse.ArgumentParser(description='Benchmark the compilation of a synthetic smart contract')
+    parser.add_argument('--instructions', type=int, default=20_000,
+                        help='approximate number of instructions of the generated contract')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of times the contract is compiled')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = run_benchmark(args.instructions, args.repeat)
+    print(f'best: {min(results):.2f}s')
@@ -0,0 +1,25 @@
+from typing import Any
+
+from boa3.sc.compiletime import contract, public
+
+
+@contract('0x3d1f9a6609c192b4de23e54b0a9430268a1d34ea')
+class Nep17:
+
+    @staticmethod
+    def symbol() -> Any:
+        pass
+
+    @staticmethod
+    def decimals() -> int:
+        pass
+
+
+@public
+def nep17_symbol() -> Any:
+    return Nep17.symbol()
+
+
+@public
+def nep17_decimals() -> int:
+    return Nep17.decimals()
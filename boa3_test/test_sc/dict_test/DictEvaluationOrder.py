@@ -0,0 +1,19 @@
+from boa3.sc.compiletime import public
+
+
+def log(calls: list[str], value: str) -> str:
+    calls.append(value)
+    return value
+
+
+@public
+def evaluation_order() -> list[str]:
+    calls: list[str] = []
+    items = {log(calls, 'key_1'): log(calls, 'value_1'), log(calls, 'key_2'): log(calls, 'value_2')}
+    return calls
+
+
+@public
+def Main() -> dict[str, str]:
+    calls: list[str] = []
+    return {log(calls, 'key_1'): log(calls, 'value_1'), log(calls, 'key_2'): log(calls, 'value_2')}
@@ -0,0 +1,9 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(n: int) -> int:
+    total = 0
+    for x in range(n):
+        total += x
+    return total
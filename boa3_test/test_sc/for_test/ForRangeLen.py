@@ -0,0 +1,13 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(items: list[int]) -> int:
+    total = 0
+    for index in range(len(items)):
+        if items[index] < 0:
+            continue
+        if items[index] > 100:
+            break
+        total += index * items[index]
+    return total
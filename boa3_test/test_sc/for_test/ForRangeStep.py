@@ -0,0 +1,9 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(start: int, stop: int) -> list[int]:
+    values: list[int] = []
+    for x in range(start, stop, -2):
+        values.append(x)
+    return values
@@ -0,0 +1,9 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(start: int, stop: int) -> list[int]:
+    values: list[int] = []
+    for x in reversed(range(start, stop)):
+        values.append(x)
+    return values
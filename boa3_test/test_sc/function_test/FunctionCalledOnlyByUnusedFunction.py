@@ -0,0 +1,14 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main() -> int:
+    return 42
+
+
+def unused_function() -> int:
+    return inner_function() + 1
+
+
+def inner_function() -> int:
+    return 10
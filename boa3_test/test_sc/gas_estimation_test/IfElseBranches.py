@@ -0,0 +1,10 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(condition: bool) -> int:
+    if condition:
+        a = 1
+    else:
+        a = 2 * 3 * 4
+    return a
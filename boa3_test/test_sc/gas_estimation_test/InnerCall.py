@@ -0,0 +1,11 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(a: int, b: int) -> int:
+    return inner(a, b) * 2
+
+
+@public
+def inner(a: int, b: int) -> int:
+    return a + b
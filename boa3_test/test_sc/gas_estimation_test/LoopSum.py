@@ -0,0 +1,11 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(n: int) -> int:
+    total = 0
+    index = 0
+    while index < n:
+        total += index
+        index += 1
+    return total
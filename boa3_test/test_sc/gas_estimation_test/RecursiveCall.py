@@ -0,0 +1,8 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(n: int) -> int:
+    if n <= 1:
+        return 1
+    return n * Main(n - 1)
@@ -0,0 +1,6 @@
+from boa3.sc.types import UInt160
+
+OWNER = UInt160(b'\x01' * 20)
+FEE = 10 * 100
+COUNTER = 1
+COUNTER = 2
@@ -0,0 +1,18 @@
+from boa3.sc.compiletime import public
+from boa3.sc.types import UInt160
+from boa3_test.test_sc.import_test.variable_import.ConstantVariables import COUNTER, FEE, OWNER
+
+
+@public
+def get_owner() -> UInt160:
+    return OWNER
+
+
+@public
+def get_fee() -> int:
+    return FEE
+
+
+@public
+def get_counter() -> int:
+    return COUNTER
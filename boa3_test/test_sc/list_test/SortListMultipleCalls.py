@@ -0,0 +1,25 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def sort_ints(values: list[int], reverse: bool) -> list[int]:
+    values.sort(reverse=reverse)
+    return values
+
+
+@public
+def sort_ascending(values: list[int]) -> list[int]:
+    values.sort()
+    return values
+
+
+@public
+def sort_descending(values: list[int]) -> list[int]:
+    values.sort(reverse=True)
+    return values
+
+
+@public
+def sort_bools(values: list[bool]) -> list[bool]:
+    values.sort()
+    return values
@@ -0,0 +1,22 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def main(x: int) -> str:
+    match x:
+        case 10:
+            return "ten"
+        case -10:
+            return "minus ten"
+        case 0:
+            return "zero"
+        case 7:
+            return "seven"
+        case 3:
+            return "three"
+        case 100:
+            return "hundred"
+        case 10:
+            return "unreachable"
+        case _:
+            return "other"
@@ -0,0 +1,22 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def main(items: list[int]) -> int:
+    total = 0
+    for item in items:
+        match item:
+            case 1:
+                total += 10
+            case 2:
+                continue
+            case 3:
+                break
+            case 4:
+                total += 40
+            case 5:
+                total += 50
+            case _:
+                total += 1
+        total += 1000
+    return total
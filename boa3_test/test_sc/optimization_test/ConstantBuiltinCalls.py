@@ -0,0 +1,22 @@
+from boa3.sc.compiletime import public
+from boa3.sc.types import UInt160
+from boa3.sc.utils import hash160, to_bytes, to_int, to_script_hash
+
+
+OWNER: UInt160 = UInt160(to_script_hash(b'NUVaphUShQPD82yoXcbvFkedjHX6rUF7QQ'))
+PREFIX = to_bytes(5)
+
+
+@public
+def get_owner() -> UInt160:
+    return OWNER
+
+
+@public
+def get_key(name: str) -> bytes:
+    return PREFIX + to_bytes(name)
+
+
+@public
+def get_values() -> list:
+    return [to_int(b'\x01\x02'), len('literal'), hash160(b'const'), to_bytes(-1234, 3, True)]
@@ -0,0 +1,11 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def fold_fstring(name: str) -> str:
+    return f'unit {"test"} {10} {name}'
+
+
+@public
+def fold_concat(prefix: str, suffix: str) -> str:
+    return prefix + 'unit' + '_' + 'test' + suffix
@@ -0,0 +1,12 @@
+from boa3.sc.compiletime import public
+
+
+def factorial(value: int) -> int:
+    if value <= 1:
+        return 1
+    return value * factorial(value - 1)
+
+
+@public
+def Main(a: int) -> int:
+    return factorial(a)
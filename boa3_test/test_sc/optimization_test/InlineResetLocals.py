@@ -0,0 +1,15 @@
+from boa3.sc.compiletime import public
+
+
+def last_item(values: list[int]) -> int:
+    for value in values:
+        last = value
+    return last
+
+
+@public
+def Main(items: list[list[int]]) -> list[int]:
+    result: list[int] = []
+    for values in items:
+        result.append(last_item(values))
+    return result
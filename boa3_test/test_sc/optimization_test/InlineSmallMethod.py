@@ -0,0 +1,17 @@
+from boa3.sc.compiletime import public
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+def limit(value: int, maximum: int) -> int:
+    if value > maximum:
+        return maximum
+    return value
+
+
+@public
+def Main(a: int, b: int) -> int:
+    total = double(a) + double(b)
+    return limit(total, 100)
@@ -0,0 +1,7 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(a: int, b: int) -> int:
+    c = a + b
+    return c * c
@@ -0,0 +1,17 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(has_items: bool, size: int) -> int:
+    items: list[int]
+    if has_items:
+        items = [1, 2, 3]
+
+    count = 0
+    # items isn't assigned when has_items is False, so its length is evaluated inside the loop
+    while count < size:
+        if has_items:
+            count += len(items)
+        else:
+            count += 1
+    return count
@@ -0,0 +1,19 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def sum_items(items: list[int]) -> int:
+    result = 0
+    index = 0
+    while index < len(items):
+        result += items[index]
+        index += 1
+    return result
+
+
+@public
+def fill_items(items: list[int], size: int) -> list[int]:
+    # the length of the list changes inside the loop, so it's evaluated in every iteration
+    while len(items) < size:
+        items.append(len(items))
+    return items
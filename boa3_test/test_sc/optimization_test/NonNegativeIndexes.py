@@ -0,0 +1,34 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def reverse_sum(items: list[int]) -> int:
+    total = 0
+    for index in range(len(items) - 1, -1, -1):
+        total += items[index]
+    return total
+
+
+@public
+def double_items(items: list[int]) -> list[int]:
+    index = 0
+    while index < len(items):
+        items[index] = items[index] * 2
+        index += 1
+    return items
+
+
+@public
+def pairs(text: str) -> list[str]:
+    result: list[str] = []
+    for index in range(len(text) - 1):
+        result.append(text[index:index + 2])
+    return result
+
+
+@public
+def suffixes(text: str) -> list[str]:
+    result: list[str] = []
+    for index in range(len(text)):
+        result.append(text[index:])
+    return result
@@ -0,0 +1,8 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(condition: bool) -> int:
+    if not condition:
+        return 1
+    return 2
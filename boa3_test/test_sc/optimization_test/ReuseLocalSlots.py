@@ -0,0 +1,12 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def main(a: int, b: int) -> int:
+    total = a + b
+    result = total * total
+
+    difference = a - b
+    result = result - difference * difference
+
+    return result
@@ -0,0 +1,25 @@
+from boa3.sc.compiletime import public
+from boa3.sc.storage import get_context, get_int, put_int
+
+
+@public
+def put_values(keys: list[bytes], value: int):
+    for key in keys:
+        put_int(key, value, get_context())
+
+
+@public
+def get_sum(first_key: bytes, second_key: bytes) -> int:
+    return get_int(first_key, get_context()) + get_int(second_key, get_context())
+
+
+@public
+def get_total(first_key: bytes, second_key: bytes, value: int) -> int:
+    if value == 0:
+        # doesn't use the storage, so it must not get the context
+        return 0
+
+    total = value
+    if value > 0:
+        total += get_int(first_key, get_context())
+    return total + get_int(second_key, get_context())
@@ -0,0 +1,18 @@
+from boa3.sc.compiletime import public
+from boa3.sc.storage import get_int, put_int
+
+
+@public
+def withdraw(amount: int) -> bool:
+    if get_int(b'balance') < amount:
+        return False
+
+    put_int(b'balance', get_int(b'balance') - amount)
+    return True
+
+
+@public
+def deposit(account: bytes, amount: int) -> int:
+    put_int(account, get_int(account) + amount)
+    # the storage has changed, so the key must be read again
+    return get_int(account)
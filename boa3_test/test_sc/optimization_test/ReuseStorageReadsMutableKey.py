@@ -0,0 +1,16 @@
+from boa3.sc.compiletime import public
+from boa3.sc.storage import get, put
+
+
+@public
+def put_value(key: bytes, value: bytes):
+    put(key, value)
+
+
+@public
+def main(key: bytearray) -> bytes:
+    a = get(key)
+    # the key is changed in place, so it must be read again
+    key[0] = 0x41
+    b = get(key)
+    return a + b
@@ -0,0 +1,6 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def Main(first: str, second: str, third: str) -> list[str]:
+    return [first.upper(), second.upper(), third.upper(), first.lower()]
@@ -0,0 +1,16 @@
+from boa3.sc.compiletime import public
+
+
+@public
+def index(string: str, substring: str) -> int:
+    return string.index(substring)
+
+
+@public
+def count(string: str, substring: str) -> int:
+    return string.count(substring)
+
+
+@public
+def replace(string: str, old: str, new: str) -> str:
+    return string.replace(old, new)
@@ -375,6 +375,22 @@ class BoaTestCase(SmartContractTestCase):
         except TypeError:
             return {}
 
+    @classmethod
+    async def get_gas_consumed(
+            cls,
+            method: str,
+            args: Optional[list] = None,
+            *,
+            target_contract: Optional[types.UInt160] = None,
+    ) -> int:
+        """
+        Gets how much GAS a test invoke of the method consumes, including the call from the invocation script
+        """
+        contract = GenericContract(cls.contract_hash if target_contract is None else target_contract)
+        receipt = await cls.node.facade.test_invoke(contract.call_function(method, args))
+        cls._check_vmstate(receipt)
+        return receipt.gas_consumed
+
     @classmethod
     def unwrap_inner_values(
             cls,
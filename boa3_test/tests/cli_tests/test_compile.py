@@ -15,10 +15,10 @@ class TestCliCompile(BoaCliTest):
         self.assertEqual(self.EXIT_CODE_SUCCESS, system_exit.exception.code)
         self.assertIn('usage: neo3-boa compile [-h] [-db] '
                       '[--project-path PROJECT_PATH] [-e ENV] '
-                      '[-o NEF_OUTPUT] [--no-failfast] '
+                      '[-o NEF_OUTPUT] [-j JOBS] [--gas-report] [--no-failfast] '
                       '[--log-level LOG_LEVEL] '
                       '[--exclude-warnings EXCLUDE_WARNINGS [EXCLUDE_WARNINGS ...]] '
-                      'input',
+                      'input [input ...]',
                       cli_output)
 
     @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'boa_built_in_methods_test', 'Env.py'))
@@ -160,6 +160,62 @@ class TestCliCompile(BoaCliTest):
         self.assertEqual(self.EXIT_CODE_ERROR, system_exit.exception.code)
         self.assertTrue('Output path file extension is not .nef' in logs.output[-1])
 
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Addition.py'),
+                  get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Subtraction.py'),
+                  '-j', '2')
+    def test_cli_compile_multiple_files(self):
+        nef_paths = [get_path_from_boa3_test('test_sc', 'arithmetic_test', f'{file_name}.nef')
+                     for file_name in ('Addition', 'Subtraction')]
+        for nef_path in nef_paths:
+            if os.path.isfile(nef_path):
+                os.remove(nef_path)
+
+        logs = self.get_cli_log()
+
+        info_logged = [log for log in logs.output if log.startswith('INFO')]
+        self.assertIn('Wrote Addition.nef to ', info_logged[-2])
+        self.assertIn('Wrote Subtraction.nef to ', info_logged[-1])
+        for nef_path in nef_paths:
+            self.assertTrue(os.path.isfile(nef_path),
+                            msg=f'{nef_path} not found')
+            self.assertTrue(os.path.isfile(nef_path.replace('nef', 'manifest.json')),
+                            msg=f'{nef_path.replace("nef", "manifest.json")} not found')
+
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Addition*.py'))
+    def test_cli_compile_glob(self):
+        logs = self.get_cli_log()
+
+        wrote_logged = [log for log in logs.output if 'Wrote ' in log]
+        self.assertGreater(len(wrote_logged), 1)
+        self.assertTrue(any('Wrote Addition.nef to ' in log for log in wrote_logged))
+
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Addition.py'),
+                  get_path_from_boa3_test('test_sc', 'native_test', 'stdlib', 'Base64EncodeMismatchedType.py'))
+    def test_cli_compile_multiple_files_with_invalid_smart_contract(self):
+        logs, system_exit = self.get_cli_log(get_exit_code=True)
+
+        self.assertEqual(self.EXIT_CODE_ERROR, system_exit.exception.code)
+        # the other contracts are compiled even if one of them fails
+        self.assertTrue(any('Wrote Addition.nef to ' in log for log in logs.output))
+        self.assertTrue(any('Base64EncodeMismatchedType.py: Could not compile' in log for log in logs.output))
+        self.assertIn('Could not compile 1 of 2 files', logs.output[-1])
+
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Addition.py'),
+                  get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Subtraction.py'),
+                  '-o', 'smart_contract.nef')
+    def test_cli_compile_multiple_files_with_output_path(self):
+        logs, system_exit = self.get_cli_log(get_exit_code=True)
+
+        self.assertEqual(self.EXIT_CODE_ERROR, system_exit.exception.code)
+        self.assertIn('Output path can only be used when compiling a single file', logs.output[-1])
+
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'arithmetic_test', 'NotExistingFile*.py'))
+    def test_cli_compile_glob_without_match(self):
+        logs, system_exit = self.get_cli_log(get_exit_code=True)
+
+        self.assertEqual(self.EXIT_CODE_ERROR, system_exit.exception.code)
+        self.assertIn('No files match', logs.output[-1])
+
     @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'import_test', 'ImportFailInnerNotExistingMethod.py'))
     def test_cli_compile_fail_fast_true(self):
         logs, system_exit = self.get_cli_log(get_exit_code=True)
@@ -210,6 +266,17 @@ class TestCliCompile(BoaCliTest):
         self.assertGreater(len(info_logged), 3)
         self.assertIn(f'Wrote {file_name}.nef', info_logged[-1])
 
+    @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Addition.py'),
+                  '--gas-report')
+    def test_cli_compile_gas_report(self):
+        file_name = 'Addition'
+        logs = self.get_cli_log()
+
+        info_logged = [log for log in logs.output if log.startswith('INFO')]
+        self.assertIn(f'Wrote {file_name}.nef', info_logged[-3])
+        self.assertIn(f"GAS report of '{file_name}':", info_logged[-2])
+        self.assertRegex(info_logged[-1], r'add: best \d+\.\d{8} GAS, worst \d+\.\d{8} GAS$')
+
     @neo3_boa_cli('compile', get_path_from_boa3_test('test_sc', 'arithmetic_test', 'Addition.py'),
                   '--log-level', 'FOO')
     def test_cli_compile_log_level_invalid(self):
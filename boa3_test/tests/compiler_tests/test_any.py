@@ -88,45 +88,32 @@ class TestAny(boatestcase.BoaTestCase):
             + Opcode.PUSHT
             + Opcode.PUSH2
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0         # SequenceFunction(bool_tuple)
-            + Opcode.CALL
-            + Integer(45).to_byte_array(min_length=1, signed=True)
+            + Opcode.STLOC0         # SequenceFunction(bool_tuple)    # SequenceFunction is inlined
             + Opcode.PUSHDATA1      # SequenceFunction([True, 1, 'ok'])
             + Integer(len(ok)).to_byte_array() + ok
             + Opcode.PUSH1
             + Opcode.PUSHT
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.CALL
-            + Integer(35).to_byte_array(min_length=1, signed=True)
+            + Opcode.STLOC0
             + Opcode.PUSHDATA1      # SequenceFunction('some_string')
             + Integer(len(some_string)).to_byte_array()
             + some_string
-            + Opcode.CALL
-            + Integer(20).to_byte_array(min_length=1, signed=True)
+            + Opcode.STLOC0
             + Opcode.PUSHDATA1      # SequenceFunction((True, 1, 'ok'))
             + Integer(len(ok)).to_byte_array() + ok
             + Opcode.PUSH1
             + Opcode.PUSHT
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.CALL
-            + Integer(10).to_byte_array(min_length=1, signed=True)
+            + Opcode.STLOC0
             + Opcode.PUSH3          # SequenceFunction([1, 2, 3])
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.CALL
-            + Integer(3).to_byte_array(min_length=1, signed=True)
-            + Opcode.RET        # return
-            + Opcode.INITSLOT   # SequenceFunction
-            + b'\x01'
-            + b'\x01'
-            + Opcode.LDARG0         # a = sequence
             + Opcode.STLOC0
-            + Opcode.RET
+            + Opcode.RET        # return
         )
 
         output, _ = self.assertCompile('FunctionAnyParam.py')
@@ -137,7 +124,7 @@ class TestAny(boatestcase.BoaTestCase):
         some_string = String('some_string').to_bytes()
         expected_output = (
             Opcode.INITSLOT
-            + b'\x05'
+            + b'\x04'
             + b'\x00'
             + Opcode.PUSHDATA1  # any_list = [True, 1, 'ok']
             + Integer(len(ok)).to_byte_array() + ok
@@ -165,16 +152,16 @@ class TestAny(boatestcase.BoaTestCase):
             + Opcode.PACK
             + Opcode.STLOC3
             + Opcode.LDLOC0     # a = any_list
-            + Opcode.STLOC4
+            + Opcode.STLOC0
             + Opcode.LDLOC2     # a = any_tuple
-            + Opcode.STLOC4
+            + Opcode.STLOC0
             + Opcode.PUSHDATA1  # a = 'some_string'
             + Integer(len(some_string)).to_byte_array() + some_string
-            + Opcode.STLOC4
+            + Opcode.STLOC0
             + Opcode.LDLOC1     # a = int_list
-            + Opcode.STLOC4
+            + Opcode.STLOC0
             + Opcode.LDLOC3     # a = bool_tuple
-            + Opcode.STLOC4
+            + Opcode.STLOC0
             + Opcode.RET
         )
 
@@ -185,7 +172,7 @@ class TestAny(boatestcase.BoaTestCase):
         ok = String('ok').to_bytes()
         expected_output = (
             Opcode.INITSLOT
-            + b'\x02'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSHDATA1  # any_list = [True, 1, 'ok']
             + Integer(len(ok)).to_byte_array() + ok
@@ -193,9 +180,7 @@ class TestAny(boatestcase.BoaTestCase):
             + Opcode.PUSHT
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # int_sequence = any_list
-            + Opcode.STLOC1
+            + Opcode.STLOC0     # int_sequence = any_list
             + Opcode.RET
         )
 
@@ -206,7 +191,7 @@ class TestAny(boatestcase.BoaTestCase):
         ok = String('ok').to_bytes()
         expected_output = (
             Opcode.INITSLOT
-            + b'\x02'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSHDATA1  # any_list = [True, 1, 'ok']
             + Integer(len(ok)).to_byte_array() + ok
@@ -214,9 +199,7 @@ class TestAny(boatestcase.BoaTestCase):
             + Opcode.PUSHT
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # str_sequence = any_list
-            + Opcode.STLOC1
+            + Opcode.STLOC0     # str_sequence = any_list
             + Opcode.RET
         )
 
@@ -242,7 +225,7 @@ class TestAny(boatestcase.BoaTestCase):
         ok = String('ok').to_bytes()
         expected_output = (
             Opcode.INITSLOT
-            + b'\x05'
+            + b'\x03'
             + b'\x00'
             + Opcode.PUSHDATA1  # any_list = [True, 1, 'ok']
             + Integer(len(ok)).to_byte_array() + ok
@@ -268,14 +251,12 @@ class TestAny(boatestcase.BoaTestCase):
             + Opcode.PUSHT
             + Opcode.PUSH2
             + Opcode.PACK
-            + Opcode.STLOC3
-            + Opcode.LDLOC3     # a = [any_list, int_list, any_tuple, bool_tuple]
-            + Opcode.LDLOC2
+            + Opcode.LDLOC2     # a = [any_list, int_list, any_tuple, bool_tuple]
             + Opcode.LDLOC1
             + Opcode.LDLOC0
             + Opcode.PUSH4
             + Opcode.PACK
-            + Opcode.STLOC4
+            + Opcode.STLOC0
             + Opcode.RET
         )
 
@@ -285,7 +266,7 @@ class TestAny(boatestcase.BoaTestCase):
     def test_sequence_of_int_sequence_success(self):
         expected_output = (
             Opcode.INITSLOT
-            + b'\x03'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSH3      # int_list = [1, 2, 3]
             + Opcode.PUSH2
@@ -298,12 +279,10 @@ class TestAny(boatestcase.BoaTestCase):
             + Opcode.PUSH10
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # a = [int_list, int_tuple]
-            + Opcode.LDLOC0
+            + Opcode.LDLOC0     # a = [int_list, int_tuple]
             + Opcode.PUSH2
             + Opcode.PACK
-            + Opcode.STLOC2
+            + Opcode.STLOC0
             + Opcode.RET
         )
 
@@ -176,14 +176,11 @@ class TestAssert(boatestcase.BoaTestCase):
             + Opcode.LDARG0
             + Opcode.PUSH0
             + Opcode.GT
-            + Opcode.CALL
-            + Integer(5).to_byte_array(min_length=1, signed=True)
+            + Opcode.PUSHDATA1  # message() is inlined
+            + Integer(len(assert_msg)).to_byte_array() + assert_msg  # assert a > 0, 'a must be greater than zero'
             + Opcode.ASSERTMSG
             + Opcode.LDARG0     # return a
             + Opcode.RET
-            + Opcode.PUSHDATA1
-            + Integer(len(assert_msg)).to_byte_array() + assert_msg  # assert a > 0, 'a must be greater than zero'
-            + Opcode.RET
         )
 
         output, _ = self.assertCompile('AssertWithStrFunctionMessage.py')
@@ -25,20 +25,13 @@ class TestBuiltinMethod(boatestcase.BoaTestCase):
 
     def test_len_of_tuple_compile(self):
         expected_output = (
-            Opcode.INITSLOT
-            + b'\x02'
-            + b'\x00'
-            + Opcode.PUSH3      # a = (1, 2, 3)
+            Opcode.PUSH3        # a = (1, 2, 3)
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # b = len(a)
-            + Opcode.SIZE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.SIZE       # b = len(a)
+            + Opcode.RET        # return b
         )
 
         output, _ = self.assertCompile('LenTuple.py')
@@ -52,20 +45,13 @@ class TestBuiltinMethod(boatestcase.BoaTestCase):
 
     def test_len_of_list_compile(self):
         expected_output = (
-            Opcode.INITSLOT
-            + b'\x02'
-            + b'\x00'
-            + Opcode.PUSH3      # a = [1, 2, 3]
+            Opcode.PUSH3        # a = [1, 2, 3]
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH3      # array length
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # b = len(a)
-            + Opcode.SIZE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.SIZE       # b = len(a)
+            + Opcode.RET        # return b
         )
 
         output, _ = self.assertCompile('LenList.py')
@@ -88,10 +74,7 @@ class TestBuiltinMethod(boatestcase.BoaTestCase):
             + Integer(len(byte_input)).to_byte_array()
             + byte_input
             + Opcode.STLOC0
-            + Opcode.PUSHDATA1            # push the bytes
-            + Integer(len(byte_input)).to_byte_array()
-            + byte_input
-            + Opcode.CALLT + b'\x00\x00'
+            + Opcode.PUSH11               # the length of a literal is evaluated in compile time
             + Opcode.RET
         )
 
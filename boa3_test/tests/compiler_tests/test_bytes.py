@@ -218,15 +218,13 @@ class TestBytes(boatestcase.BoaTestCase):
         data = b'\x01\x02\x03'
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x02'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSHDATA1  # a = bytearray(b'\x01\x02\x03')
             + Integer(len(data)).to_byte_array(min_length=1)
             + data
             + Opcode.CONVERT + StackItemType.Buffer
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # b = a
-            + Opcode.STLOC1
+            + Opcode.STLOC0     # b = a
             + Opcode.RET        # return
         )
 
@@ -524,14 +522,6 @@ class TestBytes(boatestcase.BoaTestCase):
             + Opcode.STLOC0
             + Opcode.LDLOC0     # var[0] = 0x01
             + Opcode.PUSH0
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PUSH1
             + Opcode.SETITEM
             + Opcode.LDLOC0
@@ -626,7 +616,7 @@ class TestBytes(boatestcase.BoaTestCase):
         data = b'\x01\x02\x03'
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x02'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSHDATA1  # a = b'\x01\x02\x03'
             + Integer(len(data)).to_byte_array(min_length=1)
@@ -636,7 +626,7 @@ class TestBytes(boatestcase.BoaTestCase):
             + Integer(len(data)).to_byte_array(min_length=1)
             + data
             + Opcode.CONVERT + StackItemType.Buffer
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.RET        # return
         )
 
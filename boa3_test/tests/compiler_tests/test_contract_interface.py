@@ -81,27 +81,14 @@ class TestContractInterface(boatestcase.BoaTestCase):
         self.assertEqual(nep17_result, result)
 
     def test_contract_interface_code_optimization_compile(self):
-        from boa3.internal.model.builtin.interop.interop import Interop
+        from boa3.internal.compiler.compiler import Compiler
         from boa3.internal.neo.vm.opcode.Opcode import Opcode
-        from boa3.internal.neo.vm.type.Integer import Integer
-        from boa3.internal.neo.vm.type.String import String
 
         external_contract_name = 'symbol'
-        function_name_bytes = String(external_contract_name).to_bytes()
-        contract_script_bytes = self.nep17_contract.to_array()
         contract_script_hex_str = f'0x{self.nep17_contract}'
 
         expected_output = (
-            Opcode.NEWARRAY0    # arguments list
-            + Opcode.PUSH15     # CallFlag
-            + Opcode.PUSHDATA1  # function name
-            + Integer(len(function_name_bytes)).to_byte_array()
-            + function_name_bytes
-            + Opcode.PUSHDATA1  # contract script
-            + Integer(len(contract_script_bytes)).to_byte_array()
-            + contract_script_bytes
-            + Opcode.SYSCALL
-            + Interop.CallContract.interop_method_hash
+            Opcode.CALLT + b'\x00\x00'    # the hash and the name of the method are in the method token
             + Opcode.RET
         )
 
@@ -117,6 +104,14 @@ class TestContractInterface(boatestcase.BoaTestCase):
                        },
                       manifest['permissions'])
 
+        path = self.get_contract_path('ContractInterfaceCodeOptimization.py')
+        method_tokens = Compiler()._internal_compile(path).method_tokens
+        self.assertEqual(1, len(method_tokens))
+        self.assertEqual(self.nep17_contract.to_array(), method_tokens[0].hash.to_array())
+        self.assertEqual(external_contract_name, method_tokens[0].method)
+        self.assertEqual(0, method_tokens[0].parameters_count)
+        self.assertTrue(method_tokens[0].has_return_value)
+
     async def test_contract_interface_code_optimization_run(self):
         await self.set_up_contract('ContractInterfaceCodeOptimization.py')
 
@@ -126,6 +121,57 @@ class TestContractInterface(boatestcase.BoaTestCase):
                                           )
         self.assertEqual(nep17_result, result)
 
+    def test_contract_interface_any_return_compile(self):
+        from boa3.internal.compiler.compiler import Compiler
+        from boa3.internal.model.builtin.interop.interop import Interop
+        from boa3.internal.neo.vm.opcode.Opcode import Opcode
+        from boa3.internal.neo.vm.type.Integer import Integer
+        from boa3.internal.neo.vm.type.String import String
+
+        function_name_bytes = String('symbol').to_bytes()
+        contract_script_bytes = self.nep17_contract.to_array()
+
+        expected_output = (
+            # nep17_symbol
+            Opcode.NEWARRAY0    # the method may return anything, so it's called with System.Contract.Call
+            + Opcode.PUSH15
+            + Opcode.PUSHDATA1
+            + Integer(len(function_name_bytes)).to_byte_array()
+            + function_name_bytes
+            + Opcode.PUSHDATA1
+            + Integer(len(contract_script_bytes)).to_byte_array()
+            + contract_script_bytes
+            + Opcode.SYSCALL
+            + Interop.CallContract.interop_method_hash
+            + Opcode.RET
+            # nep17_decimals
+            + Opcode.CALLT + b'\x00\x00'
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('ContractInterfaceAnyReturn.py')
+        self.assertEqual(expected_output, output)
+
+        path = self.get_contract_path('ContractInterfaceAnyReturn.py')
+        method_tokens = Compiler()._internal_compile(path).method_tokens
+        self.assertEqual(1, len(method_tokens))
+        self.assertEqual('decimals', method_tokens[0].method)
+
+    async def test_contract_interface_any_return_run(self):
+        await self.set_up_contract('ContractInterfaceAnyReturn.py')
+
+        result, _ = await self.call('nep17_symbol', [], return_type=str)
+        nep17_result, _ = await self.call('symbol', [], return_type=str,
+                                          target_contract=self.nep17_contract
+                                          )
+        self.assertEqual(nep17_result, result)
+
+        result, _ = await self.call('nep17_decimals', [], return_type=int)
+        nep17_result, _ = await self.call('decimals', [], return_type=int,
+                                          target_contract=self.nep17_contract
+                                          )
+        self.assertEqual(nep17_result, result)
+
     def test_contract_manual_interface_code_optimization_compile(self):
         from boa3.internal.model.builtin.interop.interop import Interop
         from boa3.internal.neo.vm.opcode.Opcode import Opcode
@@ -16,19 +16,14 @@ class TestDict(boatestcase.BoaTestCase):
             Opcode.INITSLOT
             + b'\x01'
             + b'\x00'
-            + Opcode.NEWMAP  # a = {1: 15, 2: 14, 3: 13}
-            + Opcode.DUP
-            + Opcode.PUSH1      # map[1] = 15
-            + Opcode.PUSH15
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH2      # map[2] = 14
+            + Opcode.PUSH13     # a = {1: 15, 2: 14, 3: 13}
+            + Opcode.PUSH3
             + Opcode.PUSH14
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH3      # map[3] = 13
-            + Opcode.PUSH13
-            + Opcode.SETITEM
+            + Opcode.PUSH2
+            + Opcode.PUSH15
+            + Opcode.PUSH1
+            + Opcode.PUSH3
+            + Opcode.PACKMAP
             + Opcode.STLOC0
             + Opcode.RET
         )
@@ -45,25 +40,20 @@ class TestDict(boatestcase.BoaTestCase):
             Opcode.INITSLOT
             + b'\x01'
             + b'\x00'
-            + Opcode.NEWMAP  # a = {'one': 1, 'two': 2, 'three': 3}
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['one'] = 1
-            + Integer(len(one)).to_byte_array(min_length=1)
-            + one
-            + Opcode.PUSH1
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['two'] = 2
-            + Integer(len(two)).to_byte_array(min_length=1)
-            + two
-            + Opcode.PUSH2
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['three'] = 3
+            + Opcode.PUSH3      # a = {'one': 1, 'two': 2, 'three': 3}
+            + Opcode.PUSHDATA1
             + Integer(len(three)).to_byte_array(min_length=1)
             + three
+            + Opcode.PUSH2
+            + Opcode.PUSHDATA1
+            + Integer(len(two)).to_byte_array(min_length=1)
+            + two
+            + Opcode.PUSH1
+            + Opcode.PUSHDATA1
+            + Integer(len(one)).to_byte_array(min_length=1)
+            + one
             + Opcode.PUSH3
-            + Opcode.SETITEM
+            + Opcode.PACKMAP
             + Opcode.STLOC0
             + Opcode.RET
         )
@@ -78,21 +68,16 @@ class TestDict(boatestcase.BoaTestCase):
             Opcode.INITSLOT
             + b'\x01'
             + b'\x00'
-            + Opcode.NEWMAP  # a = {1: True, 2: 4, 3: 'nine'}
-            + Opcode.DUP
-            + Opcode.PUSH1      # map[1] = True
-            + Opcode.PUSHT
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH2      # map[2] = 4
-            + Opcode.PUSH4
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH3      # map[3] = 'nine'
-            + Opcode.PUSHDATA1
+            + Opcode.PUSHDATA1  # a = {1: True, 2: 4, 3: 'nine'}
             + Integer(len(nine)).to_byte_array(min_length=1)
             + nine
-            + Opcode.SETITEM
+            + Opcode.PUSH3
+            + Opcode.PUSH4
+            + Opcode.PUSH2
+            + Opcode.PUSHT
+            + Opcode.PUSH1
+            + Opcode.PUSH3
+            + Opcode.PACKMAP
             + Opcode.STLOC0
             + Opcode.RET
         )
@@ -105,43 +90,29 @@ class TestDict(boatestcase.BoaTestCase):
             Opcode.INITSLOT
             + b'\x01'
             + b'\x00'
-            + Opcode.NEWMAP  # a = map
-            + Opcode.DUP
-            + Opcode.PUSH1      # map[1] = {14: False, 12: True, 5: True}
-            + Opcode.NEWMAP
-            + Opcode.DUP
-            + Opcode.PUSH14
-            + Opcode.PUSHF
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH12
-            + Opcode.PUSHT
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH5
+            + Opcode.PUSHF      # map[3] = {11: False}
+            + Opcode.PUSH11
+            + Opcode.PUSH1
+            + Opcode.PACKMAP
+            + Opcode.PUSH3
+            + Opcode.PUSHF      # map[2] = {0: True, 6: False}
+            + Opcode.PUSH6
             + Opcode.PUSHT
-            + Opcode.SETITEM
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH2      # map[2] = {0: True, 6: False}
-            + Opcode.NEWMAP
-            + Opcode.DUP
             + Opcode.PUSH0
+            + Opcode.PUSH2
+            + Opcode.PACKMAP
+            + Opcode.PUSH2
+            + Opcode.PUSHT      # map[1] = {14: False, 12: True, 5: True}
+            + Opcode.PUSH5
             + Opcode.PUSHT
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH6
-            + Opcode.PUSHF
-            + Opcode.SETITEM
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH3      # map[3] = {11: False}
-            + Opcode.NEWMAP
-            + Opcode.DUP
-            + Opcode.PUSH11
+            + Opcode.PUSH12
             + Opcode.PUSHF
-            + Opcode.SETITEM
-            + Opcode.SETITEM
+            + Opcode.PUSH14
+            + Opcode.PUSH3
+            + Opcode.PACKMAP
+            + Opcode.PUSH1
+            + Opcode.PUSH3      # a = map
+            + Opcode.PACKMAP
             + Opcode.STLOC0
             + Opcode.RET
         )
@@ -167,19 +138,14 @@ class TestDict(boatestcase.BoaTestCase):
             Opcode.INITSLOT
             + b'\x01'
             + b'\x00'
-            + Opcode.NEWMAP  # a = {1: 15, 2: 14, 3: 13}
-            + Opcode.DUP
-            + Opcode.PUSH1      # map[1] = 15
-            + Opcode.PUSH15
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH2      # map[2] = 14
+            + Opcode.PUSH13     # a = {1: 15, 2: 14, 3: 13}
+            + Opcode.PUSH3
             + Opcode.PUSH14
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH3      # map[3] = 13
-            + Opcode.PUSH13
-            + Opcode.SETITEM
+            + Opcode.PUSH2
+            + Opcode.PUSH15
+            + Opcode.PUSH1
+            + Opcode.PUSH3
+            + Opcode.PACKMAP
             + Opcode.STLOC0
             + Opcode.RET
         )
@@ -190,28 +156,23 @@ class TestDict(boatestcase.BoaTestCase):
     def test_dict_variable_keys_and_values(self):
         expected_output = (
             Opcode.INITSLOT
-            + b'\x04'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSH1   # a = 1
             + Opcode.STLOC0
             + Opcode.PUSH2   # b = 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSH3   # c = 3
-            + Opcode.STLOC2
-            + Opcode.NEWMAP  # d = {a: c, b: a, c: b}
-            + Opcode.DUP
-            + Opcode.PUSH1      # map[a] = c
+            + Opcode.STLOC0
+            + Opcode.PUSH2      # d = {a: c, b: a, c: b}
             + Opcode.PUSH3
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH2      # map[b] = a
             + Opcode.PUSH1
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSH3      # map[c] = b
             + Opcode.PUSH2
-            + Opcode.SETITEM
-            + Opcode.STLOC3
+            + Opcode.PUSH3
+            + Opcode.PUSH1
+            + Opcode.PUSH3
+            + Opcode.PACKMAP
+            + Opcode.STLOC0
             + Opcode.RET
         )
 
@@ -284,34 +245,22 @@ class TestDict(boatestcase.BoaTestCase):
         three = String('three').to_bytes()
 
         expected_output = (
-            Opcode.INITSLOT
-            + b'\x02'
-            + b'\x00'
-            + Opcode.NEWMAP  # a = {'one': 1, 'two': 2, 'three': 3}
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['one'] = 1
-            + Integer(len(one)).to_byte_array(min_length=1)
-            + one
-            + Opcode.PUSH1
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['two'] = 2
-            + Integer(len(two)).to_byte_array(min_length=1)
-            + two
-            + Opcode.PUSH2
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['three'] = 3
+            Opcode.PUSH3        # a = {'one': 1, 'two': 2, 'three': 3}
+            + Opcode.PUSHDATA1
             + Integer(len(three)).to_byte_array(min_length=1)
             + three
+            + Opcode.PUSH2
+            + Opcode.PUSHDATA1
+            + Integer(len(two)).to_byte_array(min_length=1)
+            + two
+            + Opcode.PUSH1
+            + Opcode.PUSHDATA1
+            + Integer(len(one)).to_byte_array(min_length=1)
+            + one
             + Opcode.PUSH3
-            + Opcode.SETITEM
-            + Opcode.STLOC0
-            + Opcode.LDLOC0  # b = a.keys()
-            + Opcode.KEYS
-            + Opcode.STLOC1
-            + Opcode.LDLOC1  # return b
-            + Opcode.RET
+            + Opcode.PACKMAP
+            + Opcode.KEYS    # b = a.keys()
+            + Opcode.RET     # return b
         )
 
         output, _ = self.assertCompile('KeysDict.py')
@@ -332,25 +281,20 @@ class TestDict(boatestcase.BoaTestCase):
             Opcode.INITSLOT
             + b'\x02'
             + b'\x00'
-            + Opcode.NEWMAP  # a = {'one': 1, 'two': 2, 'three': 3}
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['one'] = 1
-            + Integer(len(one)).to_byte_array(min_length=1)
-            + one
-            + Opcode.PUSH1
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['two'] = 2
-            + Integer(len(two)).to_byte_array(min_length=1)
-            + two
-            + Opcode.PUSH2
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['three'] = 3
+            + Opcode.PUSH3      # a = {'one': 1, 'two': 2, 'three': 3}
+            + Opcode.PUSHDATA1
             + Integer(len(three)).to_byte_array(min_length=1)
             + three
+            + Opcode.PUSH2
+            + Opcode.PUSHDATA1
+            + Integer(len(two)).to_byte_array(min_length=1)
+            + two
+            + Opcode.PUSH1
+            + Opcode.PUSHDATA1
+            + Integer(len(one)).to_byte_array(min_length=1)
+            + one
             + Opcode.PUSH3
-            + Opcode.SETITEM
+            + Opcode.PACKMAP
             + Opcode.STLOC0
             + Opcode.LDLOC0  # b = a.keys()
             + Opcode.KEYS
@@ -374,34 +318,22 @@ class TestDict(boatestcase.BoaTestCase):
         three = String('three').to_bytes()
 
         expected_output = (
-            Opcode.INITSLOT
-            + b'\x02'
-            + b'\x00'
-            + Opcode.NEWMAP  # a = {'one': 1, 'two': 2, 'three': 3}
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['one'] = 1
-            + Integer(len(one)).to_byte_array(min_length=1)
-            + one
-            + Opcode.PUSH1
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['two'] = 2
-            + Integer(len(two)).to_byte_array(min_length=1)
-            + two
-            + Opcode.PUSH2
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['three'] = 3
+            Opcode.PUSH3        # a = {'one': 1, 'two': 2, 'three': 3}
+            + Opcode.PUSHDATA1
             + Integer(len(three)).to_byte_array(min_length=1)
             + three
+            + Opcode.PUSH2
+            + Opcode.PUSHDATA1
+            + Integer(len(two)).to_byte_array(min_length=1)
+            + two
+            + Opcode.PUSH1
+            + Opcode.PUSHDATA1
+            + Integer(len(one)).to_byte_array(min_length=1)
+            + one
             + Opcode.PUSH3
-            + Opcode.SETITEM
-            + Opcode.STLOC0
-            + Opcode.LDLOC0  # b = a.values()
-            + Opcode.VALUES
-            + Opcode.STLOC1
-            + Opcode.LDLOC1  # return b
-            + Opcode.RET
+            + Opcode.PACKMAP
+            + Opcode.VALUES  # b = a.values()
+            + Opcode.RET     # return b
         )
 
         output, _ = self.assertCompile('ValuesDict.py')
@@ -422,25 +354,20 @@ class TestDict(boatestcase.BoaTestCase):
             Opcode.INITSLOT
             + b'\x02'
             + b'\x00'
-            + Opcode.NEWMAP  # a = {'one': 1, 'two': 2, 'three': 3}
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['one'] = 1
-            + Integer(len(one)).to_byte_array(min_length=1)
-            + one
-            + Opcode.PUSH1
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['two'] = 2
-            + Integer(len(two)).to_byte_array(min_length=1)
-            + two
-            + Opcode.PUSH2
-            + Opcode.SETITEM
-            + Opcode.DUP
-            + Opcode.PUSHDATA1  # map['three'] = 3
+            + Opcode.PUSH3      # a = {'one': 1, 'two': 2, 'three': 3}
+            + Opcode.PUSHDATA1
             + Integer(len(three)).to_byte_array(min_length=1)
             + three
+            + Opcode.PUSH2
+            + Opcode.PUSHDATA1
+            + Integer(len(two)).to_byte_array(min_length=1)
+            + two
+            + Opcode.PUSH1
+            + Opcode.PUSHDATA1
+            + Integer(len(one)).to_byte_array(min_length=1)
+            + one
             + Opcode.PUSH3
-            + Opcode.SETITEM
+            + Opcode.PACKMAP
             + Opcode.STLOC0
             + Opcode.LDLOC0  # b = a.values()
             + Opcode.VALUES
@@ -590,6 +517,17 @@ class TestDict(boatestcase.BoaTestCase):
         result, _ = await self.call('copy_dict', [{True: 1, False: 0}, True, 99], return_type=tuple[dict, dict])
         self.assertEqual(({True: 1, False: 0}, {True: 99, False: 0}), result)
 
+    async def test_dict_evaluation_order(self):
+        await self.set_up_contract('DictEvaluationOrder.py')
+
+        # the keys and values are evaluated in the order they are written, even though they are packed in reverse order
+        result, _ = await self.call('evaluation_order', [], return_type=list[str])
+        self.assertEqual(['key_1', 'value_1', 'key_2', 'value_2'], result)
+
+        result, _ = await self.call('Main', [], return_type=dict[str, str])
+        self.assertEqual({'key_1': 'value_1', 'key_2': 'value_2'}, result)
+        self.assertEqual(['key_1', 'key_2'], list(result))
+
     def test_del_dict_pair(self):
         self.assertCompilerLogs(CompilerError.NotSupportedOperation, 'DelPair.py')
 
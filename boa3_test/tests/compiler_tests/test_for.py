@@ -72,18 +72,25 @@ class TestFor(boatestcase.BoaTestCase):
 
     def test_for_iterator_condition_compile(self):
         from boa3.internal.model.builtin.interop.interop import Interop
+        from boa3.internal.neo.vm.InteropInfo import InteropInfo
         from boa3.internal.neo.vm.type.StackItem import StackItemType
 
-        call_method_address = Integer(39).to_byte_array(min_length=1, signed=True)
+        prefix = b'example'
         jmpif_address = Integer(20).to_byte_array(min_length=1, signed=True)
         jmp_address = Integer(-24).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x03'
+            + b'\x04'
             + b'\x00'
-            + Opcode.CALL       # value = get_iterator()
-            + call_method_address
+            + Opcode.PUSHDATA1  # value = get_iterator()    # get_iterator is inlined
+            + Integer(len(prefix)).to_byte_array() + prefix
+            + Opcode.STLOC3
+            + Opcode.PUSH4
+            + Opcode.PUSHDATA1
+            + Integer(len(prefix)).to_byte_array() + prefix
+            + Opcode.SYSCALL
+            + InteropInfo.get_method_hash('System.Storage.Local.Find')
             + Opcode.STLOC0
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC1
@@ -228,7 +235,7 @@ class TestFor(boatestcase.BoaTestCase):
 
         expected_output = (
             Opcode.INITSLOT
-            + b'\x03'
+            + b'\x02'
             + b'\x00'
             + Opcode.PUSH0      # a = 0
             + Opcode.STLOC0
@@ -237,8 +244,6 @@ class TestFor(boatestcase.BoaTestCase):
             + Opcode.PUSH3
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # for_sequence = sequence
             + Opcode.PUSH0      # for_index = 0
             + Opcode.JMP
             + jmpif_address
@@ -253,9 +258,9 @@ class TestFor(boatestcase.BoaTestCase):
             + Opcode.SIZE
             + Opcode.ADD
             + Opcode.PICKITEM
-            + Opcode.STLOC2
+            + Opcode.STLOC1
             + Opcode.LDLOC0         # a = a + x
-            + Opcode.LDLOC2
+            + Opcode.LDLOC1
             + Opcode.ADD
             + Opcode.STLOC0
             + Opcode.INC            # for_index = for_index + 1
@@ -271,9 +276,7 @@ class TestFor(boatestcase.BoaTestCase):
             + Opcode.LDLOC0     # a = a + 1
             + Opcode.PUSH1
             + Opcode.ADD
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         output, _ = self.assertCompile('ForElse.py')
@@ -366,3 +369,77 @@ class TestFor(boatestcase.BoaTestCase):
 
         result, _ = await self.call('main', [3], return_type=list)
         self.assertEqual([0, 0, 0], result)
+
+    def test_for_range_counter_compile(self):
+        jmpif_address = Integer(-10).to_byte_array(min_length=1, signed=True)
+
+        expected_output = (
+            Opcode.INITSLOT
+            + b'\x02'
+            + b'\x01'
+            + Opcode.PUSH0      # total = 0
+            + Opcode.STLOC0
+            + Opcode.LDARG0     # for_limit = n
+            + Opcode.PUSH0      # for_counter = 0
+            + Opcode.JMP        # begin for
+            + Integer(9).to_byte_array(min_length=1, signed=True)
+            + Opcode.DUP            # x = for_counter
+            + Opcode.STLOC1
+            + Opcode.LDLOC0         # total += x
+            + Opcode.LDLOC1
+            + Opcode.ADD
+            + Opcode.STLOC0
+            + Opcode.INC            # for_counter += 1
+            + Opcode.OVER       # if for_counter < for_limit
+            + Opcode.OVER
+            + Opcode.GT
+            + Opcode.JMPIF      # end for
+            + jmpif_address
+            + Opcode.DROP
+            + Opcode.DROP
+            + Opcode.LDLOC0     # return total
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('ForRange.py')
+        self.assertEqual(expected_output, output)
+        self.assertNotIn(Opcode.APPEND, output)
+
+    async def test_for_range_counter_run(self):
+        await self.set_up_contract('ForRange.py')
+
+        result, _ = await self.call('Main', [5], return_type=int)
+        self.assertEqual(10, result)
+
+        result, _ = await self.call('Main', [0], return_type=int)
+        self.assertEqual(0, result)
+
+        result, _ = await self.call('Main', [-3], return_type=int)
+        self.assertEqual(0, result)
+
+    async def test_for_range_negative_step(self):
+        await self.set_up_contract('ForRangeStep.py')
+
+        result, _ = await self.call('Main', [10, 3], return_type=list[int])
+        self.assertEqual(list(range(10, 3, -2)), result)
+
+        result, _ = await self.call('Main', [3, 10], return_type=list[int])
+        self.assertEqual([], result)
+
+    async def test_for_reversed_range(self):
+        await self.set_up_contract('ForReversedRange.py')
+
+        result, _ = await self.call('Main', [2, 6], return_type=list[int])
+        self.assertEqual(list(reversed(range(2, 6))), result)
+
+        result, _ = await self.call('Main', [6, 2], return_type=list[int])
+        self.assertEqual([], result)
+
+    async def test_for_range_len(self):
+        await self.set_up_contract('ForRangeLen.py')
+
+        result, _ = await self.call('Main', [[3, -1, 2, 200, 5]], return_type=int)
+        self.assertEqual(4, result)
+
+        result, _ = await self.call('Main', [[]], return_type=int)
+        self.assertEqual(0, result)
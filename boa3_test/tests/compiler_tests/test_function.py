@@ -205,19 +205,9 @@ class TestFunction(boatestcase.BoaTestCase):
         self.assertEqual(True, result)
 
     def test_call_function_without_args_compile(self):
-        called_function_address = Integer(5).to_byte_array(min_length=1, signed=True)
-
         expected_output = (
-            Opcode.INITSLOT  # Main
-            + b'\x01'
-            + b'\x00'
-            + Opcode.CALL  # a = TestFunction()
-            + called_function_address
-            + Opcode.STLOC0
-            + Opcode.LDLOC0  # return a
-            + Opcode.RET
-            + Opcode.PUSH1  # TestFunction
-            + Opcode.RET  # return 1
+            Opcode.PUSH1  # a = TestFunction()    # TestFunction is inlined
+            + Opcode.RET  # return a
         )
 
         output, _ = self.assertCompile('CallReturnFunctionWithoutArgs.py')
@@ -259,26 +249,18 @@ class TestFunction(boatestcase.BoaTestCase):
         self.assertEqual(True, result)
 
     def test_call_function_with_literal_args_compile(self):
-        called_function_address = Integer(5).to_byte_array(min_length=1, signed=True)
-
         expected_output = (
             Opcode.INITSLOT  # Main
-            + b'\x01'
+            + b'\x02'
             + b'\x00'
             + Opcode.PUSH2  # a = TestAdd(1, 2)
             + Opcode.PUSH1
-            + Opcode.CALL
-            + called_function_address
-            + Opcode.STLOC0
-            + Opcode.LDLOC0  # return a
-            + Opcode.RET
-            + Opcode.INITSLOT  # TestFunction
-            + b'\x00'
-            + b'\x02'
-            + Opcode.LDARG0  # return a + b
-            + Opcode.LDARG1
+            + Opcode.STLOC0  # TestAdd is inlined, its arguments are stored in Main's local variables
+            + Opcode.STLOC1
+            + Opcode.LDLOC0  # return a + b
+            + Opcode.LDLOC1
             + Opcode.ADD
-            + Opcode.RET  # return
+            + Opcode.RET  # return a
         )
 
         output, _ = self.assertCompile('CallReturnFunctionWithLiteralArgs.py')
@@ -291,8 +273,6 @@ class TestFunction(boatestcase.BoaTestCase):
         self.assertEqual(3, result)
 
     def test_call_void_function_with_variable_args_compile(self):
-        called_function_address = Integer(4).to_byte_array(min_length=1, signed=True)
-
         expected_output = (
             Opcode.INITSLOT  # Main
             + b'\x02'
@@ -300,21 +280,17 @@ class TestFunction(boatestcase.BoaTestCase):
             + Opcode.PUSH1  # a = 1
             + Opcode.STLOC0
             + Opcode.PUSH2  # b = 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSH2  # TestAdd(a, b)
             + Opcode.PUSH1
-            + Opcode.CALL
-            + called_function_address
-            + Opcode.PUSHT  # return True
-            + Opcode.RET
-            + Opcode.INITSLOT  # TestFunction
-            + b'\x01'
-            + b'\x02'
-            + Opcode.LDARG0  # c = a + b
-            + Opcode.LDARG1
+            + Opcode.STLOC0  # TestAdd is inlined, its arguments are stored in Main's local variables
+            + Opcode.STLOC1
+            + Opcode.LDLOC0  # c = a + b
+            + Opcode.LDLOC1
             + Opcode.ADD
             + Opcode.STLOC0
-            + Opcode.RET  # return
+            + Opcode.PUSHT  # return True
+            + Opcode.RET
         )
 
         output, _ = self.assertCompile('CallVoidFunctionWithVariableArgs.py')
@@ -327,23 +303,21 @@ class TestFunction(boatestcase.BoaTestCase):
         self.assertEqual(True, result)
 
     def test_call_function_with_variable_args_compile(self):
-        called_function_address = Integer(5).to_byte_array(min_length=1, signed=True)
+        called_function_address = Integer(3).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
             Opcode.INITSLOT  # Main
-            + b'\x03'
+            + b'\x01'
             + b'\x02'
             + Opcode.PUSH1  # a = 1
             + Opcode.STLOC0
             + Opcode.PUSH2  # b = 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSH2  # c = TestAdd(a, b)
             + Opcode.PUSH1
             + Opcode.CALL
             + called_function_address
-            + Opcode.STLOC2
-            + Opcode.LDLOC2  # return c
-            + Opcode.RET
+            + Opcode.RET  # return c
             + Opcode.INITSLOT  # TestFunction
             + b'\x00'
             + b'\x02'
@@ -363,8 +337,6 @@ class TestFunction(boatestcase.BoaTestCase):
         self.assertEqual(3, result)
 
     def test_call_function_on_return_compile(self):
-        called_function_address = Integer(3).to_byte_array(min_length=1, signed=True)
-
         expected_output = (
             Opcode.INITSLOT  # Main
             + b'\x02'
@@ -372,19 +344,15 @@ class TestFunction(boatestcase.BoaTestCase):
             + Opcode.PUSH1  # a = 1
             + Opcode.STLOC0
             + Opcode.PUSH2  # b = 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSH2  # return TestAdd(a, b)
             + Opcode.PUSH1
-            + Opcode.CALL
-            + called_function_address
-            + Opcode.RET
-            + Opcode.INITSLOT  # TestFunction
-            + b'\x00'
-            + b'\x02'
-            + Opcode.LDARG0  # return a + b
-            + Opcode.LDARG1
+            + Opcode.STLOC0  # TestAdd is inlined, its arguments are stored in Main's local variables
+            + Opcode.STLOC1
+            + Opcode.LDLOC0  # return a + b
+            + Opcode.LDLOC1
             + Opcode.ADD
-            + Opcode.RET  # return
+            + Opcode.RET
         )
 
         output, _ = self.assertCompile('CallReturnFunctionOnReturn.py')
@@ -397,15 +365,11 @@ class TestFunction(boatestcase.BoaTestCase):
         self.assertEqual(3, result)
 
     def test_call_function_without_variables_compile(self):
-        main_to_one_address = Integer(-10).to_byte_array(min_length=1, signed=True)
-        main_to_two_address = Integer(5).to_byte_array(min_length=1, signed=True)
-        two_to_one_address = Integer(-24).to_byte_array(min_length=1, signed=True)
-        end_if = Integer(5).to_byte_array(min_length=1, signed=True)
+        end_if = Integer(4).to_byte_array(min_length=1, signed=True)
+        end_elif = Integer(6).to_byte_array(min_length=1, signed=True)
 
         expected_output = (
-            Opcode.PUSH1  # One
-            + Opcode.RET  # return 1
-            + Opcode.INITSLOT  # Main
+            Opcode.INITSLOT  # Main
             + b'\x00'
             + b'\x01'
             + Opcode.LDARG0  # if arg0 == 1
@@ -413,24 +377,19 @@ class TestFunction(boatestcase.BoaTestCase):
             + Opcode.NUMEQUAL
             + Opcode.JMPIFNOT
             + end_if
-            + Opcode.CALL  # return One()
-            + main_to_one_address
+            + Opcode.PUSH1  # return One()     # One and Two are inlined
             + Opcode.RET
             + Opcode.LDARG0  # elif arg0 == 2
             + Opcode.PUSH2
             + Opcode.NUMEQUAL
             + Opcode.JMPIFNOT
-            + end_if
-            + Opcode.CALL  # return Two()
-            + main_to_two_address
+            + end_elif
+            + Opcode.PUSH1  # return Two()
+            + Opcode.PUSH1
+            + Opcode.ADD
             + Opcode.RET
             + Opcode.PUSH0  # default return
             + Opcode.RET
-            + Opcode.PUSH1  # Two
-            + Opcode.CALL  # return 1 + One()
-            + two_to_one_address
-            + Opcode.ADD
-            + Opcode.RET
         )
 
         output, _ = self.assertCompile('CallFunctionWithoutVariables.py')
@@ -543,10 +502,9 @@ class TestFunction(boatestcase.BoaTestCase):
             + b'\x01'
             + Opcode.LDARG0  # return 5 if condition else 10
             + Opcode.JMPIFNOT
-            + Integer(5).to_byte_array(min_length=1, signed=True)
+            + Integer(4).to_byte_array(min_length=1, signed=True)
             + Opcode.PUSH5  # 5
-            + Opcode.JMP  # else
-            + Integer(3).to_byte_array(min_length=1, signed=True)
+            + Opcode.RET  # else
             + Opcode.PUSH10  # 10
             + Opcode.RET  # return
         )
@@ -574,7 +532,7 @@ class TestFunction(boatestcase.BoaTestCase):
             + Opcode.LDARG0  # for_sequence = arg0
             + Opcode.PUSH0  # for_index = 0
             + Opcode.JMP  # begin for
-            + Integer(19).to_byte_array(min_length=1, signed=True)
+            + Integer(18).to_byte_array(min_length=1, signed=True)
             + Opcode.OVER  # value = for_sequence[for_index]
             + Opcode.OVER
             + Opcode.DUP
@@ -591,19 +549,17 @@ class TestFunction(boatestcase.BoaTestCase):
             + Opcode.DROP
             + Opcode.LDLOC0  # return value
             + Opcode.RET
-            + Opcode.INC  # for_index = for_index + 1
             + Opcode.DUP  # if for_index < len(for_sequence)
             + Opcode.PUSH2
             + Opcode.PICK
             + Opcode.SIZE
             + Opcode.LT
             + Opcode.JMPIF
-            + Integer(-22).to_byte_array(min_length=1, signed=True)
+            + Integer(-21).to_byte_array(min_length=1, signed=True)
             + Opcode.DROP
             + Opcode.DROP
             + Opcode.PUSH5  # else
             + Opcode.RET  # return 5
-            + Opcode.RET
         )
 
         output, _ = self.assertCompile('ReturnFor.py')
@@ -660,7 +616,6 @@ class TestFunction(boatestcase.BoaTestCase):
             + Opcode.DROP
             + Opcode.LDLOC0  # else
             + Opcode.RET  # return x
-            + Opcode.RET
         )
 
         output, _ = self.assertCompile('ReturnForOnlyOnElse.py')
@@ -678,6 +633,17 @@ class TestFunction(boatestcase.BoaTestCase):
         result, _ = await self.call('Main', [[]], return_type=int)
         self.assertEqual(0, result)
 
+    def test_function_called_only_by_unused_function(self):
+        expected_output = (
+            Opcode.PUSHINT8  # Main
+            + Integer(42).to_byte_array(min_length=1)
+            + Opcode.RET
+        )
+
+        # inner_function is never executed, so its code is removed from the script
+        output, _ = self.assertCompile('FunctionCalledOnlyByUnusedFunction.py')
+        self.assertEqual(expected_output, output)
+
     def test_missing_return_inside_for_else(self):
         self.assertCompilerLogs(CompilerError.MissingReturnStatement, 'ReturnForElseMissing.py')
 
@@ -689,21 +655,18 @@ class TestFunction(boatestcase.BoaTestCase):
             + Opcode.LDARG0  # x = arg0
             + Opcode.STLOC0
             + Opcode.JMP  # begin while
-            + Integer(8).to_byte_array(min_length=1, signed=True)
+            + Integer(6).to_byte_array(min_length=1, signed=True)
             + Opcode.LDLOC0  # x += 1
             + Opcode.PUSH1
             + Opcode.ADD
-            + Opcode.STLOC0
-            + Opcode.LDLOC0  # return x
-            + Opcode.RET
+            + Opcode.RET  # return x
             + Opcode.LDLOC0
             + Opcode.PUSH10
             + Opcode.LT
             + Opcode.JMPIF  # end while x < 10
-            + Integer(-9).to_byte_array(min_length=1, signed=True)
+            + Integer(-7).to_byte_array(min_length=1, signed=True)
             + Opcode.LDLOC0  # else
             + Opcode.RET  # return x
-            + Opcode.RET
         )
 
         output, _ = self.assertCompile('ReturnWhile.py')
@@ -724,6 +687,19 @@ class TestFunction(boatestcase.BoaTestCase):
         result, _ = await self.call('Main', [100], return_type=int)
         self.assertEqual(100, result)
 
+    def test_return_inside_while_method_range(self):
+        path = self.get_contract_path('ReturnWhile.py')
+        output, _ = self.compile_and_save(path, debug=True)
+        debug_info = self.get_debug_info(path)
+
+        self.assertIn('methods', debug_info)
+        self.assertEqual(1, len(debug_info['methods']))
+
+        # the last instruction of the method is unreachable and is removed
+        debug_method = debug_info['methods'][0]
+        self.assertEqual('0-{0}'.format(len(output)), debug_method['range'])
+        self.assertGreater(len(debug_method['sequence-points']), 0)
+
     def test_missing_return_inside_while_compile(self):
         expected_output = (
             Opcode.INITSLOT  # Main
@@ -744,7 +720,6 @@ class TestFunction(boatestcase.BoaTestCase):
             + Integer(-7).to_byte_array(min_length=1, signed=True)
             + Opcode.LDLOC0  # else
             + Opcode.RET  # return x
-            + Opcode.RET
         )
 
         output, _ = self.assertCompile('ReturnWhileOnlyOnElse.py')
@@ -810,21 +785,19 @@ class TestFunction(boatestcase.BoaTestCase):
     def test_function_with_default_argument_compile(self):
         expected_output = (
             Opcode.INITSLOT
-            + b'\x02'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSH3  # x = add(1, 2, 3)
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.CALL
-            + Integer(14).to_byte_array(signed=True, min_length=1)
+            + Integer(12).to_byte_array(signed=True, min_length=1)
             + Opcode.STLOC0
             + Opcode.PUSH0
             + Opcode.PUSH6  # y = add(5, 6)
             + Opcode.PUSH5
             + Opcode.CALL
-            + Integer(8).to_byte_array(signed=True, min_length=1)
-            + Opcode.STLOC1
-            + Opcode.LDLOC1
+            + Integer(6).to_byte_array(signed=True, min_length=1)
             + Opcode.LDLOC0
             + Opcode.PUSH2
             + Opcode.PACK
@@ -0,0 +1,130 @@
+from boa3.internal import constants
+from boa3.internal.compiler.compiler import Compiler
+from boa3.internal.compiler.gasreport import GasReport
+from boa3.internal.neo.vm.InteropInfo import InteropInfo
+from boa3.internal.neo.vm.opcode.OpcodeInfo import OpcodeInfo
+from boa3_test.tests import boatestcase
+
+
+class TestGasEstimation(boatestcase.BoaTestCase):
+    default_folder: str = 'test_sc/gas_estimation_test'
+
+    def get_gas_report(self, *args: str) -> GasReport:
+        path = self.get_contract_path(*args)
+        compiler = Compiler()
+        with boatestcase._COMPILER_LOCK:
+            compiler.compile(path)
+            return compiler.generate_gas_report()
+
+    def test_opcode_prices(self):
+        self.assertEqual(1, OpcodeInfo.PUSH1.price)
+        self.assertEqual(1 << 3, OpcodeInfo.ADD.price)
+        self.assertEqual(1 << 6, OpcodeInfo.INITSLOT.price)
+        self.assertEqual(1 << 9, OpcodeInfo.CALL.price)
+        self.assertEqual(1 << 11, OpcodeInfo.PACK.price)
+        self.assertEqual(0, OpcodeInfo.RET.price)
+
+    def test_interop_prices(self):
+        check_witness = InteropInfo.get_method_hash('System.Runtime.CheckWitness')
+        self.assertEqual(1 << 10, InteropInfo.get_price(check_witness))
+        self.assertFalse(InteropInfo.has_dynamic_price(check_witness))
+
+        storage_put = InteropInfo.get_method_hash('System.Storage.Put')
+        self.assertEqual(1 << 15, InteropInfo.get_price(storage_put))
+        self.assertTrue(InteropInfo.has_dynamic_price(storage_put))
+
+        self.assertIsNone(InteropInfo.get_price(b'\x00\x00\x00\x00'))
+        self.assertTrue(InteropInfo.has_dynamic_price(b'\x00\x00\x00\x00'))
+
+    def test_gas_estimation_single_block(self):
+        expected_price = (
+            OpcodeInfo.INITSLOT.price
+            + OpcodeInfo.LDARG0.price
+            + OpcodeInfo.LDARG1.price
+            + OpcodeInfo.ADD.price
+            + OpcodeInfo.RET.price
+        )
+
+        report = self.get_gas_report('test_sc/arithmetic_test', 'Addition.py')
+        estimation = report.get_method('add')
+        self.assertIsNotNone(estimation)
+
+        self.assertEqual(expected_price, estimation.best_price)
+        self.assertEqual(expected_price, estimation.worst_price)
+        self.assertEqual(expected_price * constants.DEFAULT_EXEC_FEE_FACTOR, estimation.best_gas)
+        self.assertEqual(1, len(estimation.blocks))
+        self.assertEqual(0, len(estimation.loops))
+        self.assertFalse(estimation.has_dynamic_price)
+
+    def test_gas_estimation_method_without_start(self):
+        path = self.get_contract_path('test_sc/arithmetic_test', 'Addition.py')
+        compiler = Compiler()
+        with boatestcase._COMPILER_LOCK:
+            compiler.compile(path)
+            # a method without instructions can't be estimated, so it isn't reported with another method's price
+            compiler._analyser.symbol_table['add'].init_bytecode = None
+            report = compiler.generate_gas_report()
+
+        self.assertIsNone(report.get_method('add'))
+
+    def test_gas_estimation_branches(self):
+        report = self.get_gas_report('IfElseBranches.py')
+        estimation = report.get_method('Main')
+
+        self.assertLess(estimation.best_price, estimation.worst_price)
+        self.assertGreater(len(estimation.blocks), 1)
+        self.assertEqual(0, len(estimation.loops))
+
+    def test_gas_estimation_loop(self):
+        report = self.get_gas_report('LoopSum.py')
+        estimation = report.get_method('Main')
+
+        self.assertEqual(1, len(estimation.loops))
+        loop = estimation.loops[0]
+        self.assertGreater(loop.best_price, 0)
+        self.assertLessEqual(loop.best_price, loop.worst_price)
+
+        # the loop is not repeated in the estimation of the method
+        self.assertLess(estimation.worst_price, sum(block.worst_price for block in estimation.blocks))
+
+    def test_gas_estimation_inner_call(self):
+        report = self.get_gas_report('InnerCall.py')
+        main = report.get_method('Main')
+        inner = report.get_method('inner')
+
+        self.assertGreaterEqual(main.best_price, inner.best_price + OpcodeInfo.CALL.price)
+        self.assertGreaterEqual(main.worst_price, inner.worst_price + OpcodeInfo.CALL.price)
+        self.assertFalse(main.has_dynamic_price)
+
+    def test_gas_estimation_recursive_call(self):
+        report = self.get_gas_report('RecursiveCall.py')
+        estimation = report.get_method('Main')
+
+        self.assertTrue(estimation.has_dynamic_price)
+        self.assertLess(estimation.best_price, estimation.worst_price)
+        self.assertIn('Main: best', str(report))
+        self.assertIn('plus dynamic fees', str(report))
+
+    def test_gas_estimation_syscall(self):
+        check_witness = InteropInfo.get_method_hash('System.Runtime.CheckWitness')
+
+        report = self.get_gas_report('test_sc/runtime_test', 'CheckWitness.py')
+        estimation = report.get_method('Main')
+
+        self.assertGreater(estimation.best_price, InteropInfo.get_price(check_witness))
+
+    def test_gas_estimation_debug_info(self):
+        path = self.get_contract_path('LoopSum.py')
+        self.compile_and_save(path, debug=True)
+        debug_info = self.get_debug_info(path)
+
+        self.assertEqual(1, len(debug_info['methods']))
+        debug_method = debug_info['methods'][0]
+        self.assertIn('gas', debug_method)
+
+        gas_info = debug_method['gas']
+        self.assertLessEqual(gas_info['best'], gas_info['worst'])
+        self.assertFalse(gas_info['dynamic'])
+        self.assertGreater(len(gas_info['blocks']), 0)
+        self.assertEqual(1, len(gas_info['loops']))
+        self.assertIn('range', gas_info['loops'][0])
@@ -288,18 +288,15 @@ class TestIf(boatestcase.BoaTestCase):
     def test_if_expression_variable_condition_compile(self):
         expected_output = (
             Opcode.INITSLOT
-            + b'\x01'
+            + b'\x00'
             + b'\x01'
             + Opcode.LDARG0
             + Opcode.JMPIFNOT   # a = 2 if arg0 else 3
-            + Integer(5).to_byte_array(min_length=1, signed=True)
+            + Integer(4).to_byte_array(min_length=1, signed=True)
             + Opcode.PUSH2      # 2
-            + Opcode.JMP        # else
-            + Integer(3).to_byte_array(min_length=1, signed=True)
+            + Opcode.RET        # else
             + Opcode.PUSH3      # 3
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         output, _ = self.assertCompile('IfExpVariableCondition.py')
@@ -321,18 +318,15 @@ class TestIf(boatestcase.BoaTestCase):
     def test_if_expression_mismatched_types_compile(self):
         expected_output = (
             Opcode.INITSLOT
-            + b'\x01'
+            + b'\x00'
             + b'\x01'
             + Opcode.LDARG0
             + Opcode.JMPIFNOT   # a = 2 if condition else None
-            + Integer(5).to_byte_array(min_length=1, signed=True)
+            + Integer(4).to_byte_array(min_length=1, signed=True)
             + Opcode.PUSH2      # 2
-            + Opcode.JMP        # else
-            + Integer(3).to_byte_array(min_length=1, signed=True)
+            + Opcode.RET        # else
             + Opcode.PUSHNULL   # None
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         output, _ = self.assertCompile('IfMismatchedIfExp.py')
@@ -537,6 +531,12 @@ class TestIf(boatestcase.BoaTestCase):
         result, _ = await self.call('main', ['hash160', b'abc', 4], return_type=bytes)
         self.assertEqual(hash160(String('abc').to_bytes()), result)
 
+    def test_boa2_test_many_elif_compile(self):
+        output, _ = self.assertCompile('IfTestManyElifBoa2.py')
+        # the elif chain compares the same variable with constants, so it's compiled as a binary search
+        self.assertIn(Opcode.JMPLT, output)
+        self.assertNotIn(Opcode.NUMEQUAL, output)
+
     async def test_boa2_test_many_elif(self):
         await self.set_up_contract('IfTestManyElifBoa2.py')
 
@@ -138,6 +138,45 @@ class TestImport(boatestcase.BoaTestCase):
         result, _ = await self.call('get_bar', [], return_type=str)
         self.assertEqual('bar', result)
 
+    def test_import_constant_variables_compile(self):
+        owner = b'\x01' * 20
+        fee = Integer(1000).to_byte_array(min_length=2, signed=True)
+
+        expected_output = (
+            Opcode.PUSHDATA1    # return OWNER
+            + Integer(len(owner)).to_byte_array(min_length=1)
+            + owner
+            + Opcode.RET
+            + Opcode.PUSHINT16  # return FEE
+            + fee
+            + Opcode.RET
+            + Opcode.LDSFLD0    # return COUNTER
+            + Opcode.RET
+            + Opcode.INITSSLOT  # only COUNTER is stored, because it's assigned twice
+            + b'\x01'
+            + Opcode.PUSH1
+            + Opcode.STSFLD0
+            + Opcode.PUSH2
+            + Opcode.STSFLD0
+            + Opcode.RET
+        )
+
+        path = self.get_contract_path('variable_import', 'ImportConstantVariables.py')
+        output, _ = self.assertCompile(path)
+        self.assertEqual(expected_output, output)
+
+    async def test_import_constant_variables_run(self):
+        await self.set_up_contract('variable_import', 'ImportConstantVariables.py')
+
+        result, _ = await self.call('get_owner', [], return_type=bytes)
+        self.assertEqual(b'\x01' * 20, result)
+
+        result, _ = await self.call('get_fee', [], return_type=int)
+        self.assertEqual(1000, result)
+
+        result, _ = await self.call('get_counter', [], return_type=int)
+        self.assertEqual(2, result)
+
     def test_typing_python_library(self):
         self.assertCompilerLogs(CompilerError.UnresolvedReference, 'ImportPythonLib.py')
 
@@ -168,13 +207,8 @@ class TestImport(boatestcase.BoaTestCase):
 
     def test_from_import_all_compile(self):
         expected_output = (
-            Opcode.INITSLOT  # function signature
-            + b'\x01'
-            + b'\x00'
-            + Opcode.CALL
-            + Integer(7).to_byte_array(min_length=1, signed=True)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
+            Opcode.CALL
+            + Integer(5).to_byte_array(min_length=1, signed=True)
             + Opcode.RET
             + Opcode.LDSFLD0  # return empty_list
             + Opcode.RET
@@ -200,13 +234,8 @@ class TestImport(boatestcase.BoaTestCase):
 
     def test_from_import_user_module_compile(self):
         expected_output = (
-            Opcode.INITSLOT  # function signature
-            + b'\x01'
-            + b'\x00'
-            + Opcode.CALL
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
+            Opcode.CALL
+            + Integer(3).to_byte_array(min_length=1, signed=True)
             + Opcode.RET
             + Opcode.NEWARRAY0  # imported function
             + Opcode.RET  # return
@@ -227,13 +256,8 @@ class TestImport(boatestcase.BoaTestCase):
 
     def test_from_import_user_module_with_alias_compile(self):
         expected_output = (
-            Opcode.INITSLOT  # function signature
-            + b'\x01'
-            + b'\x00'
-            + Opcode.CALL
-            + Integer(5).to_byte_array(min_length=1, signed=True)
-            + Opcode.STLOC0
-            + Opcode.LDLOC0
+            Opcode.CALL
+            + Integer(3).to_byte_array(min_length=1, signed=True)
             + Opcode.RET
             + Opcode.NEWARRAY0  # imported function
             + Opcode.RET  # return
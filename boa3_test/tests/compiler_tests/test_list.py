@@ -14,17 +14,12 @@ class TestList(boatestcase.BoaTestCase):
 
     def test_list_int_values(self):
         expected_output = (
-            Opcode.INITSLOT     # function signature
-            + b'\x01'
-            + b'\x00'
-            + Opcode.PUSH3      # a = [1, 2, 3]
+            Opcode.PUSH3        # a = [1, 2, 3]
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH3      # array length
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         output, _ = self.assertCompile('IntList.py')
@@ -77,20 +72,20 @@ class TestList(boatestcase.BoaTestCase):
     def test_list_variable_values(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x04'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSH1      # a = 1
             + Opcode.STLOC0
             + Opcode.PUSH2      # b = 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSH3      # c = 3
-            + Opcode.STLOC2
+            + Opcode.STLOC0
             + Opcode.PUSH3      # d = [a, b, c]
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH3      # array length
             + Opcode.PACK
-            + Opcode.STLOC3
+            + Opcode.STLOC0
             + Opcode.RET        # return
         )
 
@@ -1064,19 +1059,14 @@ class TestList(boatestcase.BoaTestCase):
 
     def test_list_pop_compile(self):
         expected_output = (
-            Opcode.INITSLOT     # function signature
-            + b'\x02'
-            + b'\x00'
-            + Opcode.PUSH5      # a = [1, 2, 3, 4, 5]
+            Opcode.PUSH5        # a = [1, 2, 3, 4, 5]
             + Opcode.PUSH4
             + Opcode.PUSH3
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH5
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # b = a.pop()
-            + Opcode.PUSHM1
+            + Opcode.PUSHM1     # b = a.pop()
             + Opcode.DUP
             + Opcode.SIGN
             + Opcode.PUSHM1
@@ -1091,9 +1081,7 @@ class TestList(boatestcase.BoaTestCase):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         output, _ = self.assertCompile('PopList.py')
         self.assertEqual(expected_output, output)
@@ -1150,19 +1138,14 @@ class TestList(boatestcase.BoaTestCase):
 
     def test_list_pop_literal_argument_compile(self):
         expected_output = (
-            Opcode.INITSLOT     # function signature
-            + b'\x02'
-            + b'\x00'
-            + Opcode.PUSH5      # a = [1, 2, 3, 4, 5]
+            Opcode.PUSH5        # a = [1, 2, 3, 4, 5]
             + Opcode.PUSH4
             + Opcode.PUSH3
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH5
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # b = a.pop(2)
-            + Opcode.PUSH2
+            + Opcode.PUSH2      # b = a.pop(2)
             + Opcode.DUP
             + Opcode.SIGN
             + Opcode.PUSHM1
@@ -1177,9 +1160,7 @@ class TestList(boatestcase.BoaTestCase):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         output, _ = self.assertCompile('PopListLiteralArgument.py')
         self.assertEqual(expected_output, output)
@@ -1193,19 +1174,14 @@ class TestList(boatestcase.BoaTestCase):
 
     def test_list_pop_literal_negative_argument_compile(self):
         expected_output = (
-            Opcode.INITSLOT     # function signature
-            + b'\x02'
-            + b'\x00'
-            + Opcode.PUSH5      # a = [1, 2, 3, 4, 5]
+            Opcode.PUSH5        # a = [1, 2, 3, 4, 5]
             + Opcode.PUSH4
             + Opcode.PUSH3
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH5
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # b = a.pop(-2)
-            + Opcode.PUSH2
+            + Opcode.PUSH2      # b = a.pop(-2)
             + Opcode.NEGATE
             + Opcode.DUP
             + Opcode.SIGN
@@ -1221,9 +1197,7 @@ class TestList(boatestcase.BoaTestCase):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         output, _ = self.assertCompile('PopListLiteralNegativeArgument.py')
         self.assertEqual(expected_output, output)
@@ -1237,7 +1211,7 @@ class TestList(boatestcase.BoaTestCase):
     def test_list_pop_literal_variable_argument_compile(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x02'
+            + b'\x00'
             + b'\x01'
             + Opcode.PUSH5      # a = [1, 2, 3, 4, 5]
             + Opcode.PUSH4
@@ -1246,9 +1220,7 @@ class TestList(boatestcase.BoaTestCase):
             + Opcode.PUSH1
             + Opcode.PUSH5
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # b = a.pop(arg0)
-            + Opcode.LDARG0
+            + Opcode.LDARG0     # b = a.pop(arg0)
             + Opcode.DUP
             + Opcode.SIGN
             + Opcode.PUSHM1
@@ -1263,9 +1235,7 @@ class TestList(boatestcase.BoaTestCase):
             + Opcode.REVERSE3
             + Opcode.SWAP
             + Opcode.REMOVE
-            + Opcode.STLOC1
-            + Opcode.LDLOC1     # return b
-            + Opcode.RET
+            + Opcode.RET        # return b
         )
         output, _ = self.assertCompile('PopListVariableArgument.py')
         self.assertEqual(expected_output, output)
@@ -1712,6 +1682,30 @@ class TestList(boatestcase.BoaTestCase):
         result, _ = await self.call('sort_test', [], return_type=list)
         self.assertEqual(sorted_list, result)
 
+    def test_list_sort_multiple_calls_compile(self):
+        output, _ = self.assertCompile('SortListMultipleCalls.py')
+
+        # the sort is generated only once, so the list is copied only in one place
+        self.assertEqual(1, output.count(Opcode.UNPACK + Opcode.PACK))
+        self.assertIn(Opcode.CALL, output)
+
+    async def test_list_sort_multiple_calls_run(self):
+        await self.set_up_contract('SortListMultipleCalls.py')
+
+        for list_ in ([], [1], [2, 1], [5, 4, 3, 2, 6, 1], [3, -1, 3, 0, -1, 7, 2, 2, 10, -5, 4]):
+            result, _ = await self.call('sort_ascending', [list_], return_type=list)
+            self.assertEqual(sorted(list_), result)
+            result, _ = await self.call('sort_descending', [list_], return_type=list)
+            self.assertEqual(sorted(list_, reverse=True), result)
+
+            for reverse in (True, False):
+                result, _ = await self.call('sort_ints', [list_, reverse], return_type=list)
+                self.assertEqual(sorted(list_, reverse=reverse), result)
+
+        list_ = [True, False, True, False, False]
+        result, _ = await self.call('sort_bools', [list_], return_type=list)
+        self.assertEqual(sorted(list_), result)
+
     def test_list_sort_key(self):
         self.assertCompilerLogs(CompilerError.UnexpectedArgument, 'SortKeyList.py')
 
@@ -1,4 +1,5 @@
 from boa3.internal.exception import CompilerError
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
 from boa3_test.tests import boatestcase
 
 
@@ -168,6 +169,48 @@ class TestMatchCase(boatestcase.BoaTestCase):
         result, _ = await self.call('main', ['unit test'], return_type=str)
         self.assertEqual("other", result)
 
+    async def test_many_int_cases_match_case(self):
+        await self.set_up_contract('ManyIntCasesMatchCase.py')
+
+        result, _ = await self.call('main', [10], return_type=str)
+        self.assertEqual("ten", result)
+
+        result, _ = await self.call('main', [-10], return_type=str)
+        self.assertEqual("minus ten", result)
+
+        result, _ = await self.call('main', [0], return_type=str)
+        self.assertEqual("zero", result)
+
+        result, _ = await self.call('main', [3], return_type=str)
+        self.assertEqual("three", result)
+
+        result, _ = await self.call('main', [100], return_type=str)
+        self.assertEqual("hundred", result)
+
+        result, _ = await self.call('main', [5], return_type=str)
+        self.assertEqual("other", result)
+
+        result, _ = await self.call('main', [-999], return_type=str)
+        self.assertEqual("other", result)
+
+    def test_many_int_cases_match_case_compile(self):
+        output, _ = self.assertCompile('ManyIntCasesMatchCase.py')
+        # the cases are found with a binary search instead of comparing the subject with every case
+        self.assertIn(Opcode.JMPLT, output)
+        self.assertNotIn(Opcode.NUMEQUAL, output)
+
+    async def test_match_case_inside_loop(self):
+        await self.set_up_contract('MatchCaseInsideLoop.py')
+
+        result, _ = await self.call('main', [[1, 2, 4, 5, 6]], return_type=int)
+        self.assertEqual(4101, result)
+
+        result, _ = await self.call('main', [[1, 3, 4]], return_type=int)
+        self.assertEqual(1010, result)
+
+        result, _ = await self.call('main', [[]], return_type=int)
+        self.assertEqual(0, result)
+
     def test_unsupported_case(self):
         path = self.get_contract_path('UnsupportedCase.py')
         self.assertCompilerLogs(CompilerError.NotSupportedOperation, path)
@@ -14,8 +14,7 @@ class TestCryptoLibClass(boatestcase.BoaTestCase):
     ecpoint_init = (
         Opcode.DUP
         + Opcode.ISNULL
-        + Opcode.NOT
-        + Opcode.JMPIFNOT
+        + Opcode.JMPIF
         + Integer(11).to_byte_array(min_length=1)
         + Opcode.CONVERT + Type.bytes.stack_item
         + Opcode.DUP
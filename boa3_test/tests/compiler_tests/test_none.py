@@ -96,12 +96,12 @@ class TestNone(boatestcase.BoaTestCase):
     def test_reassign_variable_with_none_compile(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x02'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSH2          # a = 2
             + Opcode.STLOC0
             + Opcode.PUSH4          # b = a * 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSHNULL       # a = None
             + Opcode.STLOC0
             + Opcode.RET        # return
@@ -119,14 +119,14 @@ class TestNone(boatestcase.BoaTestCase):
     def test_reassign_variable_after_none_compile(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x02'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSHNULL       # a = None
             + Opcode.STLOC0
             + Opcode.PUSH2          # a = 2
             + Opcode.STLOC0
             + Opcode.PUSH4          # b = a * 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.RET        # return
         )
         output, _ = self.assertCompile('ReassignVariableAfterNone.py')
@@ -0,0 +1,549 @@
+import json
+import logging
+
+from boa3.internal import constants
+from boa3.internal.compiler.compiler import Compiler
+from boa3.internal.compiler.filegenerator.filegenerator import FileGenerator
+from boa3.internal.model.builtin.interop.interop import Interop
+from boa3.internal.model.builtin.interop.storage import StorageGetBytesMethod
+from boa3.internal.model.builtin.interop.storage.neostorageinterop import StorageLocalGet
+from boa3.internal.model.method import Method
+from boa3.internal.model.type.type import Type
+from boa3.internal.neo import to_script_hash
+from boa3.internal.neo.cryptography import hash160
+from boa3.internal.neo.vm.opcode.Opcode import Opcode
+from boa3.internal.neo.vm.type.Integer import Integer
+from boa3.internal.neo.vm.type.StackItem import StackItemType
+from boa3.internal.neo.vm.type.String import String
+from boa3_test.tests import boatestcase
+
+
+class TestOptimization(boatestcase.BoaTestCase):
+    default_folder: str = 'test_sc/optimization_test'
+
+    def test_peephole_not_jump_compile(self):
+        expected_output = (
+            Opcode.INITSLOT
+            + b'\x00'
+            + b'\x01'
+            + Opcode.LDARG0     # if not condition
+            + Opcode.JMPIF
+            + Integer(4).to_byte_array(min_length=1, signed=True)
+            + Opcode.PUSH1      # return 1
+            + Opcode.RET
+            + Opcode.PUSH2      # return 2
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('NotCondition.py')
+        self.assertEqual(expected_output, output)
+
+        not_optimized_output, _ = self.assertCompile('NotCondition.py', optimize=False)
+        self.assertIn(Opcode.NOT + Opcode.JMPIFNOT, not_optimized_output)
+
+    async def test_peephole_not_jump_run(self):
+        await self.set_up_contract('NotCondition.py')
+
+        result, _ = await self.call('Main', [False], return_type=int)
+        self.assertEqual(1, result)
+        result, _ = await self.call('Main', [True], return_type=int)
+        self.assertEqual(2, result)
+
+    def test_peephole_store_load_compile(self):
+        expected_output = (
+            Opcode.INITSLOT
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG0     # c = a + b
+            + Opcode.LDARG1
+            + Opcode.ADD
+            + Opcode.RET        # return c
+        )
+
+        output, _ = self.assertCompile('StoreAndLoadLocal.py')
+        self.assertEqual(expected_output, output)
+
+    async def test_peephole_store_load_run(self):
+        await self.set_up_contract('StoreAndLoadLocal.py')
+
+        result, _ = await self.call('Main', [1, 2], return_type=int)
+        self.assertEqual(3, result)
+
+    def test_peephole_store_load_local_read_more_than_once(self):
+        expected_output = (
+            Opcode.INITSLOT
+            + b'\x01'
+            + b'\x02'
+            + Opcode.LDARG0     # c = a + b
+            + Opcode.LDARG1
+            + Opcode.ADD
+            + Opcode.STLOC0
+            + Opcode.LDLOC0     # return c * c
+            + Opcode.LDLOC0
+            + Opcode.MUL
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('LocalReadMoreThanOnce.py')
+        self.assertEqual(expected_output, output)
+
+    def test_peephole_report(self):
+        path = self.get_contract_path('StoreAndLoadLocal.py')
+
+        from boa3_test.tests.boatestcase import _LOGGING_LOCK as LOCK
+        with LOCK:
+            with self.assertLogs(constants.BOA_LOGGING_NAME, level=logging.INFO) as log:
+                self.compile(path)
+
+        peephole_logs = [record.getMessage() for record in log.records
+                         if record.getMessage().startswith('Peephole rule')]
+        self.assertEqual(
+            ["Peephole rule 'store-load' applied 1 time(s): 2 byte(s) and 0.00000120 GAS saved"],
+            peephole_logs
+        )
+
+    def test_inline_small_method_compile(self):
+        expected_output = (
+            Opcode.INITSLOT
+            + b'\x02'
+            + b'\x02'
+            + Opcode.LDARG0     # total = double(a) + double(b)
+            + Opcode.PUSH2
+            + Opcode.MUL
+            + Opcode.LDARG1
+            + Opcode.PUSH2
+            + Opcode.MUL
+            + Opcode.ADD
+            + Opcode.STLOC0
+            + Opcode.PUSHINT8   # return limit(total, 100)
+            + Integer(100).to_byte_array(min_length=1)
+            + Opcode.LDLOC0
+            + Opcode.STLOC0     # limit's arguments are stored in Main's local variables
+            + Opcode.STLOC1
+            + Opcode.LDLOC0     # if value > maximum
+            + Opcode.LDLOC1
+            + Opcode.GT
+            + Opcode.JMPIFNOT
+            + Integer(4).to_byte_array(min_length=1, signed=True)
+            + Opcode.LDLOC1     # return maximum
+            + Opcode.RET
+            + Opcode.LDLOC0     # return value
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('InlineSmallMethod.py')
+        self.assertEqual(expected_output, output)
+
+        not_optimized_output, _ = self.assertCompile('InlineSmallMethod.py', optimize=False)
+        self.assertIn(Opcode.CALL, not_optimized_output)
+
+    async def test_inline_small_method_run(self):
+        await self.set_up_contract('InlineSmallMethod.py')
+
+        result, _ = await self.call('Main', [1, 2], return_type=int)
+        self.assertEqual(6, result)
+        result, _ = await self.call('Main', [30, 40], return_type=int)
+        self.assertEqual(100, result)
+
+    def test_inline_method_debug_info(self):
+        path = self.get_contract_path('InlineSmallMethod.py')
+        compiler = Compiler()
+        with boatestcase._COMPILER_LOCK:
+            compiler.compile(path)
+            methods = self.get_all_symbols(compiler, symbol_type=Method)
+
+            main = methods['Main']
+            with compiler._context.activate():
+                debug_lines = {instruction.start_line for instruction in main.debug_map()}
+
+        # the arguments of the inlined methods are mapped to the local variables that replaced them
+        self.assertEqual(['total', 'double.value', 'double.value_1', 'limit.value', 'limit.maximum'],
+                         list(main.locals))
+        # the sequence points of the inlined methods are kept, so they can be stepped into
+        self.assertIn(5, debug_lines)   # return value * 2
+        self.assertIn(10, debug_lines)  # return maximum
+
+    def test_inline_reset_locals_compile(self):
+        output, _ = self.assertCompile('InlineResetLocals.py')
+        self.assertNotIn(Opcode.CALL, output)
+        # 'last' may be read before being stored, so it's reset every time last_item is inlined
+        self.assertIn(Opcode.PUSHNULL, output)
+
+    async def test_inline_reset_locals_run(self):
+        await self.set_up_contract('InlineResetLocals.py')
+
+        # the value stored by the previous iteration is not read when the list is empty
+        result, _ = await self.call('Main', [[[1, 2], [], [3]]], return_type=list)
+        self.assertEqual([2, None, 3], result)
+
+    def test_inline_recursive_method_compile(self):
+        output, _ = self.assertCompile('InlineRecursiveMethod.py')
+        self.assertEqual(2, output.count(Opcode.CALL))
+
+    async def test_inline_recursive_method_run(self):
+        await self.set_up_contract('InlineRecursiveMethod.py')
+
+        result, _ = await self.call('Main', [5], return_type=int)
+        self.assertEqual(120, result)
+
+    def test_shared_builtin_method_compile(self):
+        output, _ = self.assertCompile('SharedBuiltinMethod.py')
+        # str.upper is generated once and called three times, str.lower is called once, so it's inlined
+        self.assertEqual(3, output.count(Opcode.CALL))
+
+        path = self.get_contract_path('test_sc/string_test', 'UpperStringMethod.py')
+        output, _ = self.assertCompile(path)
+        self.assertNotIn(Opcode.CALL, output)
+
+    def test_shared_builtin_method_debug_info(self):
+        path = self.get_contract_path('test_sc/string_test', 'SearchLongString.py')
+        compiler = Compiler()
+        with boatestcase._COMPILER_LOCK:
+            compiler.compile(path)
+            methods = self.get_all_symbols(compiler, symbol_type=Method)
+
+        # the variables of the inlined builtin are named after it
+        replace_locals = list(methods['replace'].locals)
+        self.assertEqual(['replace.old', 'replace.new', 'replace.count', 'replace.string'], replace_locals[:4])
+
+    async def test_shared_builtin_method_run(self):
+        await self.set_up_contract('SharedBuiltinMethod.py')
+
+        result, _ = await self.call('Main', ['abC', '', 'x1Y'], return_type=list)
+        self.assertEqual(['ABC', '', 'X1Y', 'abc'], result)
+
+    def test_non_negative_indexes_compile(self):
+        output, _ = self.assertCompile('NonNegativeIndexes.py')
+        # the indexes are never negative nor greater than the length, so they aren't fixed in runtime
+        self.assertNotIn(Opcode.SIGN, output)
+        self.assertNotIn(Opcode.MIN, output)
+
+    async def test_non_negative_indexes_run(self):
+        await self.set_up_contract('NonNegativeIndexes.py')
+
+        result, _ = await self.call('reverse_sum', [[1, 2, 3, 4]], return_type=int)
+        self.assertEqual(10, result)
+        result, _ = await self.call('reverse_sum', [[]], return_type=int)
+        self.assertEqual(0, result)
+
+        result, _ = await self.call('double_items', [[1, -2, 3]], return_type=list)
+        self.assertEqual([2, -4, 6], result)
+
+        result, _ = await self.call('pairs', ['abcd'], return_type=list)
+        self.assertEqual(['ab', 'bc', 'cd'], result)
+        result, _ = await self.call('pairs', [''], return_type=list)
+        self.assertEqual([], result)
+
+        result, _ = await self.call('suffixes', ['abc'], return_type=list)
+        self.assertEqual(['abc', 'bc', 'c'], result)
+
+    def test_constant_builtin_calls_compile(self):
+        output, _ = self.assertCompile('ConstantBuiltinCalls.py')
+        # the calls with literal arguments are replaced by their results, so there are no calls to native contracts
+        self.assertNotIn(Opcode.CALLT, output)
+        self.assertIn(hash160(b'const'), output)
+        self.assertIn(to_script_hash(b'NUVaphUShQPD82yoXcbvFkedjHX6rUF7QQ'), output)
+
+    async def test_constant_builtin_calls_run(self):
+        await self.set_up_contract('ConstantBuiltinCalls.py')
+
+        result, _ = await self.call('get_owner', [], return_type=bytes)
+        self.assertEqual(to_script_hash(b'NUVaphUShQPD82yoXcbvFkedjHX6rUF7QQ'), result)
+
+        result, _ = await self.call('get_key', ['abc'], return_type=bytes)
+        self.assertEqual(b'\x05abc', result)
+
+        result, _ = await self.call('get_values', [], return_type=list)
+        self.assertEqual([513, 7, hash160(b'const'), b'\xff\xfb\x2e'], result)
+
+    def test_reuse_local_slots_compile(self):
+        expected_output = (
+            Opcode.INITSLOT
+            + b'\x02'           # total and result use the same slot
+            + b'\x02'
+            + Opcode.LDARG0     # total = a + b
+            + Opcode.LDARG1
+            + Opcode.ADD
+            + Opcode.STLOC0
+            + Opcode.LDLOC0     # result = total * total
+            + Opcode.LDLOC0
+            + Opcode.MUL
+            + Opcode.STLOC0
+            + Opcode.LDARG0     # difference = a - b
+            + Opcode.LDARG1
+            + Opcode.SUB
+            + Opcode.STLOC1
+            + Opcode.LDLOC0     # result = result - difference * difference
+            + Opcode.LDLOC1
+            + Opcode.LDLOC1
+            + Opcode.MUL
+            + Opcode.SUB        # return result
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('ReuseLocalSlots.py')
+        self.assertEqual(expected_output, output)
+
+        not_optimized_output, _ = self.assertCompile('ReuseLocalSlots.py', optimize=False)
+        self.assertTrue(not_optimized_output.startswith(Opcode.INITSLOT + b'\x03'))
+
+    async def test_reuse_local_slots_run(self):
+        await self.set_up_contract('ReuseLocalSlots.py')
+
+        result, _ = await self.call('main', [3, 5], return_type=int)
+        self.assertEqual(60, result)
+        result, _ = await self.call('main', [-2, 7], return_type=int)
+        self.assertEqual(-56, result)
+
+    def test_reuse_local_slots_debug_info(self):
+        path = self.get_contract_path('ReuseLocalSlots.py')
+        compiler = Compiler()
+        with boatestcase._COMPILER_LOCK:
+            # the slots are only reused with the default optimization, that isn't used when saving the debug files
+            compiler.compile(path)
+            generator = FileGenerator(compiler.result, compiler._analyser, compiler._entry_smart_contract)
+            debug_info = json.loads(generator.generate_nefdbgnfo_file())
+
+        self.assertIn('methods', debug_info)
+        self.assertEqual(1, len(debug_info['methods']))
+
+        # each variable is mapped to the slot it uses
+        self.assertEqual(['total,Integer,0', 'result,Integer,0', 'difference,Integer,1'],
+                         debug_info['methods'][0]['variables'])
+        # and to the addresses where its value is in the slot, from the instruction that stores it to the last that
+        # reads it, so the variables that share a slot can be told apart
+        self.assertEqual(['total,6-8', 'result,10-15', 'difference,14-17'],
+                         debug_info['methods'][0]['variable-ranges'])
+
+        # when the debug files are saved, each variable keeps its own slot
+        self.compile_and_save(path, debug=True)
+        debug_info = self.get_debug_info(path)
+        self.assertEqual(['total,Integer', 'result,Integer', 'difference,Integer'],
+                         debug_info['methods'][0]['variables'])
+        self.assertNotIn('variable-ranges', debug_info['methods'][0])
+
+    def test_move_loop_invariants_compile(self):
+        expected_output = (
+            # sum_items
+            Opcode.INITSLOT
+            + b'\x03'
+            + b'\x01'
+            + Opcode.PUSH0      # result = 0
+            + Opcode.STLOC0
+            + Opcode.PUSH0      # index = 0
+            + Opcode.STLOC1
+            + Opcode.LDARG0     # the length of the list is evaluated before the loop
+            + Opcode.SIZE
+            + Opcode.STLOC2
+            + Opcode.JMP
+            + Integer(12).to_byte_array(min_length=1, signed=True)
+            + Opcode.LDLOC0     # result += items[index]
+            + Opcode.LDARG0
+            + Opcode.LDLOC1
+            + Opcode.PICKITEM
+            + Opcode.ADD
+            + Opcode.STLOC0
+            + Opcode.LDLOC1     # index += 1
+            + Opcode.PUSH1
+            + Opcode.ADD
+            + Opcode.STLOC1
+            + Opcode.LDLOC1     # while index < len(items)
+            + Opcode.LDLOC2
+            + Opcode.LT
+            + Opcode.JMPIF
+            + Integer(-13).to_byte_array(min_length=1, signed=True)
+            + Opcode.LDLOC0     # return result
+            + Opcode.RET
+            # fill_items
+            + Opcode.INITSLOT
+            + b'\x00'
+            + b'\x02'
+            + Opcode.JMP
+            + Integer(17).to_byte_array(min_length=1, signed=True)
+            + Opcode.LDARG0     # items.append(len(items))
+            + Opcode.LDARG0
+            + Opcode.SIZE
+            + Opcode.OVER
+            + Opcode.ISTYPE
+            + Type.bytearray.stack_item
+            + Opcode.JMPIFNOT
+            + Integer(5).to_byte_array(min_length=1, signed=True)
+            + Opcode.CAT
+            + Opcode.JMP
+            + Integer(5).to_byte_array(min_length=1, signed=True)
+            + Opcode.APPEND
+            + Opcode.JMP
+            + Integer(3).to_byte_array(min_length=1, signed=True)
+            + Opcode.STARG0
+            + Opcode.LDARG0     # while len(items) < size
+            + Opcode.SIZE
+            + Opcode.LDARG1
+            + Opcode.LT
+            + Opcode.JMPIF
+            + Integer(-19).to_byte_array(min_length=1, signed=True)
+            + Opcode.LDARG0     # return items
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('MoveLoopInvariants.py')
+        self.assertEqual(expected_output, output)
+
+    async def test_move_loop_invariants_run(self):
+        await self.set_up_contract('MoveLoopInvariants.py')
+
+        result, _ = await self.call('sum_items', [[]], return_type=int)
+        self.assertEqual(0, result)
+        result, _ = await self.call('sum_items', [[4, -1, 10]], return_type=int)
+        self.assertEqual(13, result)
+
+        result, _ = await self.call('fill_items', [[], 3], return_type=list)
+        self.assertEqual([0, 1, 2], result)
+        result, _ = await self.call('fill_items', [[7, 7], 4], return_type=list)
+        self.assertEqual([7, 7, 2, 3], result)
+
+    def test_loop_invariant_unassigned_local_compile(self):
+        output, _ = self.assertCompile('LoopInvariantUnassignedLocal.py')
+        # the length is evaluated only after checking has_items, in the loop
+        self.assertIn(Opcode.LDARG0 + Opcode.JMPIFNOT, output)
+        self.assertLess(output.rindex(Opcode.LDARG0 + Opcode.JMPIFNOT), output.index(Opcode.SIZE))
+
+    async def test_loop_invariant_unassigned_local_run(self):
+        await self.set_up_contract('LoopInvariantUnassignedLocal.py')
+
+        result, _ = await self.call('Main', [True, 5], return_type=int)
+        self.assertEqual(6, result)
+        result, _ = await self.call('Main', [False, 5], return_type=int)
+        self.assertEqual(5, result)
+
+    def test_fold_concatenations_compile(self):
+        fstring_literal = String('unit test 10 ').to_bytes()
+        concat_literal = String('unit_test').to_bytes()
+        expected_output = (
+            # fold_fstring
+            Opcode.INITSLOT
+            + b'\x00'
+            + b'\x01'
+            + Opcode.PUSHDATA1  # the literal parts of the f-string are joined when compiling
+            + Integer(len(fstring_literal)).to_byte_array(min_length=1)
+            + fstring_literal
+            + Opcode.LDARG0
+            + Opcode.CAT
+            + Opcode.CONVERT + StackItemType.ByteString
+            + Opcode.RET
+            # fold_concat
+            + Opcode.INITSLOT
+            + b'\x00'
+            + b'\x02'
+            + Opcode.LDARG0
+            + Opcode.PUSHDATA1  # the adjacent constants are joined when compiling
+            + Integer(len(concat_literal)).to_byte_array(min_length=1)
+            + concat_literal
+            + Opcode.CAT
+            + Opcode.LDARG1
+            + Opcode.CAT
+            + Opcode.CONVERT + StackItemType.ByteString     # only the result of the chain is converted
+            + Opcode.RET
+        )
+
+        output, _ = self.assertCompile('FoldConcatenations.py')
+        self.assertEqual(expected_output, output)
+
+    async def test_fold_concatenations_run(self):
+        await self.set_up_contract('FoldConcatenations.py')
+
+        result, _ = await self.call('fold_fstring', ['boa'], return_type=str)
+        self.assertEqual('unit test 10 boa', result)
+
+        result, _ = await self.call('fold_concat', ['neo.', '!'], return_type=str)
+        self.assertEqual('neo.unit_test!', result)
+        result, _ = await self.call('fold_concat', ['', ''], return_type=str)
+        self.assertEqual('unit_test', result)
+
+    def test_reuse_storage_context_compile(self):
+        get_context = Opcode.SYSCALL + Interop.StorageGetContext.interop_method_hash
+
+        output, _ = self.assertCompile('ReuseStorageContext.py')
+        # get_sum gets the context only once, but there isn't a call that runs before every other one in get_total
+        self.assertEqual(4, output.count(get_context))
+
+        not_optimized_output, _ = self.assertCompile('ReuseStorageContext.py', optimize=False)
+        self.assertEqual(5, not_optimized_output.count(get_context))
+
+    async def test_reuse_storage_context_run(self):
+        await self.set_up_contract('ReuseStorageContext.py')
+
+        keys = [b'a', b'b', b'c']
+        result, _ = await self.call('put_values', [keys, 7], return_type=None, signing_accounts=[self.genesis])
+        self.assertIsNone(result)
+
+        result, _ = await self.call('get_sum', [b'a', b'c'], return_type=int)
+        self.assertEqual(14, result)
+        result, _ = await self.call('get_sum', [b'b', b'unit_test'], return_type=int)
+        self.assertEqual(7, result)
+
+        result, _ = await self.call('get_total', [b'a', b'c', 0], return_type=int)
+        self.assertEqual(0, result)
+        result, _ = await self.call('get_total', [b'a', b'c', 1], return_type=int)
+        self.assertEqual(15, result)
+        result, _ = await self.call('get_total', [b'a', b'c', -1], return_type=int)
+        self.assertEqual(6, result)
+
+    def test_reuse_storage_reads_compile(self):
+        storage_get = Opcode.SYSCALL + StorageGetBytesMethod(StorageLocalGet()).interop_method_hash
+
+        output, _ = self.assertCompile('ReuseStorageReads.py')
+        # withdraw reads the balance only once and deposit reads the key again after changing it
+        self.assertEqual(3, output.count(storage_get))
+
+        not_optimized_output, _ = self.assertCompile('ReuseStorageReads.py', optimize=False)
+        self.assertEqual(4, not_optimized_output.count(storage_get))
+
+    def test_reuse_storage_reads_report(self):
+        path = self.get_contract_path('ReuseStorageReads.py')
+
+        from boa3_test.tests.boatestcase import _LOGGING_LOCK as LOCK
+        with LOCK:
+            with self.assertLogs(constants.BOA_LOGGING_NAME, level=logging.INFO) as log:
+                self.compile(path)
+
+        storage_logs = [record.getMessage() for record in log.records
+                        if record.getMessage().startswith('Removed a repeated storage read')]
+        self.assertEqual(
+            ["Removed a repeated storage read of key b'balance' in method 'withdraw'"],
+            storage_logs
+        )
+
+    async def test_reuse_storage_reads_run(self):
+        await self.set_up_contract('ReuseStorageReads.py')
+
+        result, _ = await self.call('withdraw', [5], return_type=bool, signing_accounts=[self.genesis])
+        self.assertEqual(False, result)
+
+        result, _ = await self.call('deposit', [b'balance', 10], return_type=int, signing_accounts=[self.genesis])
+        self.assertEqual(10, result)
+
+        result, _ = await self.call('withdraw', [3], return_type=bool, signing_accounts=[self.genesis])
+        self.assertEqual(True, result)
+        result, _ = await self.call('withdraw', [8], return_type=bool, signing_accounts=[self.genesis])
+        self.assertEqual(False, result)
+
+        result, _ = await self.call('deposit', [b'balance', 0], return_type=int)
+        self.assertEqual(7, result)
+
+    def test_reuse_storage_reads_mutable_key_compile(self):
+        storage_get = Opcode.SYSCALL + StorageGetBytesMethod(StorageLocalGet()).interop_method_hash
+
+        output, _ = self.assertCompile('ReuseStorageReadsMutableKey.py')
+        # a bytearray key can be changed without reassigning the argument, so both reads are kept
+        self.assertEqual(2, output.count(storage_get))
+
+    async def test_reuse_storage_reads_mutable_key_run(self):
+        await self.set_up_contract('ReuseStorageReadsMutableKey.py')
+
+        result, _ = await self.call('put_value', [b'\x00\x01', b'X'], return_type=None,
+                                    signing_accounts=[self.genesis])
+        result, _ = await self.call('put_value', [b'A\x01', b'Y'], return_type=None,
+                                    signing_accounts=[self.genesis])
+
+        result, _ = await self.call('main', [bytearray(b'\x00\x01')], return_type=bytes)
+        self.assertEqual(b'XY', result)
@@ -1046,6 +1046,57 @@ class TestString(boatestcase.BoaTestCase):
     def test_string_index_mismatched_type(self):
         self.assertCompilerLogs(CompilerError.MismatchedTypes, 'IndexStringMismatchedType.py')
 
+    async def test_string_search_long_string(self):
+        await self.set_up_contract('SearchLongString.py')
+
+        # the strings are searched with StdLib's memorySearch, that limits the size of the searched memory
+        for size in (1024, 10 * 1024):
+            string = 'ab' * (size // 2 - 2) + 'unit'
+            substring = 'unit'
+            max_gas_consumed = (size // 1024) * 5 * 10 ** 6  # 0.05 GAS for each KB
+
+            result, _ = await self.call('index', [string, substring], return_type=int)
+            self.assertEqual(string.index(substring), result)
+            gas_consumed = await self.get_gas_consumed('index', [string, substring])
+            # comparing each substring consumed more than 3 GAS for each KB
+            self.assertLess(gas_consumed, max_gas_consumed)
+
+            result, _ = await self.call('count', [string, substring], return_type=int)
+            self.assertEqual(string.count(substring), result)
+            gas_consumed = await self.get_gas_consumed('count', [string, substring])
+            self.assertLess(gas_consumed, max_gas_consumed)
+
+            result, _ = await self.call('replace', [string, substring, 'test'], return_type=str)
+            self.assertEqual(string.replace(substring, 'test'), result)
+            gas_consumed = await self.get_gas_consumed('replace', [string, substring, 'test'])
+            self.assertLess(gas_consumed, max_gas_consumed)
+
+        # the value is in the end of the first searched memory and in the start of the next
+        substring = 'unit'
+        for position in (1050, 1053, 1055):
+            string = 'a' * position + substring + 'a' * 100
+            result, _ = await self.call('index', [string, substring], return_type=int)
+            self.assertEqual(string.index(substring), result)
+            result, _ = await self.call('count', [string, substring], return_type=int)
+            self.assertEqual(string.count(substring), result)
+
+        # values longer than an integer are compared as bytes when they are close to the start
+        substring = 'unit test ' * 5
+        for position in (0, 3):
+            string = 'a' * position + substring + 'b' * 50 + substring
+            result, _ = await self.call('index', [string, substring], return_type=int)
+            self.assertEqual(string.index(substring), result)
+            result, _ = await self.call('count', [string, substring], return_type=int)
+            self.assertEqual(string.count(substring), result)
+            result, _ = await self.call('replace', [string, substring, 'test'], return_type=str)
+            self.assertEqual(string.replace(substring, 'test'), result)
+
+        # values longer than the memory of memorySearch are compared with each substring
+        string = 'ab' * 1024
+        substring = string[1:1100]
+        result, _ = await self.call('index', [string, substring], return_type=int)
+        self.assertEqual(string.index(substring), result)
+
     async def test_string_property_slicing(self):
         await self.set_up_contract('StringPropertySlicing.py')
 
@@ -75,20 +75,20 @@ class TestTuple(boatestcase.BoaTestCase):
     def test_tuple_variable_values(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x04'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSH1      # a = 1
             + Opcode.STLOC0
             + Opcode.PUSH2      # b = 2
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSH3      # c = 3
-            + Opcode.STLOC2
+            + Opcode.STLOC0
             + Opcode.PUSH3      # d = (a, b, c)
             + Opcode.PUSH2
             + Opcode.PUSH1
             + Opcode.PUSH3      # tuple length
             + Opcode.PACK
-            + Opcode.STLOC3
+            + Opcode.STLOC0
             + Opcode.RET        # return
         )
 
@@ -148,18 +148,13 @@ class TestTuple(boatestcase.BoaTestCase):
     def test_tuple_get_value_typed_tuple_compile(self):
         ok = String('ok').to_bytes()
         expected_output = (
-            Opcode.INITSLOT     # function signature
-            + b'\x01'
-            + b'\x00'
-            + Opcode.PUSHDATA1  # x = [True, 1, 'ok']
+            Opcode.PUSHDATA1    # x = [True, 1, 'ok']
             + Integer(len(ok)).to_byte_array() + ok
             + Opcode.PUSH1
             + Opcode.PUSHT
             + Opcode.PUSH3
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # x[1]
-            + Opcode.PUSH1
+            + Opcode.PUSH1      # x[1]
             + Opcode.PICKITEM
             + Opcode.RET        # return
         )
@@ -246,10 +241,7 @@ class TestTuple(boatestcase.BoaTestCase):
 
     def test_tuple_slicing_omitted_compile(self):
         expected_output = (
-            Opcode.INITSLOT     # function signature
-            + b'\x01'
-            + b'\x00'
-            + Opcode.PUSH5      # a = (0, 1, 2, 3, 4, 5)
+            Opcode.PUSH5        # a = (0, 1, 2, 3, 4, 5)
             + Opcode.PUSH4
             + Opcode.PUSH3
             + Opcode.PUSH2
@@ -257,9 +249,7 @@ class TestTuple(boatestcase.BoaTestCase):
             + Opcode.PUSH0
             + Opcode.PUSH6
             + Opcode.PACK
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a[:]
-            + Opcode.UNPACK
+            + Opcode.UNPACK     # return a[:]
             + Opcode.PACK
             + Opcode.RET        # return
         )
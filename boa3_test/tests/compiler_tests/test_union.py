@@ -39,19 +39,17 @@ class TestUnion(boatestcase.BoaTestCase):
     def test_union_variable_reassign(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x03'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSH2      # a = 2
             + Opcode.STLOC0
             + Opcode.PUSH2      # b = a
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.PUSH2      # c = [a, b]
             + Opcode.PUSH2
             + Opcode.PUSH2
             + Opcode.PACK
-            + Opcode.STLOC2
-            + Opcode.LDLOC2     # b = c
-            + Opcode.STLOC1
+            + Opcode.STLOC0     # b = c
             + Opcode.RET        # return
         )
 
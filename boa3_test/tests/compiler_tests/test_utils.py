@@ -19,8 +19,7 @@ class TestUtils(boatestcase.BoaTestCase):
     ecpoint_init = (
             Opcode.DUP
             + Opcode.ISNULL
-            + Opcode.NOT
-            + Opcode.JMPIFNOT
+            + Opcode.JMPIF
             + Integer(11).to_byte_array(min_length=1)
             + Opcode.CONVERT + Type.bytes.stack_item
             + Opcode.DUP
@@ -246,8 +245,7 @@ class TestUtils(boatestcase.BoaTestCase):
                 + Opcode.LDARG0
                 + Opcode.DUP
                 + Opcode.ISNULL
-                + Opcode.NOT
-                + Opcode.JMPIFNOT
+                + Opcode.JMPIF
                 + Integer(11).to_byte_array(min_length=1)
                 + Opcode.CONVERT
                 + StackItemType.ByteString
@@ -436,7 +434,7 @@ class TestUtils(boatestcase.BoaTestCase):
 
         expected_output = (
                 Opcode.INITSLOT
-                + b'\x02'
+                + b'\x01'
                 + b'\x00'
                 + Opcode.PUSHDATA1
                 + Integer(len(byte_input1)).to_byte_array(min_length=1)
@@ -457,8 +455,6 @@ class TestUtils(boatestcase.BoaTestCase):
                 + byte_input2
                 + Opcode.PUSH2
                 + Opcode.PACK
-                + Opcode.STLOC1
-                + Opcode.LDLOC1
                 + Opcode.LDLOC0
                 + Opcode.SYSCALL
                 + Interop.CheckMultisig.interop_method_hash
@@ -97,13 +97,13 @@ class TestVariable(boatestcase.BoaTestCase):
     def test_multiple_assignments(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x03'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSHT      # a = b = c = True
             + Opcode.DUP            # c = True
-            + Opcode.STLOC2
+            + Opcode.STLOC0
             + Opcode.DUP            # b = True
-            + Opcode.STLOC1
+            + Opcode.STLOC0
             + Opcode.STLOC0         # a = True
             + Opcode.RET        # return
         )
@@ -114,7 +114,7 @@ class TestVariable(boatestcase.BoaTestCase):
     def test_multiple_assignments_set_sequence(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x03'
+            + b'\x02'
             + b'\x00'
             + Opcode.PUSH3      # a = [1, 2, 3]
             + Opcode.PUSH2
@@ -124,21 +124,13 @@ class TestVariable(boatestcase.BoaTestCase):
             + Opcode.STLOC0
             + Opcode.PUSH2      # c = a[2] = b = 2
             + Opcode.DUP            # b = 2
-            + Opcode.STLOC2
+            + Opcode.STLOC1
             + Opcode.LDLOC0         # a[2] = 2
             + Opcode.PUSH2
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(signed=True, min_length=1)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.PUSH2
             + Opcode.PICK
             + Opcode.SETITEM
-            + Opcode.STLOC1         # c = 2
+            + Opcode.STLOC0         # c = 2
             + Opcode.RET        # return
         )
 
@@ -148,7 +140,7 @@ class TestVariable(boatestcase.BoaTestCase):
     def test_multiple_assignments_set_sequence_last(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x03'
+            + b'\x02'
             + b'\x00'
             + Opcode.PUSH3      # a = [1, 2, 3]
             + Opcode.PUSH2
@@ -158,18 +150,10 @@ class TestVariable(boatestcase.BoaTestCase):
             + Opcode.STLOC0
             + Opcode.PUSH2      # a[2] = c = b = 2
             + Opcode.DUP            # b = 2
-            + Opcode.STLOC2
+            + Opcode.STLOC1
             + Opcode.DUP            # c = 2
             + Opcode.STLOC1
             + Opcode.PUSH2          # a[2] = 2
-            + Opcode.DUP
-            + Opcode.SIGN
-            + Opcode.PUSHM1
-            + Opcode.JMPNE
-            + Integer(5).to_byte_array(signed=True, min_length=1)
-            + Opcode.OVER
-            + Opcode.SIZE
-            + Opcode.ADD
             + Opcode.LDLOC0
             + Opcode.REVERSE3
             + Opcode.SETITEM
@@ -183,7 +167,7 @@ class TestVariable(boatestcase.BoaTestCase):
         string = String('str').to_bytes()
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x03'
+            + b'\x01'
             + b'\x00'
             + Opcode.PUSHDATA1      # c = 'str'
             + Integer(len(string)).to_byte_array(min_length=1)
@@ -193,8 +177,8 @@ class TestVariable(boatestcase.BoaTestCase):
             + Opcode.DUP            # c = True
             + Opcode.STLOC0
             + Opcode.DUP            # b = True
-            + Opcode.STLOC2
-            + Opcode.STLOC1         # a = True
+            + Opcode.STLOC0
+            + Opcode.STLOC0         # a = True
             + Opcode.RET        # return
         )
 
@@ -229,7 +213,8 @@ class TestVariable(boatestcase.BoaTestCase):
             + Opcode.RET
         )
 
-        output, _ = self.assertCompile('ManyAssignments.py')
+        # the variables only share the slots if the code is optimized
+        output, _ = self.assertCompile('ManyAssignments.py', optimize=False)
         self.assertEqual(expected_output, output)
 
     def test_return_arg_value_compile(self):
@@ -277,12 +262,10 @@ class TestVariable(boatestcase.BoaTestCase):
     def test_assign_local_with_arg_value_compile(self):
         expected_output = (
             Opcode.INITSLOT     # function signature
-            + b'\x01'
+            + b'\x00'
             + b'\x01'
             + Opcode.LDARG0
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # variable address
-            + Opcode.RET
+            + Opcode.RET        # variable address
         )
 
         output, _ = self.assertCompile('AssignLocalWithArgument.py')
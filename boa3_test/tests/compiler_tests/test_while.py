@@ -129,9 +129,7 @@ class TestWhile(boatestcase.BoaTestCase):
             + Opcode.LDLOC0     # else
             + Opcode.PUSH1          # a = a + 1
             + Opcode.ADD
-            + Opcode.STLOC0
-            + Opcode.LDLOC0     # return a
-            + Opcode.RET
+            + Opcode.RET        # return a
         )
 
         output, _ = self.assertCompile('WhileElse.py')